@@ -0,0 +1 @@
+"""파이프라인 단계별 성능 벤치마크."""
@@ -0,0 +1,88 @@
+"""벤치마크 실행기.
+
+    python -m benchmarks --rows 1000000
+    python -m benchmarks --baseline benchmarks/baseline.json --tolerance 0.2
+    python -m benchmarks --write-baseline benchmarks/baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+from benchmarks.generator import DEFAULT_FRAUD_RATE, generate_kaggle_csv
+from benchmarks.regression import (
+    DEFAULT_TOLERANCE,
+    find_regressions,
+    load_baseline,
+    save_baseline,
+)
+from benchmarks.stages import STAGES, run_benchmarks
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--fraud-rate", type=float, default=DEFAULT_FRAUD_RATE)
+    parser.add_argument("--invalid-rate", type=float, default=0.001)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=list(STAGES))
+    parser.add_argument("--no-allocations", action="store_true")
+    parser.add_argument("--output", type=Path, help="결과를 JSON으로 저장할 경로")
+    parser.add_argument("--baseline", type=Path, help="비교할 baseline JSON")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--write-baseline", type=Path, help="결과를 baseline으로 저장")
+    args = parser.parse_args(argv)
+    baseline = None
+    if args.baseline:
+        try:
+            baseline = load_baseline(args.baseline, rows=args.rows, seed=args.seed)
+        except ValueError as e:
+            parser.error(str(e))
+
+    with tempfile.TemporaryDirectory(prefix="benchmarks-") as tmp:
+        dataset = generate_kaggle_csv(
+            Path(tmp) / "creditcard.csv",
+            args.rows,
+            seed=args.seed,
+            fraud_rate=args.fraud_rate,
+            invalid_rate=args.invalid_rate,
+        )
+        results = run_benchmarks(
+            dataset.path,
+            stages=args.stages,
+            repeat=args.repeat,
+            trace_allocations=not args.no_allocations,
+        )
+
+    for result in results:
+        allocated = (
+            "-" if result.allocated_bytes is None else f"{result.allocated_bytes / 2**20:.1f}"
+        )
+        print(
+            f"{result.name:<15} {result.rows_per_second:>14,.0f} rows/s"
+            f"  rss {result.peak_rss_bytes / 2**20:>8.1f} MiB"
+            f"  alloc {allocated:>8} MiB"
+        )
+    if args.output:
+        args.output.write_text(
+            json.dumps([result.to_dict() for result in results], indent=2),
+            encoding="utf-8",
+        )
+    if args.write_baseline:
+        save_baseline(args.write_baseline, results, rows=args.rows, seed=args.seed)
+    if baseline is not None:
+        regressions = find_regressions(results, baseline, tolerance=args.tolerance)
+        for message in regressions:
+            print(f"REGRESSION {message}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""Kaggle Credit Card Fraud Detection 스키마의 합성 CSV 생성기."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from services.data_pipeline.domain.models import PCA_FEATURES_COUNT
+
+KAGGLE_HEADER = ",".join(
+    ['"Time"', *(f'"V{i}"' for i in range(1, PCA_FEATURES_COUNT + 1)), '"Amount"', '"Class"']
+)
+DEFAULT_FRAUD_RATE = 0.0017
+DEFAULT_CHUNK_ROWS = 100_000
+# 원본 데이터셋은 이틀(172,800초) 동안의 거래다.
+_TIME_SPAN_SECONDS = 172_800.0
+_MAX_AMOUNT = 25_691.16
+_ROW_FORMAT = ",".join(["%.1f", *["%.6f"] * PCA_FEATURES_COUNT, "%.2f", '"%d"'])
+
+
+@dataclass(frozen=True)
+class GeneratedDataset:
+    """생성된 CSV 파일과 행 구성."""
+
+    path: Path
+    rows: int
+    fraud_rows: int
+    invalid_rows: int
+
+
+def generate_kaggle_csv(
+    path: str | Path,
+    rows: int,
+    *,
+    seed: int = 0,
+    fraud_rate: float = DEFAULT_FRAUD_RATE,
+    invalid_rate: float = 0.0,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+) -> GeneratedDataset:
+    """seed로 재현 가능한 Kaggle 형식 CSV를 생성한다.
+
+    Time은 이틀 구간에서 오름차순, Amount는 로그정규 분포, V1~V28은 표준정규
+    분포를 따른다. invalid_rate 비율의 행은 파싱은 되지만 검증에서 거부되도록
+    음수 Amount 또는 NaN인 PCA 값을 절반씩 가진다.
+    """
+    if rows < 0:
+        raise ValueError(f"rows must be non-negative, got {rows}")
+    for name, rate in (("fraud_rate", fraud_rate), ("invalid_rate", invalid_rate)):
+        if not 0.0 <= rate <= 1.0:
+            raise ValueError(f"{name} must be between 0 and 1, got {rate}")
+    if chunk_rows <= 0:
+        raise ValueError(f"chunk_rows must be positive, got {chunk_rows}")
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    rng = np.random.default_rng(seed)
+    fraud_rows = 0
+    invalid_rows = 0
+    with open(path, "w", encoding="utf-8", newline="\n") as f:
+        f.write(KAGGLE_HEADER + "\n")
+        for start in range(0, rows, chunk_rows):
+            n = min(chunk_rows, rows - start)
+            block = _generate_block(rng, start, n, rows, fraud_rate, invalid_rate)
+            fraud_rows += int(block[:, -1].sum())
+            invalid_rows += int(
+                ((block[:, -2] < 0) | np.isnan(block[:, 1:-2]).any(axis=1)).sum()
+            )
+            np.savetxt(f, block, fmt=_ROW_FORMAT, delimiter=",")
+    return GeneratedDataset(
+        path=path, rows=rows, fraud_rows=fraud_rows, invalid_rows=invalid_rows
+    )
+
+
+def _generate_block(
+    rng: np.random.Generator,
+    start: int,
+    n: int,
+    total: int,
+    fraud_rate: float,
+    invalid_rate: float,
+) -> np.ndarray:
+    """[Time, V1..V28, Amount, Class] 열을 가진 (n, 31) float 배열을 만든다."""
+    block = np.empty((n, PCA_FEATURES_COUNT + 3), dtype=np.float64)
+    span = _TIME_SPAN_SECONDS / total
+    block[:, 0] = np.floor(np.sort(rng.uniform(start * span, (start + n) * span, n)))
+    block[:, 1:-2] = rng.standard_normal((n, PCA_FEATURES_COUNT))
+    block[:, -2] = np.round(np.minimum(rng.lognormal(3.0, 1.5, n), _MAX_AMOUNT), 2)
+    block[:, -1] = rng.random(n) < fraud_rate
+
+    invalid = np.flatnonzero(rng.random(n) < invalid_rate)
+    negative_amount = invalid[: len(invalid) // 2]
+    nan_pca = invalid[len(invalid) // 2:]
+    block[negative_amount, -2] = -block[negative_amount, -2] - 0.01
+    block[nan_pca, 1 + rng.integers(0, PCA_FEATURES_COUNT, len(nan_pca))] = np.nan
+    return block
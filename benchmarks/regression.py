@@ -0,0 +1,82 @@
+"""저장된 기준 처리량(baseline)과 벤치마크 결과를 비교한다."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable
+from pathlib import Path
+
+from benchmarks.stages import BenchmarkResult
+
+DEFAULT_TOLERANCE = 0.2
+
+
+def load_baseline(
+    path: str | Path,
+    *,
+    rows: int | None = None,
+    seed: int | None = None,
+) -> dict[str, float]:
+    """baseline 파일을 단계 이름 → rows/sec 매핑으로 읽는다.
+
+    처리량은 행 수에 따라 달라지므로, rows/seed가 주어지면 baseline을 기록할 때의
+    값과 같은지 확인하고 다르면 ValueError를 발생시킨다.
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    for key, expected in (("rows", rows), ("seed", seed)):
+        if expected is not None and data.get(key) != expected:
+            raise ValueError(
+                f"baseline {path} was recorded with {key}={data.get(key)},"
+                f" got {key}={expected}"
+            )
+    return {name: stage["rows_per_second"] for name, stage in data["stages"].items()}
+
+
+def save_baseline(
+    path: str | Path,
+    results: Iterable[BenchmarkResult],
+    *,
+    rows: int,
+    seed: int,
+) -> None:
+    """결과를 새 baseline으로 저장한다."""
+    data = {
+        "rows": rows,
+        "seed": seed,
+        "stages": {
+            result.name: {"rows_per_second": round(result.rows_per_second, 1)}
+            for result in results
+        },
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
+
+
+def find_regressions(
+    results: Iterable[BenchmarkResult],
+    baseline: dict[str, float],
+    *,
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> list[str]:
+    """처리량이 baseline보다 tolerance 비율 넘게 떨어진 단계를 설명하는 메시지 목록.
+
+    baseline에 없는 단계는 비교하지 않는다.
+    """
+    if not 0.0 <= tolerance < 1.0:
+        raise ValueError(f"tolerance must be in [0, 1), got {tolerance}")
+
+    regressions = []
+    for result in results:
+        expected = baseline.get(result.name)
+        if expected is None:
+            continue
+        floor = expected * (1.0 - tolerance)
+        if result.rows_per_second < floor:
+            drop = 1.0 - result.rows_per_second / expected
+            regressions.append(
+                f"{result.name}: {result.rows_per_second:,.0f} rows/s is {drop:.1%}"
+                f" below baseline {expected:,.0f} rows/s"
+            )
+    return regressions
@@ -0,0 +1,185 @@
+"""단계별 및 전체 파이프라인 벤치마크."""
+
+from __future__ import annotations
+
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+from services.data_pipeline.domain.models import FeatureBatch, TransactionBatch
+from services.data_pipeline.infrastructure.csv_parser import (
+    DEFAULT_BATCH_SIZE,
+    KaggleCsvParser,
+)
+from services.data_pipeline.infrastructure.feature_engineering import (
+    KaggleFeatureEngineeringService,
+)
+from services.data_pipeline.infrastructure.local_repository import (
+    FEATURE_FORMAT_COLUMNAR,
+    LocalFileTransactionRepository,
+    LocalFileValidationReportRepository,
+)
+from services.data_pipeline.infrastructure.pipeline import PipelinedProcessDataUseCase
+from services.data_pipeline.infrastructure.validators import TransactionValidator
+
+STAGES = ("parse", "validate", "extract", "write_csv", "write_columnar", "end_to_end")
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """한 단계의 측정 결과.
+
+    seconds는 반복 실행 중 가장 빠른 값이다. peak_rss_bytes는 해당 단계까지의
+    프로세스 최대 RSS, allocated_bytes는 tracemalloc으로 측정한 단계 내 최대
+    할당량이다 (측정하지 않으면 None).
+    """
+
+    name: str
+    rows: int
+    seconds: float
+    peak_rss_bytes: int
+    allocated_bytes: int | None = None
+
+    @property
+    def rows_per_second(self) -> float:
+        if self.seconds <= 0:
+            return 0.0
+        return self.rows / self.seconds
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "rows": self.rows,
+            "seconds": self.seconds,
+            "rows_per_second": self.rows_per_second,
+            "peak_rss_bytes": self.peak_rss_bytes,
+            "allocated_bytes": self.allocated_bytes,
+        }
+
+
+def run_benchmarks(
+    csv_path: str | Path,
+    *,
+    stages: Sequence[str] = STAGES,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    repeat: int = 3,
+    trace_allocations: bool = True,
+) -> list[BenchmarkResult]:
+    """csv_path를 입력으로 stages를 순서대로 측정한다.
+
+    각 단계의 입력(파싱된 배치, 유효 배치, 피처 배치)은 측정 전에 미리 만들어
+    두므로 단계별 시간에는 앞 단계 비용이 섞이지 않는다. 할당량은 시간 측정과
+    별도로 tracemalloc을 켠 채 한 번 더 실행해 측정한다.
+    """
+    unknown = [name for name in stages if name not in STAGES]
+    if unknown:
+        raise ValueError(f"unknown stages: {', '.join(unknown)}")
+    if repeat <= 0:
+        raise ValueError(f"repeat must be positive, got {repeat}")
+
+    csv_path = Path(csv_path)
+    parser = KaggleCsvParser()
+    validator = TransactionValidator()
+    service = KaggleFeatureEngineeringService()
+
+    def parse() -> list[TransactionBatch]:
+        with open(csv_path, "rb") as f:
+            return list(parser.parse_file(f, batch_size=batch_size))
+
+    raw = parse()
+    valid = [validator.validate_batch(batch).valid_batch for batch in raw]
+    features = [service.extract_features_batch(batch) for batch in valid]
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="benchmarks-") as tmp:
+        out = Path(tmp)
+        bodies: dict[str, tuple[Callable[[], object], int]] = {
+            "parse": (parse, _rows(raw)),
+            "validate": (
+                lambda: [validator.validate_batch(batch) for batch in raw],
+                _rows(raw),
+            ),
+            "extract": (
+                lambda: [service.extract_features_batch(batch) for batch in valid],
+                _rows(valid),
+            ),
+            "write_csv": (
+                lambda: LocalFileTransactionRepository().save_features(
+                    _iter_features(features), str(out / "features.csv")
+                ),
+                _rows(features),
+            ),
+            "write_columnar": (
+                lambda: LocalFileTransactionRepository(
+                    feature_format=FEATURE_FORMAT_COLUMNAR
+                ).save_features(_iter_features(features), str(out / "features.col")),
+                _rows(features),
+            ),
+            "end_to_end": (
+                lambda: PipelinedProcessDataUseCase(
+                    LocalFileTransactionRepository(),
+                    service,
+                    LocalFileValidationReportRepository(),
+                    batch_size=batch_size,
+                ).execute(str(csv_path), str(out / "pipeline.csv")),
+                _rows(raw),
+            ),
+        }
+        for name in stages:
+            body, rows = bodies[name]
+            results.append(
+                _measure(name, body, rows, repeat=repeat, trace=trace_allocations)
+            )
+    return results
+
+
+def peak_rss_bytes() -> int:
+    """프로세스 시작 이후 최대 RSS (bytes)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KiB, macOS는 bytes 단위로 보고한다.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _measure(
+    name: str,
+    body: Callable[[], object],
+    rows: int,
+    *,
+    repeat: int,
+    trace: bool,
+) -> BenchmarkResult:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        body()
+        best = min(best, time.perf_counter() - started)
+
+    allocated = None
+    if trace:
+        tracemalloc.start()
+        try:
+            body()
+            allocated = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return BenchmarkResult(
+        name=name,
+        rows=rows,
+        seconds=best,
+        peak_rss_bytes=peak_rss_bytes(),
+        allocated_bytes=allocated,
+    )
+
+
+def _rows(batches: Iterable[TransactionBatch | FeatureBatch]) -> int:
+    return sum(len(batch) for batch in batches)
+
+
+def _iter_features(batches: Iterable[FeatureBatch]):
+    for batch in batches:
+        yield from batch
@@ -1,12 +1,215 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import dataclass, fields, replace
+from dataclasses import field as dataclass_field
 from decimal import Decimal
+from itertools import repeat
+
+import numpy as np
+
+from shared.domain.events import DataProcessingCompleted
+from shared.domain.metrics import StageMetrics
 
 PCA_FEATURES_COUNT = 28
+AMOUNT_DECIMAL_PLACES = 2
+# 거래 속도 피처의 구간 길이(초): 1분, 10분, 1시간.
+VELOCITY_WINDOWS_SECONDS = (60, 600, 3600)
+_CENTS_LIMIT = 2**63
+# 센트 정수로 정확히 표현할 수 없는 금액(NaN, Infinity, 소수점 셋째 자리 이하, int64
+# 범위 밖)을 나타내는 amount_cents 값. decimal_to_cents가 돌려주는 범위 밖의 음수이므로
+# 검증에서 invalid amount가 되며, 행으로 꺼내면 Decimal("NaN")이 된다.
+UNREPRESENTABLE_CENTS = -_CENTS_LIMIT
+_new = object.__new__
+
+
+def format_transaction_id(row_index: int) -> str:
+    """원본 파일의 행 번호로 transaction_id를 만든다."""
+    return f"txn_{row_index:06d}"
+
+
+def cents_to_decimal(cents: int) -> Decimal:
+    """센트 단위 정수 금액을 Decimal로 변환한다. UNREPRESENTABLE_CENTS는 NaN이 된다."""
+    if cents == UNREPRESENTABLE_CENTS:
+        return Decimal("NaN")
+    return Decimal(cents).scaleb(-AMOUNT_DECIMAL_PLACES)
+
+
+def format_cents(cents: int) -> str:
+    """센트 단위 정수 금액을 str(cents_to_decimal(cents))와 같은 문자열로 만든다.
+
+    소수부는 항상 AMOUNT_DECIMAL_PLACES자리다 (150 → "1.50", 0 → "0.00").
+    """
+    if cents == UNREPRESENTABLE_CENTS:
+        return "NaN"
+    whole, fraction = divmod(abs(cents), 10**AMOUNT_DECIMAL_PLACES)
+    sign = "-" if cents < 0 else ""
+    return f"{sign}{whole}.{fraction:0{AMOUNT_DECIMAL_PLACES}d}"
+
+
+def decimal_to_cents(amount: Decimal) -> int | None:
+    """Decimal 금액을 센트 정수(int64 범위)로 변환한다. 정확히 표현할 수 없으면 None."""
+    if not amount.is_finite():
+        return None
+    scaled = amount.scaleb(AMOUNT_DECIMAL_PLACES)
+    if scaled != scaled.to_integral_value():
+        return None
+    cents = int(scaled)
+    if not -_CENTS_LIMIT < cents < _CENTS_LIMIT:
+        return None
+    return cents
 
 
 @dataclass(frozen=True)
+class BatchSource:
+    """배치의 행들이 온 원본 객체(파일, S3 키).
+
+    transaction_id는 `<name>:txn_<객체 안 행 번호>`가 된다. first_row는 객체 첫 행의
+    row_index로, 여러 객체를 이어 row_index를 옮겨도 객체 안 행 번호는 그대로다.
+    """
+
+    name: str
+    first_row: int = 0
+
+    def transaction_id(self, row_index: int) -> str:
+        return f"{self.name}:{format_transaction_id(row_index - self.first_row)}"
+
+    def shifted(self, offset: int) -> BatchSource:
+        return replace(self, first_row=self.first_row + offset)
+
+
+@dataclass(frozen=True, eq=False)
+class RowSources:
+    """행마다 원본이 다른 배치의 행별 원본 (BatchSource 대신 배치의 source에 둔다).
+
+    여러 객체의 행이 섞인 배치(외부 정렬 출력 등)를 원본이 바뀔 때마다 나누지 않고
+    한 배치로 다루기 위한 것이다. sources는 원본 표, codes는 행마다 sources에서의
+    위치다. 행을 고르면 codes도 함께 고르며, 모두 같은 원본이면 그 원본으로 줄인다.
+    """
+
+    sources: tuple[BatchSource | None, ...]
+    codes: np.ndarray
+
+    def __post_init__(self) -> None:
+        if len(self.codes) and not 0 <= self.codes.min() <= self.codes.max() < len(
+            self.sources
+        ):
+            raise ValueError("source codes must index sources")
+
+    @classmethod
+    def of(
+        cls, sources: Sequence[BatchSource | None], codes: np.ndarray
+    ) -> BatchSource | RowSources | None:
+        """행별 원본. codes가 모두 같은 원본을 가리키면(빈 경우 포함) 그 원본 하나."""
+        codes = np.asarray(codes, dtype=np.int32)
+        if not len(codes):
+            return None
+        first = codes[0]
+        if (codes == first).all():
+            return sources[first]
+        return cls(tuple(sources), codes)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, key) -> BatchSource | RowSources | None:
+        """슬라이스/마스크/인덱스 배열로 고른 행의 원본."""
+        return RowSources.of(self.sources, self.codes[key])
+
+    def source_at(self, position: int) -> BatchSource | None:
+        return self.sources[self.codes[position]]
+
+    def shifted(self, offset: int) -> RowSources:
+        sources = tuple(
+            None if source is None else source.shifted(offset) for source in self.sources
+        )
+        return replace(self, sources=sources)
+
+
+def _source_at(source: BatchSource | RowSources | None, position: int) -> BatchSource | None:
+    return source.source_at(position) if isinstance(source, RowSources) else source
+
+
+def _select_source(
+    source: BatchSource | RowSources | None, key
+) -> BatchSource | RowSources | None:
+    return source[key] if isinstance(source, RowSources) else source
+
+
+def _check_source_length(source: BatchSource | RowSources | None, n: int) -> None:
+    if isinstance(source, RowSources) and len(source) != n:
+        raise ValueError("row sources must have one code per row")
+
+
+def encode_row_sources(
+    source: BatchSource | RowSources | None, n: int, table: dict[BatchSource | None, int]
+) -> np.ndarray:
+    """n행 배치의 원본을 table(원본 → 코드, 처음 보는 원본은 추가한다)의 행별 코드로."""
+    if not isinstance(source, RowSources):
+        return np.full(n, table.setdefault(source, len(table)), dtype=np.int32)
+    mapping = np.array(
+        [table.setdefault(member, len(table)) for member in source.sources], dtype=np.int32
+    )
+    return mapping[source.codes]
+
+
+def _concat_sources(
+    sources: Sequence[BatchSource | RowSources | None], lengths: Sequence[int]
+) -> BatchSource | RowSources | None:
+    """배치들의 원본을 이어 붙인다. 모두 같은 원본이면 그 원본이다."""
+    table: dict[BatchSource | None, int] = {}
+    codes = [encode_row_sources(source, n, table) for source, n in zip(sources, lengths)]
+    if len(table) == 1:
+        return next(iter(table))
+    return RowSources.of(tuple(table), np.concatenate(codes))
+
+
+def _format_transaction_ids(
+    source: BatchSource | RowSources | None, row_index: np.ndarray
+) -> Iterator[str]:
+    if isinstance(source, RowSources):
+        ids = np.empty(len(row_index), dtype=object)
+        for code, member in enumerate(source.sources):
+            positions = np.flatnonzero(source.codes == code)
+            if len(positions):
+                ids[positions] = list(_format_transaction_ids(member, row_index[positions]))
+        return iter(ids.tolist())
+    rows = row_index.tolist()
+    if source is None:
+        return map(format_transaction_id, rows)
+    return map(source.transaction_id, rows)
+
+
+def _transaction_id(source: BatchSource | RowSources | None, position: int, row: int) -> str:
+    source = _source_at(source, position)
+    if source is None:
+        return format_transaction_id(row)
+    return source.transaction_id(row)
+
+
+def _unpack_bools(packed: np.ndarray, count: int) -> np.ndarray:
+    return np.unpackbits(packed, count=count).view(np.bool_)
+
+
+def _packed_bit(packed: np.ndarray, position: int) -> bool:
+    return bool(packed[position >> 3] >> (7 - (position & 7)) & 1)
+
+
+def _normalize_position(position: int, size: int) -> int:
+    if not -size <= position < size:
+        raise IndexError(f"batch index {position} out of range for size {size}")
+    return position % size
+
+
+def _slot_setters(cls: type) -> tuple[Callable[[object, object], None], ...]:
+    """필드 순서대로 slot 디스크립터의 __set__을 모은다.
+
+    _trusted 생성 경로용으로, frozen dataclass의 __setattr__을 거치지 않고 값을 넣는다.
+    """
+    return tuple(cls.__dict__[field.name].__set__ for field in fields(cls))
+
+
+@dataclass(frozen=True, slots=True)
 class RawTransaction:
     """Kaggle Credit Card Fraud Detection 원본 거래 데이터."""
 
@@ -22,13 +225,456 @@ class RawTransaction:
                 "pca_features must have 28 elements, "
                 f"got {len(self.pca_features)}"
             )
-        if self.time_seconds < 0:
-            raise ValueError("time_seconds must be non-negative")
+        _check_time_seconds(self.time_seconds)
+
+    @classmethod
+    def _trusted(
+        cls,
+        transaction_id: str,
+        time_seconds: float,
+        amount: Decimal,
+        is_fraud: bool,
+        pca_features: tuple[float, ...],
+    ) -> RawTransaction:
+        """__post_init__ 검사 없이 만든다. 호출하는 쪽이 조건을 보장해야 한다."""
+        txn = _new(cls)
+        set_id, set_time, set_amount, set_fraud, set_pca = _RAW_TRANSACTION_SETTERS
+        set_id(txn, transaction_id)
+        set_time(txn, time_seconds)
+        set_amount(txn, amount)
+        set_fraud(txn, is_fraud)
+        set_pca(txn, pca_features)
+        return txn
+
+
+_RAW_TRANSACTION_SETTERS = _slot_setters(RawTransaction)
+
+
+def _check_time_seconds(time_seconds: float) -> None:
+    if time_seconds < 0:
+        raise ValueError("time_seconds must be non-negative")
+
+
+class DeferredColumns:
+    """필요할 때 한 번만 디코딩하는 (행 수, width) float64 열. np.ndarray 대신 쓴다.
+
+    decode는 원본 행 위치 배열을 받아 그 행들의 값을 돌려준다. 행 선택(슬라이스,
+    bool 마스크, 인덱스 배열)은 디코딩하지 않고 위치만 고르며, 그 밖의 접근
+    (np.asarray, 원소 인덱싱, 산술 연산)은 전체를 디코딩해 결과를 보관한다.
+    decode가 예외를 발생시키면 접근한 쪽으로 그대로 전파된다.
+    """
+
+    __slots__ = ("_positions", "_width", "_decode", "_values")
+
+    def __init__(
+        self,
+        positions: np.ndarray,
+        width: int,
+        decode: Callable[[np.ndarray], np.ndarray],
+    ) -> None:
+        self._positions = np.asarray(positions, dtype=np.int64)
+        self._width = width
+        self._decode = decode
+        self._values: np.ndarray | None = None
+
+    @classmethod
+    def wrap(cls, values: np.ndarray) -> DeferredColumns:
+        """이미 디코딩된 배열을 DeferredColumns로 감싼다. 아직 읽지 않은 것으로 취급한다."""
+        values = np.asarray(values, dtype=np.float64)
+        return cls(np.arange(len(values)), values.shape[1], _ArrayDecoder(values))
+
+    @classmethod
+    def concat(cls, parts: Sequence[np.ndarray | DeferredColumns]) -> DeferredColumns:
+        """여러 열을 디코딩하지 않고 이어 붙인다. np.ndarray는 wrap해서 잇는다."""
+        deferred = [
+            part if isinstance(part, DeferredColumns) else cls.wrap(part) for part in parts
+        ]
+        total = sum(len(part) for part in deferred)
+        return cls(np.arange(total), deferred[0]._width, _ConcatDecoder(deferred))
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return (len(self._positions), self._width)
+
+    @property
+    def ndim(self) -> int:
+        return 2
+
+    @property
+    def dtype(self) -> np.dtype:
+        return np.dtype(np.float64)
+
+    @property
+    def nbytes(self) -> int:
+        """디코딩했을 때의 바이트 수."""
+        return len(self._positions) * self._width * self.dtype.itemsize
+
+    @property
+    def loaded(self) -> bool:
+        """이미 디코딩했는지 여부."""
+        return self._values is not None
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def decode(self) -> np.ndarray:
+        """전체를 디코딩한다. 결과는 보관했다가 다음 접근에 재사용한다."""
+        if self._values is None:
+            values = np.asarray(self._decode(self._positions), dtype=np.float64)
+            self._values = values.reshape(self.shape)
+        return self._values
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        values = self.decode()
+        if dtype is not None and np.dtype(dtype) != values.dtype:
+            return values.astype(dtype)
+        return values.copy() if copy else values
+
+    def __getitem__(self, key):
+        if self._values is not None:
+            return self._values[key]
+        if isinstance(key, slice) or (
+            isinstance(key, np.ndarray) and key.ndim == 1 and key.dtype.kind in "bi"
+        ):
+            return DeferredColumns(self._positions[key], self._width, self._decode)
+        return self.decode()[key]
+
+    def with_row_offset(self, offset: int) -> DeferredColumns:
+        """디코딩에서 발생하는 RowParseError의 행 번호를 offset만큼 옮긴 같은 열."""
+        if offset == 0 or self._values is not None:
+            return self
+        return DeferredColumns(
+            self._positions, self._width, _RowOffsetDecoder(self._decode, offset)
+        )
+
+    def _decode_positions(self, positions: np.ndarray) -> np.ndarray:
+        """이 열 안의 위치(0부터)에 해당하는 행을 디코딩한다."""
+        if self._values is not None:
+            return self._values[positions]
+        return self._decode(self._positions[positions])
+
+
+class _ArrayDecoder:
+    def __init__(self, values: np.ndarray) -> None:
+        self._values = values
+
+    def __call__(self, positions: np.ndarray) -> np.ndarray:
+        return self._values[positions]
+
+
+class _RowOffsetDecoder:
+    def __init__(self, decode: Callable[[np.ndarray], np.ndarray], offset: int) -> None:
+        self._decode = decode
+        self._offset = offset
+
+    def __call__(self, positions: np.ndarray) -> np.ndarray:
+        try:
+            return self._decode(positions)
+        except RowParseError as error:
+            raise error.with_row_offset(self._offset) from error
+
+
+class _ConcatDecoder:
+    def __init__(self, parts: list[DeferredColumns]) -> None:
+        self._parts = parts
+        self._bounds = np.cumsum([0, *(len(part) for part in parts)])
+
+    def __call__(self, positions: np.ndarray) -> np.ndarray:
+        values = np.empty((len(positions), self._parts[0].shape[1]), dtype=np.float64)
+        owner = np.searchsorted(self._bounds, positions, side="right") - 1
+        for index, part in enumerate(self._parts):
+            selected = owner == index
+            if selected.any():
+                values[selected] = part._decode_positions(
+                    positions[selected] - self._bounds[index]
+                )
+        return values
+
+
+@dataclass(frozen=True, eq=False)
+class TransactionBatch:
+    """RawTransaction N건을 연속 배열로 보관하는 컨테이너.
+
+    is_fraud는 np.packbits로 8건당 1바이트에 저장하고, transaction_id는
+    row_index로부터 필요할 때만 만든다. 인덱싱/순회하면 RawTransaction을
+    그때그때 생성해 돌려준다.
+
+    parse_errors는 관용 파싱 모드에서 변환에 실패해 열에서 빠진 원본 행의 오류다.
+    인덱싱으로 만든 하위 배치에는 포함되지 않는다.
+    source가 있으면 transaction_id를 원본 객체 이름으로 구분한다 (BatchSource 참고).
+    행마다 원본이 다르면 source는 RowSources다.
+    pca_features는 파서가 PCA 열을 읽지 않았으면 DeferredColumns이며, 하위 배치와
+    concat은 이를 디코딩하지 않고 유지한다.
+    """
+
+    row_index: np.ndarray
+    time_seconds: np.ndarray
+    amount_cents: np.ndarray
+    is_fraud_packed: np.ndarray
+    pca_features: np.ndarray | DeferredColumns
+    parse_errors: tuple[ValidationError, ...] = ()
+    source: BatchSource | RowSources | None = None
+
+    def __post_init__(self) -> None:
+        n = len(self.row_index)
+        if len(self.time_seconds) != n or len(self.amount_cents) != n:
+            raise ValueError("all columns must have the same length")
+        _check_source_length(self.source, n)
+        if self.pca_features.shape != (n, PCA_FEATURES_COUNT):
+            raise ValueError(
+                f"pca_features must have shape ({n}, {PCA_FEATURES_COUNT}), "
+                f"got {self.pca_features.shape}"
+            )
+        if len(self.is_fraud_packed) != (n + 7) // 8:
+            raise ValueError("is_fraud_packed length does not match row count")
+
+    @classmethod
+    def from_columns(
+        cls,
+        *,
+        row_index: np.ndarray,
+        time_seconds: np.ndarray,
+        amount_cents: np.ndarray,
+        is_fraud: np.ndarray,
+        pca_features: np.ndarray | DeferredColumns,
+        parse_errors: tuple[ValidationError, ...] = (),
+        source: BatchSource | RowSources | None = None,
+    ) -> TransactionBatch:
+        """bool 배열 is_fraud를 비트 단위로 압축해 배치를 만든다."""
+        if not isinstance(pca_features, DeferredColumns):
+            pca_features = np.asarray(pca_features, dtype=np.float64)
+        return cls(
+            row_index=np.asarray(row_index, dtype=np.int64),
+            time_seconds=np.asarray(time_seconds, dtype=np.float64),
+            amount_cents=np.asarray(amount_cents, dtype=np.int64),
+            is_fraud_packed=np.packbits(np.asarray(is_fraud, dtype=np.bool_)),
+            pca_features=pca_features,
+            parse_errors=parse_errors,
+            source=source,
+        )
+
+    @classmethod
+    def from_transactions(
+        cls,
+        transactions: Sequence[RawTransaction],
+        *,
+        start_index: int = 0,
+    ) -> TransactionBatch:
+        """RawTransaction들을 배치로 만든다. row_index는 start_index부터 매긴다.
+
+        transaction_id는 보관하지 않고 row_index로 다시 만든다 (format_transaction_id).
+        센트로 표현할 수 없는 금액(decimal_to_cents가 None)은 UNREPRESENTABLE_CENTS가
+        되며, 검증기는 행 단위 검증과 같은 규칙으로 이 행을 invalid amount로 보고한다.
+        """
+        n = len(transactions)
+        if n == 0:
+            return cls.empty()
+        amount_cents = [decimal_to_cents(txn.amount) for txn in transactions]
+        return cls.from_columns(
+            row_index=np.arange(start_index, start_index + n, dtype=np.int64),
+            time_seconds=np.array([txn.time_seconds for txn in transactions], dtype=np.float64),
+            amount_cents=np.array(
+                [UNREPRESENTABLE_CENTS if cents is None else cents for cents in amount_cents],
+                dtype=np.int64,
+            ),
+            is_fraud=np.array([txn.is_fraud for txn in transactions], dtype=np.bool_),
+            pca_features=np.array(
+                [txn.pca_features for txn in transactions], dtype=np.float64
+            ).reshape(n, PCA_FEATURES_COUNT),
+        )
+
+    @classmethod
+    def empty(cls) -> TransactionBatch:
+        return cls.from_columns(
+            row_index=np.empty(0, dtype=np.int64),
+            time_seconds=np.empty(0, dtype=np.float64),
+            amount_cents=np.empty(0, dtype=np.int64),
+            is_fraud=np.empty(0, dtype=np.bool_),
+            pca_features=np.empty((0, PCA_FEATURES_COUNT), dtype=np.float64),
+        )
+
+    @classmethod
+    def concat(cls, batches: Sequence[TransactionBatch]) -> TransactionBatch:
+        """배치들을 이어 붙인다. source가 서로 다르면 RowSources로 합친다."""
+        if not batches:
+            return cls.empty()
+        return cls.from_columns(
+            row_index=np.concatenate([b.row_index for b in batches]),
+            time_seconds=np.concatenate([b.time_seconds for b in batches]),
+            amount_cents=np.concatenate([b.amount_cents for b in batches]),
+            is_fraud=np.concatenate([b.is_fraud for b in batches]),
+            pca_features=_concat_pca([b.pca_features for b in batches]),
+            parse_errors=tuple(error for b in batches for error in b.parse_errors),
+            source=_concat_sources([b.source for b in batches], [len(b) for b in batches]),
+        )
+
+    def __len__(self) -> int:
+        return len(self.row_index)
+
+    @property
+    def record_count(self) -> int:
+        """파싱에 실패한 행까지 포함한 원본 행 수."""
+        return len(self.row_index) + len(self.parse_errors)
+
+    @property
+    def is_fraud(self) -> np.ndarray:
+        """압축을 푼 bool 배열."""
+        return _unpack_bools(self.is_fraud_packed, len(self))
+
+    def transaction_id(self, position: int) -> str:
+        return _transaction_id(self.source, position, int(self.row_index[position]))
+
+    def transaction_ids(self) -> Iterator[str]:
+        return _format_transaction_ids(self.source, self.row_index)
+
+    def with_row_offset(self, offset: int) -> TransactionBatch:
+        """row_index에 offset을 더한 배치. 나머지 열은 복사하지 않고 공유한다.
+
+        source도 함께 옮기므로 transaction_id는 바뀌지 않는다. 아직 디코딩하지 않은
+        pca_features에서 나중에 발생하는 RowParseError도 같은 만큼 행 번호를 옮긴다.
+        """
+        pca_features = self.pca_features
+        if isinstance(pca_features, DeferredColumns):
+            pca_features = pca_features.with_row_offset(offset)
+        return replace(
+            self,
+            row_index=self.row_index + offset,
+            pca_features=pca_features,
+            source=None if self.source is None else self.source.shifted(offset),
+            parse_errors=tuple(
+                replace(error, record_index=error.record_index + offset)
+                for error in self.parse_errors
+            ),
+        )
+
+    def __getitem__(self, key):
+        """정수는 RawTransaction, 슬라이스/마스크/인덱스 배열은 하위 배치를 반환한다."""
+        if isinstance(key, (int, np.integer)):
+            return self._transaction_at(int(key))
+        return TransactionBatch.from_columns(
+            row_index=self.row_index[key],
+            time_seconds=self.time_seconds[key],
+            amount_cents=self.amount_cents[key],
+            is_fraud=self.is_fraud[key],
+            pca_features=self.pca_features[key],
+            source=_select_source(self.source, key),
+        )
+
+    def __iter__(self) -> Iterator[RawTransaction]:
+        # 열을 한꺼번에 파이썬 값으로 바꾼다. pca_features 길이는 __post_init__의
+        # 모양 검사가 보장하므로 시간만 행마다 검사한다.
+        rows = zip(
+            self.transaction_ids(),
+            self.time_seconds.tolist(),
+            map(cents_to_decimal, self.amount_cents.tolist()),
+            self.is_fraud.tolist(),
+            map(tuple, np.asarray(self.pca_features).tolist()),
+        )
+        for transaction_id, time_seconds, amount, is_fraud, pca_features in rows:
+            _check_time_seconds(time_seconds)
+            yield RawTransaction._trusted(
+                transaction_id, time_seconds, amount, is_fraud, pca_features
+            )
+
+    def _transaction_at(self, position: int) -> RawTransaction:
+        position = _normalize_position(position, len(self))
+        time_seconds = float(self.time_seconds[position])
+        _check_time_seconds(time_seconds)
+        return RawTransaction._trusted(
+            self.transaction_id(position),
+            time_seconds,
+            cents_to_decimal(int(self.amount_cents[position])),
+            _packed_bit(self.is_fraud_packed, position),
+            tuple(self.pca_features[position].tolist()),
+        )
+
+
+def _concat_pca(parts: list[np.ndarray | DeferredColumns]) -> np.ndarray | DeferredColumns:
+    """하나라도 아직 디코딩하지 않은 열이면 DeferredColumns로 잇는다."""
+    if any(isinstance(part, DeferredColumns) and not part.loaded for part in parts):
+        return DeferredColumns.concat(parts)
+    return np.concatenate([np.asarray(part) for part in parts])
 
 
 @dataclass(frozen=True)
+class VelocityFeatures:
+    """time_seconds 순서 거래 스트림에서 계산한 거래 속도 피처.
+
+    window_* 튜플은 VELOCITY_WINDOWS_SECONDS 순서로, (t - 구간, t] 안의 거래
+    (현재 거래 포함) 건수, 금액 합계, 최대 금액이다. fraud_rate_to_date는 현재
+    거래보다 앞선 거래만으로 계산한 사기 비율이며, 앞선 거래가 없으면 0.0이다.
+    """
+
+    window_counts: tuple[int, ...]
+    window_amount_sums: tuple[Decimal, ...]
+    window_amount_maxes: tuple[Decimal, ...]
+    fraud_rate_to_date: float
+
+    def __post_init__(self) -> None:
+        windows = len(VELOCITY_WINDOWS_SECONDS)
+        if not (
+            len(self.window_counts)
+            == len(self.window_amount_sums)
+            == len(self.window_amount_maxes)
+            == windows
+        ):
+            raise ValueError(f"velocity features must have {windows} windows")
+        if not 0.0 <= self.fraud_rate_to_date <= 1.0:
+            raise ValueError(
+                f"fraud_rate_to_date must be between 0 and 1, got {self.fraud_rate_to_date}"
+            )
+
+
+@dataclass(frozen=True, eq=False)
+class VelocityColumns:
+    """VelocityFeatures N건을 열 단위 배열로 보관하는 컨테이너.
+
+    window_* 배열은 (N, 구간 수) 모양이고 금액은 센트 단위 정수다.
+    """
+
+    window_counts: np.ndarray
+    window_amount_sums_cents: np.ndarray
+    window_amount_maxes_cents: np.ndarray
+    fraud_rate_to_date: np.ndarray
+
+    def __post_init__(self) -> None:
+        shape = (len(self.fraud_rate_to_date), len(VELOCITY_WINDOWS_SECONDS))
+        windows = (
+            self.window_counts,
+            self.window_amount_sums_cents,
+            self.window_amount_maxes_cents,
+        )
+        if any(column.shape != shape for column in windows):
+            raise ValueError(f"window columns must have shape {shape}")
+
+    def __len__(self) -> int:
+        return len(self.fraud_rate_to_date)
+
+    def __getitem__(self, key) -> VelocityColumns:
+        """슬라이스/마스크/인덱스 배열로 고른 하위 열."""
+        return VelocityColumns(
+            window_counts=self.window_counts[key],
+            window_amount_sums_cents=self.window_amount_sums_cents[key],
+            window_amount_maxes_cents=self.window_amount_maxes_cents[key],
+            fraud_rate_to_date=self.fraud_rate_to_date[key],
+        )
+
+    def at(self, position: int) -> VelocityFeatures:
+        return VelocityFeatures(
+            window_counts=tuple(self.window_counts[position].tolist()),
+            window_amount_sums=tuple(
+                map(cents_to_decimal, self.window_amount_sums_cents[position].tolist())
+            ),
+            window_amount_maxes=tuple(
+                map(cents_to_decimal, self.window_amount_maxes_cents[position].tolist())
+            ),
+            fraud_rate_to_date=float(self.fraud_rate_to_date[position]),
+        )
+
+
+@dataclass(frozen=True, slots=True)
 class Feature:
-    """엔지니어링된 피처."""
+    """엔지니어링된 피처. velocity는 속도 피처를 계산한 경우에만 있다."""
 
     transaction_id: str
     amount: Decimal
@@ -36,6 +682,7 @@ class Feature:
     day_of_week: int
     amount_bin: str
     is_fraud: bool
+    velocity: VelocityFeatures | None = None
 
     def __post_init__(self) -> None:
         if not (0 <= self.hour_of_day <= 23):
@@ -43,11 +690,223 @@ class Feature:
         if not (0 <= self.day_of_week <= 6):
             raise ValueError(f"day_of_week must be 0-6, got {self.day_of_week}")
 
+    @classmethod
+    def _trusted(
+        cls,
+        transaction_id: str,
+        amount: Decimal,
+        hour_of_day: int,
+        day_of_week: int,
+        amount_bin: str,
+        is_fraud: bool,
+        velocity: VelocityFeatures | None,
+    ) -> Feature:
+        """__post_init__ 검사 없이 만든다. 호출하는 쪽이 조건을 보장해야 한다."""
+        feature = _new(cls)
+        set_id, set_amount, set_hour, set_day, set_bin, set_fraud, set_velocity = (
+            _FEATURE_SETTERS
+        )
+        set_id(feature, transaction_id)
+        set_amount(feature, amount)
+        set_hour(feature, hour_of_day)
+        set_day(feature, day_of_week)
+        set_bin(feature, amount_bin)
+        set_fraud(feature, is_fraud)
+        set_velocity(feature, velocity)
+        return feature
+
     @property
     def is_weekend(self) -> bool:
         return self.day_of_week in (5, 6)
 
 
+_FEATURE_SETTERS = _slot_setters(Feature)
+
+
+@dataclass(frozen=True, eq=False)
+class FeatureBatch:
+    """Feature N건을 열 단위 배열로 보관하는 컨테이너.
+
+    amount_bin은 amount_bin_labels에 대한 코드(uint8)로, is_fraud는 비트 단위로
+    압축해 저장한다. 인덱싱/순회하면 Feature를 그때그때 생성해 돌려준다.
+    source는 원본 TransactionBatch의 source를 따른다.
+    """
+
+    row_index: np.ndarray
+    amount_cents: np.ndarray
+    hour_of_day: np.ndarray
+    day_of_week: np.ndarray
+    amount_bin_codes: np.ndarray
+    amount_bin_labels: tuple[str, ...]
+    is_fraud_packed: np.ndarray
+    velocity: VelocityColumns | None = None
+    source: BatchSource | RowSources | None = None
+
+    def __post_init__(self) -> None:
+        n = len(self.row_index)
+        _check_source_length(self.source, n)
+        columns = (self.amount_cents, self.hour_of_day, self.day_of_week, self.amount_bin_codes)
+        if any(len(column) != n for column in columns) or (
+            self.velocity is not None and len(self.velocity) != n
+        ):
+            raise ValueError("all columns must have the same length")
+        if len(self.is_fraud_packed) != (n + 7) // 8:
+            raise ValueError("is_fraud_packed length does not match row count")
+        if n and not (0 <= self.hour_of_day.min() and self.hour_of_day.max() <= 23):
+            raise ValueError("hour_of_day must be 0-23")
+        if n and not (0 <= self.day_of_week.min() and self.day_of_week.max() <= 6):
+            raise ValueError("day_of_week must be 0-6")
+
+    @classmethod
+    def from_columns(
+        cls,
+        *,
+        row_index: np.ndarray,
+        amount_cents: np.ndarray,
+        hour_of_day: np.ndarray,
+        day_of_week: np.ndarray,
+        amount_bin_codes: np.ndarray,
+        amount_bin_labels: tuple[str, ...],
+        is_fraud: np.ndarray,
+        velocity: VelocityColumns | None = None,
+        source: BatchSource | RowSources | None = None,
+    ) -> FeatureBatch:
+        """bool 배열 is_fraud를 비트 단위로 압축해 배치를 만든다."""
+        return cls(
+            row_index=np.asarray(row_index, dtype=np.int64),
+            amount_cents=np.asarray(amount_cents, dtype=np.int64),
+            hour_of_day=np.asarray(hour_of_day, dtype=np.int8),
+            day_of_week=np.asarray(day_of_week, dtype=np.int8),
+            amount_bin_codes=np.asarray(amount_bin_codes, dtype=np.uint8),
+            amount_bin_labels=tuple(amount_bin_labels),
+            is_fraud_packed=np.packbits(np.asarray(is_fraud, dtype=np.bool_)),
+            velocity=velocity,
+            source=source,
+        )
+
+    @classmethod
+    def from_features(
+        cls,
+        features: Sequence[Feature],
+        *,
+        row_index: np.ndarray,
+        source: BatchSource | RowSources | None = None,
+    ) -> FeatureBatch:
+        """Feature들을 row_index 순서대로 배치로 만든다.
+
+        transaction_id는 보관하지 않고 row_index와 source로 다시 만든다.
+        amount_bin_labels는 처음 나온 순서이며, velocity는 모든 Feature에 있거나
+        모두 없어야 한다. 센트로 표현할 수 없는 금액은 UNREPRESENTABLE_CENTS가 된다.
+        """
+        if len(features) != len(row_index):
+            raise ValueError(f"got {len(features)} features for {len(row_index)} rows")
+        labels = {feature.amount_bin: None for feature in features}
+        codes = {label: code for code, label in enumerate(labels)}
+        amount_cents = [decimal_to_cents(feature.amount) for feature in features]
+        return cls.from_columns(
+            row_index=row_index,
+            amount_cents=np.array(
+                [UNREPRESENTABLE_CENTS if cents is None else cents for cents in amount_cents],
+                dtype=np.int64,
+            ),
+            hour_of_day=np.array([f.hour_of_day for f in features], dtype=np.int8),
+            day_of_week=np.array([f.day_of_week for f in features], dtype=np.int8),
+            amount_bin_codes=np.array(
+                [codes[feature.amount_bin] for feature in features], dtype=np.uint8
+            ),
+            amount_bin_labels=tuple(labels),
+            is_fraud=np.array([feature.is_fraud for feature in features], dtype=np.bool_),
+            velocity=_velocity_columns([feature.velocity for feature in features]),
+            source=source,
+        )
+
+    def __len__(self) -> int:
+        return len(self.row_index)
+
+    @property
+    def is_fraud(self) -> np.ndarray:
+        """압축을 푼 bool 배열."""
+        return _unpack_bools(self.is_fraud_packed, len(self))
+
+    @property
+    def is_weekend(self) -> np.ndarray:
+        return self.day_of_week >= 5
+
+    def transaction_id(self, position: int) -> str:
+        return _transaction_id(self.source, position, int(self.row_index[position]))
+
+    def transaction_ids(self) -> Iterator[str]:
+        return _format_transaction_ids(self.source, self.row_index)
+
+    def __getitem__(self, key):
+        """정수는 Feature, 슬라이스/마스크/인덱스 배열은 하위 배치를 반환한다."""
+        if isinstance(key, (int, np.integer)):
+            return self._feature_at(int(key))
+        return FeatureBatch.from_columns(
+            row_index=self.row_index[key],
+            amount_cents=self.amount_cents[key],
+            hour_of_day=self.hour_of_day[key],
+            day_of_week=self.day_of_week[key],
+            amount_bin_codes=self.amount_bin_codes[key],
+            amount_bin_labels=self.amount_bin_labels,
+            is_fraud=self.is_fraud[key],
+            velocity=None if self.velocity is None else self.velocity[key],
+            source=_select_source(self.source, key),
+        )
+
+    def __iter__(self) -> Iterator[Feature]:
+        # 열을 한꺼번에 파이썬 값으로 바꾼다. 시간 범위는 __post_init__이 검사했다.
+        labels = self.amount_bin_labels
+        velocity = self.velocity
+        rows = zip(
+            self.transaction_ids(),
+            map(cents_to_decimal, self.amount_cents.tolist()),
+            self.hour_of_day.tolist(),
+            self.day_of_week.tolist(),
+            [labels[code] for code in self.amount_bin_codes.tolist()],
+            self.is_fraud.tolist(),
+        )
+        for position, row in enumerate(rows):
+            yield Feature._trusted(*row, None if velocity is None else velocity.at(position))
+
+    def _feature_at(self, position: int) -> Feature:
+        position = _normalize_position(position, len(self))
+        return Feature._trusted(
+            self.transaction_id(position),
+            cents_to_decimal(int(self.amount_cents[position])),
+            int(self.hour_of_day[position]),
+            int(self.day_of_week[position]),
+            self.amount_bin_labels[self.amount_bin_codes[position]],
+            _packed_bit(self.is_fraud_packed, position),
+            None if self.velocity is None else self.velocity.at(position),
+        )
+
+
+def _velocity_columns(velocities: list[VelocityFeatures | None]) -> VelocityColumns | None:
+    """VelocityFeatures 목록을 열로 모은다. 모두 None이면 None."""
+    present = [velocity for velocity in velocities if velocity is not None]
+    if not present:
+        return None
+    if len(present) != len(velocities):
+        raise ValueError("velocity must be present on all features or none")
+    n_windows = len(VELOCITY_WINDOWS_SECONDS)
+
+    def cents(amounts: Iterator[Decimal]) -> np.ndarray:
+        values = [decimal_to_cents(amount) for amount in amounts]
+        if None in values:
+            raise ValueError("velocity amounts must be representable in cents")
+        return np.array(values, dtype=np.int64).reshape(len(present), n_windows)
+
+    return VelocityColumns(
+        window_counts=np.array(
+            [v.window_counts for v in present], dtype=np.int64
+        ).reshape(len(present), n_windows),
+        window_amount_sums_cents=cents(a for v in present for a in v.window_amount_sums),
+        window_amount_maxes_cents=cents(a for v in present for a in v.window_amount_maxes),
+        fraud_rate_to_date=np.array([v.fraud_rate_to_date for v in present], dtype=np.float64),
+    )
+
+
 @dataclass(frozen=True)
 class ProcessDataResult:
     """데이터 처리 결과."""
@@ -56,6 +915,76 @@ class ProcessDataResult:
     valid_records: int
     features_path: str
     validation_report_path: str
+    stage_metrics: tuple[StageMetrics, ...] = ()
+
+    def to_event(self) -> DataProcessingCompleted:
+        """처리 완료 이벤트로 변환한다."""
+        return DataProcessingCompleted(
+            total_records=self.total_records,
+            valid_records=self.valid_records,
+            features_path=self.features_path,
+            stage_metrics=self.stage_metrics,
+        )
+
+
+@dataclass(frozen=True)
+class SourceState:
+    """원본 객체의 현재 크기와 버전 식별자(S3 ETag). 로컬 파일은 etag가 None이다."""
+
+    size: int
+    etag: str | None = None
+
+
+@dataclass(frozen=True)
+class SourceWatermark:
+    """증분 처리에서 원본의 어디까지 처리했는지 기록한 manifest.
+
+    byte_offset은 처리한 마지막 완전한 줄의 끝, record_count는 그때까지 처리한
+    원본 행 수(= 다음 행의 row_index)다. features_size는 그 행들의 피처를 쓴 뒤의
+    피처 파일 크기로, 다음 실행은 이 크기 뒤에 덧붙인다. checksum은 check_bytes
+    규칙으로 [0, byte_offset) 구간에서 계산하며, 원본 앞부분이 바뀌었는지 확인하는
+    데 쓴다.
+    """
+
+    source: str
+    source_size: int
+    source_etag: str | None
+    byte_offset: int
+    record_count: int
+    valid_records: int
+    features_size: int
+    columns: tuple[str, ...]
+    check_bytes: int | None
+    checksum: str
+
+    def __post_init__(self) -> None:
+        if not 0 <= self.byte_offset <= self.source_size:
+            raise ValueError("byte_offset must be between 0 and source_size")
+        if not 0 <= self.valid_records <= self.record_count:
+            raise ValueError("valid_records must be between 0 and record_count")
+        if self.features_size < 0:
+            raise ValueError("features_size must be non-negative")
+
+
+class RowParseError(ValueError):
+    """원본 행 하나를 변환하지 못한 오류. 메시지는 "Row <row_index>: <reason>"이다.
+
+    행 번호를 속성으로 가지므로, shard 안의 행 번호로 발생한 오류를
+    with_row_offset으로 파일 전체 기준 행 번호로 옮길 수 있다.
+    """
+
+    def __init__(self, row_index: int, reason: str) -> None:
+        super().__init__(f"Row {row_index}: {reason}")
+        self.row_index = row_index
+        self.reason = reason
+
+    def __reduce__(self):
+        # 다른 프로세스로 보낼 때 메시지가 아니라 생성자 인자로 다시 만든다.
+        return type(self), (self.row_index, self.reason)
+
+    def with_row_offset(self, offset: int) -> RowParseError:
+        """row_index에 offset을 더한 같은 오류."""
+        return RowParseError(self.row_index + offset, self.reason)
 
 
 @dataclass(frozen=True)
@@ -67,29 +996,207 @@ class ValidationError:
     record_index: int
 
 
+class ChainedErrors(Sequence[ValidationError]):
+    """여러 오류 시퀀스를 복사 없이 이어 붙인 뷰.
+
+    offsets가 주어지면 구간마다 record_index에 해당 값을 더해 보여준다.
+    ChainedErrors를 다시 이어 붙이면 안쪽 구간을 펼쳐 한 단계로 유지한다.
+    """
+
+    def __init__(
+        self,
+        segments: Sequence[Sequence[ValidationError]],
+        offsets: Sequence[int] | None = None,
+    ) -> None:
+        self._segments: list[Sequence[ValidationError]] = []
+        self._offsets: list[int] = []
+        for segment, offset in zip(segments, repeat(0) if offsets is None else offsets):
+            if isinstance(segment, ChainedErrors):
+                self._segments.extend(segment._segments)
+                self._offsets.extend(inner + offset for inner in segment._offsets)
+            elif len(segment):
+                self._segments.append(segment)
+                self._offsets.append(offset)
+        self._length = sum(len(segment) for segment in self._segments)
+        self._materialized: tuple[ValidationError, ...] | None = None
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[ValidationError]:
+        for segment, offset in zip(self._segments, self._offsets):
+            if offset == 0:
+                yield from segment
+            else:
+                for error in segment:
+                    yield ValidationError(error.field, error.message, error.record_index + offset)
+
+    def __getitem__(self, key):
+        if self._materialized is None:
+            self._materialized = tuple(self)
+        return self._materialized[key]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __hash__(self) -> int:
+        # 같은 오류를 담은 tuple과 같다고 비교되므로 해시도 tuple과 같게 한다.
+        return hash(self[:])
+
+    def __repr__(self) -> str:
+        return f"ChainedErrors(len={self._length})"
+
+
+@dataclass(frozen=True)
+class ErrorKindSummary:
+    """(field, message) 종류별 오류 건수와 예시 행 번호 표본.
+
+    표본은 오류마다 균등 난수 키를 붙여 키가 가장 작은 max_samples개를 남긴
+    bottom-k 표본이다. sample_keys는 sample_record_indices와 같은 순서의 키로,
+    ValidationReport.merge가 두 표본을 합쳐 다시 max_samples개로 줄이는 데 쓴다.
+    키와 상한은 표본을 합치기 위한 상태이므로 비교에서 제외한다.
+    """
+
+    field: str
+    message: str
+    count: int
+    sample_record_indices: tuple[int, ...]
+    sample_keys: tuple[float, ...] = dataclass_field(default=(), compare=False, repr=False)
+    max_samples: int | None = dataclass_field(default=None, compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.count < len(self.sample_record_indices):
+            raise ValueError("count cannot be smaller than the number of samples")
+        if self.sample_keys and len(self.sample_keys) != len(self.sample_record_indices):
+            raise ValueError("sample_keys must match sample_record_indices")
+        if self.max_samples is not None and len(self.sample_record_indices) > self.max_samples:
+            raise ValueError("cannot have more samples than max_samples")
+
+
 @dataclass(frozen=True)
 class ValidationReport:
-    """데이터 검증 결과."""
+    """데이터 검증 결과.
+
+    error_summary가 있으면 집계 모드다. 건수는 error_summary가 정확히 보관하고,
+    errors에는 표본으로 남긴 오류만 들어 있다.
+    """
 
     total_records: int
-    errors: tuple[ValidationError, ...]
+    errors: Sequence[ValidationError]
+    error_summary: tuple[ErrorKindSummary, ...] | None = None
 
     def __post_init__(self) -> None:
         if self.total_records < 0:
             raise ValueError("total_records must be non-negative")
-        if self.total_records == 0 and len(self.errors) > 0:
+        if self.total_records == 0 and self.error_count > 0:
             raise ValueError("errors cannot exist when total_records is 0")
 
+    @classmethod
+    def aggregated(
+        cls, total_records: int, error_summary: tuple[ErrorKindSummary, ...]
+    ) -> ValidationReport:
+        """집계 리포트. errors는 표본 행의 오류를 (행 번호, 종류 순서)로 정렬해 만든다."""
+        examples = sorted(
+            (index, position, kind)
+            for position, kind in enumerate(error_summary)
+            for index in kind.sample_record_indices
+        )
+        return cls(
+            total_records=total_records,
+            errors=tuple(
+                ValidationError(kind.field, kind.message, index)
+                for index, _, kind in examples
+            ),
+            error_summary=error_summary,
+        )
+
+    def merge(self, other: ValidationReport) -> ValidationReport:
+        """other를 이 리포트 뒤에 이어 붙인 리포트.
+
+        other의 record_index는 이 리포트의 total_records만큼 밀린다. 결합법칙을
+        만족하고 빈 리포트(total_records == 0)는 항등원이므로, 연속된 구간의
+        부분 리포트를 어떤 순서로 묶어 합쳐도 전체를 한 번에 검증한 결과와 같다.
+        집계 리포트끼리는 건수를 더하고, 표본은 두 bottom-k 표본의 합집합에서 키가
+        가장 작은 max_samples개를 남긴다. 따라서 표본 크기가 늘지 않으며, 같은 키의
+        오류를 한 리포트에 차례로 넣은 것과 같은 표본이 된다.
+        """
+        if other.total_records == 0:
+            return self
+        if self.total_records == 0:
+            return other
+        if (self.error_summary is None) != (other.error_summary is None):
+            raise ValueError("cannot merge an aggregated report with a full report")
+
+        offset = self.total_records
+        if self.error_summary is not None and other.error_summary is not None:
+            return ValidationReport.aggregated(
+                self.total_records + other.total_records,
+                _merge_summaries(self.error_summary, other.error_summary, offset),
+            )
+        return ValidationReport(
+            total_records=self.total_records + other.total_records,
+            errors=ChainedErrors([self.errors, other.errors], offsets=[0, offset]),
+        )
+
+    @property
+    def error_count(self) -> int:
+        if self.error_summary is None:
+            return len(self.errors)
+        return sum(kind.count for kind in self.error_summary)
+
     @property
     def valid_records(self) -> int:
-        return self.total_records - len(self.errors)
+        return self.total_records - self.error_count
 
     @property
     def is_valid(self) -> bool:
-        return len(self.errors) == 0
+        return self.error_count == 0
 
     @property
     def error_rate(self) -> float:
         if self.total_records == 0:
             return 0.0
-        return len(self.errors) / self.total_records
+        return self.error_count / self.total_records
+
+
+def _merge_summaries(
+    left: tuple[ErrorKindSummary, ...],
+    right: tuple[ErrorKindSummary, ...],
+    offset: int,
+) -> tuple[ErrorKindSummary, ...]:
+    merged = {(kind.field, kind.message): kind for kind in left}
+    for kind in right:
+        shifted = replace(
+            kind,
+            sample_record_indices=tuple(index + offset for index in kind.sample_record_indices),
+        )
+        previous = merged.get((kind.field, kind.message))
+        merged[(kind.field, kind.message)] = (
+            shifted if previous is None else _merge_samples(previous, shifted)
+        )
+    return tuple(merged.values())
+
+
+def _merge_samples(left: ErrorKindSummary, right: ErrorKindSummary) -> ErrorKindSummary:
+    for kind in (left, right):
+        if kind.max_samples is None or len(kind.sample_keys) != len(kind.sample_record_indices):
+            raise ValueError("cannot merge error samples without reservoir keys")
+    if left.max_samples != right.max_samples:
+        raise ValueError(
+            f"cannot merge error samples of size {left.max_samples} and {right.max_samples}"
+        )
+    pairs = sorted(
+        zip(
+            left.sample_keys + right.sample_keys,
+            left.sample_record_indices + right.sample_record_indices,
+        )
+    )[:left.max_samples]
+    pairs.sort(key=lambda pair: pair[1])
+    return replace(
+        left,
+        count=left.count + right.count,
+        sample_record_indices=tuple(index for _, index in pairs),
+        sample_keys=tuple(key for key, _ in pairs),
+    )
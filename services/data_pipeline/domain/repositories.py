@@ -2,9 +2,18 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from collections.abc import Iterable, Iterator
+from itertools import islice
 from pathlib import Path
 
-from services.data_pipeline.domain.models import Feature, RawTransaction, ValidationReport
+from services.data_pipeline.domain.models import (
+    Feature,
+    FeatureBatch,
+    RawTransaction,
+    SourceState,
+    SourceWatermark,
+    TransactionBatch,
+    ValidationReport,
+)
 
 
 class TransactionRepository(ABC):
@@ -14,10 +23,101 @@ class TransactionRepository(ABC):
     def load_raw_transactions(self, source: str) -> Iterator[RawTransaction]:
         """원본 거래 데이터를 로드한다. 반환값은 1회성 Iterator."""
 
+    def load_raw_batches(self, source: str, batch_size: int) -> Iterator[TransactionBatch]:
+        """원본 거래 데이터를 batch_size 행 단위 배치로 로드한다. 반환값은 1회성 Iterator.
+
+        기본 구현은 load_raw_transactions를 batch_size건씩 묶는다
+        (TransactionBatch.from_transactions). 열 단위로 바로 읽을 수 있는 저장소는
+        재정의해 행 단위 객체를 만들지 않는다.
+        """
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+        transactions = iter(self.load_raw_transactions(source))
+        start_index = 0
+        while chunk := list(islice(transactions, batch_size)):
+            yield TransactionBatch.from_transactions(chunk, start_index=start_index)
+            start_index += len(chunk)
+
+    def list_sources(self, pattern: str) -> list[str]:
+        """pattern(glob, 키 접두사 등)에 해당하는 원본 이름을 정렬된 순서로 반환한다.
+
+        기본 구현은 원본 목록을 알 수 없으므로 와일드카드가 없는 pattern을 원본
+        이름 하나로 보고 [pattern]을 반환한다. 와일드카드가 있으면 NotImplementedError.
+        """
+        if any(char in pattern for char in "*?["):
+            raise NotImplementedError(
+                f"{type(self).__name__} cannot expand source patterns: {pattern}"
+            )
+        return [pattern]
+
     @abstractmethod
     def save_features(self, features: Iterable[Feature], destination: str) -> Path:
         """엔지니어링된 피처를 저장한다."""
 
+    def save_feature_batches(self, batches: Iterable[FeatureBatch], destination: str) -> Path:
+        """FeatureBatch 단위로 받은 피처를 save_features와 같은 형식으로 저장한다.
+
+        기본 구현은 배치를 Feature로 풀어 save_features에 넘긴다. 열을 바로 인코딩할
+        수 있는 저장소는 재정의해 행 단위 객체를 만들지 않는다.
+        """
+        return self.save_features((feature for batch in batches for feature in batch), destination)
+
+    def source_fingerprint(self, source: str) -> str | None:
+        """원본 내용을 식별하는 문자열. 원본이 바뀌면 값도 바뀌어야 한다.
+
+        단계 결과 캐시의 키로 쓴다. None이면 캐시하지 않으며, 기본 구현은 None이다.
+        """
+        return None
+
+
+class IncrementalTransactionRepository(TransactionRepository):
+    """뒤에 행이 덧붙는 원본을 새 행만 읽어 처리할 수 있는 거래 데이터 저장소."""
+
+    @abstractmethod
+    def source_state(self, source: str) -> SourceState:
+        """원본의 현재 크기와 버전 식별자를 반환한다."""
+
+    @abstractmethod
+    def iter_source_bytes(
+        self,
+        source: str,
+        start: int = 0,
+        end: int | None = None,
+        *,
+        etag: str | None = None,
+    ) -> Iterator[bytes]:
+        """원본의 [start, end) 바이트 구간을 청크 단위로 반환한다. end가 None이면 끝까지.
+
+        etag(SourceState.etag)가 주어지면 그 버전만 읽고, 원본이 바뀌었으면 예외를
+        발생시킨다. 버전 식별자가 없는 저장소는 무시한다.
+        """
+
+    @abstractmethod
+    def append_features(
+        self,
+        features: Iterable[Feature],
+        destination: str,
+        *,
+        base_size: int | None = None,
+    ) -> Path:
+        """기존 피처 파일 뒤에 피처를 덧붙인다. 파일이 없으면 save_features와 같다.
+
+        base_size가 주어지면 기존 파일의 앞 base_size 바이트만 남기고 그 뒤에
+        덧붙인다. 덧붙일 피처가 없어도 파일을 base_size로 줄인다.
+        """
+
+    @abstractmethod
+    def features_size(self, destination: str) -> int | None:
+        """피처 파일의 현재 바이트 크기. 파일이 없으면 None."""
+
+    @abstractmethod
+    def load_watermark(self, destination: str) -> SourceWatermark | None:
+        """피처 파일 옆 manifest를 읽는다. 없으면 None."""
+
+    @abstractmethod
+    def save_watermark(self, watermark: SourceWatermark, destination: str) -> Path:
+        """피처 파일 옆에 manifest를 저장한다."""
+
 
 class ValidationReportRepository(ABC):
     """검증 리포트 저장소 인터페이스."""
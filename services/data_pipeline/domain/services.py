@@ -3,7 +3,12 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from collections.abc import Iterable, Iterator
 
-from services.data_pipeline.domain.models import Feature, RawTransaction
+from services.data_pipeline.domain.models import (
+    Feature,
+    FeatureBatch,
+    RawTransaction,
+    TransactionBatch,
+)
 
 
 class FeatureEngineeringService(ABC):
@@ -12,3 +17,30 @@ class FeatureEngineeringService(ABC):
     @abstractmethod
     def extract_features(self, transactions: Iterable[RawTransaction]) -> Iterator[Feature]:
         """원본 거래에서 피처를 추출한다. 반환값은 1회성 Iterator."""
+
+    def extract_features_batch(self, batch: TransactionBatch) -> FeatureBatch:
+        """TransactionBatch 전체의 피처를 한 번에 추출한다.
+
+        기본 구현은 배치의 행을 extract_features에 넘겨 FeatureBatch로 모은다.
+        열 단위로 계산할 수 있는 구현은 재정의해 행 단위 객체를 만들지 않는다.
+        """
+        return FeatureBatch.from_features(
+            list(self.extract_features(batch)), row_index=batch.row_index, source=batch.source
+        )
+
+    def reset(self) -> None:
+        """extract_features_batch 호출 사이에 유지되는 상태를 초기화한다.
+
+        새 입력 스트림을 시작하기 전에 호출한다. 기본 구현은 상태가 없다.
+        """
+
+    def is_stateful(self) -> bool:
+        """앞 행들에 따라 피처가 달라지는지(reset할 상태가 있는지). 기본 구현은 False."""
+        return False
+
+    def version(self) -> str | None:
+        """피처 계산 규칙과 설정을 식별하는 문자열. 규칙이 바뀌면 값도 바뀌어야 한다.
+
+        단계 결과 캐시의 키로 쓴다. None이면 캐시하지 않으며, 기본 구현은 None이다.
+        """
+        return None
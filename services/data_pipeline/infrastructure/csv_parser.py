@@ -2,15 +2,142 @@
 
 from __future__ import annotations
 
+import csv
+import io
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import replace
 from decimal import Decimal, InvalidOperation
+from itertools import islice
 
-from services.data_pipeline.domain.models import RawTransaction
+import numpy as np
+
+from services.data_pipeline.domain.models import (
+    AMOUNT_DECIMAL_PLACES,
+    PCA_FEATURES_COUNT,
+    UNREPRESENTABLE_CENTS,
+    DeferredColumns,
+    RawTransaction,
+    RowParseError,
+    TransactionBatch,
+    ValidationError,
+    decimal_to_cents,
+    format_transaction_id,
+)
+from shared.infrastructure.instrumentation import record_bytes_read
 
 _PCA_COLUMNS = tuple(f"V{i}" for i in range(1, 29))
+_REQUIRED_COLUMNS = ("Time", "Amount", "Class", *_PCA_COLUMNS)
+
+# 관용 파싱 모드에서 기록하는 행 단위 변환 오류 (field, message).
+# 한 행에 여러 문제가 있으면 이 순서로 처음 걸린 하나만 기록한다.
+PARSE_ERROR_RULES: tuple[tuple[str, str], ...] = (
+    ("row", "malformed row"),
+    ("amount", "invalid Amount"),
+    ("pca_features", "invalid PCA feature value"),
+    ("time_seconds", "invalid Time"),
+    ("is_fraud", "invalid Class"),
+)
+_PARSE_MALFORMED, _PARSE_AMOUNT, _PARSE_PCA, _PARSE_TIME, _PARSE_CLASS = range(
+    1, len(PARSE_ERROR_RULES) + 1
+)
+# 관용 모드에서 빠른 경로가 실패한 구간을 이 줄 수 이하로 나눈 뒤 행 단위로 파싱한다.
+_ROW_FALLBACK_LINES = 64
+# 빠른 경로가 숫자 열에서 받아들일 수 있는 바이트 (nan/inf/infinity 포함).
+_FAST_PATH_BYTES = np.zeros(256, dtype=np.bool_)
+_FAST_PATH_BYTES[
+    np.frombuffer(b'0123456789.+-eE,"\r\n nanNANinfINFityITY', dtype=np.uint8)
+] = True
+
+DEFAULT_BATCH_SIZE = 65_536
+
+# PCA 열(V1~V28)을 읽는 방식. strict는 모두 디코딩해 검증하고, lazy는 줄 bytes를
+# 보관했다가 처음 접근할 때 디코딩하며, skip은 읽지 않는다 (KaggleCsvParser 참고).
+PCA_STRICT = "strict"
+PCA_LAZY = "lazy"
+PCA_SKIP = "skip"
+PCA_LOADING_MODES = (PCA_STRICT, PCA_LAZY, PCA_SKIP)
+
+# 숫자 필드를 float()/Decimal 없이 바로 변환할 최대 자릿수. 가수가 float64로 정확하다.
+_MAX_FAST_DIGITS = 15
+_POWERS_OF_TEN = 10.0 ** np.arange(_MAX_FAST_DIGITS + 1)
+# 소수 자릿수별로 가수에 곱해 센트로 만드는 값.
+_CENTS_SCALE = 10 ** np.arange(AMOUNT_DECIMAL_PLACES, -1, -1, dtype=np.int64)
+
+_NEWLINE = ord("\n")
+_COMMA = ord(",")
+_DOT = ord(".")
+_QUOTE = ord('"')
+_MINUS = ord("-")
+_PLUS = ord("+")
+_ZERO = ord("0")
+_ONE = ord("1")
+
+
+def iter_lines(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """임의 크기 bytes 청크 스트림을 개행을 포함한 줄 단위로 다시 나눈다.
+
+    청크 경계에 걸친 줄은 다음 청크와 이어 붙여 한 줄로 돌려준다.
+    """
+    remainder = b""
+    for chunk in chunks:
+        lines = (remainder + chunk).splitlines(keepends=True)
+        remainder = b""
+        # "\r\n"이 청크 경계에서 나뉠 수 있으므로 "\r"로 끝나는 줄도 보류한다.
+        if lines and not lines[-1].endswith(b"\n"):
+            remainder = lines.pop()
+        yield from lines
+    if remainder:
+        yield remainder
 
 
 class KaggleCsvParser:
-    """Kaggle CSV row를 RawTransaction 도메인 객체로 변환."""
+    """Kaggle CSV row를 RawTransaction 도메인 객체로 변환.
+
+    tolerant가 True이면 parse_batch/parse_lines/parse_file은 변환에 실패한 행에서
+    멈추지 않고, 그 행을 열에서 빼는 대신 TransactionBatch.parse_errors에
+    PARSE_ERROR_RULES 종류의 ValidationError로 기록한다. 정상 행은 예외 없이
+    벡터화된 경로로 처리된다. parse_row는 모드와 무관하게 예외를 발생시킨다.
+
+    pca_features는 배치 파싱에서 PCA 열을 읽는 방식이다 (PCA_LOADING_MODES).
+    PCA를 쓰지 않는 피처 추출만 할 때 lazy/skip으로 파싱 비용을 줄인다.
+    lazy/skip이면 배치의 pca_features는 DeferredColumns이고, 빠른 경로는 Time과
+    Amount만 숫자로 변환한다. 줄이는 것은 PCA 열 디코딩(np.loadtxt) 호출 자체다.
+    loadtxt는 usecols를 주어도 모든 열을 토큰화하므로, lazy 열을 결국 디코딩하면
+    strict와 비슷한 비용이 든다. lazy는 처음 접근할 때 디코딩하며 잘못된 값은 그때
+    ValueError가 된다. skip은 접근하면 ValueError다. 검증기는 디코딩하지 않은
+    PCA 열의 규칙을 건너뛰므로, PCA까지 검증하려면 strict를 쓴다. 파싱 결과
+    캐시나 외부 정렬처럼 열 전체를 기록하는 단계는 lazy 열을 디코딩하며, skip
+    열과는 함께 쓸 수 없다.
+    """
+
+    def __init__(self, *, tolerant: bool = False, pca_features: str = PCA_STRICT) -> None:
+        if pca_features not in PCA_LOADING_MODES:
+            raise ValueError(f"unsupported pca_features {pca_features!r}")
+        self._tolerant = tolerant
+        self._pca_features = pca_features
+
+    @property
+    def tolerant(self) -> bool:
+        return self._tolerant
+
+    @property
+    def pca_features(self) -> str:
+        return self._pca_features
+
+    def project(self, batch: TransactionBatch) -> TransactionBatch:
+        """배치의 pca_features를 이 파서의 PCA 로드 방식에 맞춘다.
+
+        캐시나 다른 프로세스에서 온 배치에 적용한다. strict이면 그대로 반환한다.
+        """
+        if self._pca_features == PCA_STRICT:
+            return batch
+        if self._pca_features == PCA_SKIP:
+            pca = _skipped_pca(len(batch))
+        elif isinstance(batch.pca_features, DeferredColumns):
+            return batch
+        else:
+            pca = DeferredColumns.wrap(batch.pca_features)
+        return replace(batch, pca_features=pca)
 
     def parse_row(
         self,
@@ -21,37 +148,546 @@ class KaggleCsvParser:
         try:
             amount = Decimal(row["Amount"])
         except InvalidOperation as e:
-            raise ValueError(
-                f"Row {row_index}: invalid Amount"
-                f" '{row['Amount']}'"
-            ) from e
+            raise RowParseError(row_index, f"invalid Amount '{row['Amount']}'") from e
 
         try:
             pca_features = tuple(
                 float(row[col]) for col in _PCA_COLUMNS
             )
         except ValueError as e:
-            raise ValueError(
-                f"Row {row_index}: invalid PCA feature value"
-            ) from e
+            raise RowParseError(row_index, "invalid PCA feature value") from e
 
         try:
             time_seconds = float(row["Time"])
         except (ValueError, TypeError) as e:
-            raise ValueError(
-                f"Row {row_index}: invalid Time '{row.get('Time')}'"
-            ) from e
+            raise RowParseError(row_index, f"invalid Time '{row.get('Time')}'") from e
 
         class_value = row["Class"]
         if class_value not in ("0", "1"):
-            raise ValueError(
-                f"Row {row_index}: invalid Class '{class_value}', expected '0' or '1'"
+            raise RowParseError(
+                row_index, f"invalid Class '{class_value}', expected '0' or '1'"
             )
 
         return RawTransaction(
-            transaction_id=f"txn_{row_index:06d}",
+            transaction_id=format_transaction_id(row_index),
             time_seconds=time_seconds,
             amount=amount,
             is_fraud=class_value == "1",
             pca_features=pca_features,
         )
+
+    def parse_header(self, line: bytes) -> tuple[str, ...]:
+        """CSV 헤더 한 줄을 컬럼 이름 튜플로 변환한다."""
+        return tuple(next(csv.reader([line.decode("utf-8")]), ()))
+
+    def parse_file(
+        self,
+        lines: Iterable[bytes],
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Iterator[TransactionBatch]:
+        """개행을 포함한 줄 단위 bytes 스트림을 batch_size 행씩 파싱한다.
+
+        첫 줄은 헤더로 취급한다. 반환값은 1회성 Iterator.
+        """
+        it = iter(lines)
+        header = next(it, None)
+        if header is None:
+            return
+        record_bytes_read(len(header))
+        yield from self.parse_lines(
+            it, columns=self.parse_header(header), batch_size=batch_size
+        )
+
+    def parse_lines(
+        self,
+        lines: Iterable[bytes],
+        *,
+        columns: Sequence[str],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        start_index: int = 0,
+    ) -> Iterator[TransactionBatch]:
+        """헤더 없는 줄 단위 bytes 스트림을 batch_size 행씩 파싱한다.
+
+        row_index는 start_index부터 매긴다. 반환값은 1회성 Iterator.
+        """
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+
+        it = iter(lines)
+        while chunk := list(islice(it, batch_size)):
+            block = b"".join(chunk)
+            record_bytes_read(len(block))
+            batch = self.parse_batch(block, columns=columns, start_index=start_index)
+            start_index += batch.record_count
+            if batch.record_count:
+                yield batch
+
+    def parse_batch(
+        self,
+        block: bytes,
+        *,
+        columns: Sequence[str],
+        start_index: int = 0,
+    ) -> TransactionBatch:
+        """헤더를 제외한 CSV bytes 블록을 열 단위 배열로 변환한다.
+
+        오류 메시지는 parse_row와 동일하다. 빠른 경로가 처리할 수 없는 블록
+        (따옴표, 컬럼 수 불일치, 변환 실패 등)은 행 단위 경로로 다시 파싱해
+        첫 번째로 실패한 행의 오류를 그대로 발생시킨다.
+        Amount는 센트 단위 정수로 저장한다. parse_row처럼 Decimal로 읽을 수 있지만
+        센트로 정확히 표현되지 않는 값(NaN, Infinity, 소수점 셋째 자리 이하)은
+        파싱을 멈추지 않고 UNREPRESENTABLE_CENTS로 남겨 검증기가 행 단위
+        invalid amount로 보고하게 한다.
+        관용 모드에서는 예외 대신 실패한 행을 parse_errors에 기록한다.
+        """
+        if self._tolerant:
+            missing = [name for name in _REQUIRED_COLUMNS if name not in columns]
+            if missing:
+                raise ValueError(f"missing required columns: {', '.join(missing)}")
+            return self.project(
+                self._parse_lines_tolerant(block.splitlines(keepends=True), columns, start_index)
+            )
+        batch = self._parse_batch_fast(block, columns, start_index)
+        if batch is None:
+            batch = self._parse_batch_rows(block, columns, start_index)
+        return self.project(batch)
+
+    def _parse_lines_tolerant(
+        self,
+        lines: list[bytes],
+        columns: Sequence[str],
+        start_index: int,
+    ) -> TransactionBatch:
+        """빠른 경로가 처리하지 못한 구간에서 문제가 있는 줄만 행 단위로 파싱한다.
+
+        숫자로 읽을 수 없는 바이트가 든 줄을 먼저 골라내 행 단위로 파싱하고,
+        나머지 구간은 빠른 경로로 파싱한다. 그래도 빠른 경로가 실패하는 구간은
+        반으로 나눠 _ROW_FALLBACK_LINES 이하가 될 때까지 좁힌다.
+        """
+        block = b"".join(lines)
+        suspect = _suspect_lines(block, lines)
+        if suspect.any() and not suspect.all():
+            bounds = [0, *(np.flatnonzero(np.diff(suspect)) + 1).tolist(), len(lines)]
+            parts = []
+            for start, stop in zip(bounds[:-1], bounds[1:]):
+                if suspect[start]:
+                    part = self._parse_rows_tolerant(
+                        b"".join(lines[start:stop]), columns, start_index
+                    )
+                else:
+                    part = self._parse_lines_tolerant(lines[start:stop], columns, start_index)
+                start_index += part.record_count
+                parts.append(part)
+            return TransactionBatch.concat(parts)
+
+        batch = self._parse_batch_fast(block, columns, start_index, tolerant=True)
+        if batch is not None:
+            return batch
+        if len(lines) <= _ROW_FALLBACK_LINES:
+            return self._parse_rows_tolerant(block, columns, start_index)
+        middle = len(lines) // 2
+        left = self._parse_lines_tolerant(lines[:middle], columns, start_index)
+        right = self._parse_lines_tolerant(
+            lines[middle:], columns, start_index + left.record_count
+        )
+        return TransactionBatch.concat([left, right])
+
+    def _parse_batch_fast(
+        self,
+        block: bytes,
+        columns: Sequence[str],
+        start_index: int,
+        *,
+        tolerant: bool = False,
+    ) -> TransactionBatch | None:
+        """numpy로 블록 전체를 한 번에 파싱한다. 처리할 수 없으면 None.
+
+        줄과 쉼표 위치로 필드 경계를 한 번 구한 뒤, Time/Amount/Class는 해당 필드
+        bytes만 모아 직접 변환하고, np.loadtxt는 strict 모드의 PCA 열에만 쓴다.
+        tolerant이면 Class, Time, 숫자가 아닌 Amount처럼 행 단위로 가려낼 수 있는
+        실패는 None 대신 해당 행을 parse_errors로 옮긴다.
+        """
+        positions = {name: pos for pos, name in enumerate(columns)}
+        if any(name not in positions for name in _REQUIRED_COLUMNS):
+            return None
+
+        text = block
+        if b"\r" in text:
+            text = text.replace(b"\r\n", b"\n")
+            if b"\r" in text:
+                return None
+        buf = np.frombuffer(text, dtype=np.uint8)
+        newlines = np.flatnonzero(buf == _NEWLINE)
+        line_starts = np.concatenate(([0], newlines + 1))
+        line_ends = np.append(newlines, len(buf))
+        # 빈 줄(마지막 개행 뒤 포함)은 csv 모듈처럼 행으로 세지 않는다.
+        filled = line_ends > line_starts
+        if not filled.all():
+            line_starts = line_starts[filled]
+            line_ends = line_ends[filled]
+        n_rows = len(line_starts)
+        if n_rows == 0:
+            return TransactionBatch.empty()
+
+        n_columns = len(columns)
+        commas = np.flatnonzero(buf == _COMMA)
+        if len(commas) != n_rows * (n_columns - 1):
+            return None
+        # 각 행의 쉼표가 모두 자기 줄 안에 있으면 행마다 컬럼 수가 같다.
+        commas = commas.reshape(n_rows, n_columns - 1)
+        if np.any(commas[:, 0] < line_starts) or np.any(commas[:, -1] >= line_ends):
+            return None
+
+        bounds = {
+            name: _field_bounds(commas, line_starts, line_ends, positions[name])
+            for name in ("Time", "Amount", "Class")
+        }
+        class_ok, is_fraud, quoted = _parse_class(buf, *bounds["Class"])
+        # Kaggle 원본은 Class 값을 "0"/"1"로 감싼다. 그 밖의 따옴표는 행 단위로 읽는다.
+        if b'"' in text and text.count(b'"') != 2 * int(np.count_nonzero(quoted)):
+            return None
+        time_seconds, invalid_time = _fields_to_floats(text, buf, *bounds["Time"])
+        amount_cents, invalid_amount = _fields_to_cents(text, buf, *bounds["Amount"])
+        invalid_time |= time_seconds < 0
+        if not tolerant and (
+            invalid_time.any() or invalid_amount.any() or not class_ok.all()
+        ):
+            return None
+
+        if self._pca_features == PCA_STRICT:
+            try:
+                pca_features = np.loadtxt(
+                    io.BytesIO(text),
+                    delimiter=",",
+                    dtype=np.float64,
+                    comments=None,
+                    usecols=[positions[name] for name in _PCA_COLUMNS],
+                    ndmin=2,
+                )
+            except ValueError:
+                return None
+            if len(pca_features) != n_rows:
+                return None
+        elif self._pca_features == PCA_LAZY:
+            pca_features = DeferredColumns(
+                np.arange(n_rows),
+                PCA_FEATURES_COUNT,
+                _PcaDecoder(
+                    text,
+                    line_starts,
+                    line_ends,
+                    [positions[name] for name in _PCA_COLUMNS],
+                    start_index,
+                ),
+            )
+        else:
+            pca_features = _skipped_pca(n_rows)
+
+        row_index = np.arange(start_index, start_index + n_rows, dtype=np.int64)
+        # 우선순위가 높은 종류가 나중에 덮어쓰도록 PARSE_ERROR_RULES의 역순으로 기록한다.
+        failed = np.zeros(n_rows, dtype=np.uint8)
+        if tolerant:
+            failed[~class_ok] = _PARSE_CLASS
+            failed[invalid_time] = _PARSE_TIME
+            failed[invalid_amount] = _PARSE_AMOUNT
+        if not failed.any():
+            return TransactionBatch.from_columns(
+                row_index=row_index,
+                time_seconds=time_seconds,
+                pca_features=pca_features,
+                amount_cents=amount_cents,
+                is_fraud=is_fraud,
+            )
+        keep = failed == 0
+        return TransactionBatch.from_columns(
+            row_index=row_index[keep],
+            time_seconds=time_seconds[keep],
+            pca_features=pca_features[keep],
+            amount_cents=amount_cents[keep],
+            is_fraud=is_fraud[keep],
+            parse_errors=_parse_errors(failed, row_index),
+        )
+
+    def _parse_batch_rows(
+        self,
+        block: bytes,
+        columns: Sequence[str],
+        start_index: int,
+    ) -> TransactionBatch:
+        reader = csv.DictReader(
+            io.StringIO(block.decode("utf-8"), newline=""), fieldnames=list(columns)
+        )
+        transactions = [
+            self.parse_row(row, row_index=start_index + offset)
+            for offset, row in enumerate(reader)
+        ]
+        return TransactionBatch.from_transactions(transactions, start_index=start_index)
+
+    def _parse_rows_tolerant(
+        self,
+        block: bytes,
+        columns: Sequence[str],
+        start_index: int,
+    ) -> TransactionBatch:
+        reader = csv.DictReader(
+            io.StringIO(block.decode("utf-8", errors="replace"), newline=""),
+            fieldnames=list(columns),
+        )
+        rows: list[tuple[float, tuple[float, ...], int, bool]] = []
+        row_index: list[int] = []
+        failed: list[int] = []
+        for offset, row in enumerate(reader):
+            parsed = _parse_row_values(row)
+            row_index.append(start_index + offset)
+            if isinstance(parsed, int):
+                failed.append(parsed)
+            else:
+                failed.append(0)
+                rows.append(parsed)
+
+        index = np.array(row_index, dtype=np.int64)
+        codes = np.array(failed, dtype=np.uint8)
+        if not rows:
+            return replace(TransactionBatch.empty(), parse_errors=_parse_errors(codes, index))
+        time_seconds, pca_features, amount_cents, is_fraud = zip(*rows)
+        return TransactionBatch.from_columns(
+            row_index=index[codes == 0],
+            time_seconds=np.array(time_seconds, dtype=np.float64),
+            pca_features=np.array(pca_features, dtype=np.float64),
+            amount_cents=np.array(amount_cents, dtype=np.int64),
+            is_fraud=np.array(is_fraud, dtype=np.bool_),
+            parse_errors=_parse_errors(codes, index),
+        )
+
+
+class _PcaDecoder:
+    """빠른 경로가 보관한 줄 bytes에서 PCA 열을 디코딩한다 (pickle 가능)."""
+
+    def __init__(
+        self,
+        text: bytes,
+        line_starts: np.ndarray,
+        line_ends: np.ndarray,
+        usecols: list[int],
+        start_index: int,
+    ) -> None:
+        self._text = text
+        self._line_starts = line_starts
+        self._line_ends = line_ends
+        self._usecols = usecols
+        self._start_index = start_index
+
+    def __call__(self, positions: np.ndarray) -> np.ndarray:
+        if len(positions) == len(self._line_starts) and np.array_equal(
+            positions, np.arange(len(positions))
+        ):
+            lines = self._text
+        else:
+            lines = b"\n".join(
+                self._text[start:end]
+                for start, end in zip(
+                    self._line_starts[positions].tolist(), self._line_ends[positions].tolist()
+                )
+            )
+        if not lines:
+            return np.empty((0, PCA_FEATURES_COUNT), dtype=np.float64)
+        try:
+            return np.loadtxt(
+                io.BytesIO(lines),
+                delimiter=",",
+                dtype=np.float64,
+                comments=None,
+                usecols=self._usecols,
+                ndmin=2,
+            )
+        except ValueError:
+            pass
+        for position in positions.tolist():
+            line = self._text[self._line_starts[position]:self._line_ends[position]]
+            fields = line.split(b",")
+            try:
+                for col in self._usecols:
+                    float(fields[col])
+            except ValueError:
+                raise RowParseError(
+                    self._start_index + position, "invalid PCA feature value"
+                ) from None
+        raise ValueError("invalid PCA feature value")
+
+
+class _SkippedPca:
+    """pca_features=skip으로 읽지 않은 열. 접근하면 ValueError."""
+
+    def __call__(self, positions: np.ndarray) -> np.ndarray:
+        raise ValueError("pca_features were not loaded (pca_features='skip')")
+
+
+def _skipped_pca(n_rows: int) -> DeferredColumns:
+    return DeferredColumns(np.arange(n_rows), PCA_FEATURES_COUNT, _SkippedPca())
+
+
+def _field_bounds(
+    commas: np.ndarray, line_starts: np.ndarray, line_ends: np.ndarray, pos: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """pos번째 필드의 행별 [시작, 끝) byte 위치. commas는 (행 수, 컬럼 수 - 1) 배열."""
+    start = line_starts if pos == 0 else commas[:, pos - 1] + 1
+    end = line_ends if pos == commas.shape[1] else commas[:, pos]
+    return start, end
+
+
+def _parse_class(
+    buf: np.ndarray, starts: np.ndarray, ends: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Class 필드를 (올바른 값인지, is_fraud, 따옴표로 감쌌는지) bool 배열로 변환한다."""
+    lengths = ends - starts
+    last = len(buf) - 1
+    quoted = (
+        (lengths == 3)
+        & (buf[np.minimum(starts, last)] == _QUOTE)
+        & (buf[np.minimum(starts + 2, last)] == _QUOTE)
+    )
+    value = buf[np.minimum(starts + quoted, last)]
+    class_ok = ((lengths == 1) | quoted) & ((value == _ZERO) | (value == _ONE))
+    return class_ok, class_ok & (value == _ONE), quoted
+
+
+def _scan_decimals(
+    buf: np.ndarray, starts: np.ndarray, ends: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """`[+-]숫자[.숫자]` 형태 필드를 (부호 없는 정수 가수, 소수 자릿수, 형태가 맞는지)로 읽는다.
+
+    필드의 같은 위치 byte를 모든 행에서 한 번에 처리해 자릿수만큼 누적하므로 행마다
+    파이썬 코드를 실행하지 않는다. 숫자가 _MAX_FAST_DIGITS개를 넘거나 지수, 공백,
+    nan/inf가 든 필드는 형태가 맞지 않는 것으로 남겨 호출한 쪽이 따로 변환한다.
+    부호는 가수에 반영하지 않으며 첫 byte가 "-"인지로 확인한다.
+    """
+    n = len(starts)
+    lengths = ends - starts
+    width = min(int(lengths.max()), _MAX_FAST_DIGITS + 2)
+    last = len(buf) - 1
+    mantissa = np.zeros(n, dtype=np.int64)
+    scale = np.zeros(n, dtype=np.int64)
+    n_digits = np.zeros(n, dtype=np.int64)
+    seen_dot = np.zeros(n, dtype=np.bool_)
+    simple = lengths <= width
+    # 행마다 연속한 width byte를 한 번에 모은 뒤 열(같은 위치 byte) 단위로 누적한다.
+    window = buf[np.minimum(starts[:, None] + np.arange(width), last)]
+    for offset in range(width):
+        inside = offset < lengths
+        chars = window[:, offset]
+        digits = chars - np.uint8(_ZERO)
+        is_digit = inside & (digits < 10)
+        is_dot = inside & (chars == _DOT)
+        allowed = is_digit | (is_dot & ~seen_dot) | ~inside
+        if offset == 0:
+            allowed |= (chars == _MINUS) | (chars == _PLUS)
+        simple &= allowed
+        mantissa = np.where(is_digit, mantissa * 10 + digits, mantissa)
+        scale += is_digit & seen_dot
+        n_digits += is_digit
+        seen_dot |= is_dot
+    simple &= (n_digits > 0) & (n_digits <= _MAX_FAST_DIGITS)
+    return mantissa, scale, simple
+
+
+def _fields_to_floats(
+    text: bytes, buf: np.ndarray, starts: np.ndarray, ends: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """숫자 필드를 float()와 같은 값의 float64로 변환한다.
+
+    가수가 2**53 미만이고 10의 거듭제곱이 정확한 범위에서는 가수 / 10**scale이
+    올바르게 반올림된 값이므로 float()와 결과가 같다. 나머지 필드만 float()로
+    변환한다. (값 배열, 변환에 실패한 행의 bool 마스크)를 반환한다.
+    """
+    mantissa, scale, simple = _scan_decimals(buf, starts, ends)
+    invalid = np.zeros(len(starts), dtype=np.bool_)
+    values = mantissa / _POWERS_OF_TEN[np.minimum(scale, _MAX_FAST_DIGITS)]
+    negative = buf[np.minimum(starts, len(buf) - 1)] == _MINUS
+    values[negative] = -values[negative]
+    for pos in np.flatnonzero(~simple).tolist():
+        try:
+            values[pos] = float(text[starts[pos]:ends[pos]].decode("utf-8", "replace"))
+        except ValueError:
+            values[pos] = np.nan
+            invalid[pos] = True
+    return values, invalid
+
+
+def _fields_to_cents(
+    text: bytes, buf: np.ndarray, starts: np.ndarray, ends: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Amount 필드를 센트 단위 정수로 변환한다.
+
+    소수점 이하 두 자리 이내의 일반 표기는 정수 연산으로 바로 변환하고, 지수
+    표기나 긴 소수 등 나머지 값만 Decimal로 확인한다. 숫자로 읽을 수는 있지만
+    센트로 정확히 표현되지 않는 값(NaN, Infinity, 소수점 셋째 자리 이하)은
+    UNREPRESENTABLE_CENTS가 되어 검증에서 invalid amount로 보고된다.
+    (센트 배열, Decimal로도 읽을 수 없는 행의 bool 마스크)를 반환한다.
+    """
+    mantissa, scale, simple = _scan_decimals(buf, starts, ends)
+    invalid = np.zeros(len(starts), dtype=np.bool_)
+    simple &= scale <= AMOUNT_DECIMAL_PLACES
+    cents = mantissa * _CENTS_SCALE[np.minimum(scale, AMOUNT_DECIMAL_PLACES)]
+    negative = buf[np.minimum(starts, len(buf) - 1)] == _MINUS
+    cents[negative] = -cents[negative]
+    for pos in np.flatnonzero(~simple).tolist():
+        try:
+            amount = Decimal(text[starts[pos]:ends[pos]].decode("utf-8", "replace"))
+        except InvalidOperation:
+            invalid[pos] = True
+            continue
+        exact = decimal_to_cents(amount)
+        cents[pos] = UNREPRESENTABLE_CENTS if exact is None else exact
+    return cents, invalid
+
+
+def _parse_errors(failed: np.ndarray, row_index: np.ndarray) -> tuple[ValidationError, ...]:
+    """행별 PARSE_ERROR_RULES 코드(0은 정상)를 ValidationError로 만든다."""
+    positions = np.flatnonzero(failed)
+    return tuple(
+        ValidationError(*PARSE_ERROR_RULES[code - 1], index)
+        for code, index in zip(failed[positions].tolist(), row_index[positions].tolist())
+    )
+
+
+def _suspect_lines(block: bytes, lines: list[bytes]) -> np.ndarray:
+    """빠른 경로가 숫자로 읽을 수 없는 바이트가 든 줄의 bool 마스크."""
+    buf = np.frombuffer(block, dtype=np.uint8)
+    line_ends = np.cumsum([len(line) for line in lines])
+    suspect = np.zeros(len(lines), dtype=np.bool_)
+    bad = np.flatnonzero(~_FAST_PATH_BYTES[buf])
+    suspect[np.searchsorted(line_ends, bad, side="right")] = True
+    return suspect
+
+
+def _parse_row_values(
+    row: dict[str, str | None],
+) -> tuple[float, tuple[float, ...], int, bool] | int:
+    """관용 모드의 행 단위 변환. 성공하면 (time, pca, cents, is_fraud), 실패하면
+    PARSE_ERROR_RULES 코드를 반환한다.
+
+    정상 값에서는 예외가 생기지 않으므로 예외는 실패한 행에서만 만들어진다.
+    """
+    if any(row.get(name) is None for name in _REQUIRED_COLUMNS):
+        return _PARSE_MALFORMED
+    try:
+        cents = decimal_to_cents(Decimal(row["Amount"]))
+    except InvalidOperation:
+        return _PARSE_AMOUNT
+    if cents is None:
+        cents = UNREPRESENTABLE_CENTS
+    try:
+        pca_features = tuple(float(row[col]) for col in _PCA_COLUMNS)
+    except ValueError:
+        return _PARSE_PCA
+    try:
+        time_seconds = float(row["Time"])
+    except ValueError:
+        return _PARSE_TIME
+    if time_seconds < 0:
+        return _PARSE_TIME
+    class_value = row["Class"]
+    if class_value not in ("0", "1"):
+        return _PARSE_CLASS
+    return time_seconds, pca_features, cents, class_value == "1"
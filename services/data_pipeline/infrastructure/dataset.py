@@ -0,0 +1,161 @@
+"""여러 원본 객체(S3 접두사, 로컬 glob)를 하나의 데이터셋으로 읽는 저장소."""
+
+from __future__ import annotations
+
+import queue
+import threading
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from pathlib import Path
+
+from services.data_pipeline.domain.models import (
+    BatchSource,
+    Feature,
+    FeatureBatch,
+    RawTransaction,
+    TransactionBatch,
+)
+from services.data_pipeline.domain.repositories import TransactionRepository
+from services.data_pipeline.infrastructure.csv_parser import DEFAULT_BATCH_SIZE
+from services.data_pipeline.infrastructure.raw_cache import cache_key
+
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_QUEUE_SIZE = 4
+_POLL_SECONDS = 0.1
+_DONE = object()
+
+
+class _Failed:
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+class DatasetTransactionRepository(TransactionRepository):
+    """source를 패턴으로 받아 일치하는 모든 원본을 이어서 로드하는 저장소.
+
+    원본 목록은 감싼 저장소의 list_sources로 정하고(S3 키 접두사, 로컬 glob),
+    이름 순서대로 배치를 반환한다. 최대 max_concurrency개의 원본을 동시에 읽고
+    파싱하며, 원본마다 아직 소비되지 않은 배치는 queue_size개까지만 쌓는다.
+    row_index는 데이터셋 전체에서 이어지고, transaction_id는
+    `<원본 이름>:txn_<원본 안 행 번호>`이므로 다른 원본이 추가되어도 바뀌지 않는다.
+    save_features와 list_sources는 감싼 저장소에 위임한다.
+    """
+
+    def __init__(
+        self,
+        repository: TransactionRepository,
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+    ) -> None:
+        if max_concurrency <= 0:
+            raise ValueError(f"max_concurrency must be positive, got {max_concurrency}")
+        if queue_size <= 0:
+            raise ValueError(f"queue_size must be positive, got {queue_size}")
+        self._repository = repository
+        self._max_concurrency = max_concurrency
+        self._queue_size = queue_size
+
+    def list_sources(self, pattern: str) -> list[str]:
+        return self._repository.list_sources(pattern)
+
+    def source_fingerprint(self, source: str) -> str | None:
+        """일치하는 원본 이름과 각 원본 fingerprint로 만든 키.
+
+        원본이 없거나 하나라도 fingerprint가 없으면 None이다.
+        """
+        names = self._repository.list_sources(source)
+        fingerprints = [self._repository.source_fingerprint(name) for name in names]
+        if not names or None in fingerprints:
+            return None
+        return cache_key("dataset", *zip(names, fingerprints))
+
+    def load_raw_transactions(self, source: str) -> Iterator[RawTransaction]:
+        for batch in self.load_raw_batches(source):
+            yield from batch
+
+    def load_raw_batches(
+        self,
+        source: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Iterator[TransactionBatch]:
+        """source 패턴에 맞는 원본들을 이름 순서대로 이어 batch_size 행 단위로 로드한다."""
+        names = self._repository.list_sources(source)
+        if not names:
+            raise FileNotFoundError(f"No sources match: {source}")
+
+        cancelled = threading.Event()
+        executor = ThreadPoolExecutor(
+            max_workers=self._max_concurrency, thread_name_prefix="dataset-load"
+        )
+        try:
+            pending: deque[tuple[str, queue.Queue]] = deque()
+            remaining = iter(names)
+
+            def submit_next() -> None:
+                name = next(remaining, None)
+                if name is not None:
+                    channel: queue.Queue = queue.Queue(self._queue_size)
+                    executor.submit(self._produce, name, batch_size, channel, cancelled)
+                    pending.append((name, channel))
+
+            for _ in range(self._max_concurrency):
+                submit_next()
+
+            # 각 원본의 row_index는 0부터 시작하므로 앞선 원본들의 행 수만큼 옮긴다.
+            offset = 0
+            while pending:
+                name, channel = pending.popleft()
+                records = 0
+                for batch in _drain(channel):
+                    yield replace(batch, source=BatchSource(name)).with_row_offset(offset)
+                    records += batch.record_count
+                offset += records
+                submit_next()
+        finally:
+            cancelled.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def save_features(self, features: Iterable[Feature], destination: str) -> Path:
+        return self._repository.save_features(features, destination)
+
+    def save_feature_batches(self, batches: Iterable[FeatureBatch], destination: str) -> Path:
+        return self._repository.save_feature_batches(batches, destination)
+
+    def _produce(
+        self,
+        name: str,
+        batch_size: int,
+        channel: queue.Queue,
+        cancelled: threading.Event,
+    ) -> None:
+        try:
+            for batch in self._repository.load_raw_batches(name, batch_size):
+                if not _put(channel, batch, cancelled):
+                    return
+            _put(channel, _DONE, cancelled)
+        except BaseException as e:
+            _put(channel, _Failed(e), cancelled)
+
+
+def _put(channel: queue.Queue, item: object, cancelled: threading.Event) -> bool:
+    """소비자가 중단하면 False를 반환한다."""
+    while not cancelled.is_set():
+        try:
+            channel.put(item, timeout=_POLL_SECONDS)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _drain(channel: queue.Queue) -> Iterator[TransactionBatch]:
+    while True:
+        item = channel.get()
+        if item is _DONE:
+            return
+        if isinstance(item, _Failed):
+            raise item.error
+        yield item
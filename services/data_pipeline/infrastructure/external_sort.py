@@ -0,0 +1,186 @@
+"""메모리 예산을 넘는 거래 배치 스트림을 time_seconds 순으로 정렬하는 외부 정렬."""
+
+from __future__ import annotations
+
+import heapq
+import tempfile
+from collections.abc import Iterable, Iterator
+from dataclasses import replace
+from itertools import islice, repeat
+from pathlib import Path
+
+import numpy as np
+
+from services.data_pipeline.domain.models import (
+    PCA_FEATURES_COUNT,
+    BatchSource,
+    RowSources,
+    TransactionBatch,
+    ValidationError,
+    encode_row_sources,
+)
+from services.data_pipeline.infrastructure.csv_parser import DEFAULT_BATCH_SIZE
+from shared.infrastructure.instrumentation import record_bytes_read, record_bytes_written
+
+DEFAULT_MEMORY_BYTES = 256 * 1024 * 1024
+
+# 정렬된 run 파일의 행 레이아웃. row_index와 source 번호로 transaction_id를 복원한다.
+_RECORD = np.dtype(
+    [
+        ("row_index", "<i8"),
+        ("source", "<i4"),
+        ("time_seconds", "<f8"),
+        ("amount_cents", "<i8"),
+        ("is_fraud", "?"),
+        ("pca_features", "<f8", (PCA_FEATURES_COUNT,)),
+    ]
+)
+_SIGN_MASK = np.int64(0x7FFF_FFFF_FFFF_FFFF)
+
+
+class ExternalTimeSorter:
+    """TransactionBatch 스트림을 time_seconds 오름차순으로 다시 배치한다.
+
+    입력을 memory_bytes 안에 들어가는 크기씩 모아 안정 정렬한 뒤 임시 바이너리
+    run 파일로 내보내고, 모든 run을 힙으로 k-way 병합한다. 입력 전체가 한 run에
+    들어가면 파일을 쓰지 않는다. 같은 시각의 거래는 입력 순서를 유지하고,
+    NaN 시각은 맨 뒤에 둔다. row_index와 행별 source를 그대로 옮기므로
+    transaction_id가 보존된다. 여러 원본의 행이 섞인 출력 배치는 source가
+    RowSources이므로, 원본이 번갈아 나와도 출력은 batch_size 행 단위다. 입력 배치의
+    parse_errors는 record_index 순으로 첫 출력 배치에 붙인다.
+    """
+
+    def __init__(
+        self,
+        *,
+        memory_bytes: int = DEFAULT_MEMORY_BYTES,
+        temp_dir: str | Path | None = None,
+    ) -> None:
+        if memory_bytes <= 0:
+            raise ValueError(f"memory_bytes must be positive, got {memory_bytes}")
+        self._run_rows = max(1, memory_bytes // _RECORD.itemsize)
+        self._temp_dir = temp_dir
+
+    def sort_batches(
+        self,
+        batches: Iterable[TransactionBatch],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Iterator[TransactionBatch]:
+        """정렬된 배치를 batch_size 행 단위로 반환한다. 반환값은 1회성 Iterator."""
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+        with tempfile.TemporaryDirectory(prefix="external-sort-", dir=self._temp_dir) as tmp:
+            parse_errors: list[ValidationError] = []
+            sources: dict[BatchSource | None, int] = {}
+            runs: list[Path] = []
+            pending: list[TransactionBatch] = []
+            pending_rows = 0
+            for batch in batches:
+                parse_errors.extend(batch.parse_errors)
+                start = 0
+                while start < len(batch):
+                    part = batch[start:start + self._run_rows - pending_rows]
+                    start += len(part)
+                    pending.append(part)
+                    pending_rows += len(part)
+                    if pending_rows == self._run_rows:
+                        runs.append(_spill(_sorted_records(pending, sources), Path(tmp), len(runs)))
+                        pending = []
+                        pending_rows = 0
+
+            errors = tuple(sorted(parse_errors, key=lambda error: error.record_index))
+            if not runs:
+                merged = iter([_sorted_records(pending, sources)])
+            else:
+                if pending:
+                    runs.append(_spill(_sorted_records(pending, sources), Path(tmp), len(runs)))
+                merged = _merge_runs(runs, batch_size, max(1, self._run_rows // len(runs)))
+            yield from _rebatch(merged, batch_size, errors, list(sources))
+
+
+def _sort_keys(time_seconds: np.ndarray) -> np.ndarray:
+    """time_seconds와 같은 순서를 갖는 int64 키. -0.0은 0.0과 같고 NaN은 가장 크다."""
+    values = np.where(np.isnan(time_seconds), np.nan, time_seconds + 0.0)
+    bits = values.view(np.int64)
+    return bits ^ ((bits >> 63) & _SIGN_MASK)
+
+
+def _sorted_records(
+    batches: list[TransactionBatch], sources: dict[BatchSource | None, int]
+) -> np.ndarray:
+    """배치들을 레코드 배열로 모아 안정 정렬한다. 새 원본에는 다음 번호를 매긴다."""
+    records = np.empty(sum(len(batch) for batch in batches), dtype=_RECORD)
+    start = 0
+    for batch in batches:
+        part = records[start:start + len(batch)]
+        part["row_index"] = batch.row_index
+        part["source"] = encode_row_sources(batch.source, len(batch), sources)
+        part["time_seconds"] = batch.time_seconds
+        part["amount_cents"] = batch.amount_cents
+        part["is_fraud"] = batch.is_fraud
+        part["pca_features"] = batch.pca_features
+        start += len(batch)
+    return records[np.argsort(_sort_keys(records["time_seconds"]), kind="stable")]
+
+
+def _spill(records: np.ndarray, directory: Path, number: int) -> Path:
+    path = directory / f"run-{number:06d}.bin"
+    records.tofile(path)
+    record_bytes_written(records.nbytes)
+    return path
+
+
+def _merge_runs(runs: list[Path], batch_size: int, chunk_rows: int) -> Iterator[np.ndarray]:
+    """run 파일들을 (키, run 번호, 위치) 순으로 병합해 batch_size 행씩 반환한다.
+
+    각 run에서는 chunk_rows개의 키만 메모리에 올리고, 레코드는 memory-map에서
+    출력 배치에 필요한 위치만 읽는다.
+    """
+    maps = [np.memmap(path, dtype=_RECORD, mode="r") for path in runs]
+    merged = heapq.merge(
+        *(_iter_keys(records, number, chunk_rows) for number, records in enumerate(maps))
+    )
+    while True:
+        chunk = list(islice(merged, batch_size))
+        if not chunk:
+            return
+        _, numbers, positions = (np.array(column) for column in zip(*chunk))
+        out = np.empty(len(chunk), dtype=_RECORD)
+        for number in np.unique(numbers):
+            selected = numbers == number
+            out[selected] = maps[number][positions[selected]]
+        record_bytes_read(out.nbytes)
+        yield out
+
+
+def _iter_keys(
+    records: np.ndarray, number: int, chunk_rows: int
+) -> Iterator[tuple[int, int, int]]:
+    for start in range(0, len(records), chunk_rows):
+        stop = min(start + chunk_rows, len(records))
+        keys = _sort_keys(np.asarray(records["time_seconds"][start:stop])).tolist()
+        yield from zip(keys, repeat(number), range(start, stop))
+
+
+def _rebatch(
+    chunks: Iterator[np.ndarray],
+    batch_size: int,
+    parse_errors: tuple[ValidationError, ...],
+    sources: list[BatchSource | None],
+) -> Iterator[TransactionBatch]:
+    pending_errors = parse_errors
+    for records in chunks:
+        for start in range(0, len(records), batch_size):
+            part = records[start:start + batch_size]
+            yield TransactionBatch.from_columns(
+                row_index=np.ascontiguousarray(part["row_index"]),
+                time_seconds=np.ascontiguousarray(part["time_seconds"]),
+                amount_cents=np.ascontiguousarray(part["amount_cents"]),
+                is_fraud=np.ascontiguousarray(part["is_fraud"]),
+                pca_features=np.ascontiguousarray(part["pca_features"]),
+                parse_errors=pending_errors,
+                source=RowSources.of(sources, part["source"]),
+            )
+            pending_errors = ()
+    if pending_errors:
+        yield replace(TransactionBatch.empty(), parse_errors=pending_errors)
@@ -0,0 +1,400 @@
+"""memory-map으로 바로 읽을 수 있는 열 단위 피처 파일 형식.
+
+파일 구조::
+
+    MAGIC | 열 블록들 (8바이트 정렬) | footer JSON | footer 길이 (<u8) | MAGIC
+
+footer에는 행 수, amount_bin 사전, 열마다 dtype/오프셋/바이트 수를 기록한다.
+is_fraud/is_weekend는 np.packbits로 8건당 1바이트, transaction_id는 고정
+폭 bytes(S) 열로 저장한다. 속도 피처가 있으면 (행 수, 구간 수) 모양의 열을
+추가하고 footer에 shape를 함께 기록한다.
+"""
+
+from __future__ import annotations
+
+import json
+import shutil
+import tempfile
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from decimal import Decimal
+from itertools import islice
+from pathlib import Path
+from typing import BinaryIO
+
+import numpy as np
+
+from services.data_pipeline.domain.models import (
+    VELOCITY_WINDOWS_SECONDS,
+    BatchSource,
+    Feature,
+    FeatureBatch,
+    RowSources,
+    VelocityColumns,
+    cents_to_decimal,
+    decimal_to_cents,
+)
+from shared.infrastructure.instrumentation import record_bytes_written
+
+MAGIC = b"FRDFEAT1"
+DEFAULT_CHUNK_ROWS = 65_536
+_FORMAT_VERSION = 1
+_ALIGNMENT = 8
+_FOOTER_LENGTH = np.dtype("<u8")
+_COPY_BYTES = 8 * 1024 * 1024
+_MAX_BIN_LABELS = 256
+
+# 열 이름 → 저장 dtype (transaction_id 제외)
+_FIXED_COLUMNS = {
+    "amount_cents": "<i8",
+    "hour_of_day": "|i1",
+    "day_of_week": "|i1",
+    "amount_bin_codes": "|u1",
+}
+_PACKED_COLUMNS = ("is_fraud", "is_weekend")
+# 속도 피처 열 이름 → (저장 dtype, 구간별 열 여부)
+_VELOCITY_COLUMNS = {
+    "window_counts": ("<i8", True),
+    "window_amount_sums_cents": ("<i8", True),
+    "window_amount_maxes_cents": ("<i8", True),
+    "fraud_rate_to_date": ("<f8", False),
+}
+
+
+@dataclass(frozen=True, eq=False)
+class FeatureColumns:
+    """열 단위 피처 파일을 memory-map한 읽기 전용 열 배열.
+
+    모든 배열은 파일에 대한 복사 없는 뷰이므로 파일이 바뀌지 않는 동안만 유효하다.
+    """
+
+    transaction_id: np.ndarray
+    amount_cents: np.ndarray
+    hour_of_day: np.ndarray
+    day_of_week: np.ndarray
+    amount_bin_codes: np.ndarray
+    amount_bin_labels: tuple[str, ...]
+    is_fraud_packed: np.ndarray
+    is_weekend_packed: np.ndarray
+    velocity: VelocityColumns | None = None
+
+    def __len__(self) -> int:
+        return len(self.amount_cents)
+
+    @property
+    def is_fraud(self) -> np.ndarray:
+        """압축을 푼 bool 배열."""
+        return np.unpackbits(self.is_fraud_packed, count=len(self)).view(np.bool_)
+
+    @property
+    def is_weekend(self) -> np.ndarray:
+        """압축을 푼 bool 배열."""
+        return np.unpackbits(self.is_weekend_packed, count=len(self)).view(np.bool_)
+
+    def feature_batch(
+        self,
+        start: int,
+        stop: int,
+        *,
+        row_index: np.ndarray,
+        source: BatchSource | RowSources | None = None,
+    ) -> FeatureBatch:
+        """[start, stop) 행을 FeatureBatch로 만든다.
+
+        transaction_id 열은 쓰지 않으므로 row_index와 source가 저장할 때의 값과
+        같아야 같은 transaction_id가 나온다. 열은 파일에 대한 뷰를 그대로 쓴다.
+        """
+        if not 0 <= start <= stop <= len(self):
+            raise IndexError(f"rows [{start}, {stop}) out of range for size {len(self)}")
+        skip = start & 7
+        is_fraud = np.unpackbits(self.is_fraud_packed[start >> 3:(stop + 7) >> 3])
+        return FeatureBatch.from_columns(
+            row_index=row_index,
+            amount_cents=self.amount_cents[start:stop],
+            hour_of_day=self.hour_of_day[start:stop],
+            day_of_week=self.day_of_week[start:stop],
+            amount_bin_codes=self.amount_bin_codes[start:stop],
+            amount_bin_labels=self.amount_bin_labels,
+            is_fraud=is_fraud[skip:skip + stop - start].view(np.bool_),
+            velocity=None if self.velocity is None else self.velocity[start:stop],
+            source=source,
+        )
+
+    def __iter__(self) -> Iterator[Feature]:
+        is_fraud = self.is_fraud.tolist()
+        for position in range(len(self)):
+            yield Feature(
+                transaction_id=self.transaction_id[position].decode("utf-8"),
+                amount=cents_to_decimal(int(self.amount_cents[position])),
+                hour_of_day=int(self.hour_of_day[position]),
+                day_of_week=int(self.day_of_week[position]),
+                amount_bin=self.amount_bin_labels[self.amount_bin_codes[position]],
+                is_fraud=is_fraud[position],
+                velocity=None if self.velocity is None else self.velocity.at(position),
+            )
+
+
+def write_feature_columns(
+    features: Iterable[Feature],
+    path: Path,
+    *,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+) -> None:
+    """피처를 열 단위 파일로 저장한다.
+
+    chunk_rows 행씩 열로 변환해 path 옆 임시 디렉터리의 열별 파일에 이어 쓰고,
+    끝나면 하나의 파일로 합친다. 메모리에는 한 청크만 머문다.
+    """
+    if chunk_rows <= 0:
+        raise ValueError(f"chunk_rows must be positive, got {chunk_rows}")
+
+    with tempfile.TemporaryDirectory(dir=path.parent, prefix=f".{path.name}.") as tmp:
+        spill = _ColumnSpill(Path(tmp))
+        try:
+            it = iter(features)
+            while chunk := list(islice(it, chunk_rows)):
+                spill.append(chunk)
+        finally:
+            spill.close()
+        spill.assemble(path)
+
+
+class FeatureBatchWriter:
+    """FeatureBatch를 받는 대로 열로 이어 쓰고 finish에서 path 하나로 합친다.
+
+    write_feature_columns와 같은 파일을 만들되 Feature 객체를 거치지 않는다.
+    finish 없이 close하면 임시 파일만 지우고 path는 만들지 않는다.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._tmp = tempfile.TemporaryDirectory(dir=path.parent, prefix=f".{path.name}.")
+        self._spill = _ColumnSpill(Path(self._tmp.name))
+
+    def __enter__(self) -> FeatureBatchWriter:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def append(self, batch: FeatureBatch) -> None:
+        self._spill.append_batch(batch)
+
+    def finish(self) -> None:
+        self._spill.close()
+        self._spill.assemble(self._path)
+        self.close()
+
+    def close(self) -> None:
+        self._spill.close()
+        self._tmp.cleanup()
+
+
+def open_feature_columns(path: str | Path) -> FeatureColumns:
+    """write_feature_columns로 저장한 파일을 memory-map해 연다."""
+    data = np.memmap(path, dtype=np.uint8, mode="r")
+    trailer = len(MAGIC) + _FOOTER_LENGTH.itemsize
+    if (
+        len(data) < len(MAGIC) + trailer
+        or bytes(data[:len(MAGIC)]) != MAGIC
+        or bytes(data[-len(MAGIC):]) != MAGIC
+    ):
+        raise ValueError(f"{path} is not a columnar feature file")
+    footer_length = int(data[-trailer:-len(MAGIC)].view(_FOOTER_LENGTH)[0])
+    footer = json.loads(bytes(data[-trailer - footer_length:-trailer]))
+    if footer["version"] != _FORMAT_VERSION:
+        raise ValueError(f"unsupported columnar feature file version {footer['version']}")
+
+    def column(name: str) -> np.ndarray:
+        spec = footer["columns"][name]
+        start = spec["offset"]
+        values = data[start:start + spec["nbytes"]].view(spec["dtype"])
+        return values.reshape(spec["shape"]) if "shape" in spec else values
+
+    velocity = None
+    if "fraud_rate_to_date" in footer["columns"]:
+        velocity = VelocityColumns(**{name: column(name) for name in _VELOCITY_COLUMNS})
+    return FeatureColumns(
+        transaction_id=column("transaction_id"),
+        amount_cents=column("amount_cents"),
+        hour_of_day=column("hour_of_day"),
+        day_of_week=column("day_of_week"),
+        amount_bin_codes=column("amount_bin_codes"),
+        amount_bin_labels=tuple(footer["amount_bin_labels"]),
+        is_fraud_packed=column("is_fraud"),
+        is_weekend_packed=column("is_weekend"),
+        velocity=velocity,
+    )
+
+
+class _ColumnSpill:
+    """청크 단위로 변환한 열을 열별 임시 파일에 이어 쓴다."""
+
+    def __init__(self, directory: Path) -> None:
+        self._directory = directory
+        names = ("transaction_id", *_FIXED_COLUMNS, *_PACKED_COLUMNS)
+        self._files = {name: open(directory / f"{name}.bin", "wb") for name in names}
+        self._labels: dict[str, int] = {}
+        # transaction_id 청크별 (행 수, 폭). 폭이 다르면 합칠 때 최대 폭으로 맞춘다.
+        self._id_chunks: list[tuple[int, int]] = []
+        self._rows = 0
+        # 첫 청크에서 정한다. 속도 피처는 모든 피처에 있거나 모두 없어야 한다.
+        self._velocity: bool | None = None
+
+    def append(self, chunk: list[Feature]) -> None:
+        ids = np.array([f.transaction_id.encode("utf-8") for f in chunk], dtype=np.bytes_)
+        self._start_velocity(chunk[0].velocity is not None)
+        if any((f.velocity is not None) != self._velocity for f in chunk):
+            raise ValueError("velocity features must be present on all features or none")
+        self._write(
+            ids,
+            {
+                "amount_cents": [_cents(f.transaction_id, f.amount) for f in chunk],
+                "hour_of_day": [f.hour_of_day for f in chunk],
+                "day_of_week": [f.day_of_week for f in chunk],
+                "amount_bin_codes": [self._code(f.amount_bin) for f in chunk],
+                "is_fraud": [f.is_fraud for f in chunk],
+                "is_weekend": [f.is_weekend for f in chunk],
+            },
+            self._velocity_columns(chunk) if self._velocity else {},
+        )
+
+    def append_batch(self, batch: FeatureBatch) -> None:
+        """FeatureBatch의 열을 행 단위 Feature를 만들지 않고 그대로 이어 쓴다."""
+        if not len(batch):
+            return
+        self._start_velocity(batch.velocity is not None)
+        if (batch.velocity is not None) != self._velocity:
+            raise ValueError("velocity features must be present on all features or none")
+        ids = np.array(
+            [transaction_id.encode("utf-8") for transaction_id in batch.transaction_ids()],
+            dtype=np.bytes_,
+        )
+        codes = np.array([self._code(label) for label in batch.amount_bin_labels], dtype="|u1")
+        velocity = {}
+        if batch.velocity is not None:
+            velocity = {name: getattr(batch.velocity, name) for name in _VELOCITY_COLUMNS}
+        self._write(
+            ids,
+            {
+                "amount_cents": batch.amount_cents,
+                "hour_of_day": batch.hour_of_day,
+                "day_of_week": batch.day_of_week,
+                "amount_bin_codes": codes[batch.amount_bin_codes],
+                "is_fraud": batch.is_fraud,
+                "is_weekend": batch.is_weekend,
+            },
+            velocity,
+        )
+
+    def _write(self, ids: np.ndarray, columns: dict, velocity: dict) -> None:
+        ids.tofile(self._files["transaction_id"])
+        self._id_chunks.append((len(ids), ids.dtype.itemsize))
+        for name, dtype in _FIXED_COLUMNS.items():
+            np.asarray(columns[name], dtype=dtype).tofile(self._files[name])
+        for name in _PACKED_COLUMNS:
+            np.asarray(columns[name], dtype=np.bool_).tofile(self._files[name])
+        for name, values in velocity.items():
+            np.asarray(values, dtype=_VELOCITY_COLUMNS[name][0]).tofile(self._files[name])
+        self._rows += len(ids)
+
+    def _start_velocity(self, present: bool) -> None:
+        """첫 청크의 속도 피처 유무로 열 구성을 정한다."""
+        if self._velocity is not None:
+            return
+        self._velocity = present
+        if present:
+            for name in _VELOCITY_COLUMNS:
+                self._files[name] = open(self._directory / f"{name}.bin", "wb")
+
+    @staticmethod
+    def _velocity_columns(chunk: list[Feature]) -> dict:
+        velocities = [f.velocity for f in chunk]
+        return {
+            "window_counts": [v.window_counts for v in velocities],
+            "window_amount_sums_cents": [
+                [_cents(f.transaction_id, total) for total in v.window_amount_sums]
+                for f, v in zip(chunk, velocities)
+            ],
+            "window_amount_maxes_cents": [
+                [_cents(f.transaction_id, top) for top in v.window_amount_maxes]
+                for f, v in zip(chunk, velocities)
+            ],
+            "fraud_rate_to_date": [v.fraud_rate_to_date for v in velocities],
+        }
+
+    def close(self) -> None:
+        for f in self._files.values():
+            f.close()
+
+    def assemble(self, path: Path) -> None:
+        width = max((w for _, w in self._id_chunks), default=1)
+        specs: dict[str, dict] = {}
+        with open(path, "wb") as out:
+            out.write(MAGIC)
+            specs["transaction_id"] = self._write_block(
+                out, f"|S{width}", lambda: self._copy_ids(out, width)
+            )
+            for name, dtype in _FIXED_COLUMNS.items():
+                specs[name] = self._write_block(
+                    out, dtype, lambda name=name: self._copy_raw(out, name)
+                )
+            for name in _PACKED_COLUMNS:
+                specs[name] = self._write_block(
+                    out, "|u1", lambda name=name: self._copy_packed(out, name)
+                )
+            if self._velocity:
+                for name, (dtype, per_window) in _VELOCITY_COLUMNS.items():
+                    specs[name] = self._write_block(
+                        out, dtype, lambda name=name: self._copy_raw(out, name)
+                    )
+                    if per_window:
+                        specs[name]["shape"] = [self._rows, len(VELOCITY_WINDOWS_SECONDS)]
+            footer = json.dumps({
+                "version": _FORMAT_VERSION,
+                "rows": self._rows,
+                "amount_bin_labels": list(self._labels),
+                "columns": specs,
+            }).encode("utf-8")
+            out.write(footer)
+            out.write(np.array([len(footer)], dtype=_FOOTER_LENGTH).tobytes())
+            out.write(MAGIC)
+            record_bytes_written(out.tell())
+
+    def _code(self, label: str) -> int:
+        code = self._labels.setdefault(label, len(self._labels))
+        if code >= _MAX_BIN_LABELS:
+            raise ValueError(f"amount_bin has more than {_MAX_BIN_LABELS} distinct values")
+        return code
+
+    @staticmethod
+    def _write_block(out: BinaryIO, dtype: str, copy: Callable[[], None]) -> dict:
+        out.write(b"\0" * (-out.tell() % _ALIGNMENT))
+        offset = out.tell()
+        copy()
+        return {"dtype": dtype, "offset": offset, "nbytes": out.tell() - offset}
+
+    def _copy_raw(self, out: BinaryIO, name: str) -> None:
+        with open(self._directory / f"{name}.bin", "rb") as f:
+            shutil.copyfileobj(f, out, _COPY_BYTES)
+
+    def _copy_ids(self, out: BinaryIO, width: int) -> None:
+        if all(w == width for _, w in self._id_chunks):
+            self._copy_raw(out, "transaction_id")
+            return
+        with open(self._directory / "transaction_id.bin", "rb") as f:
+            for rows, chunk_width in self._id_chunks:
+                ids = np.fromfile(f, dtype=f"S{chunk_width}", count=rows)
+                ids.astype(f"S{width}").tofile(out)
+
+    def _copy_packed(self, out: BinaryIO, name: str) -> None:
+        with open(self._directory / f"{name}.bin", "rb") as f:
+            while block := f.read(_COPY_BYTES):
+                out.write(np.packbits(np.frombuffer(block, dtype=np.bool_)).tobytes())
+
+
+def _cents(transaction_id: str, amount: Decimal) -> int:
+    value = decimal_to_cents(amount)
+    if value is None:
+        raise ValueError(f"{transaction_id}: amount {amount} is not representable in cents")
+    return value
@@ -0,0 +1,194 @@
+"""피처 CSV 인코딩. 로컬/S3 저장소가 같은 형식으로 저장하도록 공유한다."""
+
+from __future__ import annotations
+
+import csv
+import io
+from collections.abc import Iterable, Iterator
+from decimal import Decimal
+from itertools import chain
+
+import numpy as np
+
+from services.data_pipeline.domain.models import (
+    AMOUNT_DECIMAL_PLACES,
+    VELOCITY_WINDOWS_SECONDS,
+    Feature,
+    FeatureBatch,
+    decimal_to_cents,
+    format_cents,
+)
+
+FEATURE_CSV_FIELDNAMES = [
+    "transaction_id",
+    "amount",
+    "hour_of_day",
+    "day_of_week",
+    "amount_bin",
+    "is_fraud",
+    "is_weekend",
+]
+# 속도 피처가 있으면 FEATURE_CSV_FIELDNAMES 뒤에 붙는 컬럼.
+VELOCITY_CSV_FIELDNAMES = [
+    *(
+        f"{name}_{seconds}s"
+        for seconds in VELOCITY_WINDOWS_SECONDS
+        for name in ("txn_count", "amount_sum", "amount_max")
+    ),
+    "fraud_rate_to_date",
+]
+
+DEFAULT_CHUNK_BYTES = 1024 * 1024
+# 센트 나머지(0~99)의 소수부 문자열(끝의 0은 뺀다, 0 → "", 50 → ".5", 5 → ".05").
+# _format_amounts가 행마다 포맷하지 않도록 미리 만든다.
+_FRACTIONS = [
+    f".{i:0{AMOUNT_DECIMAL_PLACES}d}".rstrip("0").rstrip(".")
+    for i in range(10**AMOUNT_DECIMAL_PLACES)
+]
+
+
+def encode_feature_csv(
+    features: Iterable[Feature],
+    *,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+    header: bool = True,
+) -> Iterator[bytes]:
+    """피처 CSV를 UTF-8 bytes 조각으로 인코딩한다.
+
+    header가 False이면 기존 파일 뒤에 덧붙일 수 있도록 헤더 줄을 생략한다.
+    금액은 끝의 0을 뺀 가장 짧은 소수 표기로 쓴다 ("123.50" → 123.5, "7.00" → 7).
+    원본 표기가 그런 Kaggle 데이터에서는 str(Decimal)과 같고, encode_feature_batch_csv와
+    바이트가 같다. 센트로 표현할 수 없는 금액만 str(Decimal) 그대로 쓴다.
+
+    마지막 조각을 제외한 각 조각은 chunk_bytes 이상이다. 반환값은 1회성 Iterator.
+    첫 피처에 속도 피처가 있으면 VELOCITY_CSV_FIELDNAMES 컬럼을 덧붙이며, 이때는
+    모든 피처에 속도 피처가 있어야 한다.
+    """
+    if chunk_bytes <= 0:
+        raise ValueError(f"chunk_bytes must be positive, got {chunk_bytes}")
+
+    it = iter(features)
+    first = next(it, None)
+    with_velocity = first is not None and first.velocity is not None
+    if first is not None:
+        it = chain([first], it)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(_fieldnames(with_velocity))
+    for feature in it:
+        row = [
+            feature.transaction_id,
+            _format_amount(feature.amount),
+            feature.hour_of_day,
+            feature.day_of_week,
+            feature.amount_bin,
+            feature.is_fraud,
+            feature.is_weekend,
+        ]
+        if (feature.velocity is not None) != with_velocity:
+            raise ValueError("velocity features must be present on all features or none")
+        if with_velocity:
+            velocity = feature.velocity
+            for count, total, top in zip(
+                velocity.window_counts,
+                velocity.window_amount_sums,
+                velocity.window_amount_maxes,
+            ):
+                row += [count, _format_amount(total), _format_amount(top)]
+            row.append(velocity.fraud_rate_to_date)
+        writer.writerow(row)
+        if buffer.tell() >= chunk_bytes:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def encode_feature_batch_csv(
+    batches: Iterable[FeatureBatch],
+    *,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+    header: bool = True,
+) -> Iterator[bytes]:
+    """FeatureBatch를 encode_feature_csv와 같은 형식으로 인코딩한다.
+
+    Feature 객체와 Decimal을 만들지 않고 열을 그대로 쓰며, 금액은 센트 정수에서
+    encode_feature_csv와 같은 표기로 바로 만든다. 따라서 같은 행의 Feature를
+    encode_feature_csv로 인코딩한 결과와 바이트가 같다. 속도 피처 컬럼 여부는 처음으로 행이 있는 배치가 정한다. 조각은 배치 단위로
+    나누므로 chunk_bytes보다 클 수 있다.
+    """
+    if chunk_bytes <= 0:
+        raise ValueError(f"chunk_bytes must be positive, got {chunk_bytes}")
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    with_velocity: bool | None = None
+    for batch in batches:
+        if not len(batch):
+            continue
+        if with_velocity is None:
+            with_velocity = batch.velocity is not None
+            if header:
+                writer.writerow(_fieldnames(with_velocity))
+        elif (batch.velocity is not None) != with_velocity:
+            raise ValueError("velocity features must be present on all features or none")
+        writer.writerows(zip(*_batch_columns(batch)))
+        if buffer.tell() >= chunk_bytes:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+    if with_velocity is None and header:
+        writer.writerow(_fieldnames(False))
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def _fieldnames(with_velocity: bool) -> list[str]:
+    return FEATURE_CSV_FIELDNAMES + (VELOCITY_CSV_FIELDNAMES if with_velocity else [])
+
+
+def _batch_columns(batch: FeatureBatch) -> list[list]:
+    """CSV 컬럼 순서대로 배치의 열을 str(Feature 필드)와 같은 값의 리스트로 만든다."""
+    columns = [
+        list(batch.transaction_ids()),
+        _format_amounts(batch.amount_cents),
+        batch.hour_of_day.tolist(),
+        batch.day_of_week.tolist(),
+        [batch.amount_bin_labels[code] for code in batch.amount_bin_codes.tolist()],
+        batch.is_fraud.tolist(),
+        batch.is_weekend.tolist(),
+    ]
+    velocity = batch.velocity
+    if velocity is not None:
+        for window in range(len(VELOCITY_WINDOWS_SECONDS)):
+            columns += [
+                velocity.window_counts[:, window].tolist(),
+                _format_amounts(velocity.window_amount_sums_cents[:, window]),
+                _format_amounts(velocity.window_amount_maxes_cents[:, window]),
+            ]
+        columns.append(velocity.fraud_rate_to_date.tolist())
+    return columns
+
+
+def _format_amount(amount: Decimal) -> str:
+    """금액의 CSV 표기. 센트로 표현할 수 있으면 _format_amounts와 같다."""
+    cents = decimal_to_cents(amount)
+    return str(amount) if cents is None else _format_cents(cents)
+
+
+def _format_cents(cents: int) -> str:
+    """format_cents에서 소수부 끝의 0을 뺀 표기 (150 → "1.5", 700 → "7")."""
+    return format_cents(cents).rstrip("0").rstrip(".")
+
+
+def _format_amounts(cents: np.ndarray) -> list[str]:
+    """열 전체에 _format_cents를 적용한다. 음수가 없으면 몫/나머지를 배열 단위로 구한다."""
+    if len(cents) and cents.min() < 0:
+        return list(map(_format_cents, cents.tolist()))
+    whole, fraction = np.divmod(cents, 10**AMOUNT_DECIMAL_PLACES)
+    return [
+        f"{units}{_FRACTIONS[rest]}"
+        for units, rest in zip(whole.tolist(), fraction.tolist())
+    ]
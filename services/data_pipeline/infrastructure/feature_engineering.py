@@ -2,44 +2,138 @@
 
 from __future__ import annotations
 
+import json
 from collections.abc import Iterable, Iterator
+from dataclasses import replace
 from decimal import Decimal
 
-from services.data_pipeline.domain.models import Feature, RawTransaction
+import numpy as np
+
+from services.data_pipeline.domain.models import (
+    AMOUNT_DECIMAL_PLACES,
+    VELOCITY_WINDOWS_SECONDS,
+    Feature,
+    FeatureBatch,
+    RawTransaction,
+    TransactionBatch,
+    VelocityFeatures,
+    cents_to_decimal,
+    decimal_to_cents,
+)
 from services.data_pipeline.domain.services import FeatureEngineeringService
+from services.data_pipeline.infrastructure.velocity import VelocityFeatureExtractor
 
 SECONDS_PER_DAY = 86400
 SECONDS_PER_HOUR = 3600
 DAYS_PER_WEEK = 7
+# 피처 계산 코드를 바꿔 같은 입력의 결과가 달라지면 올린다 (version() 참고).
+_FEATURE_VERSION = 1
 
 AMOUNT_LOW_UPPER = Decimal("10")
 AMOUNT_MEDIUM_UPPER = Decimal("100")
 AMOUNT_HIGH_UPPER = Decimal("500")
 
+AMOUNT_BIN_LABELS = ("low", "medium", "high", "very_high")
+_AMOUNT_BIN_EDGES_CENTS = np.array(
+    [
+        int(upper.scaleb(AMOUNT_DECIMAL_PLACES))
+        for upper in (AMOUNT_LOW_UPPER, AMOUNT_MEDIUM_UPPER, AMOUNT_HIGH_UPPER)
+    ],
+    dtype=np.int64,
+)
+
 
 class KaggleFeatureEngineeringService(FeatureEngineeringService):
-    """Kaggle Credit Card Fraud Detection 데이터셋 전용 피처 엔지니어링."""
+    """Kaggle Credit Card Fraud Detection 데이터셋 전용 피처 엔지니어링.
+
+    velocity가 True이면 VELOCITY_WINDOWS_SECONDS 구간별 거래 속도 피처와 누적
+    사기 비율도 계산한다. 입력은 time_seconds 순서여야 하며, 이 상태는
+    extract_features_batch 호출 사이에 유지되므로 새 입력 전에 reset()을 호출한다.
+    extract_features는 호출마다 새 스트림으로 계산한다.
+    """
+
+    def __init__(self, *, velocity: bool = False) -> None:
+        self._velocity = VelocityFeatureExtractor() if velocity else None
+
+    def reset(self) -> None:
+        if self._velocity is not None:
+            self._velocity.reset()
+
+    def is_stateful(self) -> bool:
+        return self._velocity is not None
+
+    def version(self) -> str:
+        """_FEATURE_VERSION, 시간 상수, 금액 구간 경계와 라벨, 속도 피처 구간."""
+        return json.dumps([
+            _FEATURE_VERSION,
+            [SECONDS_PER_DAY, SECONDS_PER_HOUR, DAYS_PER_WEEK],
+            [str(upper) for upper in (AMOUNT_LOW_UPPER, AMOUNT_MEDIUM_UPPER, AMOUNT_HIGH_UPPER)],
+            list(AMOUNT_BIN_LABELS),
+            None if self._velocity is None else list(VELOCITY_WINDOWS_SECONDS),
+        ])
 
     def extract_features(
         self, transactions: Iterable[RawTransaction]
     ) -> Iterator[Feature]:
         """원본 거래에서 피처를 추출한다. 반환값은 1회성 Iterator."""
-        return (self._to_feature(txn) for txn in transactions)
+        if self._velocity is None:
+            return (self._to_feature(txn) for txn in transactions)
+        return self._iter_with_velocity(transactions, VelocityFeatureExtractor())
+
+    def extract_features_batch(self, batch: TransactionBatch) -> FeatureBatch:
+        """TransactionBatch 전체의 피처를 배열 연산으로 한 번에 계산한다.
+
+        결과는 _to_feature를 행마다 적용한 것과 값 단위로 같다.
+        """
+        if not np.all(np.isfinite(batch.time_seconds)):
+            raise ValueError("time_seconds must be finite")
+        seconds = batch.time_seconds.astype(np.int64)
+        hour_of_day = (seconds % SECONDS_PER_DAY) // SECONDS_PER_HOUR
+        day_of_week = (seconds // SECONDS_PER_DAY) % DAYS_PER_WEEK
+        amount_bin_codes = np.searchsorted(
+            _AMOUNT_BIN_EDGES_CENTS, batch.amount_cents, side="right"
+        )
+        velocity = None
+        if self._velocity is not None:
+            velocity = self._velocity.update_batch(
+                batch.time_seconds, batch.amount_cents, batch.is_fraud
+            )
+        return FeatureBatch(
+            row_index=batch.row_index,
+            amount_cents=batch.amount_cents,
+            hour_of_day=hour_of_day.astype(np.int8),
+            day_of_week=day_of_week.astype(np.int8),
+            amount_bin_codes=amount_bin_codes.astype(np.uint8),
+            amount_bin_labels=AMOUNT_BIN_LABELS,
+            is_fraud_packed=batch.is_fraud_packed,
+            velocity=velocity,
+            source=batch.source,
+        )
+
+    def _iter_with_velocity(
+        self,
+        transactions: Iterable[RawTransaction],
+        extractor: VelocityFeatureExtractor,
+    ) -> Iterator[Feature]:
+        for txn in transactions:
+            stats, rate = extractor.update(txn.time_seconds, _amount_cents(txn), txn.is_fraud)
+            velocity = VelocityFeatures(
+                window_counts=tuple(count for count, _, _ in stats),
+                window_amount_sums=tuple(cents_to_decimal(total) for _, total, _ in stats),
+                window_amount_maxes=tuple(cents_to_decimal(top) for _, _, top in stats),
+                fraud_rate_to_date=rate,
+            )
+            yield replace(self._to_feature(txn), velocity=velocity)
 
     @staticmethod
     def _to_feature(txn: RawTransaction) -> Feature:
-        """단일 RawTransaction을 Feature로 변환한다."""
+        """단일 RawTransaction을 Feature로 변환한다. 센트로 표현할 수 없는 금액은 ValueError."""
         hour_of_day = (int(txn.time_seconds) % SECONDS_PER_DAY) // SECONDS_PER_HOUR
         day_of_week = (int(txn.time_seconds) // SECONDS_PER_DAY) % DAYS_PER_WEEK
 
-        if txn.amount < AMOUNT_LOW_UPPER:
-            amount_bin = "low"
-        elif txn.amount < AMOUNT_MEDIUM_UPPER:
-            amount_bin = "medium"
-        elif txn.amount < AMOUNT_HIGH_UPPER:
-            amount_bin = "high"
-        else:
-            amount_bin = "very_high"
+        amount_bin = AMOUNT_BIN_LABELS[
+            np.searchsorted(_AMOUNT_BIN_EDGES_CENTS, _amount_cents(txn), side="right")
+        ]
 
         return Feature(
             transaction_id=txn.transaction_id,
@@ -49,3 +143,15 @@ class KaggleFeatureEngineeringService(FeatureEngineeringService):
             amount_bin=amount_bin,
             is_fraud=txn.is_fraud,
         )
+
+
+def _amount_cents(txn: RawTransaction) -> int:
+    """피처 계산용 센트 정수 금액. 센트로 표현할 수 없으면 ValueError.
+
+    검증기가 같은 규칙(decimal_to_cents가 None)으로 invalid amount를 보고하므로
+    검증을 거친 행에서는 일어나지 않는다.
+    """
+    cents = decimal_to_cents(txn.amount)
+    if cents is None:
+        raise ValueError(f"{txn.transaction_id}: amount {txn.amount} is not representable in cents")
+    return cents
@@ -0,0 +1,280 @@
+"""뒤에 행이 덧붙는 원본에서 새 행만 처리하는 증분 파이프라인."""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+from services.data_pipeline.application.use_cases import ProcessDataUseCase
+from services.data_pipeline.domain.models import (
+    Feature,
+    ProcessDataResult,
+    RawTransaction,
+    SourceState,
+    SourceWatermark,
+    TransactionBatch,
+)
+from services.data_pipeline.domain.repositories import (
+    IncrementalTransactionRepository,
+    TransactionRepository,
+    ValidationReportRepository,
+)
+from services.data_pipeline.domain.services import FeatureEngineeringService
+from services.data_pipeline.infrastructure.csv_parser import (
+    DEFAULT_BATCH_SIZE,
+    KaggleCsvParser,
+    iter_lines,
+)
+from services.data_pipeline.infrastructure.pipeline import (
+    DEFAULT_QUEUE_SIZE,
+    PipelinedProcessDataUseCase,
+)
+from services.data_pipeline.infrastructure.validators import TransactionValidator
+from shared.infrastructure.instrumentation import record_bytes_read
+
+_Digest = type(hashlib.sha256())
+
+
+class IncrementalProcessDataUseCase(ProcessDataUseCase):
+    """이전 실행 이후 원본 뒤에 덧붙은 행만 로드 → 검증 → 피처 추출 → 저장한다.
+
+    피처 파일 옆 manifest(SourceWatermark)에 처리한 바이트 위치와 행 수, 원본
+    크기/ETag, 처리한 앞부분의 checksum, 피처 파일 크기를 기록한다. 다음 실행은
+    checksum이 맞으면 그 위치부터(S3는 Range GET으로) 새 줄만 읽어 피처를 기존
+    파일 뒤에 덧붙이고, manifest가 없거나 앞부분이 바뀌었으면 처음부터 다시
+    만든다. 개행으로 끝나지 않은 마지막 줄은 아직 쓰는 중으로 보고 다음 실행으로
+    미룬다. 피처를 덧붙인 뒤 manifest를 저장하기 전에 중단되었다면 피처 파일이
+    manifest의 크기보다 크므로, 다음 실행은 그 크기로 자른 뒤 덧붙여 같은 행이
+    두 번 기록되지 않게 한다.
+
+    검증 리포트와 반환하는 건수는 이번 실행에서 처리한 행만 다루며, 누적 건수는
+    manifest에 남는다. checksum은 기본적으로 처리한 앞부분 전체의 SHA-256이다.
+    이어서 처리할 때는 저장된 앞부분 [0, byte_offset)만 한 번 해시해 확인하고, 그
+    digest를 새 줄이 파서로 흘러가는 동안 이어서 갱신하므로 원본을 한 번만 읽는다.
+    check_bytes를 주면 앞부분을 모두 다시 읽지 않도록 처음과 마지막 check_bytes
+    바이트만 해시하며, 그 사이가 바뀐 경우는 알아채지 못한다. velocity처럼 앞
+    행들에 기대는 피처는 실행 사이에 상태를 이어 갈 수 없으므로 상태가 있는
+    피처 서비스(is_stateful)는 받지 않는다.
+    """
+
+    def __init__(
+        self,
+        transaction_repository: IncrementalTransactionRepository,
+        feature_service: FeatureEngineeringService,
+        report_repository: ValidationReportRepository,
+        *,
+        validator: TransactionValidator | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        check_bytes: int | None = None,
+        tolerant: bool = False,
+    ) -> None:
+        if check_bytes is not None and check_bytes <= 0:
+            raise ValueError(f"check_bytes must be positive, got {check_bytes}")
+        if feature_service.is_stateful():
+            raise ValueError(
+                "incremental processing does not support stateful feature services "
+                "(e.g. velocity features)"
+            )
+        self._transactions = transaction_repository
+        self._features = feature_service
+        self._reports = report_repository
+        self._validator = validator
+        self._batch_size = batch_size
+        self._queue_size = queue_size
+        self._check_bytes = check_bytes
+        self._parser = KaggleCsvParser(tolerant=tolerant)
+
+    def execute(self, source: str, destination: str) -> ProcessDataResult:
+        state = self._transactions.source_state(source)
+        resume, digest = self._resume_point(source, destination, state)
+        rows = _AppendedRows(self._transactions, self._parser, resume, state, digest)
+        result = PipelinedProcessDataUseCase(
+            rows,
+            self._features,
+            self._reports,
+            validator=self._validator,
+            batch_size=self._batch_size,
+            queue_size=self._queue_size,
+        ).execute(source, destination)
+
+        previous_records = 0 if resume is None else resume.record_count
+        previous_valid = 0 if resume is None else resume.valid_records
+        self._transactions.save_watermark(
+            SourceWatermark(
+                source=source,
+                source_size=state.size,
+                source_etag=state.etag,
+                byte_offset=rows.end_offset,
+                record_count=previous_records + rows.record_count,
+                valid_records=previous_valid + result.valid_records,
+                features_size=self._transactions.features_size(destination) or 0,
+                columns=rows.columns,
+                check_bytes=self._check_bytes,
+                checksum=self._checksum(source, state, resume, rows),
+            ),
+            destination,
+        )
+        return result
+
+    def _checksum(
+        self,
+        source: str,
+        state: SourceState,
+        resume: SourceWatermark | None,
+        rows: _AppendedRows,
+    ) -> str:
+        """이번 실행까지 처리한 [0, rows.end_offset) 구간의 checksum."""
+        if rows.digest is not None:
+            return rows.digest.hexdigest()
+        if (
+            resume is not None
+            and resume.check_bytes == self._check_bytes
+            and resume.byte_offset == rows.end_offset
+        ):
+            return resume.checksum
+        return _prefix_checksum(
+            self._transactions, source, rows.end_offset, self._check_bytes, state.etag
+        )
+
+    def _resume_point(
+        self, source: str, destination: str, state: SourceState
+    ) -> tuple[SourceWatermark | None, _Digest | None]:
+        """이어서 처리할 수 있는 manifest와 그 앞부분을 해시한 digest.
+
+        manifest가 없거나 앞부분이 바뀌었으면 manifest는 None이다. digest는 전체
+        해시(check_bytes=None)로 이어 갈 수 있을 때만 주며, 처음부터 처리하면 빈
+        digest, 원본이 그대로라 앞부분을 읽지 않았으면 None이다.
+        """
+        fresh = hashlib.sha256() if self._check_bytes is None else None
+        previous = self._transactions.load_watermark(destination)
+        if previous is None or previous.source != source or not previous.columns:
+            return None, fresh
+        if state.size < previous.byte_offset:
+            return None, fresh
+        features_size = self._transactions.features_size(destination)
+        if features_size is None or features_size < previous.features_size:
+            return None, fresh
+        if state.etag is not None and (state.size, state.etag) == (
+            previous.source_size,
+            previous.source_etag,
+        ):
+            return previous, None
+        if previous.check_bytes is not None:
+            checksum = _prefix_checksum(
+                self._transactions, source, previous.byte_offset, previous.check_bytes, state.etag
+            )
+            return (previous, None) if checksum == previous.checksum else (None, fresh)
+        digest = _hash_prefix(self._transactions, source, previous.byte_offset, state.etag)
+        if digest.hexdigest() != previous.checksum:
+            return None, fresh
+        return previous, digest if self._check_bytes is None else None
+
+
+class _AppendedRows(TransactionRepository):
+    """PipelinedProcessDataUseCase에 넘기는 저장소 뷰.
+
+    resume 이후의 완전한 줄만 로드하고, resume이 있으면 피처를 덧붙여 저장한다.
+    로드가 끝나면 end_offset, columns, record_count가 이번 실행 결과를 가리킨다.
+    digest가 있으면 읽은 헤더와 줄로 갱신해 [0, end_offset)의 해시가 되게 한다.
+    """
+
+    def __init__(
+        self,
+        repository: IncrementalTransactionRepository,
+        parser: KaggleCsvParser,
+        resume: SourceWatermark | None,
+        state: SourceState,
+        digest: _Digest | None = None,
+    ) -> None:
+        self._repository = repository
+        self._parser = parser
+        self._resume = resume
+        self._state = state
+        self.digest = digest
+        self.end_offset = 0 if resume is None else resume.byte_offset
+        self.columns: tuple[str, ...] = () if resume is None else resume.columns
+        self.record_count = 0
+
+    def list_sources(self, pattern: str) -> list[str]:
+        return self._repository.list_sources(pattern)
+
+    def load_raw_transactions(self, source: str) -> Iterator[RawTransaction]:
+        for batch in self.load_raw_batches(source):
+            yield from batch
+
+    def load_raw_batches(
+        self,
+        source: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Iterator[TransactionBatch]:
+        lines = iter_lines(
+            self._repository.iter_source_bytes(
+                source, self.end_offset, self._state.size, etag=self._state.etag
+            )
+        )
+        start_index = 0
+        if self._resume is None:
+            header = next(lines, None)
+            if header is None or not header.endswith(b"\n"):
+                return
+            record_bytes_read(len(header))
+            self.columns = self._parser.parse_header(header)
+            self.end_offset += len(header)
+            if self.digest is not None:
+                self.digest.update(header)
+        else:
+            start_index = self._resume.record_count
+
+        for batch in self._parser.parse_lines(
+            self._complete_lines(lines),
+            columns=self.columns,
+            batch_size=batch_size,
+            start_index=start_index,
+        ):
+            self.record_count += batch.record_count
+            yield batch
+
+    def save_features(self, features: Iterable[Feature], destination: str) -> Path:
+        if self._resume is None:
+            return self._repository.save_features(features, destination)
+        return self._repository.append_features(
+            features, destination, base_size=self._resume.features_size
+        )
+
+    def _complete_lines(self, lines: Iterator[bytes]) -> Iterator[bytes]:
+        for line in lines:
+            if not line.endswith(b"\n"):
+                return
+            self.end_offset += len(line)
+            if self.digest is not None:
+                self.digest.update(line)
+            yield line
+
+
+def _prefix_checksum(
+    repository: IncrementalTransactionRepository,
+    source: str,
+    offset: int,
+    check_bytes: int | None,
+    etag: str | None,
+) -> str:
+    """원본 [0, offset) 구간의 SHA-256. check_bytes가 있으면 처음과 마지막 구간만 읽는다."""
+    if check_bytes is None or offset <= 2 * check_bytes:
+        return _hash_prefix(repository, source, offset, etag).hexdigest()
+    digest = hashlib.sha256(str(offset).encode("ascii"))
+    for start, end in [(0, check_bytes), (offset - check_bytes, offset)]:
+        for chunk in repository.iter_source_bytes(source, start, end, etag=etag):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _hash_prefix(
+    repository: IncrementalTransactionRepository, source: str, offset: int, etag: str | None
+) -> _Digest:
+    """원본 [0, offset) 구간을 해시한 digest. 이어서 update할 수 있다."""
+    digest = hashlib.sha256()
+    for chunk in repository.iter_source_bytes(source, 0, offset, etag=etag):
+        digest.update(chunk)
+    return digest
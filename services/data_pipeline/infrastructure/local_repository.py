@@ -3,23 +3,101 @@
 from __future__ import annotations
 
 import csv
-import json
+import glob
+import os
 from collections.abc import Iterable, Iterator
 from pathlib import Path
 
-from services.data_pipeline.domain.models import Feature, RawTransaction, ValidationReport
+from services.data_pipeline.domain.models import (
+    Feature,
+    FeatureBatch,
+    RawTransaction,
+    SourceState,
+    SourceWatermark,
+    TransactionBatch,
+    ValidationReport,
+)
 from services.data_pipeline.domain.repositories import (
-    TransactionRepository,
+    IncrementalTransactionRepository,
     ValidationReportRepository,
 )
-from services.data_pipeline.infrastructure.csv_parser import KaggleCsvParser
+from services.data_pipeline.infrastructure.csv_parser import (
+    DEFAULT_BATCH_SIZE,
+    PCA_SKIP,
+    PCA_STRICT,
+    KaggleCsvParser,
+)
+from services.data_pipeline.infrastructure.feature_columnar import (
+    FeatureBatchWriter,
+    write_feature_columns,
+)
+from services.data_pipeline.infrastructure.feature_csv import (
+    encode_feature_batch_csv,
+    encode_feature_csv,
+)
+from services.data_pipeline.infrastructure.parallel_csv import (
+    DEFAULT_SHARD_BYTES,
+    load_sharded,
+)
+from services.data_pipeline.infrastructure.raw_cache import ParsedRawCache, cache_key
+from services.data_pipeline.infrastructure.report_json import (
+    encode_errors_ndjson,
+    encode_report_json,
+)
+from services.data_pipeline.infrastructure.watermark_json import (
+    decode_watermark,
+    encode_watermark,
+    watermark_destination,
+)
+from shared.infrastructure.instrumentation import record_bytes_written
 
+DEFAULT_PARALLEL_MIN_BYTES = 256 * 1024 * 1024
+DEFAULT_READ_BYTES = 1024 * 1024
+FEATURE_FORMAT_CSV = "csv"
+FEATURE_FORMAT_COLUMNAR = "columnar"
 
-class LocalFileTransactionRepository(TransactionRepository):
-    """로컬 CSV 파일에서 Kaggle 거래 데이터를 로드하는 저장소."""
 
-    def __init__(self) -> None:
-        self._parser = KaggleCsvParser()
+class LocalFileTransactionRepository(IncrementalTransactionRepository):
+    """로컬 CSV 파일에서 Kaggle 거래 데이터를 로드하는 저장소.
+
+    workers가 2 이상이고 파일이 parallel_min_bytes 이상이면 load_raw_batches는
+    파일을 shard_bytes 단위로 나눠 프로세스 풀에서 파싱한다.
+    cache가 주어지면 파싱 결과를 (경로, mtime, 크기) 키로 캐시해 두고,
+    파일이 바뀌지 않은 다음 로드부터는 CSV 대신 캐시를 memory-map으로 읽는다.
+    feature_format이 "columnar"이면 save_features는 CSV 대신 열 단위 바이너리
+    파일(feature_columnar)을 쓴다.
+    tolerant가 True이면 load_raw_batches는 변환에 실패한 행에서 멈추지 않고
+    배치의 parse_errors로 넘긴다 (KaggleCsvParser 참고).
+    pca_features가 "lazy"/"skip"이면 PCA 열을 디코딩하지 않는다 (KaggleCsvParser 참고).
+    캐시 적중 시에도 같은 방식으로 보이며, skip은 캐시와 함께 쓸 수 없다.
+    증분 처리용 manifest는 피처 파일 옆 `<이름>_manifest.json`에 저장한다.
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: int = 1,
+        parallel_min_bytes: int = DEFAULT_PARALLEL_MIN_BYTES,
+        shard_bytes: int = DEFAULT_SHARD_BYTES,
+        cache: ParsedRawCache | None = None,
+        feature_format: str = FEATURE_FORMAT_CSV,
+        tolerant: bool = False,
+        pca_features: str = PCA_STRICT,
+    ) -> None:
+        if workers <= 0:
+            raise ValueError(f"workers must be positive, got {workers}")
+        if shard_bytes <= 0:
+            raise ValueError(f"shard_bytes must be positive, got {shard_bytes}")
+        if feature_format not in (FEATURE_FORMAT_CSV, FEATURE_FORMAT_COLUMNAR):
+            raise ValueError(f"unsupported feature_format {feature_format!r}")
+        if cache is not None and pca_features == PCA_SKIP:
+            raise ValueError("pca_features='skip' cannot be combined with a parsed raw cache")
+        self._parser = KaggleCsvParser(tolerant=tolerant, pca_features=pca_features)
+        self._workers = workers
+        self._parallel_min_bytes = parallel_min_bytes
+        self._shard_bytes = shard_bytes
+        self._cache = cache
+        self._feature_format = feature_format
 
     def load_raw_transactions(self, source: str) -> Iterator[RawTransaction]:
         path = Path(source)
@@ -31,62 +109,202 @@ class LocalFileTransactionRepository(TransactionRepository):
             for idx, row in enumerate(reader):
                 yield self._parser.parse_row(row, row_index=idx)
 
+    def load_raw_batches(
+        self,
+        source: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Iterator[TransactionBatch]:
+        """원본 거래 데이터를 batch_size 행 단위의 열 배열로 로드한다."""
+        path = Path(source)
+        if not path.exists():
+            raise FileNotFoundError(f"File not found: {source}")
+        if self._cache is None:
+            yield from self._parse_batches(path, batch_size)
+            return
+
+        key = self._fingerprint(path)
+        cached = self._cache.iter_batches(key, batch_size)
+        if cached is not None:
+            yield from map(self._parser.project, cached)
+        else:
+            yield from self._cache.write_through(key, self._parse_batches(path, batch_size))
+
+    def source_fingerprint(self, source: str) -> str | None:
+        """(경로, mtime, 크기, 파싱 설정)으로 만든 키. 파싱 결과 캐시 키와 같다."""
+        path = Path(source)
+        if not path.exists():
+            return None
+        return self._fingerprint(path)
+
+    def _fingerprint(self, path: Path) -> str:
+        stat = path.stat()
+        return cache_key(
+            "local",
+            path.resolve(),
+            stat.st_mtime_ns,
+            stat.st_size,
+            self._parser.tolerant,
+            self._parser.pca_features,
+        )
+
+    def _parse_batches(self, path: Path, batch_size: int) -> Iterator[TransactionBatch]:
+        if self._workers > 1 and path.stat().st_size >= self._parallel_min_bytes:
+            yield from load_sharded(
+                path,
+                batch_size=batch_size,
+                workers=self._workers,
+                shard_bytes=self._shard_bytes,
+                tolerant=self._parser.tolerant,
+                pca_features=self._parser.pca_features,
+            )
+            return
+
+        with open(path, "rb") as f:
+            yield from self._parser.parse_file(f, batch_size=batch_size)
+
+    def list_sources(self, pattern: str) -> list[str]:
+        """glob 패턴(`**` 포함)에 맞는 파일 경로를 정렬해 반환한다. 디렉터리는 제외한다."""
+        return sorted(
+            path for path in glob.glob(pattern, recursive=True) if os.path.isfile(path)
+        )
+
     def save_features(self, features: Iterable[Feature], destination: str) -> Path:
-        """엔지니어링된 피처를 CSV 파일로 저장한다."""
+        """엔지니어링된 피처를 feature_format 형식의 파일로 저장한다."""
+        path = Path(destination)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        if self._feature_format == FEATURE_FORMAT_COLUMNAR:
+            write_feature_columns(features, path)
+            return path
+
+        with open(path, "wb") as f:
+            for chunk in encode_feature_csv(features):
+                f.write(chunk)
+                record_bytes_written(len(chunk))
+
+        return path
+
+    def save_feature_batches(self, batches: Iterable[FeatureBatch], destination: str) -> Path:
+        """save_features와 같은 파일을 Feature 객체를 만들지 않고 열에서 바로 쓴다."""
         path = Path(destination)
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        fieldnames = [
-            "transaction_id",
-            "amount",
-            "hour_of_day",
-            "day_of_week",
-            "amount_bin",
-            "is_fraud",
-            "is_weekend",
-        ]
-
-        with open(path, "w", encoding="utf-8", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            for feature in features:
-                writer.writerow({
-                    "transaction_id": feature.transaction_id,
-                    "amount": str(feature.amount),
-                    "hour_of_day": feature.hour_of_day,
-                    "day_of_week": feature.day_of_week,
-                    "amount_bin": feature.amount_bin,
-                    "is_fraud": feature.is_fraud,
-                    "is_weekend": feature.is_weekend,
-                })
+        if self._feature_format == FEATURE_FORMAT_COLUMNAR:
+            with FeatureBatchWriter(path) as writer:
+                for batch in batches:
+                    writer.append(batch)
+                writer.finish()
+            return path
+
+        with open(path, "wb") as f:
+            for chunk in encode_feature_batch_csv(batches):
+                f.write(chunk)
+                record_bytes_written(len(chunk))
 
         return path
 
+    def source_state(self, source: str) -> SourceState:
+        path = Path(source)
+        if not path.exists():
+            raise FileNotFoundError(f"File not found: {source}")
+        return SourceState(size=path.stat().st_size)
+
+    def iter_source_bytes(
+        self,
+        source: str,
+        start: int = 0,
+        end: int | None = None,
+        *,
+        etag: str | None = None,
+    ) -> Iterator[bytes]:
+        """로컬 파일에는 버전 식별자가 없으므로 etag는 무시한다."""
+        with open(source, "rb") as f:
+            if end is None:
+                end = os.fstat(f.fileno()).st_size
+            f.seek(start)
+            remaining = end - start
+            while remaining > 0:
+                chunk = f.read(min(remaining, DEFAULT_READ_BYTES))
+                if not chunk:
+                    return
+                remaining -= len(chunk)
+                yield chunk
+
+    def append_features(
+        self,
+        features: Iterable[Feature],
+        destination: str,
+        *,
+        base_size: int | None = None,
+    ) -> Path:
+        """CSV 피처 파일 뒤에 헤더 없이 피처를 덧붙인다. 열 단위 형식은 덧붙일 수 없다.
+
+        base_size가 주어지면 파일을 그 크기로 자른 뒤 덧붙인다.
+        """
+        if self._feature_format == FEATURE_FORMAT_COLUMNAR:
+            raise ValueError("columnar feature files cannot be appended")
+        path = Path(destination)
+        if base_size is not None and path.exists():
+            os.truncate(path, min(base_size, path.stat().st_size))
+        if not path.exists() or path.stat().st_size == 0:
+            return self.save_features(features, destination)
+
+        with open(path, "ab") as f:
+            for chunk in encode_feature_csv(features, header=False):
+                f.write(chunk)
+                record_bytes_written(len(chunk))
+        return path
+
+    def features_size(self, destination: str) -> int | None:
+        try:
+            return Path(destination).stat().st_size
+        except FileNotFoundError:
+            return None
+
+    def load_watermark(self, destination: str) -> SourceWatermark | None:
+        try:
+            text = Path(watermark_destination(destination)).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+        return decode_watermark(text)
+
+    def save_watermark(self, watermark: SourceWatermark, destination: str) -> Path:
+        """manifest를 임시 파일에 쓴 뒤 교체해, 중간에 실패해도 이전 manifest가 남게 한다."""
+        path = Path(watermark_destination(destination))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.tmp")
+        tmp.write_text(encode_watermark(watermark), encoding="utf-8")
+        os.replace(tmp, path)
+        return path
+
 
 class LocalFileValidationReportRepository(ValidationReportRepository):
-    """로컬 JSON 파일로 검증 리포트를 저장하는 저장소."""
+    """로컬 JSON 파일로 검증 리포트를 저장하는 저장소.
+
+    리포트는 오류 목록을 조각 단위로 인코딩해 쓰므로 오류 수만큼 dict를 만들지
+    않는다. errors_sidecar가 True이면 오류를 한 줄에 하나씩 담은
+    `<이름>.errors.ndjson` 파일을 리포트 옆에 함께 저장한다.
+    """
+
+    def __init__(self, *, errors_sidecar: bool = False) -> None:
+        self._errors_sidecar = errors_sidecar
 
     def save_report(self, report: ValidationReport, destination: str) -> Path:
         """검증 리포트를 JSON 파일로 저장한다."""
         path = Path(destination)
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        data = {
-            "total_records": report.total_records,
-            "valid_records": report.valid_records,
-            "error_rate": report.error_rate,
-            "is_valid": report.is_valid,
-            "errors": [
-                {
-                    "field": error.field,
-                    "message": error.message,
-                    "record_index": error.record_index,
-                }
-                for error in report.errors
-            ],
-        }
-
         with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+            for chunk in encode_report_json(report):
+                f.write(chunk)
+
+        if self._errors_sidecar:
+            with open(errors_sidecar_path(path), "w", encoding="utf-8") as f:
+                f.writelines(encode_errors_ndjson(report.errors))
 
         return path
+
+
+def errors_sidecar_path(report_path: Path) -> Path:
+    """리포트 파일 옆 NDJSON 오류 파일 경로."""
+    return report_path.with_name(f"{report_path.stem}.errors.ndjson")
@@ -0,0 +1,157 @@
+"""대용량 로컬 CSV를 행 경계에 맞춘 바이트 구간으로 나눠 병렬 파싱한다."""
+
+from __future__ import annotations
+
+import os
+from collections import deque
+from collections.abc import Iterator, Sequence
+from concurrent.futures import Future
+from functools import partial
+from pathlib import Path
+
+from services.data_pipeline.domain.models import RowParseError, TransactionBatch
+from services.data_pipeline.infrastructure.csv_parser import PCA_STRICT, KaggleCsvParser
+from services.data_pipeline.infrastructure.process_pool import new_process_pool
+from shared.infrastructure.instrumentation import record_bytes_read
+
+DEFAULT_SHARD_BYTES = 32 * 1024 * 1024
+
+
+def plan_shards(path: Path, data_start: int, shard_bytes: int) -> list[tuple[int, int]]:
+    """[data_start, 파일 끝)을 약 shard_bytes 크기의 (start, end) 구간으로 나눈다.
+
+    각 경계는 다음 줄의 시작 위치로 맞춘다.
+    """
+    size = path.stat().st_size
+    boundaries = [data_start]
+    with open(path, "rb") as f:
+        target = data_start + shard_bytes
+        while target < size:
+            f.seek(target - 1)
+            f.readline()
+            boundary = f.tell()
+            if boundary >= size:
+                break
+            boundaries.append(boundary)
+            target = boundary + shard_bytes
+    boundaries.append(size)
+    return list(zip(boundaries[:-1], boundaries[1:]))
+
+
+def parse_shard(
+    path: str,
+    start: int,
+    end: int,
+    columns: Sequence[str],
+    batch_size: int,
+    start_index: int = 0,
+    *,
+    tolerant: bool = False,
+    pca_features: str = PCA_STRICT,
+) -> list[TransactionBatch]:
+    """파일의 [start, end) 구간을 파싱한다. row_index는 start_index부터 매긴다."""
+    with open(path, "rb") as f:
+        f.seek(start)
+        block = f.read(end - start)
+    parser = KaggleCsvParser(tolerant=tolerant, pca_features=pca_features)
+    return list(
+        parser.parse_lines(
+            block.splitlines(keepends=True),
+            columns=columns,
+            batch_size=batch_size,
+            start_index=start_index,
+        )
+    )
+
+
+def plan_shard_loaders(
+    path: Path,
+    *,
+    batch_size: int,
+    shard_bytes: int = DEFAULT_SHARD_BYTES,
+    tolerant: bool = False,
+    pca_features: str = PCA_STRICT,
+) -> list[partial[list[TransactionBatch]]]:
+    """파일을 shard로 나누고, 시작 row_index를 받아 shard를 파싱하는 callable 목록을 만든다.
+
+    TransactionValidator.validate_shards에 넘길 수 있도록 pickle 가능하다.
+    tolerant와 pca_features는 KaggleCsvParser와 같다.
+    """
+    with open(path, "rb") as f:
+        header = f.readline()
+        data_start = f.tell()
+    if not header:
+        return []
+    columns = KaggleCsvParser().parse_header(header)
+    return [
+        partial(
+            parse_shard,
+            os.fspath(path),
+            start,
+            end,
+            columns,
+            batch_size,
+            tolerant=tolerant,
+            pca_features=pca_features,
+        )
+        for start, end in plan_shards(path, data_start, shard_bytes)
+    ]
+
+
+def load_sharded(
+    path: Path,
+    *,
+    batch_size: int,
+    workers: int,
+    shard_bytes: int = DEFAULT_SHARD_BYTES,
+    tolerant: bool = False,
+    pca_features: str = PCA_STRICT,
+) -> Iterator[TransactionBatch]:
+    """샤드를 프로세스 풀에서 파싱하고, 파일 순서대로 row_index를 이어 붙여 반환한다.
+
+    각 샤드는 row_index 0부터 파싱한 뒤 앞선 샤드들의 행 수만큼 더해지므로
+    transaction_id는 순차 파싱과 같다. 샤드에서 발생한 RowParseError도 같은
+    만큼 행 번호를 옮겨 다시 발생시키므로 순차 경로와 같은 오류 메시지가 된다.
+    동시에 처리 중인 샤드는 workers * 2개로 제한한다.
+    """
+    parser = KaggleCsvParser()
+    with open(path, "rb") as f:
+        header = f.readline()
+        data_start = f.tell()
+    if not header:
+        return
+    record_bytes_read(len(header))
+    columns = parser.parse_header(header)
+    shards = plan_shards(path, data_start, shard_bytes)
+
+    executor = new_process_pool(workers)
+    try:
+        pending: deque[tuple[tuple[int, int], Future]] = deque()
+        remaining = iter(shards)
+
+        def submit_next() -> None:
+            shard = next(remaining, None)
+            if shard is not None:
+                future = executor.submit(
+                    parse_shard, os.fspath(path), *shard, columns, batch_size,
+                    tolerant=tolerant, pca_features=pca_features,
+                )
+                pending.append((shard, future))
+
+        for _ in range(workers * 2):
+            submit_next()
+
+        offset = 0
+        while pending:
+            shard, future = pending.popleft()
+            submit_next()
+            try:
+                batches = future.result()
+            except RowParseError as error:
+                raise error.with_row_offset(offset) from error
+            record_bytes_read(shard[1] - shard[0])
+            for batch in batches:
+                yield batch.with_row_offset(offset)
+            offset += sum(batch.record_count for batch in batches)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
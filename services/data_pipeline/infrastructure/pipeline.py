@@ -0,0 +1,343 @@
+"""로드 → 검증 → 피처 엔지니어링 → 저장 단계를 겹쳐 실행하는 파이프라인."""
+
+from __future__ import annotations
+
+import queue
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import ExitStack
+from dataclasses import replace
+from pathlib import Path
+
+import numpy as np
+
+from services.data_pipeline.application.use_cases import ProcessDataUseCase
+from services.data_pipeline.domain.models import (
+    FeatureBatch,
+    ProcessDataResult,
+    TransactionBatch,
+    ValidationReport,
+)
+from services.data_pipeline.domain.repositories import (
+    TransactionRepository,
+    ValidationReportRepository,
+)
+from services.data_pipeline.domain.services import FeatureEngineeringService
+from services.data_pipeline.infrastructure.csv_parser import DEFAULT_BATCH_SIZE
+from services.data_pipeline.infrastructure.external_sort import ExternalTimeSorter
+from services.data_pipeline.infrastructure.stage_cache import (
+    STAGE_FEATURES,
+    STAGE_VALIDATE,
+    CachedFeatures,
+    CachedValidation,
+    FeaturesRecorder,
+    StageCache,
+    ValidationRecorder,
+    stage_key,
+)
+from services.data_pipeline.infrastructure.validators import TransactionValidator
+from shared.infrastructure.instrumentation import StageRecorder
+
+DEFAULT_QUEUE_SIZE = 4
+_POLL_SECONDS = 0.1
+_DONE = object()
+
+
+class _Cancelled(Exception):
+    """다른 단계가 실패해 파이프라인이 중단되었음을 알린다."""
+
+
+class _Channel:
+    """단계 사이를 잇는 bounded queue. 취소되면 대기 중인 put/get이 중단된다."""
+
+    def __init__(self, maxsize: int, cancelled: threading.Event) -> None:
+        self._queue: queue.Queue = queue.Queue(maxsize)
+        self._cancelled = cancelled
+
+    def put(self, item: object, recorder: StageRecorder) -> None:
+        with recorder.waiting():
+            while True:
+                if self._cancelled.is_set():
+                    raise _Cancelled
+                try:
+                    self._queue.put(item, timeout=_POLL_SECONDS)
+                    return
+                except queue.Full:
+                    continue
+
+    def close(self, recorder: StageRecorder) -> None:
+        self.put(_DONE, recorder)
+
+    def consume(self, recorder: StageRecorder) -> Iterator:
+        while True:
+            with recorder.waiting():
+                item = self._get()
+            if item is _DONE:
+                return
+            yield item
+
+    def _get(self) -> object:
+        while True:
+            if self._cancelled.is_set():
+                raise _Cancelled
+            try:
+                return self._queue.get(timeout=_POLL_SECONDS)
+            except queue.Empty:
+                continue
+
+
+class PipelinedProcessDataUseCase(ProcessDataUseCase):
+    """파싱, 검증, 피처 추출, 저장을 각각의 스레드에서 실행하는 ProcessDataUseCase.
+
+    단계 사이는 bounded queue로 연결되어 I/O와 CPU 작업이 겹쳐 실행되고,
+    메모리에는 단계마다 최대 queue_size개의 배치만 머문다. 검증 리포트는
+    피처 파일 옆에 `<이름>_validation_report.json`으로 저장한다.
+    sorter가 주어지면 파싱한 배치를 time_seconds 순으로 외부 정렬한 뒤 검증한다.
+    정렬은 입력을 모두 읽은 뒤에 첫 배치를 내보내므로 parse 단계가 길어진다.
+
+    stage_cache가 주어지고 저장소가 원본 fingerprint를 주면 검증 결과는
+    (fingerprint, 정렬 여부, 검증기 version) 키로, 피처는 (검증 키, 피처 서비스
+    version) 키로 캐시한다. 검증 결과가 있으면 검증을 건너뛰고 저장된 valid_mask로
+    행을 고르며, 피처까지 있으면 파싱부터 피처 추출까지 건너뛰고 저장만 한다.
+    파싱 결과는 저장소의 ParsedRawCache가 맡는다.
+    """
+
+    def __init__(
+        self,
+        transaction_repository: TransactionRepository,
+        feature_service: FeatureEngineeringService,
+        report_repository: ValidationReportRepository,
+        *,
+        validator: TransactionValidator | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        sorter: ExternalTimeSorter | None = None,
+        stage_cache: StageCache | None = None,
+    ) -> None:
+        if queue_size <= 0:
+            raise ValueError(f"queue_size must be positive, got {queue_size}")
+        self._transactions = transaction_repository
+        self._features = feature_service
+        self._reports = report_repository
+        self._validator = validator or TransactionValidator()
+        self._batch_size = batch_size
+        self._queue_size = queue_size
+        self._sorter = sorter
+        self._stage_cache = stage_cache
+
+    def execute(self, source: str, destination: str) -> ProcessDataResult:
+        keys = self._stage_keys(source)
+        if keys is None:
+            return self._run(source, destination)
+
+        cache = self._stage_cache
+        validate_key, features_key = keys
+        with ExitStack() as stack:
+            cached = cache.load_validation(validate_key)
+            validation_recorder = None
+            if cached is None:
+                validation_recorder = stack.enter_context(cache.record_validation(validate_key))
+            features_recorder = None
+            if features_key is not None:
+                cached_features = None if cached is None else cache.load_features(features_key)
+                if cached_features is not None:
+                    return self._replay(cached.report, cached_features, destination)
+                features_recorder = stack.enter_context(cache.record_features(features_key))
+            return self._run(
+                source,
+                destination,
+                cached=cached,
+                validation_recorder=validation_recorder,
+                features_recorder=features_recorder,
+            )
+
+    def _stage_keys(self, source: str) -> tuple[str, str | None] | None:
+        """(검증 키, 피처 키). 캐시할 수 없으면 None, 피처만 캐시할 수 없으면 피처 키가 None."""
+        if self._stage_cache is None:
+            return None
+        fingerprint = self._transactions.source_fingerprint(source)
+        if fingerprint is None:
+            return None
+        validate_key = stage_key(
+            STAGE_VALIDATE, fingerprint, self._sorter is not None, self._validator.version()
+        )
+        feature_version = self._features.version()
+        if feature_version is None:
+            return validate_key, None
+        return validate_key, stage_key(STAGE_FEATURES, validate_key, feature_version)
+
+    def _run(
+        self,
+        source: str,
+        destination: str,
+        *,
+        cached: CachedValidation | None = None,
+        validation_recorder: ValidationRecorder | None = None,
+        features_recorder: FeaturesRecorder | None = None,
+    ) -> ProcessDataResult:
+        cancelled = threading.Event()
+        raw = _Channel(self._queue_size, cancelled)
+        valid = _Channel(self._queue_size, cancelled)
+        features = _Channel(self._queue_size, cancelled)
+        builder = self._validator.report_builder()
+        self._features.reset()
+        recorders = [StageRecorder(name) for name in ("parse", "validate", "extract", "write")]
+        parse_recorder, validate_recorder, extract_recorder, write_recorder = recorders
+        saved: list[Path] = []
+
+        def parse() -> None:
+            batches = self._transactions.load_raw_batches(source, self._batch_size)
+            if self._sorter is not None:
+                batches = self._sorter.sort_batches(batches, self._batch_size)
+            for batch in batches:
+                parse_recorder.add_rows(batch.record_count, len(batch))
+                raw.put(batch, parse_recorder)
+            raw.close(parse_recorder)
+
+        def validate() -> None:
+            for batch in raw.consume(validate_recorder):
+                result = self._validator.validate_batch(batch)
+                builder.add_batch_result(result)
+                if validation_recorder is not None:
+                    validation_recorder.append(result.valid_mask)
+                valid_batch = result.valid_batch
+                validate_recorder.add_rows(batch.record_count, len(valid_batch))
+                valid.put(valid_batch, validate_recorder)
+            valid.close(validate_recorder)
+
+        def select_valid() -> None:
+            """저장된 valid_mask로 유효한 행을 고른다. 검증 규칙은 실행하지 않는다."""
+            position = 0
+            for batch in raw.consume(validate_recorder):
+                mask = cached.valid_mask[position:position + len(batch)]
+                position += len(batch)
+                if len(mask) != len(batch):
+                    raise ValueError("cached validation does not match the input rows")
+                valid_batch = _select(batch, mask)
+                validate_recorder.add_rows(batch.record_count, len(valid_batch))
+                valid.put(valid_batch, validate_recorder)
+            if position != len(cached.valid_mask):
+                raise ValueError("cached validation does not match the input rows")
+            valid.close(validate_recorder)
+
+        def extract() -> None:
+            for batch in valid.consume(extract_recorder):
+                feature_batch = self._features.extract_features_batch(batch)
+                if features_recorder is not None:
+                    features_recorder.append(feature_batch)
+                extract_recorder.add_rows(len(batch), len(feature_batch))
+                features.put(feature_batch, extract_recorder)
+            features.close(extract_recorder)
+
+        def write() -> None:
+            saved.append(
+                self._transactions.save_feature_batches(
+                    _count_features(features.consume(write_recorder), write_recorder),
+                    destination,
+                )
+            )
+
+        _run_stages(
+            [
+                (parse_recorder, parse),
+                (validate_recorder, validate if cached is None else select_valid),
+                (extract_recorder, extract),
+                (write_recorder, write),
+            ],
+            cancelled,
+        )
+
+        report = builder.build() if cached is None else cached.report
+        if validation_recorder is not None:
+            validation_recorder.finish(report)
+        if features_recorder is not None:
+            features_recorder.finish()
+        return self._result(report, destination, saved[0], recorders)
+
+    def _replay(
+        self, report: ValidationReport, features: CachedFeatures, destination: str
+    ) -> ProcessDataResult:
+        """캐시된 피처를 저장만 한다. parse/validate/extract 지표는 0으로 남는다."""
+        recorders = [StageRecorder(name) for name in ("parse", "validate", "extract", "write")]
+        write_recorder = recorders[-1]
+        saved: list[Path] = []
+
+        def write() -> None:
+            saved.append(
+                self._transactions.save_feature_batches(
+                    _count_features(features.batches(self._batch_size), write_recorder),
+                    destination,
+                )
+            )
+
+        _run_stages([(write_recorder, write)], threading.Event())
+        return self._result(report, destination, saved[0], recorders)
+
+    def _result(
+        self,
+        report: ValidationReport,
+        destination: str,
+        features_path: Path,
+        recorders: list[StageRecorder],
+    ) -> ProcessDataResult:
+        report_path = self._reports.save_report(report, _report_destination(destination))
+        return ProcessDataResult(
+            total_records=report.total_records,
+            valid_records=report.valid_records,
+            features_path=str(features_path),
+            validation_report_path=str(report_path),
+            stage_metrics=tuple(recorder.metrics() for recorder in recorders),
+        )
+
+
+def _select(batch: TransactionBatch, mask: np.ndarray) -> TransactionBatch:
+    """BatchValidationResult.valid_batch와 같은 규칙으로 mask 행만 남긴다."""
+    if mask.all():
+        return replace(batch, parse_errors=()) if batch.parse_errors else batch
+    return batch[mask]
+
+
+def _count_features(
+    batches: Iterable[FeatureBatch], recorder: StageRecorder
+) -> Iterator[FeatureBatch]:
+    for batch in batches:
+        recorder.add_rows(len(batch), len(batch))
+        yield batch
+
+
+def _run_stages(
+    stages: list[tuple[StageRecorder, Callable[[], None]]],
+    cancelled: threading.Event,
+) -> None:
+    """각 단계를 스레드로 실행하고, 처음 실패한 단계의 예외를 다시 발생시킨다."""
+    errors: list[BaseException] = []
+    lock = threading.Lock()
+
+    def run(recorder: StageRecorder, body: Callable[[], None]) -> None:
+        recorder.start()
+        try:
+            body()
+        except _Cancelled:
+            pass
+        except BaseException as e:
+            with lock:
+                errors.append(e)
+            cancelled.set()
+        finally:
+            recorder.stop()
+
+    threads = [
+        threading.Thread(target=run, args=stage, name=f"pipeline-{stage[0].name}")
+        for stage in stages
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+
+
+def _report_destination(destination: str) -> str:
+    path = Path(destination)
+    return str(path.with_name(f"{path.stem}_validation_report.json"))
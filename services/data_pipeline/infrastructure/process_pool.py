@@ -0,0 +1,20 @@
+"""병렬 파싱·검증에 쓰는 프로세스 풀."""
+
+from __future__ import annotations
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+
+def new_process_pool(max_workers: int) -> ProcessPoolExecutor:
+    """worker를 fork하지 않고 새로 띄우는 ProcessPoolExecutor.
+
+    파이프라인은 단계마다 스레드를 쓰므로, 다른 스레드가 잡은 lock까지 복제되는
+    fork 대신 forkserver(지원하지 않는 플랫폼에서는 spawn)로 worker를 시작한다.
+    worker에 넘기는 함수와 인자는 pickle 가능해야 한다.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    method = "forkserver" if "forkserver" in methods else "spawn"
+    return ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=multiprocessing.get_context(method)
+    )
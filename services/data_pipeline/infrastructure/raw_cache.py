@@ -0,0 +1,197 @@
+"""파싱된 원본 거래 열을 디스크에 보관하고 memory-map으로 다시 읽는 캐시."""
+
+from __future__ import annotations
+
+import bisect
+import hashlib
+import json
+import os
+import shutil
+import uuid
+from collections.abc import Iterable, Iterator
+from dataclasses import replace
+from pathlib import Path
+
+import numpy as np
+
+from services.data_pipeline.domain.models import (
+    PCA_FEATURES_COUNT,
+    TransactionBatch,
+    ValidationError,
+)
+from shared.infrastructure.instrumentation import record_bytes_read, record_bytes_written
+
+DEFAULT_MAX_BYTES = 10 * 1024**3
+_FORMAT_VERSION = 1
+_MANIFEST = "manifest.json"
+_TMP_PREFIX = ".tmp-"
+
+# 열 이름 → (dtype, 행당 추가 차원)
+_COLUMNS: dict[str, tuple[str, tuple[int, ...]]] = {
+    "row_index": ("<i8", ()),
+    "time_seconds": ("<f8", ()),
+    "amount_cents": ("<i8", ()),
+    "pca_features": ("<f8", (PCA_FEATURES_COUNT,)),
+}
+_LABELS = "is_fraud"
+_PACKED_LABELS = "is_fraud_packed"
+
+
+def cache_key(*parts: object) -> str:
+    """원본 식별 정보(경로, mtime, 크기, ETag 등)로 캐시 키를 만든다."""
+    payload = json.dumps([_FORMAT_VERSION, *map(str, parts)])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ParsedRawCache:
+    """키별로 열마다 고정 레이아웃 바이너리 파일과 manifest를 저장하는 캐시.
+
+    적중 시 각 열을 np.memmap으로 열어 복사 없이 배치를 만든다. 전체 크기가
+    max_bytes를 넘으면 가장 오래 전에 사용된 항목부터 삭제한다.
+    배치의 parse_errors는 manifest에 함께 저장했다가 같은 행 위치의 배치에 붙인다.
+    """
+
+    def __init__(self, directory: str | Path, *, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        if max_bytes <= 0:
+            raise ValueError(f"max_bytes must be positive, got {max_bytes}")
+        self._directory = Path(directory)
+        self._max_bytes = max_bytes
+
+    def __contains__(self, key: str) -> bool:
+        return (self._directory / key / _MANIFEST).exists()
+
+    def iter_batches(self, key: str, batch_size: int) -> Iterator[TransactionBatch] | None:
+        """캐시된 열을 batch_size 행 단위의 memory-map 뷰로 반환한다. 없으면 None."""
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+        entry = self._directory / key
+        try:
+            manifest = json.loads((entry / _MANIFEST).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        os.utime(entry / _MANIFEST)
+        parse_errors = tuple(
+            ValidationError(field, message, index)
+            for index, field, message in manifest.get("parse_errors", ())
+        )
+        return _iter_views(entry, manifest["rows"], batch_size, parse_errors)
+
+    def write_through(
+        self,
+        key: str,
+        batches: Iterable[TransactionBatch],
+    ) -> Iterator[TransactionBatch]:
+        """batches를 그대로 흘려보내면서 캐시에 기록한다.
+
+        입력이 끝까지 소비된 경우에만 항목을 확정하고, 중간에 실패하거나
+        소비가 중단되면 기록 중이던 파일을 지운다.
+        """
+        self._directory.mkdir(parents=True, exist_ok=True)
+        tmp = self._directory / f"{_TMP_PREFIX}{key}-{uuid.uuid4().hex}"
+        tmp.mkdir()
+        rows = 0
+        parse_errors: list[ValidationError] = []
+        try:
+            files = {
+                name: open(tmp / f"{name}.bin", "wb") for name in (*_COLUMNS, _LABELS)
+            }
+            try:
+                for batch in batches:
+                    for name, (dtype, _) in _COLUMNS.items():
+                        np.ascontiguousarray(getattr(batch, name), dtype=dtype).tofile(
+                            files[name]
+                        )
+                    batch.is_fraud.tofile(files[_LABELS])
+                    record_bytes_written(_nbytes(batch))
+                    rows += len(batch)
+                    parse_errors.extend(batch.parse_errors)
+                    yield batch
+            finally:
+                for f in files.values():
+                    f.close()
+            self._commit(key, tmp, rows, parse_errors)
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    def evict(self) -> None:
+        """전체 크기가 max_bytes 이하가 될 때까지 오래된 항목부터 삭제한다."""
+        entries = []
+        for entry in self._directory.iterdir():
+            manifest = entry / _MANIFEST
+            if entry.name.startswith(_TMP_PREFIX) or not manifest.exists():
+                continue
+            size = sum(f.stat().st_size for f in entry.iterdir())
+            entries.append((manifest.stat().st_mtime_ns, size, entry))
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries, key=lambda e: e[0]):
+            if total <= self._max_bytes:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+
+    def _commit(
+        self, key: str, tmp: Path, rows: int, parse_errors: list[ValidationError]
+    ) -> None:
+        labels = np.fromfile(tmp / f"{_LABELS}.bin", dtype=np.bool_)
+        np.packbits(labels).tofile(tmp / f"{_PACKED_LABELS}.bin")
+        (tmp / f"{_LABELS}.bin").unlink()
+        manifest = {
+            "version": _FORMAT_VERSION,
+            "key": key,
+            "stage": "parse",
+            "rows": rows,
+            "parse_errors": [[e.record_index, e.field, e.message] for e in parse_errors],
+        }
+        (tmp / _MANIFEST).write_text(json.dumps(manifest), encoding="utf-8")
+        try:
+            tmp.rename(self._directory / key)
+        except OSError:
+            # 다른 프로세스가 같은 키를 먼저 기록했다.
+            return
+        self.evict()
+
+
+def _iter_views(
+    entry: Path,
+    rows: int,
+    batch_size: int,
+    parse_errors: tuple[ValidationError, ...],
+) -> Iterator[TransactionBatch]:
+    if rows == 0:
+        if parse_errors:
+            yield replace(TransactionBatch.empty(), parse_errors=parse_errors)
+        return
+    columns = {
+        name: np.memmap(
+            entry / f"{name}.bin", dtype=dtype, mode="r", shape=(rows, *extra)
+        )
+        for name, (dtype, extra) in _COLUMNS.items()
+    }
+    packed = np.memmap(entry / f"{_PACKED_LABELS}.bin", dtype=np.uint8, mode="r")
+    # 압축된 라벨을 바이트 경계에서 자를 수 있도록 8의 배수로 맞춘다.
+    step = -(-batch_size // 8) * 8
+    # 각 parse_error는 다음 배치의 첫 행보다 앞에 있는 배치에 붙인다.
+    error_indices = [error.record_index for error in parse_errors]
+    taken = 0
+    for start in range(0, rows, step):
+        stop = min(start + step, rows)
+        until = (
+            len(parse_errors)
+            if stop == rows
+            else bisect.bisect_left(error_indices, int(columns["row_index"][stop]))
+        )
+        batch = TransactionBatch(
+            row_index=columns["row_index"][start:stop],
+            time_seconds=columns["time_seconds"][start:stop],
+            amount_cents=columns["amount_cents"][start:stop],
+            is_fraud_packed=packed[start // 8:(stop + 7) // 8],
+            pca_features=columns["pca_features"][start:stop],
+            parse_errors=parse_errors[taken:until],
+        )
+        taken = until
+        record_bytes_read(_nbytes(batch))
+        yield batch
+
+
+def _nbytes(batch: TransactionBatch) -> int:
+    return sum(getattr(batch, name).nbytes for name in (*_COLUMNS, _PACKED_LABELS))
@@ -0,0 +1,146 @@
+"""검증 리포트 JSON 스트리밍 인코딩.
+
+json.dump(..., ensure_ascii=False, indent=2)와 바이트 단위로 같은 출력을
+오류 목록 전체를 dict로 만들지 않고 조각 단위로 만든다. decode_report_json은
+그 출력을 다시 ValidationReport로 읽는다. 집계 모드 표본에 bottom-k 키와 상한이
+있으면 error_summary 항목에 sample_keys/max_samples로 함께 써서, 읽은 리포트도
+ValidationReport.merge로 합칠 수 있게 한다.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable, Iterator
+
+from services.data_pipeline.domain.models import (
+    ErrorKindSummary,
+    ValidationError,
+    ValidationReport,
+)
+
+DEFAULT_CHUNK_CHARS = 1024 * 1024
+
+
+def encode_report_json(
+    report: ValidationReport,
+    *,
+    chunk_chars: int = DEFAULT_CHUNK_CHARS,
+) -> Iterator[str]:
+    """리포트를 indent=2 JSON 문자열 조각으로 인코딩한다.
+
+    마지막 조각을 제외한 각 조각은 chunk_chars 이상이다. 반환값은 1회성 Iterator.
+    """
+    if chunk_chars <= 0:
+        raise ValueError(f"chunk_chars must be positive, got {chunk_chars}")
+
+    buffer: list[str] = []
+    size = 0
+    for part in _iter_report_parts(report):
+        buffer.append(part)
+        size += len(part)
+        if size >= chunk_chars:
+            yield "".join(buffer)
+            buffer = []
+            size = 0
+    if buffer:
+        yield "".join(buffer)
+
+
+def encode_errors_ndjson(errors: Iterable[ValidationError]) -> Iterator[str]:
+    """오류를 한 줄에 하나씩 JSON 객체로 인코딩한다 (newline-delimited JSON)."""
+    encode = _StringCache()
+    for error in errors:
+        yield (
+            f'{{"field": {encode(error.field)}, "message": {encode(error.message)},'
+            f' "record_index": {error.record_index}}}\n'
+        )
+
+
+def decode_report_json(text: str) -> ValidationReport:
+    """encode_report_json 출력을 ValidationReport로 읽는다.
+
+    valid_records 등 파생 값은 다시 계산하므로 읽지 않는다.
+    """
+    data = json.loads(text)
+    summary = data.get("error_summary")
+    return ValidationReport(
+        total_records=data["total_records"],
+        errors=tuple(
+            ValidationError(error["field"], error["message"], error["record_index"])
+            for error in data["errors"]
+        ),
+        error_summary=None if summary is None else tuple(
+            ErrorKindSummary(
+                field=kind["field"],
+                message=kind["message"],
+                count=kind["count"],
+                sample_record_indices=tuple(kind["sample_record_indices"]),
+                sample_keys=tuple(kind.get("sample_keys", ())),
+                max_samples=kind.get("max_samples"),
+            )
+            for kind in summary
+        ),
+    )
+
+
+def _iter_report_parts(report: ValidationReport) -> Iterator[str]:
+    yield (
+        "{\n"
+        f'  "total_records": {report.total_records},\n'
+        f'  "valid_records": {report.valid_records},\n'
+        f'  "error_rate": {json.dumps(report.error_rate)},\n'
+        f'  "is_valid": {json.dumps(report.is_valid)},\n'
+        '  "errors": '
+    )
+    yield from _iter_list(_iter_error_objects(report.errors))
+    if report.error_summary is not None:
+        yield ',\n  "error_summary": '
+        yield from _iter_list(_encode_summary(kind) for kind in report.error_summary)
+    yield "\n}"
+
+
+def _iter_list(items: Iterable[str]) -> Iterator[str]:
+    """2단계 들여쓰기 위치의 JSON 배열. 빈 배열은 json.dump처럼 "[]"로 쓴다."""
+    separator = "[\n"
+    for item in items:
+        yield separator
+        yield item
+        separator = ",\n"
+    yield "[]" if separator == "[\n" else "\n  ]"
+
+
+def _iter_error_objects(errors: Iterable[ValidationError]) -> Iterator[str]:
+    encode = _StringCache()
+    for error in errors:
+        yield (
+            "    {\n"
+            f'      "field": {encode(error.field)},\n'
+            f'      "message": {encode(error.message)},\n'
+            f'      "record_index": {error.record_index}\n'
+            "    }"
+        )
+
+
+def _encode_summary(kind: ErrorKindSummary) -> str:
+    data = {
+        "field": kind.field,
+        "message": kind.message,
+        "count": kind.count,
+        "sample_record_indices": list(kind.sample_record_indices),
+    }
+    if kind.sample_keys:
+        data["sample_keys"] = list(kind.sample_keys)
+    if kind.max_samples is not None:
+        data["max_samples"] = kind.max_samples
+    text = json.dumps(data, ensure_ascii=False, indent=2)
+    return "\n".join("    " + line for line in text.split("\n"))
+
+
+class _StringCache(dict):
+    """field/message처럼 반복되는 문자열의 JSON 인코딩 결과를 재사용한다."""
+
+    def __call__(self, value: str) -> str:
+        encoded = self.get(value)
+        if encoded is None:
+            encoded = self[value] = json.dumps(value, ensure_ascii=False)
+        return encoded
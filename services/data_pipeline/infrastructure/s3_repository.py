@@ -3,23 +3,96 @@
 from __future__ import annotations
 
 import csv
+from collections import deque
 from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import chain
 from pathlib import Path
 
 import boto3
+from botocore.exceptions import ClientError
 
-from services.data_pipeline.domain.models import Feature, RawTransaction
-from services.data_pipeline.domain.repositories import TransactionRepository
-from services.data_pipeline.infrastructure.csv_parser import KaggleCsvParser
+from services.data_pipeline.domain.models import (
+    Feature,
+    FeatureBatch,
+    RawTransaction,
+    SourceState,
+    SourceWatermark,
+    TransactionBatch,
+)
+from services.data_pipeline.domain.repositories import IncrementalTransactionRepository
+from services.data_pipeline.infrastructure.csv_parser import (
+    DEFAULT_BATCH_SIZE,
+    PCA_SKIP,
+    PCA_STRICT,
+    KaggleCsvParser,
+    iter_lines,
+)
+from services.data_pipeline.infrastructure.feature_csv import (
+    encode_feature_batch_csv,
+    encode_feature_csv,
+)
+from services.data_pipeline.infrastructure.raw_cache import ParsedRawCache, cache_key
+from services.data_pipeline.infrastructure.watermark_json import (
+    decode_watermark,
+    encode_watermark,
+    watermark_destination,
+)
+from shared.infrastructure.instrumentation import record_bytes_written
 
+DEFAULT_RANGE_BYTES = 8 * 1024 * 1024
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_RANGED_MIN_BYTES = 64 * 1024 * 1024
+DEFAULT_PART_BYTES = 8 * 1024 * 1024
+# S3가 마지막이 아닌 멀티파트 파트에 요구하는 최소 크기.
+_MIN_PART_BYTES = 5 * 1024 * 1024
 
-class S3TransactionRepository(TransactionRepository):
-    """S3에서 Kaggle CSV 거래 데이터를 로드하는 저장소."""
 
-    def __init__(self, bucket: str, s3_client=None) -> None:
+class S3TransactionRepository(IncrementalTransactionRepository):
+    """S3에서 Kaggle CSV 거래 데이터를 로드하는 저장소.
+
+    load_raw_batches는 객체가 ranged_min_bytes 이상이면 range_bytes 크기의
+    Range GET을 max_concurrency개까지 동시에 요청해 내려받는다.
+    save_features는 part_bytes 크기 파트로 멀티파트 업로드한다.
+    S3는 마지막 파트를 제외하고 5MB 미만 파트를 거부한다.
+    원본을 읽는 GET은 처음 확인한 ETag를 IfMatch로 고정하므로, 읽는 도중 객체가
+    덮어써지면 두 버전을 이어 붙이지 않고 ClientError(PreconditionFailed)가 난다.
+    cache가 주어지면 파싱 결과를 (버킷, 키, ETag, 크기) 키로 로컬에 캐시한다.
+    tolerant가 True이면 변환에 실패한 행을 배치의 parse_errors로 넘긴다.
+    pca_features가 "lazy"/"skip"이면 PCA 열을 디코딩하지 않는다 (KaggleCsvParser 참고).
+    증분 처리에서는 원본의 새 구간만 Range GET으로 읽고, 피처 객체 뒤에 덧붙일 때는
+    기존 객체를 서버 측 복사(UploadPartCopy)로 첫 파트에 넣는다.
+    """
+
+    def __init__(
+        self,
+        bucket: str,
+        s3_client=None,
+        *,
+        range_bytes: int = DEFAULT_RANGE_BYTES,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        ranged_min_bytes: int = DEFAULT_RANGED_MIN_BYTES,
+        part_bytes: int = DEFAULT_PART_BYTES,
+        cache: ParsedRawCache | None = None,
+        tolerant: bool = False,
+        pca_features: str = PCA_STRICT,
+    ) -> None:
+        if range_bytes <= 0:
+            raise ValueError(f"range_bytes must be positive, got {range_bytes}")
+        if max_concurrency <= 0:
+            raise ValueError(f"max_concurrency must be positive, got {max_concurrency}")
+        if part_bytes <= 0:
+            raise ValueError(f"part_bytes must be positive, got {part_bytes}")
         self._bucket = bucket
         self._s3 = s3_client or boto3.client("s3")
-        self._parser = KaggleCsvParser()
+        if cache is not None and pca_features == PCA_SKIP:
+            raise ValueError("pca_features='skip' cannot be combined with a parsed raw cache")
+        self._parser = KaggleCsvParser(tolerant=tolerant, pca_features=pca_features)
+        self._range_bytes = range_bytes
+        self._max_concurrency = max_concurrency
+        self._ranged_min_bytes = ranged_min_bytes
+        self._part_bytes = part_bytes
+        self._cache = cache
 
     def load_raw_transactions(self, source: str) -> Iterator[RawTransaction]:
         response = self._s3.get_object(Bucket=self._bucket, Key=source)
@@ -28,5 +101,282 @@ class S3TransactionRepository(TransactionRepository):
         for idx, row in enumerate(reader):
             yield self._parser.parse_row(row, row_index=idx)
 
+    def load_raw_batches(
+        self,
+        source: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Iterator[TransactionBatch]:
+        """원본 거래 데이터를 batch_size 행 단위의 열 배열로 로드한다."""
+        head = self._s3.head_object(Bucket=self._bucket, Key=source)
+        if self._cache is None:
+            yield from self._parse_batches(source, head, batch_size)
+            return
+
+        key = self._fingerprint(source, head)
+        cached = self._cache.iter_batches(key, batch_size)
+        if cached is not None:
+            yield from map(self._parser.project, cached)
+        else:
+            yield from self._cache.write_through(
+                key, self._parse_batches(source, head, batch_size)
+            )
+
+    def source_fingerprint(self, source: str) -> str | None:
+        """(버킷, 키, ETag, 크기, 파싱 설정)으로 만든 키. 파싱 결과 캐시 키와 같다."""
+        return self._fingerprint(source, self._s3.head_object(Bucket=self._bucket, Key=source))
+
+    def _fingerprint(self, source: str, head: dict) -> str:
+        return cache_key(
+            "s3",
+            self._bucket,
+            source,
+            head["ETag"],
+            head["ContentLength"],
+            self._parser.tolerant,
+            self._parser.pca_features,
+        )
+
+    def _parse_batches(
+        self, source: str, head: dict, batch_size: int
+    ) -> Iterator[TransactionBatch]:
+        size, etag = head["ContentLength"], head["ETag"]
+        if size >= self._ranged_min_bytes:
+            lines = iter_lines(self._iter_ranges(source, size, etag=etag))
+        else:
+            response = self._s3.get_object(Bucket=self._bucket, Key=source, IfMatch=etag)
+            lines = response["Body"].iter_lines(keepends=True)
+        yield from self._parser.parse_file(lines, batch_size=batch_size)
+
+    def _iter_ranges(
+        self, key: str, size: int, start: int = 0, *, etag: str
+    ) -> Iterator[bytes]:
+        """객체의 [start, size) 구간을 range_bytes 단위 Range GET으로 병렬 다운로드해
+        순서대로 반환한다.
+
+        모든 요청은 etag 버전만 읽는다. 아직 소비되지 않은 구간은 최대
+        max_concurrency개만 유지한다.
+        """
+        starts = iter(range(start, size, self._range_bytes))
+        with ThreadPoolExecutor(max_workers=self._max_concurrency) as pool:
+            pending: deque[Future[bytes]] = deque()
+
+            def submit_next() -> None:
+                start = next(starts, None)
+                if start is not None:
+                    end = min(start + self._range_bytes, size) - 1
+                    pending.append(pool.submit(self._get_range, key, start, end, etag))
+
+            for _ in range(self._max_concurrency):
+                submit_next()
+            try:
+                while pending:
+                    chunk = pending.popleft().result()
+                    submit_next()
+                    yield chunk
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def _get_range(self, key: str, start: int, end: int, etag: str) -> bytes:
+        response = self._s3.get_object(
+            Bucket=self._bucket, Key=key, Range=f"bytes={start}-{end}", IfMatch=etag
+        )
+        return response["Body"].read()
+
+    def list_sources(self, pattern: str) -> list[str]:
+        """pattern을 키 접두사로 보고 페이지를 넘겨 가며 객체 키를 모은다.
+
+        `/`로 끝나는 디렉터리 표시용 키는 제외한다.
+        """
+        paginator = self._s3.get_paginator("list_objects_v2")
+        keys = [
+            obj["Key"]
+            for page in paginator.paginate(Bucket=self._bucket, Prefix=pattern)
+            for obj in page.get("Contents", ())
+            if not obj["Key"].endswith("/")
+        ]
+        return sorted(keys)
+
     def save_features(self, features: Iterable[Feature], destination: str) -> Path:
-        raise NotImplementedError("DEV-39에서 구현")
+        """피처를 LocalFileTransactionRepository와 같은 CSV 형식으로 S3에 저장한다.
+
+        피처를 인코딩하는 동안 완성된 파트를 max_concurrency개까지 동시에
+        업로드하므로, 메모리에는 최대 max_concurrency + 1개의 파트만 머문다.
+        실패하면 멀티파트 업로드를 중단(abort)하고 예외를 다시 발생시킨다.
+        """
+        return self._multipart_upload(
+            destination, encode_feature_csv(features, chunk_bytes=self._part_bytes)
+        )
+
+    def save_feature_batches(self, batches: Iterable[FeatureBatch], destination: str) -> Path:
+        """save_features와 같은 객체를 Feature 객체를 만들지 않고 열에서 바로 올린다."""
+        return self._multipart_upload(
+            destination, encode_feature_batch_csv(batches, chunk_bytes=self._part_bytes)
+        )
+
+    def source_state(self, source: str) -> SourceState:
+        head = self._s3.head_object(Bucket=self._bucket, Key=source)
+        return SourceState(size=head["ContentLength"], etag=head["ETag"])
+
+    def iter_source_bytes(
+        self,
+        source: str,
+        start: int = 0,
+        end: int | None = None,
+        *,
+        etag: str | None = None,
+    ) -> Iterator[bytes]:
+        if end is None or etag is None:
+            state = self.source_state(source)
+            end = state.size if end is None else end
+            etag = state.etag if etag is None else etag
+        if start < end:
+            yield from self._iter_ranges(source, end, start, etag=etag)
+
+    def append_features(
+        self,
+        features: Iterable[Feature],
+        destination: str,
+        *,
+        base_size: int | None = None,
+    ) -> Path:
+        """기존 피처 객체 뒤에 헤더 없이 피처를 덧붙인 객체로 교체한다.
+
+        기존 객체(base_size가 주어지면 그 앞 base_size 바이트)가 S3 최소 파트 크기
+        이상이면 서버 측 복사로 첫 파트를 만들고, 그보다 작으면 내려받아 첫 업로드
+        파트 앞에 붙인다. 덧붙일 피처가 없으면 객체를 그대로 두되, base_size보다
+        크면 그 크기로 줄인다.
+        """
+        current = self._object_size(destination)
+        existing = current if current is None or base_size is None else min(current, base_size)
+        if not existing:
+            return self.save_features(features, destination)
+        chunks = encode_feature_csv(features, chunk_bytes=self._part_bytes, header=False)
+        first = next(chunks, None)
+        if first is None:
+            if existing < current:
+                self._truncate_object(destination, existing)
+            return Path(destination)
+        if existing >= _MIN_PART_BYTES:
+            return self._multipart_upload(
+                destination, chain([first], chunks), copy_existing=existing
+            )
+        body = self._read_prefix(destination, existing)
+        return self._multipart_upload(destination, chain([body + first], chunks))
+
+    def features_size(self, destination: str) -> int | None:
+        return self._object_size(destination)
+
+    def _read_prefix(self, key: str, size: int) -> bytes:
+        return self._s3.get_object(
+            Bucket=self._bucket, Key=key, Range=f"bytes=0-{size - 1}"
+        )["Body"].read()
+
+    def _truncate_object(self, key: str, size: int) -> None:
+        """객체를 앞 size 바이트로 교체한다. 크면 서버 측 복사를 쓴다."""
+        if size >= _MIN_PART_BYTES:
+            self._multipart_upload(key, [], copy_existing=size)
+        else:
+            self._s3.put_object(Bucket=self._bucket, Key=key, Body=self._read_prefix(key, size))
+
+    def load_watermark(self, destination: str) -> SourceWatermark | None:
+        try:
+            response = self._s3.get_object(
+                Bucket=self._bucket, Key=watermark_destination(destination)
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("NoSuchKey", "404"):
+                return None
+            raise
+        return decode_watermark(response["Body"].read().decode("utf-8"))
+
+    def save_watermark(self, watermark: SourceWatermark, destination: str) -> Path:
+        key = watermark_destination(destination)
+        self._s3.put_object(
+            Bucket=self._bucket, Key=key, Body=encode_watermark(watermark).encode("utf-8")
+        )
+        return Path(key)
+
+    def _object_size(self, key: str) -> int | None:
+        try:
+            return self._s3.head_object(Bucket=self._bucket, Key=key)["ContentLength"]
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("NoSuchKey", "404"):
+                return None
+            raise
+
+    def _multipart_upload(
+        self,
+        destination: str,
+        chunks: Iterable[bytes],
+        *,
+        copy_existing: int | None = None,
+    ) -> Path:
+        """chunks를 파트로 올려 destination을 만든다. 실패하면 업로드를 중단한다.
+
+        copy_existing이 주어지면 destination의 현재 객체 앞 copy_existing 바이트를
+        첫 파트로 복사한다.
+        """
+        upload_id = self._s3.create_multipart_upload(
+            Bucket=self._bucket, Key=destination
+        )["UploadId"]
+        try:
+            parts: list[dict] = []
+            if copy_existing is not None:
+                response = self._s3.upload_part_copy(
+                    Bucket=self._bucket,
+                    Key=destination,
+                    UploadId=upload_id,
+                    PartNumber=1,
+                    CopySource={"Bucket": self._bucket, "Key": destination},
+                    CopySourceRange=f"bytes=0-{copy_existing - 1}",
+                )
+                parts.append({"ETag": response["CopyPartResult"]["ETag"], "PartNumber": 1})
+            parts += self._upload_parts(chunks, destination, upload_id, len(parts) + 1)
+            self._s3.complete_multipart_upload(
+                Bucket=self._bucket,
+                Key=destination,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except BaseException:
+            self._s3.abort_multipart_upload(
+                Bucket=self._bucket, Key=destination, UploadId=upload_id
+            )
+            raise
+        return Path(destination)
+
+    def _upload_parts(
+        self,
+        chunks: Iterable[bytes],
+        key: str,
+        upload_id: str,
+        first_part_number: int = 1,
+    ) -> list[dict]:
+        parts: list[dict] = []
+        with ThreadPoolExecutor(max_workers=self._max_concurrency) as pool:
+            pending: deque[Future[dict]] = deque()
+            try:
+                for part_number, body in enumerate(chunks, start=first_part_number):
+                    if len(pending) >= self._max_concurrency:
+                        parts.append(pending.popleft().result())
+                    pending.append(
+                        pool.submit(self._upload_part, key, upload_id, part_number, body)
+                    )
+                    record_bytes_written(len(body))
+                while pending:
+                    parts.append(pending.popleft().result())
+            finally:
+                for future in pending:
+                    future.cancel()
+        return parts
+
+    def _upload_part(self, key: str, upload_id: str, part_number: int, body: bytes) -> dict:
+        response = self._s3.upload_part(
+            Bucket=self._bucket,
+            Key=key,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=body,
+        )
+        return {"ETag": response["ETag"], "PartNumber": part_number}
@@ -0,0 +1,365 @@
+"""파이프라인 단계 결과를 입력 fingerprint와 단계 버전으로 찾아 재사용하는 캐시.
+
+    python -m services.data_pipeline.infrastructure.stage_cache inspect CACHE_DIR
+    python -m services.data_pipeline.infrastructure.stage_cache prune CACHE_DIR --max-bytes 1G
+
+항목은 ParsedRawCache와 같은 레이아웃(키 디렉터리 + manifest.json)이므로 두 캐시가
+한 디렉터리를 함께 쓸 수 있고, inspect/prune은 파싱 캐시 항목도 함께 다룬다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+from services.data_pipeline.domain.models import (
+    BatchSource,
+    FeatureBatch,
+    RowSources,
+    ValidationReport,
+    encode_row_sources,
+)
+from services.data_pipeline.infrastructure.feature_columnar import (
+    FeatureBatchWriter,
+    FeatureColumns,
+    open_feature_columns,
+)
+from services.data_pipeline.infrastructure.raw_cache import cache_key
+from services.data_pipeline.infrastructure.report_json import (
+    decode_report_json,
+    encode_report_json,
+)
+
+DEFAULT_MAX_BYTES = 10 * 1024**3
+STAGE_VALIDATE = "validate"
+STAGE_FEATURES = "features"
+_FORMAT_VERSION = 3
+_MANIFEST = "manifest.json"
+_TMP_PREFIX = ".tmp-"
+_VALID_MASK = "valid_mask.bin"
+_REPORT = "report.json"
+_FEATURES = "features.col"
+_ROW_INDEX = "row_index.bin"
+_SOURCES = "sources.json"
+_SOURCE_CODES = "source_codes.bin"
+_SIZE_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+
+
+def stage_key(stage: str, *parts: object) -> str:
+    """단계 이름, 입력 fingerprint(또는 앞 단계 키), 단계 버전으로 캐시 키를 만든다."""
+    return cache_key("stage", stage, *parts)
+
+
+@dataclass(frozen=True)
+class StageCacheEntry:
+    """캐시 항목 하나의 manifest 요약."""
+
+    key: str
+    stage: str
+    rows: int
+    size_bytes: int
+    last_used_ns: int
+
+
+@dataclass(frozen=True, eq=False)
+class CachedValidation:
+    """검증 단계 결과. valid_mask는 파싱 단계가 낸 행 순서를 따른다."""
+
+    valid_mask: np.ndarray
+    report: ValidationReport
+
+
+@dataclass(frozen=True, eq=False)
+class CachedFeatures:
+    """피처 단계 결과. source_codes는 행마다 sources 표에서의 원본 위치다."""
+
+    columns: FeatureColumns
+    row_index: np.ndarray
+    sources: tuple[BatchSource | None, ...]
+    source_codes: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.columns)
+
+    def batches(self, batch_size: int) -> Iterator[FeatureBatch]:
+        """기록할 때와 같은 row_index/source를 가진 batch_size 행 이하의 배치들."""
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+        for start in range(0, len(self), batch_size):
+            stop = min(start + batch_size, len(self))
+            yield self.columns.feature_batch(
+                start,
+                stop,
+                row_index=self.row_index[start:stop],
+                source=RowSources.of(self.sources, self.source_codes[start:stop]),
+            )
+
+
+class ValidationRecorder:
+    """검증 단계가 배치마다 낸 valid_mask와 최종 리포트를 항목 디렉터리에 기록한다."""
+
+    def __init__(self, directory: Path) -> None:
+        self._directory = directory
+        self._mask = open(directory / _VALID_MASK, "wb")
+        self.rows = 0
+        self.finished = False
+
+    def append(self, valid_mask: np.ndarray) -> None:
+        np.asarray(valid_mask, dtype=np.bool_).tofile(self._mask)
+        self.rows += len(valid_mask)
+
+    def finish(self, report: ValidationReport) -> None:
+        self._mask.close()
+        mask = np.fromfile(self._directory / _VALID_MASK, dtype=np.bool_)
+        np.packbits(mask).tofile(self._directory / _VALID_MASK)
+        with open(self._directory / _REPORT, "w", encoding="utf-8") as f:
+            f.writelines(encode_report_json(report))
+        self.finished = True
+
+    def close(self) -> None:
+        self._mask.close()
+
+
+class FeaturesRecorder:
+    """피처 단계가 낸 FeatureBatch를 열 단위 피처 파일로 기록한다.
+
+    transaction_id를 다시 만들 수 있도록 row_index와 행별 원본 코드도 함께 남긴다.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self._directory = directory
+        self._writer = FeatureBatchWriter(directory / _FEATURES)
+        self._row_index = open(directory / _ROW_INDEX, "wb")
+        self._source_codes = open(directory / _SOURCE_CODES, "wb")
+        self._sources: dict[BatchSource | None, int] = {}
+        self.rows = 0
+        self.finished = False
+
+    def append(self, batch: FeatureBatch) -> None:
+        self._writer.append(batch)
+        np.asarray(batch.row_index, dtype="<i8").tofile(self._row_index)
+        codes = encode_row_sources(batch.source, len(batch), self._sources)
+        codes.astype("<i4", copy=False).tofile(self._source_codes)
+        self.rows += len(batch)
+
+    def finish(self) -> None:
+        self._writer.finish()
+        self._row_index.close()
+        self._source_codes.close()
+        sources = [
+            None if source is None else {"name": source.name, "first_row": source.first_row}
+            for source in self._sources
+        ]
+        (self._directory / _SOURCES).write_text(json.dumps(sources), encoding="utf-8")
+        self.finished = True
+
+    def close(self) -> None:
+        self._writer.close()
+        self._row_index.close()
+        self._source_codes.close()
+
+
+class StageCache:
+    """단계 결과를 키별 디렉터리에 저장하는 content-addressed 캐시.
+
+    키는 입력 fingerprint와 단계 코드/설정 버전에서 만들므로(stage_key) 입력이나
+    규칙이 바뀌면 다른 항목을 가리키고, 바뀌지 않은 단계는 저장된 결과를 다시
+    쓴다. 기록은 임시 디렉터리에 한 뒤 rename으로 확정하고, 전체 크기가
+    max_bytes를 넘으면 가장 오래 전에 사용된 항목부터 삭제한다.
+    """
+
+    def __init__(self, directory: str | Path, *, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        if max_bytes <= 0:
+            raise ValueError(f"max_bytes must be positive, got {max_bytes}")
+        self._directory = Path(directory)
+        self._max_bytes = max_bytes
+
+    def __contains__(self, key: str) -> bool:
+        return (self._directory / key / _MANIFEST).exists()
+
+    def load_validation(self, key: str) -> CachedValidation | None:
+        """저장된 검증 결과. 없으면 None."""
+        manifest = self._open(key)
+        if manifest is None:
+            return None
+        entry = self._directory / key
+        packed = np.fromfile(entry / _VALID_MASK, dtype=np.uint8)
+        return CachedValidation(
+            valid_mask=np.unpackbits(packed, count=manifest["rows"]).view(np.bool_),
+            report=decode_report_json((entry / _REPORT).read_text(encoding="utf-8")),
+        )
+
+    def load_features(self, key: str) -> CachedFeatures | None:
+        """저장된 피처. 열은 memory-map한 뷰다. 없으면 None."""
+        if self._open(key) is None:
+            return None
+        entry = self._directory / key
+        sources = json.loads((entry / _SOURCES).read_text(encoding="utf-8"))
+        return CachedFeatures(
+            columns=open_feature_columns(entry / _FEATURES),
+            row_index=np.memmap(entry / _ROW_INDEX, dtype="<i8", mode="r"),
+            sources=tuple(
+                None if source is None else BatchSource(source["name"], source["first_row"])
+                for source in sources
+            ),
+            source_codes=np.memmap(entry / _SOURCE_CODES, dtype="<i4", mode="r"),
+        )
+
+    @contextmanager
+    def record_validation(self, key: str) -> Iterator[ValidationRecorder]:
+        """블록이 예외 없이 끝나고 finish가 호출되었으면 key 항목으로 확정한다."""
+        with self._record(key, STAGE_VALIDATE, ValidationRecorder) as recorder:
+            yield recorder
+
+    @contextmanager
+    def record_features(self, key: str) -> Iterator[FeaturesRecorder]:
+        """블록이 예외 없이 끝나고 finish가 호출되었으면 key 항목으로 확정한다."""
+        with self._record(key, STAGE_FEATURES, FeaturesRecorder) as recorder:
+            yield recorder
+
+    def entries(self) -> list[StageCacheEntry]:
+        """확정된 항목을 최근에 사용한 순서로 반환한다."""
+        if not self._directory.is_dir():
+            return []
+        entries = []
+        for entry in self._directory.iterdir():
+            manifest_path = entry / _MANIFEST
+            if entry.name.startswith(_TMP_PREFIX) or not manifest_path.exists():
+                continue
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+            entries.append(
+                StageCacheEntry(
+                    key=entry.name,
+                    stage=manifest.get("stage", "parse"),
+                    rows=manifest["rows"],
+                    size_bytes=sum(f.stat().st_size for f in entry.iterdir()),
+                    last_used_ns=manifest_path.stat().st_mtime_ns,
+                )
+            )
+        return sorted(entries, key=lambda e: e.last_used_ns, reverse=True)
+
+    def evict(self, max_bytes: int | None = None) -> list[StageCacheEntry]:
+        """전체 크기가 max_bytes 이하가 될 때까지 오래된 항목부터 삭제한다.
+
+        max_bytes가 None이면 생성할 때 받은 값을 쓴다. 삭제한 항목을 반환한다.
+        """
+        limit = self._max_bytes if max_bytes is None else max_bytes
+        entries = self.entries()
+        total = sum(entry.size_bytes for entry in entries)
+        removed = []
+        for entry in reversed(entries):
+            if total <= limit:
+                break
+            self.remove(entry.key)
+            total -= entry.size_bytes
+            removed.append(entry)
+        return removed
+
+    def remove(self, key: str) -> None:
+        shutil.rmtree(self._directory / key, ignore_errors=True)
+
+    def _open(self, key: str) -> dict | None:
+        manifest_path = self._directory / key / _MANIFEST
+        try:
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        if manifest.get("version") != _FORMAT_VERSION:
+            return None
+        os.utime(manifest_path)
+        return manifest
+
+    @contextmanager
+    def _record(self, key: str, stage: str, recorder_type: type) -> Iterator:
+        self._directory.mkdir(parents=True, exist_ok=True)
+        tmp = self._directory / f"{_TMP_PREFIX}{key}-{uuid.uuid4().hex}"
+        tmp.mkdir()
+        try:
+            recorder = recorder_type(tmp)
+            try:
+                yield recorder
+            finally:
+                recorder.close()
+            if recorder.finished:
+                self._commit(key, stage, tmp, recorder.rows)
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    def _commit(self, key: str, stage: str, tmp: Path, rows: int) -> None:
+        manifest = {"version": _FORMAT_VERSION, "key": key, "stage": stage, "rows": rows}
+        (tmp / _MANIFEST).write_text(json.dumps(manifest), encoding="utf-8")
+        try:
+            tmp.rename(self._directory / key)
+        except OSError:
+            # 다른 실행이 같은 키를 먼저 기록했다.
+            return
+        self.evict()
+
+
+def parse_size(text: str) -> int:
+    """"512M", "10G" 같은 크기 표기를 바이트 수로 바꾼다 (1024 단위)."""
+    value = text.strip().upper().removesuffix("B").removesuffix("I")
+    unit = value[-1:] if value[-1:] in _SIZE_UNITS else ""
+    number = value[:len(value) - len(unit)]
+    try:
+        size = int(float(number) * _SIZE_UNITS[unit])
+    except ValueError:
+        raise ValueError(f"invalid size {text!r}") from None
+    if size < 0:
+        raise ValueError(f"invalid size {text!r}")
+    return size
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m services.data_pipeline.infrastructure.stage_cache",
+        description="단계 결과 캐시 디렉터리를 조회하고 정리한다.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    inspect = commands.add_parser("inspect", help="항목을 최근 사용 순으로 출력")
+    inspect.add_argument("directory", type=Path)
+    prune = commands.add_parser("prune", help="오래된 항목부터 삭제")
+    prune.add_argument("directory", type=Path)
+    prune.add_argument(
+        "--max-bytes", type=parse_size, default=0, help="남길 전체 크기 (기본값 0은 모두 삭제)"
+    )
+    prune.add_argument("--stage", help="이 단계의 항목만 모두 삭제")
+    args = parser.parse_args(argv)
+
+    cache = StageCache(args.directory)
+    if args.command == "inspect":
+        entries = cache.entries()
+        for entry in entries:
+            used = datetime.fromtimestamp(entry.last_used_ns / 1e9, tz=timezone.utc)
+            print(
+                f"{entry.key[:16]}  {entry.stage:<9} {entry.rows:>12,} rows"
+                f"  {entry.size_bytes / 2**20:>10.1f} MiB  {used:%Y-%m-%d %H:%M:%S}"
+            )
+        total = sum(entry.size_bytes for entry in entries)
+        print(f"{len(entries)} entries, {total / 2**20:.1f} MiB")
+        return 0
+
+    if args.stage is not None:
+        removed = [entry for entry in cache.entries() if entry.stage == args.stage]
+        for entry in removed:
+            cache.remove(entry.key)
+    else:
+        removed = cache.evict(args.max_bytes)
+    freed = sum(entry.size_bytes for entry in removed)
+    print(f"removed {len(removed)} entries, {freed / 2**20:.1f} MiB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
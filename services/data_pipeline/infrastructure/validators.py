@@ -2,42 +2,494 @@
 
 from __future__ import annotations
 
+import heapq
+import json
 import math
-from collections.abc import Iterable
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import Future
+from dataclasses import dataclass, replace
+from typing import Generic, TypeVar
+
+import numpy as np
 
 from services.data_pipeline.domain.models import (
     PCA_FEATURES_COUNT,
+    ChainedErrors,
+    DeferredColumns,
+    ErrorKindSummary,
     RawTransaction,
+    RowParseError,
+    TransactionBatch,
     ValidationError,
     ValidationReport,
+    decimal_to_cents,
+)
+from services.data_pipeline.infrastructure.process_pool import new_process_pool
+
+# 검증 규칙별 (field, message). 인덱스가 오류 비트마스크의 비트 위치이며,
+# 순서는 _validate_one이 오류를 기록하는 순서와 같다.
+VALIDATION_RULES: tuple[tuple[str, str], ...] = (
+    ("transaction_id", "empty transaction_id"),
+    ("time_seconds", "invalid time_seconds"),
+    ("amount", "invalid amount"),
+    ("is_fraud", "invalid is_fraud type"),
+    ("pca_features", "pca_features count mismatch"),
+    ("pca_features", "pca_features contains NaN or Inf"),
 )
 
+# compute_error_bits/_validate_one의 판정을 바꾸면 올린다 (TransactionValidator.version 참고).
+_RULES_VERSION = 1
+
+ERROR_TIME_SECONDS = 1 << 1
+ERROR_AMOUNT = 1 << 2
+ERROR_PCA_NON_FINITE = 1 << 5
+
+# 집계 모드에서 행 단위 오류를 모아 두었다가 한 번에 표본에 반영하는 크기.
+_AGGREGATE_FLUSH_ERRORS = 4096
+
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+T = TypeVar("T")
+
+
+class BitmaskErrors(Sequence[ValidationError]):
+    """행별 오류 비트마스크를 ValidationError 시퀀스로 보여주는 지연 뷰.
+
+    오류가 있는 행의 비트마스크와 record_index만 보관하고, ValidationError는
+    순회(직렬화)할 때 만든다.
+    """
+
+    def __init__(self, error_bits: np.ndarray, record_index: np.ndarray) -> None:
+        failed = np.flatnonzero(error_bits)
+        self._bits = error_bits[failed]
+        self._record_index = record_index[failed]
+        self._length = int(_POPCOUNT[self._bits].sum(dtype=np.int64))
+        self._materialized: tuple[ValidationError, ...] | None = None
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[ValidationError]:
+        for bits, index in zip(self._bits.tolist(), self._record_index.tolist()):
+            for bit, (field, message) in enumerate(VALIDATION_RULES):
+                if bits >> bit & 1:
+                    yield ValidationError(field, message, index)
+
+    def __getitem__(self, key):
+        if self._materialized is None:
+            self._materialized = tuple(self)
+        return self._materialized[key]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __hash__(self) -> int:
+        # 같은 오류를 담은 tuple과 같다고 비교되므로 해시도 tuple과 같게 한다.
+        return hash(self[:])
+
+    def __repr__(self) -> str:
+        return f"BitmaskErrors(len={self._length})"
+
+
+class ValidationReportBuilder:
+    """검증 결과를 받아 ValidationReport를 점진적으로 만든다.
+
+    max_error_samples가 주어지면 집계 모드로 동작한다. 오류를 개별로 보관하지
+    않고 (field, message)별 정확한 건수와 최대 max_error_samples개의 예시 행
+    번호(seed로 재현 가능한 균등 표본)만 남기므로, 메모리 사용량이 오류 수와
+    무관하게 일정하다. stream은 같은 seed의 다른 builder와 다른 표본 키를 쓰게
+    하는 번호로, 나중에 merge할 부분 리포트마다 다르게 준다.
+    """
+
+    def __init__(
+        self, *, max_error_samples: int | None = None, seed: int = 0, stream: int = 0
+    ) -> None:
+        if max_error_samples is not None and max_error_samples < 0:
+            raise ValueError(
+                f"max_error_samples must be non-negative, got {max_error_samples}"
+            )
+        self._total = 0
+        self._segments: list[Sequence[ValidationError]] = []
+        self._pending: list[ValidationError] = []
+        self._max_samples = max_error_samples
+        self._rng = np.random.default_rng([seed, stream] if stream else seed)
+        self._kinds: dict[tuple[str, str], _ErrorReservoir] = {}
+
+    @property
+    def aggregated(self) -> bool:
+        return self._max_samples is not None
+
+    def add_records(self, count: int) -> None:
+        self._total += count
+
+    def add_errors(self, errors: Iterable[ValidationError]) -> None:
+        self._pending.extend(errors)
+        if self.aggregated and len(self._pending) >= _AGGREGATE_FLUSH_ERRORS:
+            self._flush_pending()
+
+    def add_batch_result(self, result: BatchValidationResult) -> None:
+        """배치 결과는 비트마스크 형태 그대로 보관한다.
+
+        배치의 parse_errors(파싱에 실패한 행)도 같은 리포트에 포함된다.
+        """
+        self._flush_pending()
+        self.add_records(result.batch.record_count)
+        if self.aggregated:
+            self._aggregate_bits(result.error_bits, result.batch.row_index)
+            self.add_errors(result.batch.parse_errors)
+            return
+        errors = result.report.errors
+        if len(errors):
+            self._segments.append(errors)
+
+    def build(self) -> ValidationReport:
+        self._flush_pending()
+        if self.aggregated:
+            return self._build_aggregated()
+        if not self._segments:
+            errors: Sequence[ValidationError] = ()
+        elif len(self._segments) == 1 and isinstance(self._segments[0], tuple):
+            errors = self._segments[0]
+        else:
+            errors = ChainedErrors(self._segments)
+        return ValidationReport(total_records=self._total, errors=errors)
+
+    def _flush_pending(self) -> None:
+        if not self._pending:
+            return
+        if self.aggregated:
+            grouped: dict[tuple[str, str], list[int]] = {}
+            for error in self._pending:
+                grouped.setdefault((error.field, error.message), []).append(error.record_index)
+            for kind, indices in grouped.items():
+                self._reservoir(kind).add(
+                    np.array(indices, dtype=np.int64), self._rng.random(len(indices))
+                )
+        else:
+            self._segments.append(tuple(self._pending))
+        self._pending = []
+
+    def _aggregate_bits(self, error_bits: np.ndarray, record_index: np.ndarray) -> None:
+        failed = np.flatnonzero(error_bits)
+        if not len(failed):
+            return
+        bits = error_bits[failed]
+        indices = record_index[failed]
+        for bit, kind in enumerate(VALIDATION_RULES):
+            hit = (bits >> bit & 1).astype(np.bool_)
+            if hit.any():
+                self._reservoir(kind).add(indices[hit], self._rng.random(int(hit.sum())))
+
+    def _reservoir(self, kind: tuple[str, str]) -> _ErrorReservoir:
+        reservoir = self._kinds.get(kind)
+        if reservoir is None:
+            reservoir = self._kinds[kind] = _ErrorReservoir(self._max_samples or 0)
+        return reservoir
+
+    def _build_aggregated(self) -> ValidationReport:
+        # VALIDATION_RULES 순서, 그 외 종류는 처음 나온 순서로 정렬한다.
+        rule_order = {kind: pos for pos, kind in enumerate(VALIDATION_RULES)}
+        kinds = sorted(
+            self._kinds.items(),
+            key=lambda item: rule_order.get(item[0], len(rule_order)),
+        )
+        summary = tuple(reservoir.summary(field, message) for (field, message), reservoir in kinds)
+        return ValidationReport.aggregated(self._total, summary)
+
+
+class _ErrorReservoir:
+    """한 오류 종류의 건수와 bottom-k 표본.
+
+    항목마다 균등 난수 키를 붙이고 키가 가장 작은 size개만 남기면 지금까지 본
+    항목에서 비복원 균등 추출한 것과 같다. 배치 단위로 벡터 연산한다.
+    """
+
+    def __init__(self, size: int) -> None:
+        self.count = 0
+        self._size = size
+        self._keys = np.empty(0, dtype=np.float64)
+        self._indices = np.empty(0, dtype=np.int64)
+
+    def add(self, indices: np.ndarray, keys: np.ndarray) -> None:
+        """행 번호 indices를 같은 길이의 키 keys와 함께 넣는다."""
+        self.count += len(indices)
+        if self._size == 0:
+            return
+        keys = np.concatenate([self._keys, keys])
+        indices = np.concatenate([self._indices, indices])
+        if len(keys) > self._size:
+            keep = np.argpartition(keys, self._size - 1)[:self._size]
+            keys = keys[keep]
+            indices = indices[keep]
+        self._keys = keys
+        self._indices = indices
+
+    def summary(self, field: str, message: str) -> ErrorKindSummary:
+        order = np.argsort(self._indices, kind="stable")
+        return ErrorKindSummary(
+            field,
+            message,
+            self.count,
+            tuple(self._indices[order].tolist()),
+            sample_keys=tuple(self._keys[order].tolist()),
+            max_samples=self._size,
+        )
+
+
+class ValidationStream(Iterator[T], Generic[T]):
+    """검증을 통과한 항목을 지연 생성하는 1회성 Iterator.
+
+    입력이 모두 소진되면 build()로 ValidationReport가 확정되어 report로 조회할
+    수 있고, on_complete 콜백이 있으면 함께 호출된다.
+    """
+
+    def __init__(
+        self,
+        items: Iterator[T],
+        build: Callable[[], ValidationReport],
+        on_complete: Callable[[ValidationReport], None] | None = None,
+    ) -> None:
+        self._items = items
+        self._build = build
+        self._on_complete = on_complete
+        self._report: ValidationReport | None = None
+
+    def __next__(self) -> T:
+        try:
+            return next(self._items)
+        except StopIteration:
+            if self._report is None:
+                self._report = self._build()
+                if self._on_complete is not None:
+                    self._on_complete(self._report)
+            raise
+
+    @property
+    def report(self) -> ValidationReport:
+        if self._report is None:
+            raise RuntimeError("validation stream has not been exhausted yet")
+        return self._report
+
+
+@dataclass(frozen=True, eq=False)
+class BatchValidationResult:
+    """validate_batch 결과. 행마다 규칙별 실패 비트를 uint8로 보관한다."""
+
+    batch: TransactionBatch
+    error_bits: np.ndarray
+
+    @property
+    def valid_mask(self) -> np.ndarray:
+        return self.error_bits == 0
+
+    @property
+    def valid_batch(self) -> TransactionBatch:
+        """유효한 행만 남긴 배치. parse_errors는 리포트로 옮겨졌으므로 비운다."""
+        if not self.error_bits.any():
+            if self.batch.parse_errors:
+                return replace(self.batch, parse_errors=())
+            return self.batch
+        return self.batch[self.valid_mask]
+
+    @property
+    def report(self) -> ValidationReport:
+        """record_index는 batch.row_index를 따른다.
+
+        parse_errors가 있으면 검증 오류와 record_index 순서로 합친다.
+        """
+        errors: Sequence[ValidationError] = BitmaskErrors(
+            self.error_bits, self.batch.row_index
+        )
+        if self.batch.parse_errors:
+            errors = tuple(
+                heapq.merge(
+                    self.batch.parse_errors, errors, key=lambda error: error.record_index
+                )
+            )
+        return ValidationReport(total_records=self.batch.record_count, errors=errors)
+
 
 class TransactionValidator:
-    """RawTransaction 스키마 검증기."""
+    """RawTransaction 스키마 검증기.
+
+    max_error_samples가 주어지면 리포트를 집계 모드로 만든다
+    (ValidationReportBuilder 참고).
+    """
+
+    def __init__(self, *, max_error_samples: int | None = None, seed: int = 0) -> None:
+        if max_error_samples is not None and max_error_samples < 0:
+            raise ValueError(
+                f"max_error_samples must be non-negative, got {max_error_samples}"
+            )
+        self._max_error_samples = max_error_samples
+        self._seed = seed
+
+    def version(self) -> str:
+        """검증 규칙과 리포트 설정을 식별하는 문자열. 단계 결과 캐시의 키로 쓴다."""
+        return json.dumps(
+            [_RULES_VERSION, VALIDATION_RULES, self._max_error_samples, self._seed]
+        )
+
+    def report_builder(self, *, stream: int = 0) -> ValidationReportBuilder:
+        """이 검증기의 리포트 모드로 설정된 빈 ValidationReportBuilder."""
+        return ValidationReportBuilder(
+            max_error_samples=self._max_error_samples, seed=self._seed, stream=stream
+        )
 
     def validate(
         self,
         transactions: Iterable[RawTransaction],
     ) -> tuple[list[RawTransaction], ValidationReport]:
         """모든 transaction을 검증하고, 유효한 것만 반환 + ValidationReport 동봉."""
-        valid: list[RawTransaction] = []
-        errors: list[ValidationError] = []
-        total = 0
+        stream = self.validate_stream(transactions)
+        valid = list(stream)
+        return valid, stream.report
+
+    def validate_stream(
+        self,
+        transactions: Iterable[RawTransaction],
+        *,
+        on_complete: Callable[[ValidationReport], None] | None = None,
+    ) -> ValidationStream[RawTransaction]:
+        """입력을 읽는 대로 검증해 유효한 transaction만 지연 생성한다.
+
+        ValidationReport는 스트림이 소진될 때 확정된다.
+        """
+        builder = self.report_builder()
+        return ValidationStream(
+            self._iter_valid(transactions, builder), builder.build, on_complete
+        )
+
+    def validate_batches(
+        self,
+        batches: Iterable[TransactionBatch],
+        *,
+        on_complete: Callable[[ValidationReport], None] | None = None,
+    ) -> ValidationStream[TransactionBatch]:
+        """배치 단위로 검증해 유효한 행만 남긴 하위 배치를 지연 생성한다."""
+        builder = self.report_builder()
+        return ValidationStream(
+            self._iter_valid_batches(batches, builder), builder.build, on_complete
+        )
+
+    def validate_shards(
+        self,
+        shards: Iterable[Callable[[int], Iterable[TransactionBatch]]],
+        *,
+        workers: int,
+        on_complete: Callable[[ValidationReport], None] | None = None,
+    ) -> ValidationStream[TransactionBatch]:
+        """shard를 프로세스 풀에서 로드·검증하고 shard 순서대로 합친다.
+
+        shard는 시작 row_index를 받아 배치를 반환하는 pickle 가능한 callable이다.
+        worker는 shard(0)을 검증하고, 유효 배치와 부분 리포트는 앞선 shard들의
+        행 수만큼 밀어 ValidationReport.merge로 합친다. shard 로드에서 발생한
+        RowParseError도 같은 만큼 행 번호를 옮겨 다시 발생시키므로 순차 실행과
+        같은 오류가 된다. 동시에 처리 중인 shard는 workers * 2개로 제한한다.
+        """
+        if workers <= 0:
+            raise ValueError(f"workers must be positive, got {workers}")
+        merged = [ValidationReport(total_records=0, errors=())]
+        return ValidationStream(
+            self._iter_valid_shards(shards, workers, merged),
+            lambda: merged[0],
+            on_complete,
+        )
+
+    def _iter_valid_shards(
+        self,
+        shards: Iterable[Callable[[int], Iterable[TransactionBatch]]],
+        workers: int,
+        merged: list[ValidationReport],
+    ) -> Iterator[TransactionBatch]:
+        executor = new_process_pool(workers)
+        try:
+            pending: deque[Future] = deque()
+            remaining = enumerate(shards)
+
+            def submit_next() -> None:
+                position, shard = next(remaining, (None, None))
+                if shard is not None:
+                    pending.append(executor.submit(_validate_shard, self, shard, position))
+
+            for _ in range(workers * 2):
+                submit_next()
+
+            while pending:
+                future = pending.popleft()
+                submit_next()
+                offset = merged[0].total_records
+                try:
+                    valid, report = future.result()
+                except RowParseError as error:
+                    raise error.with_row_offset(offset) from error
+                merged[0] = merged[0].merge(report)
+                for batch in valid:
+                    yield batch.with_row_offset(offset)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def validate_batch(self, batch: TransactionBatch) -> BatchValidationResult:
+        """TransactionBatch 전체를 배열 연산으로 한 번에 검증한다.
 
+        pca_features가 아직 디코딩하지 않은 DeferredColumns이면 디코딩하지 않고
+        PCA 규칙을 건너뛴다 (KaggleCsvParser의 pca_features 참고).
+        """
+        pca_features = batch.pca_features
+        if isinstance(pca_features, DeferredColumns) and not pca_features.loaded:
+            pca_features = None
+        error_bits = self.compute_error_bits(
+            time_seconds=batch.time_seconds,
+            amount_cents=batch.amount_cents,
+            pca_features=pca_features,
+        )
+        return BatchValidationResult(batch=batch, error_bits=error_bits)
+
+    def compute_error_bits(
+        self,
+        *,
+        time_seconds: np.ndarray,
+        amount_cents: np.ndarray,
+        pca_features: np.ndarray | None,
+    ) -> np.ndarray:
+        """열 배열에서 행별 오류 비트마스크(uint8)를 계산한다.
+
+        transaction_id, is_fraud 타입, PCA 개수 규칙은 배열 표현에서 항상
+        만족되므로 해당 비트는 설정되지 않는다. pca_features가 None이면
+        PCA 값 규칙도 건너뛴다.
+        """
+        error_bits = np.zeros(len(time_seconds), dtype=np.uint8)
+        error_bits[~np.isfinite(time_seconds) | (time_seconds < 0)] |= ERROR_TIME_SECONDS
+        error_bits[amount_cents < 0] |= ERROR_AMOUNT
+        if pca_features is not None:
+            error_bits[~np.isfinite(pca_features).all(axis=1)] |= ERROR_PCA_NON_FINITE
+        return error_bits
+
+    def _iter_valid(
+        self,
+        transactions: Iterable[RawTransaction],
+        builder: ValidationReportBuilder,
+    ) -> Iterator[RawTransaction]:
         for idx, txn in enumerate(transactions):
-            total += 1
+            builder.add_records(1)
             row_errors = self._validate_one(txn, idx)
             if row_errors:
-                errors.extend(row_errors)
+                builder.add_errors(row_errors)
             else:
-                valid.append(txn)
+                yield txn
 
-        report = ValidationReport(
-            total_records=total,
-            errors=tuple(errors),
-        )
-        return valid, report
+    def _iter_valid_batches(
+        self,
+        batches: Iterable[TransactionBatch],
+        builder: ValidationReportBuilder,
+    ) -> Iterator[TransactionBatch]:
+        for batch in batches:
+            result = self.validate_batch(batch)
+            builder.add_batch_result(result)
+            yield result.valid_batch
 
     def _validate_one(
         self,
@@ -56,7 +508,8 @@ class TransactionValidator:
                 ValidationError("time_seconds", "invalid time_seconds", index)
             )
 
-        if not txn.amount.is_finite() or txn.amount < 0:
+        cents = decimal_to_cents(txn.amount)
+        if cents is None or cents < 0:
             errors.append(
                 ValidationError("amount", "invalid amount", index)
             )
@@ -81,3 +534,19 @@ class TransactionValidator:
             )
 
         return errors
+
+
+def _validate_shard(
+    validator: TransactionValidator,
+    shard: Callable[[int], Iterable[TransactionBatch]],
+    position: int,
+) -> tuple[list[TransactionBatch], ValidationReport]:
+    """worker 프로세스에서 shard 하나를 row_index 0부터 로드해 검증한다.
+
+    집계 모드의 표본 키는 shard 순서(position)마다 다른 stream에서 뽑는다.
+    """
+    builder = validator.report_builder(stream=position)
+    valid = [
+        batch for batch in validator._iter_valid_batches(shard(0), builder) if len(batch)
+    ]
+    return valid, builder.build()
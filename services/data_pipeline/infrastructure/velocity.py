@@ -0,0 +1,138 @@
+"""time_seconds 순서 거래 스트림의 구간별 거래 속도 피처 계산."""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+
+import numpy as np
+
+from services.data_pipeline.domain.models import VELOCITY_WINDOWS_SECONDS, VelocityColumns
+
+
+class SlidingWindow:
+    """(t - seconds, t] 구간 거래의 건수, 금액 합계, 최대 금액을 유지한다.
+
+    구간 안 거래의 deque와 금액이 단조 감소하는 최댓값 후보 deque를 함께
+    관리하므로 push는 분할 상환 O(1)이고, 메모리는 구간 안의 거래 수에만
+    비례한다.
+    """
+
+    __slots__ = ("_seconds", "_entries", "_maxima", "_sum")
+
+    def __init__(self, seconds: float) -> None:
+        if seconds <= 0:
+            raise ValueError(f"window seconds must be positive, got {seconds}")
+        self._seconds = seconds
+        self._entries: deque[tuple[float, int]] = deque()
+        self._maxima: deque[tuple[float, int]] = deque()
+        self._sum = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def push(self, time_seconds: float, amount_cents: int) -> tuple[int, int, int]:
+        """거래를 추가하고 (건수, 금액 합계, 최대 금액)을 반환한다. 현재 거래를 포함한다."""
+        expired = time_seconds - self._seconds
+        entries = self._entries
+        entries.append((time_seconds, amount_cents))
+        self._sum += amount_cents
+        while entries[0][0] <= expired:
+            self._sum -= entries.popleft()[1]
+
+        maxima = self._maxima
+        while maxima and maxima[-1][1] <= amount_cents:
+            maxima.pop()
+        maxima.append((time_seconds, amount_cents))
+        while maxima[0][0] <= expired:
+            maxima.popleft()
+        return len(entries), self._sum, maxima[0][1]
+
+
+class VelocityFeatureExtractor:
+    """VELOCITY_WINDOWS_SECONDS 구간별 속도 피처와 누적 사기 비율을 계산한다.
+
+    호출 사이에 상태를 유지하므로 입력은 하나의 스트림으로서 time_seconds가
+    감소하지 않아야 한다. 새 스트림을 시작하려면 reset()을 호출한다.
+    """
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self._windows = [SlidingWindow(seconds) for seconds in VELOCITY_WINDOWS_SECONDS]
+        self._last_time = -np.inf
+        self._seen = 0
+        self._fraud = 0
+
+    def update(
+        self, time_seconds: float, amount_cents: int, is_fraud: bool
+    ) -> tuple[list[tuple[int, int, int]], float]:
+        """거래 하나를 반영하고 ([구간별 (건수, 합계, 최대)], 누적 사기 비율)을 반환한다."""
+        if not math.isfinite(time_seconds):
+            raise ValueError("time_seconds must be finite")
+        self._check_order(time_seconds)
+        stats = [window.push(time_seconds, amount_cents) for window in self._windows]
+        rate = self._fraud / self._seen if self._seen else 0.0
+        self._seen += 1
+        self._fraud += bool(is_fraud)
+        self._last_time = time_seconds
+        return stats, rate
+
+    def update_batch(
+        self,
+        time_seconds: np.ndarray,
+        amount_cents: np.ndarray,
+        is_fraud: np.ndarray,
+    ) -> VelocityColumns:
+        """배치를 스트림 순서대로 반영해 행별 속도 피처 열을 만든다."""
+        n = len(time_seconds)
+        if n == 0:
+            return _empty_columns()
+        if not np.all(np.isfinite(time_seconds)):
+            raise ValueError("time_seconds must be finite")
+        self._check_order(float(time_seconds[0]))
+        if np.any(np.diff(time_seconds) < 0):
+            raise ValueError("time_seconds must be non-decreasing for velocity features")
+
+        times = time_seconds.tolist()
+        amounts = amount_cents.tolist()
+        stats = np.empty((len(self._windows), n, 3), dtype=np.int64)
+        for position, window in enumerate(self._windows):
+            stats[position] = list(map(window.push, times, amounts))
+
+        frauds = np.asarray(is_fraud, dtype=np.int64)
+        prior_seen = self._seen + np.arange(n, dtype=np.int64)
+        prior_fraud = self._fraud + np.cumsum(frauds) - frauds
+        rate = np.divide(
+            prior_fraud,
+            prior_seen,
+            out=np.zeros(n, dtype=np.float64),
+            where=prior_seen > 0,
+        )
+        self._seen += n
+        self._fraud += int(frauds.sum())
+        self._last_time = times[-1]
+        return VelocityColumns(
+            window_counts=stats[:, :, 0].T.copy(),
+            window_amount_sums_cents=stats[:, :, 1].T.copy(),
+            window_amount_maxes_cents=stats[:, :, 2].T.copy(),
+            fraud_rate_to_date=rate,
+        )
+
+    def _check_order(self, first: float) -> None:
+        if first < self._last_time:
+            raise ValueError(
+                "time_seconds must be non-decreasing for velocity features,"
+                f" got {first} after {self._last_time}"
+            )
+
+
+def _empty_columns() -> VelocityColumns:
+    windows = len(VELOCITY_WINDOWS_SECONDS)
+    return VelocityColumns(
+        window_counts=np.empty((0, windows), dtype=np.int64),
+        window_amount_sums_cents=np.empty((0, windows), dtype=np.int64),
+        window_amount_maxes_cents=np.empty((0, windows), dtype=np.int64),
+        fraud_rate_to_date=np.empty(0, dtype=np.float64),
+    )
@@ -0,0 +1,52 @@
+"""증분 처리 manifest(SourceWatermark) JSON 인코딩. 로컬/S3 저장소가 공유한다."""
+
+from __future__ import annotations
+
+import json
+from pathlib import PurePosixPath
+
+from services.data_pipeline.domain.models import SourceWatermark
+
+_FORMAT_VERSION = 3
+
+
+def watermark_destination(features_destination: str) -> str:
+    """피처 파일 옆 manifest 경로(`<이름>_manifest.json`)."""
+    path = PurePosixPath(features_destination)
+    return str(path.with_name(f"{path.stem}_manifest.json"))
+
+
+def encode_watermark(watermark: SourceWatermark) -> str:
+    data = {
+        "version": _FORMAT_VERSION,
+        "source": watermark.source,
+        "source_size": watermark.source_size,
+        "source_etag": watermark.source_etag,
+        "byte_offset": watermark.byte_offset,
+        "record_count": watermark.record_count,
+        "valid_records": watermark.valid_records,
+        "features_size": watermark.features_size,
+        "columns": list(watermark.columns),
+        "check_bytes": watermark.check_bytes,
+        "checksum": watermark.checksum,
+    }
+    return json.dumps(data, ensure_ascii=False, indent=2)
+
+
+def decode_watermark(text: str) -> SourceWatermark | None:
+    """manifest를 읽는다. 형식 버전이 다르면 None을 반환해 전체 재처리하게 한다."""
+    data = json.loads(text)
+    if data.get("version") != _FORMAT_VERSION:
+        return None
+    return SourceWatermark(
+        source=data["source"],
+        source_size=data["source_size"],
+        source_etag=data["source_etag"],
+        byte_offset=data["byte_offset"],
+        record_count=data["record_count"],
+        valid_records=data["valid_records"],
+        features_size=data["features_size"],
+        columns=tuple(data["columns"]),
+        check_bytes=data["check_bytes"],
+        checksum=data["checksum"],
+    )
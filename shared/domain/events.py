@@ -1,6 +1,8 @@
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 
+from shared.domain.metrics import StageMetrics
+
 
 @dataclass(frozen=True)
 class DomainEvent:
@@ -11,11 +13,12 @@ class DomainEvent:
 
 @dataclass(frozen=True)
 class DataProcessingCompleted(DomainEvent):
-    """데이터 처리 완료 이벤트."""
+    """데이터 처리 완료 이벤트. stage_metrics는 단계별 처리량."""
 
     total_records: int = 0
     valid_records: int = 0
     features_path: str = ""
+    stage_metrics: tuple[StageMetrics, ...] = ()
 
     def __post_init__(self) -> None:
         if not self.features_path:
@@ -0,0 +1,34 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class StageMetrics:
+    """파이프라인 단계별 처리량.
+
+    busy_seconds는 단계 사이 큐에서 기다린 시간을 뺀 실제 처리 시간이고,
+    cpu_seconds는 단계 스레드가 사용한 CPU 시간이다.
+    """
+
+    name: str
+    rows_in: int
+    rows_out: int
+    wall_seconds: float
+    busy_seconds: float
+    cpu_seconds: float = 0.0
+    bytes_read: int = 0
+    bytes_written: int = 0
+
+    def __post_init__(self) -> None:
+        if not self.name:
+            raise ValueError("name must not be empty")
+        if self.rows_in < 0 or self.rows_out < 0:
+            raise ValueError("row counts must be non-negative")
+        if self.bytes_read < 0 or self.bytes_written < 0:
+            raise ValueError("byte counts must be non-negative")
+
+    @property
+    def rows_per_second(self) -> float:
+        """busy_seconds 기준 입력 처리량."""
+        if self.busy_seconds <= 0:
+            return 0.0
+        return self.rows_in / self.busy_seconds
@@ -0,0 +1,86 @@
+"""파이프라인 단계별 시간, 행 수, 입출력 바이트 계측.
+
+계측은 행 단위가 아니라 배치/청크 단위로 누적한다. 단계 스레드에서
+StageRecorder.start()를 호출하면 그 스레드의 현재 recorder가 되고, 저장소나
+파서는 record_bytes_read/record_bytes_written으로 현재 recorder에 바이트 수를
+더한다. 현재 recorder가 없으면 아무 일도 하지 않는다.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from shared.domain.metrics import StageMetrics
+
+_local = threading.local()
+
+
+class StageRecorder:
+    """한 단계의 처리 건수, wall/CPU 시간(큐 대기 시간 제외), 입출력 바이트를 기록한다."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.rows_in = 0
+        self.rows_out = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self._started = 0.0
+        self._finished = 0.0
+        self._cpu_started = 0.0
+        self._cpu_finished = 0.0
+        self._waiting = 0.0
+
+    def start(self) -> None:
+        """현재 스레드의 recorder로 등록하고 시간 측정을 시작한다."""
+        _local.recorder = self
+        self._started = time.perf_counter()
+        self._cpu_started = time.thread_time()
+
+    def stop(self) -> None:
+        self._cpu_finished = time.thread_time()
+        self._finished = time.perf_counter()
+        if getattr(_local, "recorder", None) is self:
+            _local.recorder = None
+
+    def add_rows(self, rows_in: int, rows_out: int) -> None:
+        self.rows_in += rows_in
+        self.rows_out += rows_out
+
+    @contextmanager
+    def waiting(self) -> Iterator[None]:
+        """블록 안에서 보낸 시간을 처리 시간에서 제외한다."""
+        began = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._waiting += time.perf_counter() - began
+
+    def metrics(self) -> StageMetrics:
+        wall = max(self._finished - self._started, 0.0)
+        return StageMetrics(
+            name=self.name,
+            rows_in=self.rows_in,
+            rows_out=self.rows_out,
+            wall_seconds=wall,
+            busy_seconds=max(wall - self._waiting, 0.0),
+            cpu_seconds=max(self._cpu_finished - self._cpu_started, 0.0),
+            bytes_read=self.bytes_read,
+            bytes_written=self.bytes_written,
+        )
+
+
+def record_bytes_read(count: int) -> None:
+    """현재 스레드의 recorder에 읽은 바이트 수를 더한다."""
+    recorder = getattr(_local, "recorder", None)
+    if recorder is not None:
+        recorder.bytes_read += count
+
+
+def record_bytes_written(count: int) -> None:
+    """현재 스레드의 recorder에 쓴 바이트 수를 더한다."""
+    recorder = getattr(_local, "recorder", None)
+    if recorder is not None:
+        recorder.bytes_written += count
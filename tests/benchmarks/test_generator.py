@@ -0,0 +1,41 @@
+"""합성 Kaggle CSV 생성기 테스트."""
+
+import pytest
+
+from benchmarks.generator import generate_kaggle_csv
+from services.data_pipeline.infrastructure.local_repository import (
+    LocalFileTransactionRepository,
+)
+from services.data_pipeline.infrastructure.validators import TransactionValidator
+
+
+class TestGenerateKaggleCsv:
+    def test_same_seed_is_reproducible(self, tmp_path):
+        a = generate_kaggle_csv(tmp_path / "a.csv", 500, seed=7, chunk_rows=128)
+        b = generate_kaggle_csv(tmp_path / "b.csv", 500, seed=7, chunk_rows=128)
+        c = generate_kaggle_csv(tmp_path / "c.csv", 500, seed=8, chunk_rows=128)
+
+        assert a.path.read_bytes() == b.path.read_bytes()
+        assert a.path.read_bytes() != c.path.read_bytes()
+
+    def test_invalid_rows_are_rejected_by_validator(self, tmp_path):
+        dataset = generate_kaggle_csv(
+            tmp_path / "data.csv", 2000, fraud_rate=0.1, invalid_rate=0.05, chunk_rows=300
+        )
+        batches = list(LocalFileTransactionRepository().load_raw_batches(str(dataset.path)))
+        results = [TransactionValidator().validate_batch(batch) for batch in batches]
+
+        assert sum(len(b) for b in batches) == 2000
+        assert 0 < dataset.invalid_rows == sum((~r.valid_mask).sum() for r in results)
+        assert 0 < dataset.fraud_rows == sum(b.is_fraud.sum() for b in batches)
+        times = [t for b in batches for t in b.time_seconds.tolist()]
+        assert times == sorted(times)
+
+    def test_zero_rows_writes_header_only(self, tmp_path):
+        dataset = generate_kaggle_csv(tmp_path / "empty.csv", 0)
+
+        assert dataset.path.read_text().count("\n") == 1
+
+    def test_invalid_rate_out_of_range_rejected(self, tmp_path):
+        with pytest.raises(ValueError, match="invalid_rate must be between 0 and 1"):
+            generate_kaggle_csv(tmp_path / "x.csv", 10, invalid_rate=1.5)
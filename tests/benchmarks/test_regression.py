@@ -0,0 +1,63 @@
+"""벤치마크 baseline 비교 테스트."""
+
+import pytest
+
+from benchmarks.__main__ import main
+from benchmarks.regression import find_regressions, load_baseline, save_baseline
+from benchmarks.stages import BenchmarkResult
+
+
+def _result(name: str, rows_per_second: float) -> BenchmarkResult:
+    return BenchmarkResult(name=name, rows=int(rows_per_second), seconds=1.0, peak_rss_bytes=1)
+
+
+class TestFindRegressions:
+    def test_drop_beyond_tolerance_is_reported(self):
+        baseline = {"parse": 1000.0, "validate": 1000.0}
+        results = [_result("parse", 790), _result("validate", 810)]
+
+        regressions = find_regressions(results, baseline, tolerance=0.2)
+
+        assert regressions == ["parse: 790 rows/s is 21.0% below baseline 1,000 rows/s"]
+
+    def test_stage_missing_from_baseline_is_ignored(self):
+        assert find_regressions([_result("extract", 1)], {"parse": 1000.0}) == []
+
+    def test_invalid_tolerance_rejected(self):
+        with pytest.raises(ValueError, match="tolerance must be in"):
+            find_regressions([], {}, tolerance=1.0)
+
+    def test_baseline_round_trip(self, tmp_path):
+        path = tmp_path / "baseline.json"
+        save_baseline(path, [_result("parse", 1234.56)], rows=10, seed=0)
+
+        assert load_baseline(path) == {"parse": 1234.0}
+        assert load_baseline(path, rows=10, seed=0) == {"parse": 1234.0}
+
+    def test_baseline_from_other_row_count_rejected(self, tmp_path):
+        path = tmp_path / "baseline.json"
+        save_baseline(path, [_result("parse", 1.0)], rows=10, seed=0)
+
+        with pytest.raises(ValueError, match="recorded with rows=10, got rows=20"):
+            load_baseline(path, rows=20)
+
+
+class TestMain:
+    def test_exit_code_reflects_regression(self, tmp_path, capsys):
+        args = ["--rows", "50", "--repeat", "1", "--stages", "parse", "--no-allocations"]
+        baseline = tmp_path / "baseline.json"
+        save_baseline(baseline, [_result("parse", 1e12)], rows=50, seed=0)
+
+        assert main([*args, "--write-baseline", str(tmp_path / "new.json")]) == 0
+        assert main([*args, "--baseline", str(baseline)]) == 1
+        assert "REGRESSION parse" in capsys.readouterr().err
+
+    def test_mismatched_baseline_rejected_before_running(self, tmp_path, capsys):
+        baseline = tmp_path / "baseline.json"
+        save_baseline(baseline, [_result("parse", 1.0)], rows=100, seed=0)
+
+        with pytest.raises(SystemExit) as exc_info:
+            main(["--rows", "50", "--stages", "parse", "--baseline", str(baseline)])
+
+        assert exc_info.value.code == 2
+        assert "recorded with rows=100, got rows=50" in capsys.readouterr().err
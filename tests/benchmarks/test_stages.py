@@ -0,0 +1,37 @@
+"""단계별 벤치마크 실행 테스트."""
+
+import pytest
+
+from benchmarks.generator import generate_kaggle_csv
+from benchmarks.stages import STAGES, BenchmarkResult, run_benchmarks
+
+
+class TestRunBenchmarks:
+    def test_reports_every_stage(self, tmp_path):
+        dataset = generate_kaggle_csv(tmp_path / "data.csv", 300, invalid_rate=0.1)
+
+        results = run_benchmarks(dataset.path, batch_size=64, repeat=1)
+
+        assert [r.name for r in results] == list(STAGES)
+        by_name = {r.name: r for r in results}
+        assert by_name["parse"].rows == 300
+        assert by_name["extract"].rows == 300 - dataset.invalid_rows
+        assert all(r.rows_per_second > 0 for r in results)
+        assert all(r.peak_rss_bytes > 0 for r in results)
+        assert all(r.allocated_bytes > 0 for r in results)
+
+    def test_allocation_tracing_can_be_disabled(self, tmp_path):
+        dataset = generate_kaggle_csv(tmp_path / "data.csv", 50)
+
+        (result,) = run_benchmarks(
+            dataset.path, stages=["parse"], repeat=1, trace_allocations=False
+        )
+
+        assert result.allocated_bytes is None
+
+    def test_unknown_stage_rejected(self, tmp_path):
+        with pytest.raises(ValueError, match="unknown stages: train"):
+            run_benchmarks(tmp_path / "data.csv", stages=["train"])
+
+    def test_zero_seconds_reports_zero_throughput(self):
+        assert BenchmarkResult("parse", 10, 0.0, 1).rows_per_second == 0.0
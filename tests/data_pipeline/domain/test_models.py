@@ -1,16 +1,47 @@
+import pickle
+from dataclasses import replace
 from decimal import Decimal
 
+import numpy as np
 import pytest
+from hypothesis import given
+from hypothesis import strategies as st
 
 from services.data_pipeline.domain.models import (
+    BatchSource,
+    ErrorKindSummary,
     Feature,
+    FeatureBatch,
     ProcessDataResult,
     RawTransaction,
+    RowParseError,
+    TransactionBatch,
     ValidationError,
     ValidationReport,
+    VelocityColumns,
+    VelocityFeatures,
+    cents_to_decimal,
+    decimal_to_cents,
+    format_cents,
 )
 
 
+class TestCents:
+    @given(st.integers(min_value=-(2**63) + 1, max_value=2**63 - 1))
+    def test_format_matches_decimal_and_round_trips(self, cents: int) -> None:
+        text = format_cents(cents)
+        assert text == str(cents_to_decimal(cents))
+        assert decimal_to_cents(Decimal(text)) == cents
+
+    @pytest.mark.parametrize(("cents", "text"), [(0, "0.00"), (5, "0.05"), (-120, "-1.20")])
+    def test_format(self, cents: int, text: str) -> None:
+        assert format_cents(cents) == text
+
+    @pytest.mark.parametrize("amount", ["0.001", "NaN", "Infinity", "1e17"])
+    def test_unrepresentable_amount(self, amount: str) -> None:
+        assert decimal_to_cents(Decimal(amount)) is None
+
+
 class TestRawTransaction:
     def test_create_raw_transaction(self):
         tx = RawTransaction(
@@ -231,3 +262,360 @@ class TestValidationReport:
         with pytest.raises(ValueError, match="errors cannot exist when total_records is 0"):
             ValidationReport(total_records=0, errors=errors)
 
+    def test_summary_counts_override_sampled_errors(self):
+        summary = (
+            ErrorKindSummary(
+                field="amount", message="negative", count=40, sample_record_indices=(3,)
+            ),
+            ErrorKindSummary(field="time", message="nan", count=10, sample_record_indices=()),
+        )
+        report = ValidationReport(
+            total_records=1000,
+            errors=(ValidationError(field="amount", message="negative", record_index=3),),
+            error_summary=summary,
+        )
+        assert report.error_count == 50
+        assert report.valid_records == 950
+        assert report.error_rate == 0.05
+        assert not report.is_valid
+
+    def test_merge_shifts_record_index_and_sums_totals(self):
+        left = ValidationReport(
+            total_records=3,
+            errors=(ValidationError(field="amount", message="bad", record_index=1),),
+        )
+        right = ValidationReport(
+            total_records=4,
+            errors=(
+                ValidationError(field="time", message="nan", record_index=0),
+                ValidationError(field="amount", message="bad", record_index=3),
+            ),
+        )
+
+        merged = left.merge(right)
+
+        assert merged.total_records == 7
+        assert merged.errors == (
+            ValidationError(field="amount", message="bad", record_index=1),
+            ValidationError(field="time", message="nan", record_index=3),
+            ValidationError(field="amount", message="bad", record_index=6),
+        )
+        assert merged.valid_records == 4
+
+    def test_merged_report_hashes_like_tuple_report(self):
+        left = ValidationReport(
+            total_records=2,
+            errors=(ValidationError(field="amount", message="bad", record_index=1),),
+        )
+        merged = left.merge(left)
+
+        assert hash(merged) == hash(replace(merged, errors=tuple(merged.errors)))
+        assert len({merged, replace(merged, errors=tuple(merged.errors))}) == 1
+
+    def test_merge_is_associative_with_empty_identity(self):
+        parts = [
+            ValidationReport(
+                total_records=n,
+                errors=tuple(
+                    ValidationError(field="f", message="m", record_index=i)
+                    for i in range(0, n, 2)
+                ),
+            )
+            for n in (3, 5, 2)
+        ]
+        empty = ValidationReport(total_records=0, errors=())
+        a, b, c = parts
+
+        assert a.merge(b).merge(c) == a.merge(b.merge(c))
+        assert empty.merge(a) == a.merge(empty) == a
+        assert [e.record_index for e in a.merge(b).merge(c).errors] == [0, 2, 3, 5, 7, 8]
+
+    def test_merge_aggregated_reports(self):
+        def aggregated(total, count, samples, keys):
+            return ValidationReport.aggregated(
+                total,
+                (
+                    ErrorKindSummary(
+                        field="amount",
+                        message="bad",
+                        count=count,
+                        sample_record_indices=samples,
+                        sample_keys=keys,
+                        max_samples=2,
+                    ),
+                ),
+            )
+
+        merged = aggregated(10, 4, (2, 7), (0.5, 0.1)).merge(
+            aggregated(10, 6, (1, 5), (0.3, 0.9))
+        )
+
+        assert merged.error_count == 10
+        assert merged.error_summary[0].sample_record_indices == (7, 11)
+        assert merged.error_summary[0].sample_keys == (0.1, 0.3)
+        assert [e.record_index for e in merged.errors] == [7, 11]
+
+    def test_merge_samples_without_keys_rejected(self):
+        def aggregated(samples):
+            kind = ErrorKindSummary(
+                field="amount", message="bad", count=5, sample_record_indices=samples
+            )
+            return ValidationReport.aggregated(10, (kind,))
+
+        with pytest.raises(ValueError, match="without reservoir keys"):
+            aggregated((2,)).merge(aggregated((5,)))
+
+    def test_merge_aggregated_with_full_rejected(self):
+        full = ValidationReport(total_records=1, errors=())
+        aggregated = ValidationReport(total_records=1, errors=(), error_summary=())
+        with pytest.raises(ValueError, match="cannot merge an aggregated report"):
+            full.merge(aggregated)
+
+    def test_summary_count_smaller_than_samples_rejected(self):
+        with pytest.raises(ValueError, match="count cannot be smaller"):
+            ErrorKindSummary(field="a", message="b", count=0, sample_record_indices=(1,))
+
+
+
+class TestRowParseError:
+    def test_shifted_and_pickled_with_row_index(self):
+        error = RowParseError(3, "invalid Class '9', expected '0' or '1'")
+
+        shifted = pickle.loads(pickle.dumps(error)).with_row_offset(30)
+
+        assert isinstance(shifted, ValueError)
+        assert shifted.row_index == 33
+        assert str(shifted) == "Row 33: invalid Class '9', expected '0' or '1'"
+
+
+def _make_batch(n: int = 3) -> TransactionBatch:
+    return TransactionBatch.from_columns(
+        row_index=np.arange(10, 10 + n),
+        time_seconds=np.arange(n, dtype=np.float64),
+        amount_cents=np.array([14962, 269, 100][:n] + [0] * max(0, n - 3)),
+        is_fraud=np.array([i % 2 == 1 for i in range(n)]),
+        pca_features=np.arange(n * 28, dtype=np.float64).reshape(n, 28),
+    )
+
+
+class TestTransactionBatch:
+    def test_len_and_packed_labels(self):
+        batch = _make_batch(10)
+        assert len(batch) == 10
+        assert batch.is_fraud_packed.dtype == np.uint8
+        assert batch.is_fraud_packed.nbytes == 2
+        assert batch.is_fraud.tolist() == [i % 2 == 1 for i in range(10)]
+
+    def test_getitem_returns_raw_transaction(self):
+        tx = _make_batch()[1]
+        assert isinstance(tx, RawTransaction)
+        assert tx.transaction_id == "txn_000011"
+        assert tx.time_seconds == 1.0
+        assert tx.amount == Decimal("2.69")
+        assert tx.is_fraud is True
+        assert tx.pca_features == tuple(float(v) for v in range(28, 56))
+
+    def test_negative_index(self):
+        batch = _make_batch()
+        assert batch[-1].transaction_id == "txn_000012"
+
+    def test_index_out_of_range(self):
+        with pytest.raises(IndexError):
+            _make_batch()[3]
+
+    def test_iteration_matches_indexing(self):
+        batch = _make_batch()
+        assert list(batch) == [batch[i] for i in range(len(batch))]
+
+    def test_rows_are_slotted_and_equal_to_validated_construction(self):
+        tx = _make_batch()[0]
+        assert not hasattr(tx, "__dict__")
+        assert tx == RawTransaction(
+            transaction_id=tx.transaction_id,
+            time_seconds=tx.time_seconds,
+            amount=tx.amount,
+            is_fraud=tx.is_fraud,
+            pca_features=tx.pca_features,
+        )
+        assert pickle.loads(pickle.dumps(tx)) == tx
+
+    def test_negative_time_still_rejected_on_access(self):
+        batch = replace(_make_batch(), time_seconds=np.array([0.0, -1.0, 2.0]))
+        assert batch[0].time_seconds == 0.0
+        with pytest.raises(ValueError, match="time_seconds must be non-negative"):
+            batch[1]
+
+    def test_transaction_ids_are_formatted_lazily(self):
+        batch = _make_batch()
+        assert list(batch.transaction_ids()) == ["txn_000010", "txn_000011", "txn_000012"]
+        assert batch.transaction_id(0) == "txn_000010"
+
+    def test_mask_returns_sub_batch(self):
+        batch = _make_batch()
+        sub = batch[np.array([True, False, True])]
+        assert isinstance(sub, TransactionBatch)
+        assert sub.row_index.tolist() == [10, 12]
+        assert sub.is_fraud.tolist() == [False, False]
+        assert sub.amount_cents.tolist() == [14962, 100]
+
+    def test_concat(self):
+        batch = _make_batch()
+        merged = TransactionBatch.concat([batch[:1], batch[1:]])
+        assert merged.row_index.tolist() == batch.row_index.tolist()
+        assert merged.is_fraud.tolist() == batch.is_fraud.tolist()
+
+    def test_empty(self):
+        batch = TransactionBatch.empty()
+        assert len(batch) == 0
+        assert list(batch) == []
+
+    def test_source_namespaces_ids_and_survives_offset(self):
+        batch = replace(_make_batch(), source=BatchSource("raw/day-01.csv", first_row=10))
+        shifted = batch.with_row_offset(100)
+
+        assert list(batch.transaction_ids()) == [
+            "raw/day-01.csv:txn_000000",
+            "raw/day-01.csv:txn_000001",
+            "raw/day-01.csv:txn_000002",
+        ]
+        assert shifted.row_index.tolist() == [110, 111, 112]
+        assert list(shifted.transaction_ids()) == list(batch.transaction_ids())
+        assert shifted[1:].transaction_id(0) == "raw/day-01.csv:txn_000001"
+        assert TransactionBatch.concat([shifted[:1], shifted[1:]]).source == shifted.source
+
+    def test_concat_keeps_mixed_sources_per_row(self):
+        batch = _make_batch()
+        ids = [
+            *batch.transaction_ids(),
+            *replace(batch, source=BatchSource("a.csv")).transaction_ids(),
+        ]
+
+        mixed = TransactionBatch.concat([batch, replace(batch, source=BatchSource("a.csv"))])
+
+        assert list(mixed.transaction_ids()) == ids
+        assert [mixed.transaction_id(i) for i in range(len(mixed))] == ids
+        assert mixed[len(batch):].source == BatchSource("a.csv")
+        assert list(mixed[1:-1].transaction_ids()) == ids[1:-1]
+
+    def test_mismatched_columns_rejected(self):
+        with pytest.raises(ValueError, match="pca_features must have shape"):
+            TransactionBatch.from_columns(
+                row_index=np.arange(2),
+                time_seconds=np.zeros(2),
+                amount_cents=np.zeros(2),
+                is_fraud=np.zeros(2, dtype=bool),
+                pca_features=np.zeros((2, 27)),
+            )
+
+
+class TestFeatureBatch:
+    def _batch(self) -> FeatureBatch:
+        return FeatureBatch.from_columns(
+            row_index=np.array([0, 1]),
+            amount_cents=np.array([14962, 269]),
+            hour_of_day=np.array([0, 12]),
+            day_of_week=np.array([1, 5]),
+            amount_bin_codes=np.array([2, 0]),
+            amount_bin_labels=("low", "medium", "high", "very_high"),
+            is_fraud=np.array([False, True]),
+        )
+
+    def test_getitem_returns_feature(self):
+        feature = self._batch()[1]
+        assert feature == Feature(
+            transaction_id="txn_000001",
+            amount=Decimal("2.69"),
+            hour_of_day=12,
+            day_of_week=5,
+            amount_bin="low",
+            is_fraud=True,
+        )
+
+    def test_is_weekend(self):
+        assert self._batch().is_weekend.tolist() == [False, True]
+
+    def test_features_are_slotted_and_pickle(self):
+        feature = self._batch()[0]
+        assert not hasattr(feature, "__dict__")
+        assert pickle.loads(pickle.dumps(feature)) == feature
+        assert replace(feature, hour_of_day=3).hour_of_day == 3
+        with pytest.raises(ValueError, match="hour_of_day must be 0-23"):
+            replace(feature, hour_of_day=24)
+
+    @pytest.mark.parametrize(
+        ("column", "value", "message"),
+        [("hour_of_day", 24, "hour_of_day must be 0-23"), ("day_of_week", -1, "day_of_week")],
+    )
+    def test_out_of_range_columns_rejected(self, column, value, message):
+        values = getattr(self._batch(), column).copy()
+        values[1] = value
+        with pytest.raises(ValueError, match=message):
+            replace(self._batch(), **{column: values})
+
+    def test_mask_returns_sub_batch(self):
+        sub = self._batch()[np.array([False, True])]
+        assert isinstance(sub, FeatureBatch)
+        assert [f.transaction_id for f in sub] == ["txn_000001"]
+
+    def test_velocity_columns_follow_indexing(self):
+        velocity = VelocityColumns(
+            window_counts=np.array([[1, 1, 1], [1, 2, 2]]),
+            window_amount_sums_cents=np.array([[14962] * 3, [269, 15231, 15231]]),
+            window_amount_maxes_cents=np.array([[14962] * 3, [269, 14962, 14962]]),
+            fraud_rate_to_date=np.array([0.0, 0.0]),
+        )
+        batch = replace(self._batch(), velocity=velocity)
+
+        assert batch[np.array([False, True])][0].velocity == VelocityFeatures(
+            window_counts=(1, 2, 2),
+            window_amount_sums=(Decimal("2.69"), Decimal("152.31"), Decimal("152.31")),
+            window_amount_maxes=(Decimal("2.69"), Decimal("149.62"), Decimal("149.62")),
+            fraud_rate_to_date=0.0,
+        )
+        assert self._batch()[0].velocity is None
+
+    def test_velocity_length_mismatch_rejected(self):
+        velocity = VelocityColumns(
+            window_counts=np.ones((1, 3)),
+            window_amount_sums_cents=np.ones((1, 3)),
+            window_amount_maxes_cents=np.ones((1, 3)),
+            fraud_rate_to_date=np.zeros(1),
+        )
+        with pytest.raises(ValueError, match="same length"):
+            replace(self._batch(), velocity=velocity)
+
+    def test_from_features_round_trips(self):
+        batch = self._batch()
+        rebuilt = FeatureBatch.from_features(list(batch), row_index=batch.row_index)
+        assert list(rebuilt) == list(batch)
+
+    def test_from_features_mixed_velocity_rejected(self):
+        one = (Decimal(1),) * 3
+        features = list(self._batch())
+        features[0] = replace(features[0], velocity=VelocityFeatures((1, 1, 1), one, one, 0.0))
+        with pytest.raises(ValueError, match="all features or none"):
+            FeatureBatch.from_features(features, row_index=np.arange(2))
+
+    def test_from_features_length_checked(self):
+        with pytest.raises(ValueError, match="got 2 features for 3 rows"):
+            FeatureBatch.from_features(list(self._batch()), row_index=np.arange(3))
+
+
+class TestVelocityFeatures:
+    def test_window_count_must_match(self):
+        with pytest.raises(ValueError, match="must have 3 windows"):
+            VelocityFeatures((1,), (Decimal(1),), (Decimal(1),), 0.0)
+
+    def test_fraud_rate_range(self):
+        one = (Decimal(1),) * 3
+        with pytest.raises(ValueError, match="fraud_rate_to_date must be between 0 and 1"):
+            VelocityFeatures((1, 1, 1), one, one, 1.5)
+
+    def test_columns_shape_checked(self):
+        with pytest.raises(ValueError, match=r"window columns must have shape \(2, 3\)"):
+            VelocityColumns(
+                window_counts=np.ones((2, 2)),
+                window_amount_sums_cents=np.ones((2, 3)),
+                window_amount_maxes_cents=np.ones((2, 3)),
+                fraud_rate_to_date=np.zeros(2),
+            )
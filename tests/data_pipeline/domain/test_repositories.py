@@ -0,0 +1,71 @@
+from collections.abc import Iterable, Iterator
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from services.data_pipeline.domain.models import (
+    Feature,
+    RawTransaction,
+    format_transaction_id,
+)
+from services.data_pipeline.domain.repositories import TransactionRepository
+
+
+class _RowOnlyRepository(TransactionRepository):
+    """load_raw_transactions만 구현한 저장소."""
+
+    def __init__(self, transactions: list[RawTransaction]) -> None:
+        self._transactions = transactions
+
+    def load_raw_transactions(self, source: str) -> Iterator[RawTransaction]:
+        return iter(self._transactions)
+
+    def save_features(self, features: Iterable[Feature], destination: str) -> Path:
+        raise NotImplementedError
+
+
+def _txn(index: int, amount: Decimal) -> RawTransaction:
+    return RawTransaction(
+        transaction_id=format_transaction_id(index),
+        time_seconds=float(index),
+        amount=amount,
+        is_fraud=index % 2 == 1,
+        pca_features=tuple(float(index) for _ in range(28)),
+    )
+
+
+class TestLoadRawBatchesDefault:
+    def test_chunks_row_api(self):
+        transactions = [_txn(i, Decimal(i) + Decimal("0.25")) for i in range(5)]
+        repo = _RowOnlyRepository(transactions)
+
+        batches = list(repo.load_raw_batches("data.csv", batch_size=2))
+
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        assert [batch.row_index.tolist() for batch in batches] == [[0, 1], [2, 3], [4]]
+        assert [txn for batch in batches for txn in batch] == transactions
+
+    def test_unrepresentable_amount_reads_back_as_nan(self):
+        repo = _RowOnlyRepository([_txn(0, Decimal("0.001"))])
+
+        (batch,) = repo.load_raw_batches("data.csv", batch_size=10)
+
+        assert batch[0].amount.is_nan()
+
+    def test_empty_source_yields_nothing(self):
+        assert list(_RowOnlyRepository([]).load_raw_batches("data.csv", batch_size=10)) == []
+
+    def test_non_positive_batch_size_rejected(self):
+        with pytest.raises(ValueError, match="batch_size"):
+            list(_RowOnlyRepository([]).load_raw_batches("data.csv", batch_size=0))
+
+
+class TestListSourcesDefault:
+    def test_plain_name_is_single_source(self):
+        assert _RowOnlyRepository([]).list_sources("data/part-0.csv") == ["data/part-0.csv"]
+
+    @pytest.mark.parametrize("pattern", ["data/*.csv", "data/part-?.csv", "data/[ab].csv"])
+    def test_wildcard_rejected(self, pattern: str):
+        with pytest.raises(NotImplementedError, match="_RowOnlyRepository"):
+            _RowOnlyRepository([]).list_sources(pattern)
@@ -16,3 +16,6 @@ class TestFeatureEngineeringServiceInterface:
         sig = inspect.signature(FeatureEngineeringService.extract_features)
         params = list(sig.parameters.keys())
         assert "transactions" in params
+
+    def test_extract_features_batch_has_default(self):
+        assert "extract_features_batch" not in FeatureEngineeringService.__abstractmethods__
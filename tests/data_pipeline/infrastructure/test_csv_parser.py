@@ -1,9 +1,20 @@
 from decimal import Decimal
 
+import numpy as np
 import pytest
 
-from services.data_pipeline.infrastructure.csv_parser import KaggleCsvParser
-from tests.data_pipeline.infrastructure.conftest import make_kaggle_row
+from services.data_pipeline.domain.models import (
+    UNREPRESENTABLE_CENTS,
+    DeferredColumns,
+    TransactionBatch,
+)
+from services.data_pipeline.infrastructure.csv_parser import (
+    PCA_LAZY,
+    PCA_SKIP,
+    KaggleCsvParser,
+    iter_lines,
+)
+from tests.data_pipeline.infrastructure.conftest import KAGGLE_FIELDNAMES, make_kaggle_row
 
 
 class TestKaggleCsvParser:
@@ -68,3 +79,322 @@ class TestKaggleCsvParser:
         row = make_kaggle_row(Class="")
         with pytest.raises(ValueError, match="invalid Class"):
             parser.parse_row(row, row_index=0)
+
+
+def _csv_lines(rows: list[dict[str, str]], *, line_end: str = "\n") -> list[bytes]:
+    header = ",".join(KAGGLE_FIELDNAMES)
+    lines = [header] + [",".join(row[name] for name in KAGGLE_FIELDNAMES) for row in rows]
+    return [f"{line}{line_end}".encode() for line in lines]
+
+
+def _parse_single_batch(lines: list[bytes]):
+    parser = KaggleCsvParser()
+    columns = parser.parse_header(lines[0])
+    return parser.parse_batch(b"".join(lines[1:]), columns=columns, start_index=0)
+
+
+class TestParseBatch:
+    def test_matches_parse_row(self):
+        rows = [
+            make_kaggle_row(Time="0.0", Amount="149.62", Class="0", V1="-1.359807134"),
+            make_kaggle_row(Time="1.5", Amount="2.69", Class="1", V28="0.014724169"),
+            make_kaggle_row(Time="86400", Amount="378.66", Class="0", V14="1e-3"),
+        ]
+        batch = _parse_single_batch(_csv_lines(rows))
+        parser = KaggleCsvParser()
+
+        assert len(batch) == 3
+        for i, row in enumerate(rows):
+            txn = parser.parse_row(row, row_index=i)
+            assert batch.row_index[i] == i
+            assert batch.time_seconds[i] == txn.time_seconds
+            assert tuple(batch.pca_features[i]) == txn.pca_features
+            assert batch.amount_cents[i] == int(txn.amount * 100)
+            assert batch.is_fraud[i] == txn.is_fraud
+            assert batch[i] == txn
+
+    def test_column_dtypes_and_shapes(self):
+        batch = _parse_single_batch(_csv_lines([make_kaggle_row()] * 4))
+        assert batch.time_seconds.dtype == np.float64
+        assert batch.pca_features.shape == (4, 28)
+        assert batch.pca_features.dtype == np.float64
+        assert batch.amount_cents.dtype == np.int64
+        assert batch.is_fraud.dtype == np.bool_
+
+    def test_quoted_kaggle_class_and_crlf(self):
+        lines = _csv_lines([make_kaggle_row(Class="1")], line_end="\r\n")
+        lines[1] = lines[1].replace(b",1\r\n", b',"1"\r\n')
+        batch = _parse_single_batch(lines)
+        assert batch.is_fraud.tolist() == [True]
+
+    def test_blank_lines_are_skipped(self):
+        lines = _csv_lines([make_kaggle_row(Amount="1"), make_kaggle_row(Amount="2")])
+        lines.insert(2, b"\n")
+        batch = _parse_single_batch(lines)
+        assert batch.amount_cents.tolist() == [100, 200]
+        assert batch.row_index.tolist() == [0, 1]
+
+    def test_amount_with_exponent_converted_exactly(self):
+        batch = _parse_single_batch(_csv_lines([
+            make_kaggle_row(Amount="1.5e2"),
+            make_kaggle_row(Amount="0.100"),
+        ]))
+        assert batch.amount_cents.tolist() == [15000, 10]
+
+    @pytest.mark.parametrize("tolerant", [False, True])
+    @pytest.mark.parametrize("amount", ["0.001", "NaN", "Infinity"])
+    def test_amount_not_representable_in_cents_left_to_validator(self, amount, tolerant):
+        lines = _csv_lines([make_kaggle_row(), make_kaggle_row(Amount=amount)])
+        parser = KaggleCsvParser(tolerant=tolerant)
+
+        batch = parser.parse_batch(b"".join(lines[1:]), columns=parser.parse_header(lines[0]))
+
+        assert batch.amount_cents.tolist() == [14962, UNREPRESENTABLE_CENTS]
+        assert batch.parse_errors == ()
+        assert batch[1].amount.is_nan()
+
+    def test_fields_parsed_like_float_and_decimal(self):
+        times = ["0", "-0", "+1.5", "0.1", "123456789.123456", "1e3", " 2", "nan", "1_0"]
+        amounts = ["0", "7", "1.5", "-2.25", "+0.10", "1.50E1", "007", " 3", "1_000"]
+        rows = [make_kaggle_row(Time=t, Amount=a) for t, a in zip(times, amounts)]
+
+        batch = _parse_single_batch(_csv_lines(rows))
+
+        expected = [float(row["Time"]) for row in rows]
+        np.testing.assert_array_equal(batch.time_seconds, expected)
+        assert batch.amount_cents.tolist() == [
+            int(Decimal(row["Amount"]) * 100) for row in rows
+        ]
+
+    @pytest.mark.parametrize(
+        ("overrides", "expected"),
+        [
+            ({"Amount": "not_a_number"}, "Row 1: invalid Amount 'not_a_number'"),
+            ({"V5": "not_a_number"}, "Row 1: invalid PCA feature value"),
+            ({"Time": "not_a_number"}, "Row 1: invalid Time 'not_a_number'"),
+            ({"Class": "2"}, "Row 1: invalid Class '2', expected '0' or '1'"),
+            ({"Time": "-1.0"}, "time_seconds must be non-negative"),
+        ],
+    )
+    def test_error_messages_match_parse_row(self, overrides, expected):
+        parser = KaggleCsvParser()
+        with pytest.raises(ValueError) as row_error:
+            parser.parse_row(make_kaggle_row(**overrides), row_index=1)
+
+        lines = _csv_lines([make_kaggle_row(), make_kaggle_row(**overrides)])
+        with pytest.raises(ValueError) as batch_error:
+            _parse_single_batch(lines)
+
+        assert str(batch_error.value) == str(row_error.value) == expected
+
+    def test_missing_column_raises(self):
+        parser = KaggleCsvParser()
+        with pytest.raises(KeyError):
+            parser.parse_batch(b"0.0,100.00\n", columns=("Time", "Amount"))
+
+    def test_empty_block(self):
+        batch = _parse_single_batch(_csv_lines([]))
+        assert len(batch) == 0
+        assert batch.pca_features.shape == (0, 28)
+
+
+class TestParseFile:
+    def test_splits_into_batches_with_continuous_row_index(self):
+        rows = [make_kaggle_row(Time=str(float(i))) for i in range(5)]
+        parser = KaggleCsvParser()
+        batches = list(parser.parse_file(_csv_lines(rows), batch_size=2))
+
+        assert [len(b) for b in batches] == [2, 2, 1]
+        assert np.concatenate([b.row_index for b in batches]).tolist() == [0, 1, 2, 3, 4]
+        assert batches[2].time_seconds.tolist() == [4.0]
+
+    def test_error_row_index_is_global(self):
+        rows = [make_kaggle_row() for _ in range(3)] + [make_kaggle_row(Class="x")]
+        parser = KaggleCsvParser()
+        with pytest.raises(ValueError, match="Row 3: invalid Class 'x'"):
+            list(parser.parse_file(_csv_lines(rows), batch_size=2))
+
+    def test_empty_input(self):
+        parser = KaggleCsvParser()
+        assert list(parser.parse_file([])) == []
+
+    def test_non_positive_batch_size_rejected(self):
+        parser = KaggleCsvParser()
+        with pytest.raises(ValueError, match="batch_size must be positive"):
+            list(parser.parse_file(_csv_lines([]), batch_size=0))
+
+
+_TOLERANT_CASES = [
+    ({"Amount": "not_a_number"}, ("amount", "invalid Amount")),
+    ({"V5": "not_a_number"}, ("pca_features", "invalid PCA feature value")),
+    ({"Time": "not_a_number"}, ("time_seconds", "invalid Time")),
+    ({"Time": "-1.0"}, ("time_seconds", "invalid Time")),
+    ({"Class": "2"}, ("is_fraud", "invalid Class")),
+    ({"Class": ""}, ("is_fraud", "invalid Class")),
+    ({"Amount": "x", "Class": "2"}, ("amount", "invalid Amount")),
+]
+
+
+def _tolerant_errors(batches) -> list[tuple[str, str, int]]:
+    return [(e.field, e.message, e.record_index) for b in batches for e in b.parse_errors]
+
+
+class TestTolerantParse:
+    @pytest.mark.parametrize(("overrides", "kind"), _TOLERANT_CASES)
+    @pytest.mark.parametrize("size", [3, 200])
+    def test_failed_row_recorded_and_rest_parsed(self, overrides, kind, size):
+        rows = [make_kaggle_row(Time=str(float(i))) for i in range(size)]
+        bad = size // 2
+        rows[bad] = make_kaggle_row(**overrides)
+        parser = KaggleCsvParser(tolerant=True)
+
+        batches = list(parser.parse_file(_csv_lines(rows), batch_size=1000))
+
+        assert _tolerant_errors(batches) == [(*kind, bad)]
+        expected = [i for i in range(size) if i != bad]
+        assert np.concatenate([b.row_index for b in batches]).tolist() == expected
+        assert np.concatenate([b.time_seconds for b in batches]).tolist() == [
+            float(i) for i in expected
+        ]
+
+    def test_result_does_not_depend_on_batch_size(self):
+        rows = [make_kaggle_row(Time=str(float(i))) for i in range(300)]
+        for position, (overrides, _) in zip(range(5, 300, 37), _TOLERANT_CASES):
+            rows[position] = make_kaggle_row(**overrides)
+        parser = KaggleCsvParser(tolerant=True)
+
+        results = []
+        for batch_size in (7, 64, 1000):
+            batches = list(parser.parse_file(_csv_lines(rows), batch_size=batch_size))
+            results.append((
+                _tolerant_errors(batches),
+                np.concatenate([b.row_index for b in batches]).tolist(),
+            ))
+
+        assert results[0] == results[1] == results[2]
+        assert len(results[0][0]) == len(_TOLERANT_CASES)
+        assert len(results[0][1]) == 300 - len(_TOLERANT_CASES)
+
+    def test_short_row_is_malformed(self):
+        lines = _csv_lines([make_kaggle_row(), make_kaggle_row()])
+        lines[2] = b"0.0,1.0\n"
+        batches = list(KaggleCsvParser(tolerant=True).parse_file(lines))
+
+        assert _tolerant_errors(batches) == [("row", "malformed row", 1)]
+        assert batches[0].record_count == 2
+
+    def test_all_rows_failed_still_yields_batch(self):
+        lines = _csv_lines([make_kaggle_row(Class="x"), make_kaggle_row(Class="y")])
+        batches = list(KaggleCsvParser(tolerant=True).parse_file(lines, batch_size=1))
+
+        assert [len(b) for b in batches] == [0, 0]
+        assert [e.record_index for b in batches for e in b.parse_errors] == [0, 1]
+
+    def test_blank_lines_keep_row_index_in_step_with_strict(self):
+        rows = [make_kaggle_row(Amount=str(i)) for i in range(4)]
+        lines = _csv_lines(rows)
+        lines.insert(2, b"\n")
+        strict = list(KaggleCsvParser().parse_file(lines, batch_size=2))
+
+        lines[4] = lines[4].replace(b",2,0", b",bad,0")
+        tolerant = list(KaggleCsvParser(tolerant=True).parse_file(lines, batch_size=2))
+
+        assert _tolerant_errors(tolerant) == [("amount", "invalid Amount", 2)]
+        assert [i for b in strict for i in b.row_index.tolist()] == [0, 1, 2, 3]
+        assert [i for b in tolerant for i in b.row_index.tolist()] == [0, 1, 3]
+
+    def test_missing_required_column_raises(self):
+        with pytest.raises(ValueError, match="missing required columns: Class, V1"):
+            KaggleCsvParser(tolerant=True).parse_batch(
+                b"0.0,100.00\n", columns=("Time", "Amount")
+            )
+
+
+def _pca_rows(n: int) -> list[dict[str, str]]:
+    return [
+        make_kaggle_row(Time=str(float(i)), **{f"V{j}": f"{i}.{j}" for j in range(1, 29)})
+        for i in range(n)
+    ]
+
+
+class TestPcaLoading:
+    @pytest.mark.parametrize("tolerant", [False, True])
+    def test_lazy_decodes_same_values_on_access(self, tolerant):
+        lines = _csv_lines(_pca_rows(6))
+        strict = list(KaggleCsvParser().parse_file(lines, batch_size=4))
+        lazy = list(
+            KaggleCsvParser(tolerant=tolerant, pca_features=PCA_LAZY).parse_file(
+                lines, batch_size=4
+            )
+        )
+
+        assert all(isinstance(b.pca_features, DeferredColumns) for b in lazy)
+        assert not any(b.pca_features.loaded for b in lazy)
+        assert [b.time_seconds.tolist() for b in lazy] == [
+            b.time_seconds.tolist() for b in strict
+        ]
+        for lazy_batch, strict_batch in zip(lazy, strict):
+            np.testing.assert_array_equal(
+                np.asarray(lazy_batch.pca_features), strict_batch.pca_features
+            )
+        assert lazy[0].pca_features.loaded
+
+    def test_selection_and_concat_stay_deferred(self):
+        lines = _csv_lines(_pca_rows(6))
+        strict = next(KaggleCsvParser().parse_file(lines))
+        lazy = list(KaggleCsvParser(pca_features=PCA_LAZY).parse_file(lines, batch_size=4))
+
+        selected = TransactionBatch.concat([lazy[0][1:3], lazy[1]])[np.array([0, 2, 3])]
+
+        assert isinstance(selected.pca_features, DeferredColumns)
+        assert selected.pca_features.shape == (3, 28)
+        np.testing.assert_array_equal(
+            np.asarray(selected.pca_features), strict.pca_features[[1, 4, 5]]
+        )
+
+    def test_lazy_invalid_value_raises_on_access(self):
+        rows = _pca_rows(4)
+        rows[2]["V7"] = "oops"
+        batch = next(KaggleCsvParser(pca_features=PCA_LAZY).parse_file(_csv_lines(rows)))
+
+        assert batch.time_seconds.tolist() == [0.0, 1.0, 2.0, 3.0]
+        assert batch.pca_features[:2].shape == (2, 28)
+        with pytest.raises(ValueError, match="Row 2: invalid PCA feature value"):
+            np.asarray(batch.pca_features)
+
+    def test_skip_raises_on_access(self):
+        batch = next(KaggleCsvParser(pca_features=PCA_SKIP).parse_file(_csv_lines(_pca_rows(3))))
+
+        assert batch.pca_features.shape == (3, 28)
+        assert batch.amount_cents.tolist() == [14962] * 3
+        with pytest.raises(ValueError, match="pca_features were not loaded"):
+            batch[0]
+
+    def test_project_cached_batch(self):
+        batch = next(KaggleCsvParser().parse_file(_csv_lines(_pca_rows(2))))
+
+        lazy = KaggleCsvParser(pca_features=PCA_LAZY).project(batch)
+        skipped = KaggleCsvParser(pca_features=PCA_SKIP).project(batch)
+
+        assert KaggleCsvParser().project(batch) is batch
+        assert not lazy.pca_features.loaded
+        np.testing.assert_array_equal(np.asarray(lazy.pca_features), batch.pca_features)
+        with pytest.raises(ValueError, match="not loaded"):
+            np.asarray(skipped.pca_features)
+
+    def test_unsupported_mode_rejected(self):
+        with pytest.raises(ValueError, match="unsupported pca_features 'none'"):
+            KaggleCsvParser(pca_features="none")
+
+
+class TestIterLines:
+    def test_stitches_lines_across_chunks(self):
+        chunks = [b"a,b\nc", b",d\ne,", b"f\n", b"g"]
+        assert list(iter_lines(chunks)) == [b"a,b\n", b"c,d\n", b"e,f\n", b"g"]
+
+    def test_crlf_split_across_chunks(self):
+        chunks = [b"a\r", b"\nb\r\n"]
+        assert list(iter_lines(chunks)) == [b"a\r\n", b"b\r\n"]
+
+    def test_empty(self):
+        assert list(iter_lines([])) == []
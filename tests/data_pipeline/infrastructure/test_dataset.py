@@ -0,0 +1,231 @@
+"""여러 원본 객체 데이터셋 로드 테스트."""
+
+import csv
+import io
+import threading
+import time
+
+import boto3
+import numpy as np
+import pytest
+from moto import mock_aws
+
+from services.data_pipeline.infrastructure.dataset import DatasetTransactionRepository
+from services.data_pipeline.infrastructure.feature_engineering import (
+    KaggleFeatureEngineeringService,
+)
+from services.data_pipeline.infrastructure.local_repository import (
+    LocalFileTransactionRepository,
+    LocalFileValidationReportRepository,
+)
+from services.data_pipeline.infrastructure.pipeline import PipelinedProcessDataUseCase
+from services.data_pipeline.infrastructure.s3_repository import S3TransactionRepository
+from tests.data_pipeline.infrastructure.conftest import KAGGLE_FIELDNAMES, make_kaggle_row
+
+
+def _csv_text(rows: list[dict[str, str]]) -> str:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=KAGGLE_FIELDNAMES)
+    writer.writeheader()
+    writer.writerows(rows)
+    return buffer.getvalue()
+
+
+def _rows(n: int, first_time: int = 0) -> list[dict[str, str]]:
+    return [make_kaggle_row(Time=str(float(first_time + i))) for i in range(n)]
+
+
+def _write_days(directory, sizes: dict[str, int]) -> None:
+    directory.mkdir(parents=True, exist_ok=True)
+    # 파일을 이름 역순으로 만들어 목록 순서가 생성 순서에 기대지 않음을 확인한다.
+    for name in sorted(sizes, reverse=True):
+        (directory / name).write_text(_csv_text(_rows(sizes[name])))
+
+
+class _SlowRepository(LocalFileTransactionRepository):
+    """원본마다 로드를 지연시키고 동시에 로드 중인 원본 수를 기록한다."""
+
+    def __init__(self, latency: float) -> None:
+        super().__init__()
+        self._latency = latency
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self.max_in_flight = 0
+
+    def load_raw_batches(self, source, batch_size=8):
+        with self._lock:
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+        try:
+            time.sleep(self._latency)
+            yield from super().load_raw_batches(source, batch_size)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+
+class TestDatasetTransactionRepository:
+    def test_local_glob_in_name_order_with_namespaced_ids(self, tmp_path):
+        _write_days(tmp_path / "raw", {"day-01.csv": 3, "day-02.csv": 0, "day-03.csv": 2})
+        (tmp_path / "raw" / "notes.txt").write_text("skip")
+        repo = DatasetTransactionRepository(LocalFileTransactionRepository())
+        pattern = str(tmp_path / "raw" / "*.csv")
+
+        batches = list(repo.load_raw_batches(pattern, batch_size=2))
+
+        prefix = str(tmp_path / "raw")
+        assert [t.transaction_id for b in batches for t in b] == [
+            f"{prefix}/day-01.csv:txn_000000",
+            f"{prefix}/day-01.csv:txn_000001",
+            f"{prefix}/day-01.csv:txn_000002",
+            f"{prefix}/day-03.csv:txn_000000",
+            f"{prefix}/day-03.csv:txn_000001",
+        ]
+        np.testing.assert_array_equal(
+            np.concatenate([b.row_index for b in batches]), np.arange(5)
+        )
+        assert batches[0].source.name == f"{prefix}/day-01.csv"
+        assert [t.transaction_id for t in repo.load_raw_transactions(pattern)][-1] == (
+            f"{prefix}/day-03.csv:txn_000001"
+        )
+
+    def test_recursive_glob(self, tmp_path):
+        _write_days(tmp_path / "raw" / "2024" / "01", {"a.csv": 1})
+        _write_days(tmp_path / "raw" / "2023" / "12", {"b.csv": 1})
+        repo = LocalFileTransactionRepository()
+
+        assert repo.list_sources(str(tmp_path / "raw" / "**" / "*.csv")) == [
+            str(tmp_path / "raw" / "2023" / "12" / "b.csv"),
+            str(tmp_path / "raw" / "2024" / "01" / "a.csv"),
+        ]
+
+    def test_bounded_concurrency(self, tmp_path):
+        _write_days(tmp_path, {f"day-{i:02d}.csv": 2 for i in range(6)})
+        inner = _SlowRepository(latency=0.05)
+        repo = DatasetTransactionRepository(inner, max_concurrency=2, queue_size=1)
+
+        rows = sum(len(b) for b in repo.load_raw_batches(str(tmp_path / "*.csv"), 8))
+
+        assert rows == 12
+        assert inner.max_in_flight == 2
+
+    def test_no_match_raises(self, tmp_path):
+        repo = DatasetTransactionRepository(LocalFileTransactionRepository())
+        with pytest.raises(FileNotFoundError, match="No sources match"):
+            list(repo.load_raw_batches(str(tmp_path / "*.csv")))
+
+    def test_source_failure_propagates_after_earlier_sources(self, tmp_path):
+        _write_days(tmp_path, {"a.csv": 2})
+        (tmp_path / "b.csv").write_text(_csv_text([make_kaggle_row(Amount="abc")]))
+        repo = DatasetTransactionRepository(LocalFileTransactionRepository())
+
+        stream = repo.load_raw_batches(str(tmp_path / "*.csv"), batch_size=8)
+        assert len(next(stream)) == 2
+        with pytest.raises(ValueError, match="invalid Amount"):
+            next(stream)
+
+    def test_tolerant_parse_errors_use_dataset_record_index(self, tmp_path):
+        _write_days(tmp_path, {"a.csv": 2})
+        rows = _rows(2)
+        rows[1]["Amount"] = "abc"
+        (tmp_path / "b.csv").write_text(_csv_text(rows))
+        repo = DatasetTransactionRepository(LocalFileTransactionRepository(tolerant=True))
+
+        batches = list(repo.load_raw_batches(str(tmp_path / "*.csv"), batch_size=8))
+
+        assert [e.record_index for b in batches for e in b.parse_errors] == [3]
+        assert [t.transaction_id for t in batches[1]] == [f"{tmp_path}/b.csv:txn_000000"]
+
+    def test_fingerprint_tracks_member_sources(self, tmp_path):
+        _write_days(tmp_path, {"a.csv": 2, "b.csv": 1})
+        repo = DatasetTransactionRepository(LocalFileTransactionRepository())
+        pattern = str(tmp_path / "*.csv")
+        before = repo.source_fingerprint(pattern)
+
+        _write_days(tmp_path, {"c.csv": 1})
+
+        assert before is not None
+        assert repo.source_fingerprint(pattern) != before
+        assert repo.source_fingerprint(str(tmp_path / "*.json")) is None
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError, match="max_concurrency must be positive"):
+            DatasetTransactionRepository(LocalFileTransactionRepository(), max_concurrency=0)
+        with pytest.raises(ValueError, match="queue_size must be positive"):
+            DatasetTransactionRepository(LocalFileTransactionRepository(), queue_size=0)
+
+    def test_pipeline_over_local_glob(self, tmp_path):
+        _write_days(tmp_path / "raw", {"day-01.csv": 3, "day-02.csv": 2})
+        use_case = PipelinedProcessDataUseCase(
+            DatasetTransactionRepository(LocalFileTransactionRepository()),
+            KaggleFeatureEngineeringService(),
+            LocalFileValidationReportRepository(),
+            batch_size=2,
+        )
+
+        result = use_case.execute(str(tmp_path / "raw" / "*.csv"), str(tmp_path / "f.csv"))
+
+        assert result.total_records == 5
+        with open(tmp_path / "f.csv", newline="") as f:
+            ids = [row["transaction_id"] for row in csv.DictReader(f)]
+        assert ids[3] == f"{tmp_path}/raw/day-02.csv:txn_000000"
+
+
+class _SmallPageS3Client:
+    """list_objects_v2 페이지 크기를 줄여 페이지 넘김을 확인하는 S3 클라이언트 래퍼."""
+
+    def __init__(self, client, page_size: int) -> None:
+        self._client = client
+        self._page_size = page_size
+        self.pages = 0
+
+    def get_paginator(self, operation: str):
+        paginator = self._client.get_paginator(operation)
+        wrapper = self
+
+        class _Paginator:
+            def paginate(self, **kwargs):
+                config = {"PageSize": wrapper._page_size}
+                for page in paginator.paginate(**kwargs, PaginationConfig=config):
+                    wrapper.pages += 1
+                    yield page
+
+        return _Paginator()
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+
+class TestS3Dataset:
+    @mock_aws
+    def test_paginated_listing(self):
+        s3 = boto3.client("s3", region_name="us-east-1")
+        s3.create_bucket(Bucket="test-bucket")
+        for i in reversed(range(7)):
+            s3.put_object(Bucket="test-bucket", Key=f"raw/{i:02d}.csv", Body=b"")
+        s3.put_object(Bucket="test-bucket", Key="raw/", Body=b"")
+        s3.put_object(Bucket="test-bucket", Key="other/x.csv", Body=b"")
+        client = _SmallPageS3Client(s3, page_size=2)
+        repo = S3TransactionRepository(bucket="test-bucket", s3_client=client)
+
+        keys = repo.list_sources("raw/")
+
+        assert keys == [f"raw/{i:02d}.csv" for i in range(7)]
+        assert client.pages == 4
+
+    @mock_aws
+    def test_loads_prefix_in_key_order(self):
+        s3 = boto3.client("s3", region_name="us-east-1")
+        s3.create_bucket(Bucket="test-bucket")
+        for key, first_time in (("raw/2024-01-02.csv", 100), ("raw/2024-01-01.csv", 0)):
+            s3.put_object(
+                Bucket="test-bucket", Key=key, Body=_csv_text(_rows(3, first_time)).encode()
+            )
+        repo = DatasetTransactionRepository(
+            S3TransactionRepository(bucket="test-bucket", s3_client=s3), max_concurrency=2
+        )
+
+        txns = list(repo.load_raw_transactions("raw/"))
+
+        assert [t.time_seconds for t in txns] == [0.0, 1.0, 2.0, 100.0, 101.0, 102.0]
+        assert txns[3].transaction_id == "raw/2024-01-02.csv:txn_000000"
@@ -0,0 +1,172 @@
+"""time_seconds 외부 정렬 테스트."""
+
+from dataclasses import replace
+
+import numpy as np
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from services.data_pipeline.domain.models import (
+    PCA_FEATURES_COUNT,
+    BatchSource,
+    TransactionBatch,
+    ValidationError,
+)
+from services.data_pipeline.infrastructure.external_sort import ExternalTimeSorter
+
+# run 파일 한 행의 크기. memory_bytes를 행 수 단위로 지정하는 데 쓴다.
+_ROW_BYTES = 8 + 4 + 8 + 8 + 1 + 8 * PCA_FEATURES_COUNT
+
+
+def _batch(times, *, start: int = 0, parse_errors=()) -> TransactionBatch:
+    n = len(times)
+    row_index = np.arange(start, start + n)
+    return TransactionBatch.from_columns(
+        row_index=row_index,
+        time_seconds=np.asarray(times, dtype=np.float64),
+        amount_cents=row_index * 10,
+        is_fraud=row_index % 3 == 0,
+        pca_features=np.repeat(row_index[:, None] / 7, PCA_FEATURES_COUNT, axis=1),
+        parse_errors=parse_errors,
+    )
+
+
+def _split(times, size: int) -> list[TransactionBatch]:
+    return [_batch(times[i:i + size], start=i) for i in range(0, len(times), size)]
+
+
+def _sorter(tmp_path, rows: int) -> ExternalTimeSorter:
+    return ExternalTimeSorter(memory_bytes=rows * _ROW_BYTES, temp_dir=tmp_path)
+
+
+class TestExternalTimeSorter:
+    def test_sorts_across_spilled_runs(self, tmp_path):
+        times = [50.0, 10.0, 40.0, 10.0, 30.0, 0.0, 20.0, 10.0, 5.0, 60.0]
+        sorted_batches = list(_sorter(tmp_path, 3).sort_batches(_split(times, 4), batch_size=4))
+
+        assert [len(b) for b in sorted_batches] == [4, 4, 2]
+        merged = TransactionBatch.concat(sorted_batches)
+        # 같은 시각(10.0)의 거래는 입력 순서를 유지한다.
+        assert merged.row_index.tolist() == [5, 8, 1, 3, 7, 6, 4, 2, 0, 9]
+        np.testing.assert_array_equal(merged.time_seconds, np.sort(times))
+        np.testing.assert_array_equal(merged.amount_cents, merged.row_index * 10)
+        np.testing.assert_array_equal(merged.is_fraud, merged.row_index % 3 == 0)
+        np.testing.assert_array_equal(merged.pca_features[:, 0], merged.row_index / 7)
+        assert sorted_batches[0][0].transaction_id == "txn_000005"
+        assert list(tmp_path.iterdir()) == []
+
+    def test_single_run_skips_spill(self, tmp_path, monkeypatch):
+        import services.data_pipeline.infrastructure.external_sort as external_sort
+
+        def fail(*args):
+            raise AssertionError("should not spill")
+
+        monkeypatch.setattr(external_sort, "_spill", fail)
+        sorted_batches = list(
+            _sorter(tmp_path, 100).sort_batches(_split([3.0, 1.0, 2.0], 2), batch_size=2)
+        )
+
+        assert [b.row_index.tolist() for b in sorted_batches] == [[1, 2], [0]]
+
+    def test_nan_last_and_negative_zero_equal_to_zero(self, tmp_path):
+        times = [np.nan, 1.0, 0.0, -0.0, -1.0]
+        merged = TransactionBatch.concat(
+            list(_sorter(tmp_path, 2).sort_batches([_batch(times)], batch_size=10))
+        )
+
+        assert merged.row_index.tolist() == [4, 2, 3, 1, 0]
+
+    def test_sources_preserved_per_row(self, tmp_path):
+        first = replace(_batch([0.0, 20.0, 40.0]), source=BatchSource("a.csv"))
+        second = replace(_batch([10.0, 30.0], start=3), source=BatchSource("b.csv", 3))
+
+        sorted_batches = list(_sorter(tmp_path, 2).sort_batches([first, second], batch_size=4))
+
+        assert [len(b) for b in sorted_batches] == [4, 1]
+        assert sorted_batches[1].source == BatchSource("a.csv")
+        assert [t.transaction_id for b in sorted_batches for t in b] == [
+            "a.csv:txn_000000",
+            "b.csv:txn_000000",
+            "a.csv:txn_000001",
+            "b.csv:txn_000001",
+            "a.csv:txn_000002",
+        ]
+
+    def test_interleaved_sources_fill_batches(self, tmp_path):
+        n = 10_000
+        first = replace(_batch(np.arange(n) * 2.0), source=BatchSource("a.csv"))
+        second = replace(
+            _batch(np.arange(n) * 2.0 + 1, start=n), source=BatchSource("b.csv", n)
+        )
+
+        sorted_batches = list(
+            _sorter(tmp_path, 4096).sort_batches([first, second], batch_size=1000)
+        )
+
+        assert [len(b) for b in sorted_batches] == [1000] * 20
+        ids = [transaction_id for b in sorted_batches for transaction_id in b.transaction_ids()]
+        assert ids[:4] == [
+            "a.csv:txn_000000",
+            "b.csv:txn_000000",
+            "a.csv:txn_000001",
+            "b.csv:txn_000001",
+        ]
+        assert ids[-1] == f"b.csv:txn_{n - 1:06d}"
+
+    def test_parse_errors_attached_to_first_batch(self, tmp_path):
+        batches = [
+            _batch([2.0, 1.0], parse_errors=(ValidationError("row", "malformed row", 2),)),
+            _batch([0.0], start=3, parse_errors=(ValidationError("row", "malformed row", 4),)),
+        ]
+
+        sorted_batches = list(_sorter(tmp_path, 1).sort_batches(batches, batch_size=2))
+
+        assert [e.record_index for e in sorted_batches[0].parse_errors] == [2, 4]
+        assert sorted_batches[1].parse_errors == ()
+        assert sum(b.record_count for b in sorted_batches) == 5
+
+    def test_only_parse_errors(self, tmp_path):
+        error = ValidationError("row", "malformed row", 0)
+        batches = [_batch([], parse_errors=(error,))]
+
+        sorted_batches = list(_sorter(tmp_path, 4).sort_batches(batches))
+
+        assert len(sorted_batches) == 1
+        assert len(sorted_batches[0]) == 0
+        assert sorted_batches[0].parse_errors == (error,)
+
+    def test_empty_input(self, tmp_path):
+        assert list(_sorter(tmp_path, 4).sort_batches([])) == []
+
+    def test_abandoned_iteration_removes_runs(self, tmp_path):
+        stream = _sorter(tmp_path, 2).sort_batches(_split([5.0, 4.0, 3.0, 2.0, 1.0], 2), 1)
+
+        assert next(stream).row_index.tolist() == [4]
+        assert len(list(tmp_path.iterdir())) == 1
+        stream.close()
+        assert list(tmp_path.iterdir()) == []
+
+    @settings(max_examples=50, deadline=None)
+    @given(
+        times=st.lists(st.integers(0, 20).map(float), max_size=60),
+        run_rows=st.integers(1, 8),
+        input_size=st.integers(1, 9),
+        batch_size=st.integers(1, 9),
+    )
+    def test_matches_stable_sort(self, tmp_path_factory, times, run_rows, input_size, batch_size):
+        tmp_path = tmp_path_factory.mktemp("sort")
+        sorted_batches = list(
+            _sorter(tmp_path, run_rows).sort_batches(_split(times, input_size), batch_size)
+        )
+
+        assert all(len(b) == batch_size for b in sorted_batches[:-1])
+        merged = TransactionBatch.concat(sorted_batches)
+        expected = sorted(range(len(times)), key=lambda i: times[i])
+        assert merged.row_index.tolist() == expected
+
+    def test_invalid_arguments(self, tmp_path):
+        with pytest.raises(ValueError, match="memory_bytes must be positive"):
+            ExternalTimeSorter(memory_bytes=0)
+        with pytest.raises(ValueError, match="batch_size must be positive"):
+            list(_sorter(tmp_path, 4).sort_batches([], batch_size=0))
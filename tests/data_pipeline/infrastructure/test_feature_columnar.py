@@ -0,0 +1,207 @@
+"""열 단위 피처 파일 형식 테스트."""
+
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from services.data_pipeline.domain.models import (
+    BatchSource,
+    Feature,
+    FeatureBatch,
+    VelocityColumns,
+    VelocityFeatures,
+)
+from services.data_pipeline.infrastructure.feature_columnar import (
+    FeatureBatchWriter,
+    open_feature_columns,
+    write_feature_columns,
+)
+from services.data_pipeline.infrastructure.local_repository import (
+    LocalFileTransactionRepository,
+)
+
+
+def _feature(i: int, **overrides) -> Feature:
+    values = {
+        "transaction_id": f"txn_{i:06d}",
+        "amount": Decimal(i).scaleb(-2),
+        "hour_of_day": i % 24,
+        "day_of_week": i % 7,
+        "amount_bin": ("low", "medium", "high")[i % 3],
+        "is_fraud": i % 5 == 0,
+    }
+    values.update(overrides)
+    return Feature(**values)
+
+
+def _write_plain(tmp_path):
+    path = tmp_path / "plain.col"
+    write_feature_columns([_feature(0)], path)
+    return path
+
+
+class TestFeatureColumns:
+    def test_round_trip(self, tmp_path):
+        features = [_feature(i) for i in range(23)]
+        path = tmp_path / "features.col"
+
+        write_feature_columns(features, path, chunk_rows=5)
+        columns = open_feature_columns(path)
+
+        assert list(columns) == features
+        assert columns.amount_cents.tolist() == list(range(23))
+        assert columns.amount_bin_labels == ("low", "medium", "high")
+        assert columns.is_weekend.tolist() == [f.is_weekend for f in features]
+        assert len(columns.is_fraud_packed) == 3
+
+    def test_columns_are_zero_copy_views(self, tmp_path):
+        path = tmp_path / "features.col"
+        write_feature_columns([_feature(i) for i in range(10)], path)
+
+        columns = open_feature_columns(path)
+
+        for array in (columns.amount_cents, columns.hour_of_day, columns.transaction_id):
+            assert isinstance(array.base, np.memmap)
+            assert not array.flags.writeable
+
+    def test_transaction_id_width_grows_across_chunks(self, tmp_path):
+        features = [_feature(1), _feature(2, transaction_id="txn_1000000")]
+        path = tmp_path / "features.col"
+
+        write_feature_columns(features, path, chunk_rows=1)
+
+        assert open_feature_columns(path).transaction_id.tolist() == [
+            b"txn_000001",
+            b"txn_1000000",
+        ]
+
+    def test_velocity_round_trip(self, tmp_path):
+        features = [
+            _feature(
+                i,
+                velocity=VelocityFeatures(
+                    window_counts=(1, i + 1, 2 * i + 1),
+                    window_amount_sums=tuple(Decimal(i * k).scaleb(-2) for k in (1, 2, 3)),
+                    window_amount_maxes=tuple(Decimal(i + k).scaleb(-2) for k in (1, 2, 3)),
+                    fraud_rate_to_date=i / 10,
+                ),
+            )
+            for i in range(9)
+        ]
+        path = tmp_path / "features.col"
+
+        write_feature_columns(features, path, chunk_rows=4)
+        columns = open_feature_columns(path)
+
+        assert list(columns) == features
+        assert columns.velocity.window_counts.shape == (9, 3)
+        assert isinstance(columns.velocity.window_counts.base, np.memmap)
+        assert open_feature_columns(_write_plain(tmp_path)).velocity is None
+
+    def test_mixed_velocity_rejected(self, tmp_path):
+        velocity = VelocityFeatures((1, 1, 1), (Decimal(1),) * 3, (Decimal(1),) * 3, 0.0)
+        with pytest.raises(ValueError, match="present on all features or none"):
+            write_feature_columns(
+                [_feature(0, velocity=velocity), _feature(1)], tmp_path / "features.col"
+            )
+
+    def test_empty(self, tmp_path):
+        path = tmp_path / "features.col"
+        write_feature_columns([], path)
+
+        columns = open_feature_columns(path)
+
+        assert len(columns) == 0
+        assert list(columns) == []
+
+    def test_sub_cent_amount_rejected(self, tmp_path):
+        with pytest.raises(ValueError, match="txn_000000: amount 0.001 is not representable"):
+            write_feature_columns(
+                [_feature(0, amount=Decimal("0.001"))], tmp_path / "features.col"
+            )
+        assert list(tmp_path.iterdir()) == []
+
+    def test_batch_writer_matches_feature_writer(self, tmp_path):
+        def batch(start: int, n: int, labels: tuple[str, ...]) -> FeatureBatch:
+            rows = np.arange(start, start + n)
+            windows = np.stack([rows, rows * 2, rows * 3], axis=1)
+            return FeatureBatch.from_columns(
+                row_index=rows,
+                amount_cents=rows * 125,
+                hour_of_day=rows % 24,
+                day_of_week=rows % 7,
+                amount_bin_codes=rows % len(labels),
+                amount_bin_labels=labels,
+                is_fraud=rows % 3 == 0,
+                velocity=VelocityColumns(windows, windows * 10, windows * 5, rows / 10),
+                source=BatchSource("day-01.csv", start),
+            )
+
+        batches = [batch(0, 5, ("low", "high")), batch(5, 0, ("low",)), batch(5, 4, ("high",))]
+        path = tmp_path / "batches.col"
+        with FeatureBatchWriter(path) as writer:
+            for b in batches:
+                writer.append(b)
+            writer.finish()
+        expected = tmp_path / "features.col"
+        write_feature_columns([f for b in batches for f in b], expected)
+
+        assert list(open_feature_columns(path)) == list(open_feature_columns(expected))
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["batches.col", "features.col"]
+
+    def test_batch_writer_without_finish_leaves_nothing(self, tmp_path):
+        with FeatureBatchWriter(tmp_path / "features.col") as writer:
+            writer.append(FeatureBatch.from_columns(
+                row_index=np.arange(2),
+                amount_cents=np.arange(2),
+                hour_of_day=np.zeros(2),
+                day_of_week=np.zeros(2),
+                amount_bin_codes=np.zeros(2),
+                amount_bin_labels=("low",),
+                is_fraud=np.zeros(2, dtype=bool),
+            ))
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_rejects_other_files(self, tmp_path):
+        path = tmp_path / "features.csv"
+        path.write_bytes(b"transaction_id,amount\n" * 4)
+
+        with pytest.raises(ValueError, match="is not a columnar feature file"):
+            open_feature_columns(path)
+
+
+class TestRepositoryFeatureFormat:
+    def test_columnar_save_features(self, tmp_path):
+        repo = LocalFileTransactionRepository(feature_format="columnar")
+        features = [_feature(i) for i in range(4)]
+
+        path = repo.save_features(iter(features), str(tmp_path / "out" / "features.col"))
+
+        assert list(open_feature_columns(path)) == features
+
+    @pytest.mark.parametrize("feature_format", ["csv", "columnar"])
+    def test_save_feature_batches_matches_save_features(self, tmp_path, feature_format):
+        repo = LocalFileTransactionRepository(feature_format=feature_format)
+        batch = FeatureBatch.from_columns(
+            row_index=np.arange(6),
+            amount_cents=np.array([0, 5, 999, 1000, 14962, 10**15]),
+            hour_of_day=np.arange(6),
+            day_of_week=np.arange(6),
+            amount_bin_codes=np.array([0, 0, 0, 1, 2, 3]),
+            amount_bin_labels=("low", "medium", "high", "very_high"),
+            is_fraud=np.arange(6) % 2 == 0,
+        )
+
+        path = repo.save_feature_batches([batch[:4], batch[4:]], str(tmp_path / "batches"))
+        expected = repo.save_features(list(batch), str(tmp_path / "features"))
+
+        if feature_format == "csv":
+            assert path.read_bytes() == expected.read_bytes()
+        else:
+            assert list(open_feature_columns(path)) == list(open_feature_columns(expected))
+
+    def test_unknown_format_rejected(self):
+        with pytest.raises(ValueError, match="unsupported feature_format 'parquet'"):
+            LocalFileTransactionRepository(feature_format="parquet")
@@ -0,0 +1,128 @@
+from dataclasses import replace
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from services.data_pipeline.domain.models import (
+    BatchSource,
+    Feature,
+    FeatureBatch,
+    VelocityColumns,
+    VelocityFeatures,
+)
+from services.data_pipeline.infrastructure.feature_csv import (
+    FEATURE_CSV_FIELDNAMES,
+    VELOCITY_CSV_FIELDNAMES,
+    encode_feature_batch_csv,
+    encode_feature_csv,
+)
+
+
+def _feature(i: int) -> Feature:
+    return Feature(
+        transaction_id=f"txn_{i:06d}",
+        amount=Decimal("12.30"),
+        hour_of_day=1,
+        day_of_week=6,
+        amount_bin="medium",
+        is_fraud=False,
+    )
+
+
+class TestEncodeFeatureCsv:
+    def test_chunks_concatenate_to_full_csv(self):
+        features = [_feature(i) for i in range(20)]
+        chunks = list(encode_feature_csv(features, chunk_bytes=100))
+        whole = b"".join(encode_feature_csv(features, chunk_bytes=10**9))
+
+        assert len(chunks) > 1
+        assert all(len(chunk) >= 100 for chunk in chunks[:-1])
+        assert b"".join(chunks) == whole
+        assert whole.splitlines()[1] == b"txn_000000,12.3,1,6,medium,False,True"
+
+    def test_velocity_columns_appended(self):
+        velocity = VelocityFeatures(
+            window_counts=(1, 2, 3),
+            window_amount_sums=(Decimal("1.00"), Decimal("2.50"), Decimal("4.00")),
+            window_amount_maxes=(Decimal("1.00"), Decimal("1.50"), Decimal("1.50")),
+            fraud_rate_to_date=0.25,
+        )
+        features = [replace(_feature(i), velocity=velocity) for i in range(2)]
+
+        lines = b"".join(encode_feature_csv(features)).decode().splitlines()
+
+        assert lines[0].split(",") == FEATURE_CSV_FIELDNAMES + VELOCITY_CSV_FIELDNAMES
+        assert VELOCITY_CSV_FIELDNAMES[:3] == ["txn_count_60s", "amount_sum_60s", "amount_max_60s"]
+        assert lines[1].endswith(",1,1,1,2,2.5,1.5,3,4,1.5,0.25")
+
+    def test_mixed_velocity_rejected(self):
+        velocity = VelocityFeatures((1, 1, 1), (Decimal(1),) * 3, (Decimal(1),) * 3, 0.0)
+        features = [replace(_feature(0), velocity=velocity), _feature(1)]
+        with pytest.raises(ValueError, match="present on all features or none"):
+            list(encode_feature_csv(features))
+
+    def test_non_positive_chunk_bytes_rejected(self):
+        with pytest.raises(ValueError, match="chunk_bytes must be positive"):
+            list(encode_feature_csv([], chunk_bytes=0))
+
+
+def _feature_batch(start: int, n: int, *, velocity: bool = False) -> FeatureBatch:
+    rows = np.arange(start, start + n)
+    return FeatureBatch.from_columns(
+        row_index=rows,
+        amount_cents=rows * 1237 - 5,
+        hour_of_day=rows % 24,
+        day_of_week=rows % 7,
+        amount_bin_codes=rows % 4,
+        amount_bin_labels=("low", "medium", "high", "very_high"),
+        is_fraud=rows % 3 == 0,
+        velocity=VelocityColumns(
+            window_counts=np.stack([rows % 5 + 1] * 3, axis=1),
+            window_amount_sums_cents=np.stack([rows * 100, rows * 101, rows * 10**12], axis=1),
+            window_amount_maxes_cents=np.stack([rows, rows * 7, rows * 99], axis=1),
+            fraud_rate_to_date=rows / (start + n),
+        ) if velocity else None,
+        source=BatchSource("part-1.csv") if start else None,
+    )
+
+
+class TestEncodeFeatureBatchCsv:
+    @pytest.mark.parametrize("velocity", [False, True])
+    @pytest.mark.parametrize("header", [False, True])
+    def test_matches_feature_encoding(self, velocity, header):
+        batches = [
+            _feature_batch(0, 5, velocity=velocity),
+            _feature_batch(5, 0, velocity=velocity),
+            _feature_batch(5, 9, velocity=velocity),
+        ]
+        features = [feature for batch in batches for feature in batch]
+
+        chunks = list(encode_feature_batch_csv(batches, chunk_bytes=100, header=header))
+
+        assert len(chunks) == 2
+        assert b"".join(chunks) == b"".join(encode_feature_csv(features, header=header))
+
+    def test_amount_text_matches_row_encoder(self):
+        amounts = ["0", "1.5", "7", "0.05", "123.5", "100", "7.00", "123.50", "-1.20"]
+        features = [
+            replace(_feature(i), amount=Decimal(amount)) for i, amount in enumerate(amounts)
+        ]
+        batch = FeatureBatch.from_features(features, row_index=np.arange(len(amounts)))
+
+        row_csv = b"".join(encode_feature_csv(features))
+
+        assert b"".join(encode_feature_batch_csv([batch])) == row_csv
+        assert [line.split(",")[1] for line in row_csv.decode().splitlines()[1:]] == [
+            "0", "1.5", "7", "0.05", "123.5", "100", "7", "123.5", "-1.2",
+        ]
+
+    def test_empty_batches_write_plain_header(self):
+        batches = [_feature_batch(0, 0, velocity=True)]
+        assert b"".join(encode_feature_batch_csv(batches)) == b"".join(encode_feature_csv([]))
+        assert list(encode_feature_batch_csv(batches, header=False)) == []
+
+    def test_mixed_velocity_rejected(self):
+        batches = [_feature_batch(0, 2, velocity=True), _feature_batch(2, 2)]
+        with pytest.raises(ValueError, match="present on all features or none"):
+            list(encode_feature_batch_csv(batches))
@@ -2,12 +2,22 @@
 
 from __future__ import annotations
 
+import math
 from collections.abc import Iterator
 from decimal import Decimal
 
+import numpy as np
 import pytest
-
-from services.data_pipeline.domain.models import Feature, RawTransaction
+from hypothesis import given
+from hypothesis import strategies as st
+
+from services.data_pipeline.domain.models import (
+    Feature,
+    FeatureBatch,
+    RawTransaction,
+    TransactionBatch,
+)
+from services.data_pipeline.domain.services import FeatureEngineeringService
 from services.data_pipeline.infrastructure.feature_engineering import (
     KaggleFeatureEngineeringService,
 )
@@ -107,6 +117,12 @@ class TestAmountBin:
         feature = service._to_feature(txn)
         assert feature.amount_bin == "very_high"
 
+    def test_amount_not_representable_in_cents_rejected(
+        self, service: KaggleFeatureEngineeringService
+    ) -> None:
+        with pytest.raises(ValueError, match="not representable in cents"):
+            service._to_feature(_make_txn(amount=Decimal("9.999")))
+
 
 class TestStreaming:
     """스트리밍(Iterator) 동작 테스트."""
@@ -152,3 +168,138 @@ class TestPassThrough:
         assert feature.transaction_id == "txn-pass"
         assert feature.amount == Decimal("42.50")
         assert feature.is_fraud is True
+
+
+def _make_batch(times: list[float], cents: list[int], labels: list[bool]) -> TransactionBatch:
+    n = len(times)
+    return TransactionBatch.from_columns(
+        row_index=np.arange(n),
+        time_seconds=np.array(times, dtype=np.float64),
+        amount_cents=np.array(cents, dtype=np.int64),
+        is_fraud=np.array(labels, dtype=np.bool_),
+        pca_features=np.zeros((n, 28)),
+    )
+
+
+class TestExtractFeaturesBatch:
+    """extract_features_batch 벡터화 경로 테스트."""
+
+    @given(
+        st.lists(
+            st.tuples(
+                st.floats(min_value=0, max_value=1e10, allow_nan=False),
+                st.integers(min_value=0, max_value=10**12),
+                st.booleans(),
+            ),
+            max_size=50,
+        )
+    )
+    def test_matches_per_row_path(self, rows: list[tuple[float, int, bool]]) -> None:
+        service = KaggleFeatureEngineeringService()
+        batch = _make_batch(
+            [r[0] for r in rows], [r[1] for r in rows], [r[2] for r in rows]
+        )
+
+        result = service.extract_features_batch(batch)
+
+        assert isinstance(result, FeatureBatch)
+        assert list(result) == [service._to_feature(txn) for txn in batch]
+        assert result.is_weekend.tolist() == [f.is_weekend for f in result]
+
+    def test_amount_bin_edges(
+        self, service: KaggleFeatureEngineeringService
+    ) -> None:
+        cents = [999, 1000, 9999, 10000, 49999, 50000]
+        batch = _make_batch([0.0] * 6, cents, [False] * 6)
+
+        result = service.extract_features_batch(batch)
+
+        assert [f.amount_bin for f in result] == [
+            "low", "medium", "medium", "high", "high", "very_high",
+        ]
+
+    def test_non_finite_time_rejected(
+        self, service: KaggleFeatureEngineeringService
+    ) -> None:
+        batch = _make_batch([math.nan], [100], [False])
+        with pytest.raises(ValueError, match="time_seconds must be finite"):
+            service.extract_features_batch(batch)
+
+    def test_no_velocity_by_default(
+        self, service: KaggleFeatureEngineeringService
+    ) -> None:
+        result = service.extract_features_batch(_make_batch([0.0], [100], [False]))
+        assert result.velocity is None
+        assert result[0].velocity is None
+
+
+class TestDefaultExtractFeaturesBatch:
+    """행 단위 기본 구현과 벡터화 재정의가 같은 배치를 만드는지 확인한다."""
+
+    @pytest.mark.parametrize("velocity", [False, True])
+    def test_matches_vectorized_override(self, velocity: bool) -> None:
+        batch = _make_batch(
+            [0.0, 30.0, 30.0, 4000.0], [999, 1000, 50000, 7], [True, False, False, True]
+        )[1:]
+
+        default = FeatureEngineeringService.extract_features_batch(
+            KaggleFeatureEngineeringService(velocity=velocity), batch
+        )
+        vectorized = KaggleFeatureEngineeringService(velocity=velocity).extract_features_batch(
+            batch
+        )
+
+        assert list(default) == list(vectorized)
+        assert default.row_index.tolist() == [1, 2, 3]
+        assert default.amount_cents.tolist() == vectorized.amount_cents.tolist()
+        assert (default.velocity is None) == (not velocity)
+
+
+class TestVelocityFeatures:
+    """velocity=True일 때 속도 피처 테스트."""
+
+    def _rows(self) -> tuple[list[float], list[int], list[bool]]:
+        times = [0.0, 30.0, 30.0, 90.0, 700.0, 4000.0, 4001.0]
+        cents = [500, 100, 900, 200, 50, 300, 10]
+        labels = [True, False, False, True, False, False, False]
+        return times, cents, labels
+
+    def test_batches_match_per_row_path_across_calls(self) -> None:
+        times, cents, labels = self._rows()
+        batch = _make_batch(times, cents, labels)
+        service = KaggleFeatureEngineeringService(velocity=True)
+
+        batched = [
+            f for part in (batch[:3], batch[3:]) for f in service.extract_features_batch(part)
+        ]
+        per_row = list(
+            KaggleFeatureEngineeringService(velocity=True).extract_features(batch)
+        )
+
+        assert batched == per_row
+        assert per_row[3].velocity.window_counts == (1, 4, 4)
+        assert per_row[3].velocity.window_amount_maxes == (
+            Decimal("2.00"), Decimal("9.00"), Decimal("9.00")
+        )
+        assert per_row[4].velocity.window_amount_sums == (
+            Decimal("0.50"), Decimal("0.50"), Decimal("17.50")
+        )
+        assert per_row[4].velocity.fraud_rate_to_date == 0.5
+
+    def test_reset_starts_new_stream(self) -> None:
+        times, cents, labels = self._rows()
+        batch = _make_batch(times, cents, labels)
+        service = KaggleFeatureEngineeringService(velocity=True)
+        first = list(service.extract_features_batch(batch))
+
+        service.reset()
+
+        assert list(service.extract_features_batch(batch)) == first
+        with pytest.raises(ValueError, match="non-decreasing"):
+            service.extract_features_batch(batch)
+
+    def test_extract_features_calls_are_independent(self) -> None:
+        service = KaggleFeatureEngineeringService(velocity=True)
+        txns = [_make_txn(time_seconds=10.0), _make_txn(time_seconds=20.0)]
+
+        assert list(service.extract_features(txns)) == list(service.extract_features(txns))
@@ -0,0 +1,332 @@
+"""원본 뒤에 덧붙은 행만 처리하는 증분 파이프라인 테스트."""
+
+import csv
+import hashlib
+import io
+import json
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from services.data_pipeline.infrastructure.csv_parser import KaggleCsvParser
+from services.data_pipeline.infrastructure.feature_engineering import (
+    KaggleFeatureEngineeringService,
+)
+from services.data_pipeline.infrastructure.incremental import IncrementalProcessDataUseCase
+from services.data_pipeline.infrastructure.local_repository import (
+    LocalFileTransactionRepository,
+    LocalFileValidationReportRepository,
+)
+from services.data_pipeline.infrastructure.s3_repository import S3TransactionRepository
+from tests.data_pipeline.infrastructure.conftest import KAGGLE_FIELDNAMES, make_kaggle_row
+
+
+def _header() -> str:
+    return ",".join(KAGGLE_FIELDNAMES) + "\n"
+
+
+def _lines(rows: list[dict[str, str]]) -> str:
+    buffer = io.StringIO()
+    csv.DictWriter(buffer, fieldnames=KAGGLE_FIELDNAMES, lineterminator="\n").writerows(rows)
+    return buffer.getvalue()
+
+
+def _rows(start: int, n: int) -> list[dict[str, str]]:
+    return [
+        make_kaggle_row(Time=str(float(i * 100)), Amount=f"{i}.50", Class=str(i % 2))
+        for i in range(start, start + n)
+    ]
+
+
+def _use_case(repo=None, **kwargs) -> IncrementalProcessDataUseCase:
+    return IncrementalProcessDataUseCase(
+        repo or LocalFileTransactionRepository(),
+        KaggleFeatureEngineeringService(),
+        LocalFileValidationReportRepository(),
+        batch_size=3,
+        **kwargs,
+    )
+
+
+def _full_rebuild(source, destination) -> bytes:
+    _use_case().execute(str(source), str(destination))
+    return destination.read_bytes()
+
+
+class TestIncrementalProcessDataUseCase:
+    def test_appends_only_new_rows(self, tmp_path):
+        source = tmp_path / "raw.csv"
+        features = tmp_path / "out" / "features.csv"
+        source.write_text(_header() + _lines(_rows(0, 5)))
+        use_case = _use_case()
+
+        first = use_case.execute(str(source), str(features))
+        with open(source, "a") as f:
+            f.write(_lines(_rows(5, 4)))
+        second = use_case.execute(str(source), str(features))
+
+        assert (first.total_records, second.total_records) == (5, 4)
+        assert features.read_bytes() == _full_rebuild(source, tmp_path / "full.csv")
+        manifest = json.loads((tmp_path / "out" / "features_manifest.json").read_text())
+        assert manifest["byte_offset"] == source.stat().st_size
+        assert (manifest["record_count"], manifest["valid_records"]) == (9, 9)
+        report = json.loads((tmp_path / "out" / "features_validation_report.json").read_text())
+        assert report["total_records"] == 4
+
+    def test_unchanged_source_processes_nothing(self, tmp_path):
+        source = tmp_path / "raw.csv"
+        features = tmp_path / "features.csv"
+        source.write_text(_header() + _lines(_rows(0, 3)))
+        use_case = _use_case()
+        use_case.execute(str(source), str(features))
+        before = features.read_bytes()
+
+        result = use_case.execute(str(source), str(features))
+
+        assert result.total_records == 0
+        assert features.read_bytes() == before
+
+    def test_partial_last_line_deferred(self, tmp_path):
+        source = tmp_path / "raw.csv"
+        features = tmp_path / "features.csv"
+        complete = _header() + _lines(_rows(0, 2))
+        tail = _lines(_rows(2, 1))
+        source.write_text(complete + tail[:-10])
+        use_case = _use_case()
+
+        first = use_case.execute(str(source), str(features))
+        with open(source, "a") as f:
+            f.write(tail[-10:])
+        second = use_case.execute(str(source), str(features))
+
+        assert (first.total_records, second.total_records) == (2, 1)
+        assert features.read_bytes() == _full_rebuild(source, tmp_path / "full.csv")
+
+    @pytest.mark.parametrize("check_bytes", [None, 16])
+    def test_changed_prefix_triggers_full_rebuild(self, tmp_path, check_bytes):
+        source = tmp_path / "raw.csv"
+        features = tmp_path / "features.csv"
+        rows = _rows(0, 6)
+        source.write_text(_header() + _lines(rows))
+        use_case = _use_case(check_bytes=check_bytes)
+        use_case.execute(str(source), str(features))
+
+        rows[-1]["Amount"] = "9.99"
+        source.write_text(_header() + _lines(rows + _rows(6, 1)))
+        result = use_case.execute(str(source), str(features))
+
+        assert result.total_records == 7
+        assert features.read_bytes() == _full_rebuild(source, tmp_path / "full.csv")
+
+    def test_changed_middle_detected_by_default(self, tmp_path):
+        source = tmp_path / "raw.csv"
+        features = tmp_path / "features.csv"
+        rows = _rows(0, 200)
+        source.write_text(_header() + _lines(rows))
+        use_case = _use_case()
+        use_case.execute(str(source), str(features))
+
+        rows[100]["Amount"] = "9.99"
+        source.write_text(_header() + _lines(rows))
+        result = use_case.execute(str(source), str(features))
+
+        assert result.total_records == 200
+        assert features.read_bytes() == _full_rebuild(source, tmp_path / "full.csv")
+
+    def test_resume_reads_source_once(self, tmp_path):
+        class CountingRepository(LocalFileTransactionRepository):
+            bytes_read = 0
+
+            def iter_source_bytes(self, source, start=0, end=None, *, etag=None):
+                for chunk in super().iter_source_bytes(source, start, end, etag=etag):
+                    self.bytes_read += len(chunk)
+                    yield chunk
+
+        source = tmp_path / "raw.csv"
+        features = tmp_path / "features.csv"
+        source.write_text(_header() + _lines(_rows(0, 50)))
+        repo = CountingRepository()
+        use_case = _use_case(repo)
+        use_case.execute(str(source), str(features))
+
+        for start in (50, 80):
+            with open(source, "a") as f:
+                f.write(_lines(_rows(start, 30)))
+            repo.bytes_read = 0
+            use_case.execute(str(source), str(features))
+            assert repo.bytes_read == source.stat().st_size
+
+        manifest = json.loads((tmp_path / "features_manifest.json").read_text())
+        assert manifest["checksum"] == hashlib.sha256(source.read_bytes()).hexdigest()
+        assert features.read_bytes() == _full_rebuild(source, tmp_path / "full.csv")
+
+    @pytest.mark.parametrize("appended", [0, 3])
+    def test_crash_before_manifest_does_not_duplicate_rows(
+        self, tmp_path, monkeypatch, appended
+    ):
+        source = tmp_path / "raw.csv"
+        features = tmp_path / "features.csv"
+        source.write_text(_header() + _lines(_rows(0, 4)))
+        repo = LocalFileTransactionRepository()
+        _use_case(repo).execute(str(source), str(features))
+        with open(source, "a") as f:
+            f.write(_lines(_rows(4, 3)))
+
+        def crash(watermark, destination):
+            raise OSError("interrupted")
+
+        with monkeypatch.context() as patch:
+            patch.setattr(repo, "save_watermark", crash)
+            with pytest.raises(OSError, match="interrupted"):
+                _use_case(repo).execute(str(source), str(features))
+        with open(source, "a") as f:
+            f.write(_lines(_rows(7, appended)))
+        result = _use_case(repo).execute(str(source), str(features))
+
+        assert result.total_records == 3 + appended
+        assert features.read_bytes() == _full_rebuild(source, tmp_path / "full.csv")
+
+    def test_truncated_features_trigger_full_rebuild(self, tmp_path):
+        source = tmp_path / "raw.csv"
+        features = tmp_path / "features.csv"
+        source.write_text(_header() + _lines(_rows(0, 4)))
+        use_case = _use_case()
+        use_case.execute(str(source), str(features))
+        features.write_bytes(features.read_bytes()[:-5])
+
+        result = use_case.execute(str(source), str(features))
+
+        assert result.total_records == 4
+        assert features.read_bytes() == _full_rebuild(source, tmp_path / "full.csv")
+
+    def test_validation_and_parse_errors_keep_source_row_index(self, tmp_path):
+        source = tmp_path / "raw.csv"
+        features = tmp_path / "features.csv"
+        source.write_text(_header() + _lines(_rows(0, 3)))
+        use_case = _use_case(tolerant=True)
+        use_case.execute(str(source), str(features))
+
+        new_rows = _rows(3, 3)
+        new_rows[0]["Amount"] = "-1.00"
+        new_rows[2]["Amount"] = "abc"
+        with open(source, "a") as f:
+            f.write(_lines(new_rows))
+        result = use_case.execute(str(source), str(features))
+
+        report = json.loads(open(result.validation_report_path).read())
+        assert [e["record_index"] for e in report["errors"]] == [3, 5]
+        with open(features, newline="") as f:
+            ids = [row["transaction_id"] for row in csv.DictReader(f)]
+        assert ids == ["txn_000000", "txn_000001", "txn_000002", "txn_000004"]
+        manifest = json.loads((tmp_path / "features_manifest.json").read_text())
+        assert (manifest["record_count"], manifest["valid_records"]) == (6, 4)
+
+    def test_invalid_check_bytes(self):
+        with pytest.raises(ValueError, match="check_bytes must be positive"):
+            _use_case(check_bytes=0)
+
+    def test_stateful_feature_service_rejected(self):
+        with pytest.raises(ValueError, match="stateful feature services"):
+            IncrementalProcessDataUseCase(
+                LocalFileTransactionRepository(),
+                KaggleFeatureEngineeringService(velocity=True),
+                LocalFileValidationReportRepository(),
+            )
+
+
+class TestS3Incremental:
+    @mock_aws
+    def test_ranged_read_and_appended_feature_object(self, tmp_path):
+        s3 = boto3.client("s3", region_name="us-east-1")
+        s3.create_bucket(Bucket="test-bucket")
+        body = _header() + _lines(_rows(0, 4))
+        s3.put_object(Bucket="test-bucket", Key="raw/feed.csv", Body=body.encode())
+        repo = S3TransactionRepository(bucket="test-bucket", s3_client=s3, range_bytes=97)
+        use_case = _use_case(repo)
+        # 검증 리포트는 로컬 저장소가 피처 키와 같은 경로 옆에 쓰므로 tmp_path 아래 키를 쓴다.
+        destination = str(tmp_path / "features.csv")
+
+        use_case.execute("raw/feed.csv", destination)
+        appended = body + _lines(_rows(4, 3))
+        s3.put_object(Bucket="test-bucket", Key="raw/feed.csv", Body=appended.encode())
+        result = use_case.execute("raw/feed.csv", destination)
+
+        assert result.total_records == 3
+        saved = s3.get_object(Bucket="test-bucket", Key=destination)["Body"].read()
+        source = tmp_path / "raw.csv"
+        source.write_text(appended)
+        assert saved == _full_rebuild(source, tmp_path / "full.csv")
+        manifest = repo.load_watermark(destination)
+        head = s3.head_object(Bucket="test-bucket", Key="raw/feed.csv")
+        assert (manifest.source_etag, manifest.byte_offset) == (head["ETag"], len(appended))
+
+    @mock_aws
+    def test_append_cuts_object_to_base_size(self):
+        s3 = boto3.client("s3", region_name="us-east-1")
+        s3.create_bucket(Bucket="test-bucket")
+        s3.put_object(Bucket="test-bucket", Key="features.csv", Body=b"header\nstale\n")
+        repo = S3TransactionRepository(bucket="test-bucket", s3_client=s3)
+        feature = next(iter(_features(1)))
+
+        repo.append_features([], "features.csv", base_size=7)
+        assert repo.features_size("features.csv") == 7
+        repo.append_features([feature], "features.csv", base_size=7)
+
+        body = s3.get_object(Bucket="test-bucket", Key="features.csv")["Body"].read()
+        assert body.startswith(b"header\n")
+        assert body[7:].decode().startswith(f"{feature.transaction_id},")
+
+    @mock_aws
+    def test_append_copies_large_existing_object_server_side(self):
+        s3 = boto3.client("s3", region_name="us-east-1")
+        s3.create_bucket(Bucket="test-bucket")
+        existing = b"x" * (5 * 1024 * 1024) + b"\n"
+        s3.put_object(Bucket="test-bucket", Key="features.csv", Body=existing)
+        client = _CopyCountingS3Client(s3)
+        repo = S3TransactionRepository(bucket="test-bucket", s3_client=client)
+        feature = next(iter(_features(2)))
+
+        repo.append_features([feature], "features.csv")
+
+        body = s3.get_object(Bucket="test-bucket", Key="features.csv")["Body"].read()
+        assert client.copies == 1
+        assert body.startswith(existing)
+        assert body[len(existing):].decode().startswith(f"{feature.transaction_id},")
+
+    @mock_aws
+    def test_append_without_features_leaves_object(self):
+        s3 = boto3.client("s3", region_name="us-east-1")
+        s3.create_bucket(Bucket="test-bucket")
+        s3.put_object(Bucket="test-bucket", Key="features.csv", Body=b"header\n")
+        repo = S3TransactionRepository(bucket="test-bucket", s3_client=s3)
+
+        repo.append_features([], "features.csv")
+
+        assert s3.get_object(Bucket="test-bucket", Key="features.csv")["Body"].read() == (
+            b"header\n"
+        )
+        assert repo.load_watermark("features.csv") is None
+
+
+class _CopyCountingS3Client:
+    def __init__(self, client) -> None:
+        self._client = client
+        self.copies = 0
+
+    def upload_part_copy(self, **kwargs):
+        self.copies += 1
+        return self._client.upload_part_copy(**kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+
+def _features(n: int):
+    lines = io.BytesIO((_header() + _lines(_rows(0, n))).encode())
+    service = KaggleFeatureEngineeringService()
+    return [
+        feature
+        for batch in KaggleCsvParser().parse_file(lines)
+        for feature in service.extract_features_batch(batch)
+    ]
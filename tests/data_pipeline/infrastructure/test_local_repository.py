@@ -5,6 +5,7 @@ from decimal import Decimal
 import pytest
 
 from services.data_pipeline.domain.models import (
+    ErrorKindSummary,
     Feature,
     ValidationError,
     ValidationReport,
@@ -13,6 +14,7 @@ from services.data_pipeline.infrastructure.local_repository import (
     LocalFileTransactionRepository,
     LocalFileValidationReportRepository,
 )
+from services.data_pipeline.infrastructure.validators import TransactionValidator
 from tests.data_pipeline.infrastructure.conftest import make_kaggle_row
 
 
@@ -40,6 +42,86 @@ class TestLocalFileTransactionRepository:
         with pytest.raises(FileNotFoundError):
             list(repo.load_raw_transactions("/nonexistent/path.csv"))
 
+    def test_load_raw_batches_matches_row_path(self, kaggle_csv):
+        csv_path = kaggle_csv([
+            make_kaggle_row(Time=str(float(i)), Amount=f"{i}.25", Class=str(i % 2))
+            for i in range(5)
+        ])
+        repo = LocalFileTransactionRepository()
+        batches = list(repo.load_raw_batches(str(csv_path), batch_size=2))
+        transactions = list(repo.load_raw_transactions(str(csv_path)))
+
+        assert [len(b) for b in batches] == [2, 2, 1]
+        amount_cents = [c for b in batches for c in b.amount_cents.tolist()]
+        is_fraud = [f for b in batches for f in b.is_fraud.tolist()]
+        assert amount_cents == [int(t.amount * 100) for t in transactions]
+        assert is_fraud == [t.is_fraud for t in transactions]
+
+    def test_load_raw_batches_nonexistent_file_raises(self):
+        repo = LocalFileTransactionRepository()
+        with pytest.raises(FileNotFoundError):
+            list(repo.load_raw_batches("/nonexistent/path.csv"))
+
+    def test_tolerant_parse_errors_join_validation_report(self, kaggle_csv):
+        csv_path = kaggle_csv([
+            make_kaggle_row(),
+            make_kaggle_row(Amount="-1.00"),
+            make_kaggle_row(Class="x"),
+            make_kaggle_row(V3="nan"),
+            make_kaggle_row(Time="later"),
+        ])
+        repo = LocalFileTransactionRepository(tolerant=True)
+
+        stream = TransactionValidator().validate_batches(
+            repo.load_raw_batches(str(csv_path), batch_size=4)
+        )
+        valid = list(stream)
+
+        assert [i for b in valid for i in b.row_index.tolist()] == [0]
+        assert all(not b.parse_errors for b in valid)
+        assert stream.report.total_records == 5
+        assert stream.report.valid_records == 1
+        assert list(stream.report.errors) == [
+            ValidationError("amount", "invalid amount", 1),
+            ValidationError("is_fraud", "invalid Class", 2),
+            ValidationError("pca_features", "pca_features contains NaN or Inf", 3),
+            ValidationError("time_seconds", "invalid Time", 4),
+        ]
+
+    def test_tolerant_aggregated_report_counts_parse_errors(self, kaggle_csv):
+        rows = [make_kaggle_row(Class="x") if i % 3 == 0 else make_kaggle_row() for i in range(9)]
+        repo = LocalFileTransactionRepository(tolerant=True)
+
+        stream = TransactionValidator(max_error_samples=1).validate_batches(
+            repo.load_raw_batches(str(kaggle_csv(rows)), batch_size=2)
+        )
+        list(stream)
+
+        (kind,) = stream.report.error_summary
+        assert (kind.field, kind.message, kind.count) == ("is_fraud", "invalid Class", 3)
+        assert set(kind.sample_record_indices) <= {0, 3, 6}
+        assert stream.report.valid_records == 6
+
+    def test_tolerant_sharded_load_matches_sequential(self, kaggle_csv):
+        rows = [make_kaggle_row(Time=str(float(i))) for i in range(40)]
+        for i in (3, 17, 31):
+            rows[i] = make_kaggle_row(Amount="bad")
+        csv_path = str(kaggle_csv(rows))
+        sequential = LocalFileTransactionRepository(tolerant=True)
+        sharded = LocalFileTransactionRepository(
+            tolerant=True, workers=2, parallel_min_bytes=0, shard_bytes=1500
+        )
+
+        def load(repo):
+            batches = list(repo.load_raw_batches(csv_path, batch_size=4))
+            return (
+                [e.record_index for b in batches for e in b.parse_errors],
+                [i for b in batches for i in b.row_index.tolist()],
+            )
+
+        assert load(sharded) == load(sequential)
+        assert load(sequential)[0] == [3, 17, 31]
+
 
 class TestSaveFeatures:
     """save_features 메서드 테스트."""
@@ -199,3 +281,35 @@ class TestLocalFileValidationReportRepository:
             "message": "유효하지 않은 시간",
             "record_index": 7,
         }
+
+    def test_save_aggregated_report(self, tmp_path):
+        """집계 리포트는 error_summary와 표본 오류를 함께 저장한다."""
+        report = ValidationReport(
+            total_records=50,
+            errors=(ValidationError(field="amount", message="invalid amount", record_index=3),),
+            error_summary=(
+                ErrorKindSummary(
+                    field="amount",
+                    message="invalid amount",
+                    count=20,
+                    sample_record_indices=(3,),
+                ),
+            ),
+        )
+        dest = tmp_path / "report.json"
+        LocalFileValidationReportRepository().save_report(report, str(dest))
+
+        with open(dest, encoding="utf-8") as f:
+            data = json.load(f)
+
+        assert data["valid_records"] == 30
+        assert data["error_rate"] == pytest.approx(0.4)
+        assert len(data["errors"]) == 1
+        assert data["error_summary"] == [
+            {
+                "field": "amount",
+                "message": "invalid amount",
+                "count": 20,
+                "sample_record_indices": [3],
+            }
+        ]
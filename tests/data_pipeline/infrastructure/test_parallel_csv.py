@@ -0,0 +1,194 @@
+"""병렬 샤드 파싱 테스트."""
+
+import numpy as np
+import pytest
+
+from services.data_pipeline.domain.models import DeferredColumns
+from services.data_pipeline.infrastructure.local_repository import (
+    LocalFileTransactionRepository,
+)
+from services.data_pipeline.infrastructure.parallel_csv import (
+    plan_shard_loaders,
+    plan_shards,
+)
+from services.data_pipeline.infrastructure.process_pool import new_process_pool
+from services.data_pipeline.infrastructure.validators import TransactionValidator
+from tests.data_pipeline.infrastructure.conftest import make_kaggle_row
+
+
+def _rows(n: int) -> list[dict[str, str]]:
+    return [
+        make_kaggle_row(Time=str(float(i)), Amount=f"{i}.{i % 100:02d}", Class=str(i % 2))
+        for i in range(n)
+    ]
+
+
+def _parallel_repo() -> LocalFileTransactionRepository:
+    return LocalFileTransactionRepository(workers=2, parallel_min_bytes=0, shard_bytes=1500)
+
+
+class TestPlanShards:
+    def test_boundaries_are_line_aligned_and_cover_file(self, kaggle_csv):
+        csv_path = kaggle_csv(_rows(30))
+        content = csv_path.read_bytes()
+        data_start = content.index(b"\n") + 1
+
+        shards = plan_shards(csv_path, data_start, 1000)
+
+        assert len(shards) > 1
+        assert shards[0][0] == data_start
+        assert shards[-1][1] == len(content)
+        for (_, end), (start, _) in zip(shards, shards[1:]):
+            assert end == start
+            assert content[start - 1:start] == b"\n"
+
+
+class TestShardedLoading:
+    def test_matches_sequential_load(self, kaggle_csv):
+        csv_path = kaggle_csv(_rows(50))
+
+        parallel = list(_parallel_repo().load_raw_batches(str(csv_path), batch_size=7))
+        sequential = list(
+            LocalFileTransactionRepository().load_raw_batches(str(csv_path), batch_size=7)
+        )
+
+        assert len(parallel) > 1
+        for column in ("row_index", "time_seconds", "amount_cents", "is_fraud"):
+            np.testing.assert_array_equal(
+                np.concatenate([getattr(b, column) for b in parallel]),
+                np.concatenate([getattr(b, column) for b in sequential]),
+            )
+        assert [t.transaction_id for b in parallel for t in b] == [
+            f"txn_{i:06d}" for i in range(50)
+        ]
+
+    def test_error_reports_global_row_index(self, kaggle_csv):
+        rows = _rows(40)
+        rows[33]["Class"] = "9"
+        csv_path = kaggle_csv(rows)
+
+        with pytest.raises(ValueError, match="Row 33: invalid Class '9'"):
+            list(_parallel_repo().load_raw_batches(str(csv_path), batch_size=4))
+
+    def test_lazy_pca_error_reports_global_row_index(self, kaggle_csv):
+        rows = _rows(40)
+        rows[33]["V3"] = "abc"
+        repo = LocalFileTransactionRepository(
+            workers=2, parallel_min_bytes=0, shard_bytes=1500, pca_features="lazy"
+        )
+
+        batches = list(repo.load_raw_batches(str(kaggle_csv(rows)), batch_size=4))
+
+        batch = next(b for b in batches if 33 in b.row_index)
+        with pytest.raises(ValueError, match="Row 33: invalid PCA feature value"):
+            np.asarray(batch.pca_features)
+
+    def test_workers_are_not_forked(self):
+        pool = new_process_pool(1)
+        try:
+            assert pool._mp_context.get_start_method() in ("forkserver", "spawn")
+        finally:
+            pool.shutdown()
+
+    def test_small_file_uses_sequential_path(self, kaggle_csv):
+        csv_path = kaggle_csv(_rows(3))
+        repo = LocalFileTransactionRepository(workers=4)
+
+        batches = list(repo.load_raw_batches(str(csv_path)))
+
+        assert [len(b) for b in batches] == [3]
+
+    def test_header_only_file(self, kaggle_csv):
+        csv_path = kaggle_csv([])
+        assert list(_parallel_repo().load_raw_batches(str(csv_path))) == []
+
+    def test_invalid_workers_rejected(self):
+        with pytest.raises(ValueError, match="workers must be positive"):
+            LocalFileTransactionRepository(workers=0)
+
+
+def _invalid_rows(n: int) -> list[dict[str, str]]:
+    rows = _rows(n)
+    for i in range(0, n, 7):
+        rows[i]["Amount"] = "-1.00"
+    for i in range(0, n, 5):
+        rows[i]["V3"] = "nan"
+    return rows
+
+
+class TestValidateShards:
+    def _sequential(self, csv_path, validator):
+        batches = LocalFileTransactionRepository().load_raw_batches(str(csv_path), 4)
+        stream = validator.validate_batches(batches)
+        return [b for b in stream if len(b)], stream.report
+
+    def test_merged_report_matches_sequential(self, kaggle_csv):
+        csv_path = kaggle_csv(_invalid_rows(60))
+        validator = TransactionValidator()
+        shards = plan_shard_loaders(csv_path, batch_size=4, shard_bytes=1500)
+
+        stream = validator.validate_shards(shards, workers=2)
+        valid = list(stream)
+        expected_valid, expected_report = self._sequential(csv_path, validator)
+
+        assert len(shards) > 2
+        assert stream.report == expected_report
+        assert stream.report.errors == tuple(expected_report.errors)
+        np.testing.assert_array_equal(
+            np.concatenate([b.row_index for b in valid]),
+            np.concatenate([b.row_index for b in expected_valid]),
+        )
+
+    def test_aggregated_counts_match_sequential(self, kaggle_csv):
+        csv_path = kaggle_csv(_invalid_rows(60))
+        validator = TransactionValidator(max_error_samples=2)
+        shards = plan_shard_loaders(csv_path, batch_size=4, shard_bytes=1500)
+
+        stream = validator.validate_shards(shards, workers=2)
+        list(stream)
+        _, expected = self._sequential(csv_path, validator)
+
+        counts = {(k.field, k.count) for k in stream.report.error_summary}
+        assert counts == {(k.field, k.count) for k in expected.error_summary}
+        assert stream.report.valid_records == expected.valid_records
+
+    def test_error_reports_global_row_index(self, kaggle_csv):
+        rows = _rows(40)
+        rows[33]["Class"] = "9"
+        shards = plan_shard_loaders(kaggle_csv(rows), batch_size=4, shard_bytes=1500)
+
+        with pytest.raises(ValueError, match="Row 33: invalid Class '9'"):
+            list(TransactionValidator().validate_shards(shards, workers=2))
+
+    def test_lazy_pca_shards_report_global_row_index(self, kaggle_csv):
+        rows = _rows(40)
+        rows[33]["V3"] = "abc"
+        shards = plan_shard_loaders(
+            kaggle_csv(rows), batch_size=4, shard_bytes=1500, pca_features="lazy"
+        )
+
+        valid = list(TransactionValidator().validate_shards(shards, workers=2))
+
+        assert len(shards) > 2
+        assert sum(len(b) for b in valid) == 40
+        assert all(isinstance(b.pca_features, DeferredColumns) for b in valid)
+        batch = next(b for b in valid if 33 in b.row_index)
+        with pytest.raises(ValueError, match="Row 33: invalid PCA feature value"):
+            np.asarray(batch.pca_features)
+
+    def test_skipped_pca_shards_are_not_decoded(self, kaggle_csv):
+        shards = plan_shard_loaders(
+            kaggle_csv(_rows(40)), batch_size=4, shard_bytes=1500, pca_features="skip"
+        )
+
+        valid = list(TransactionValidator().validate_shards(shards, workers=2))
+
+        with pytest.raises(ValueError, match="pca_features were not loaded"):
+            np.asarray(valid[-1].pca_features)
+
+    def test_header_only_file(self, kaggle_csv):
+        shards = plan_shard_loaders(kaggle_csv([]), batch_size=4)
+        stream = TransactionValidator().validate_shards(shards, workers=2)
+
+        assert list(stream) == []
+        assert stream.report.total_records == 0
@@ -0,0 +1,228 @@
+"""PipelinedProcessDataUseCase 테스트."""
+
+import csv
+import json
+import math
+
+import pytest
+
+from services.data_pipeline.infrastructure.external_sort import ExternalTimeSorter
+from services.data_pipeline.infrastructure.feature_engineering import (
+    KaggleFeatureEngineeringService,
+)
+from services.data_pipeline.infrastructure.local_repository import (
+    LocalFileTransactionRepository,
+    LocalFileValidationReportRepository,
+)
+from services.data_pipeline.infrastructure.pipeline import PipelinedProcessDataUseCase
+from services.data_pipeline.infrastructure.validators import TransactionValidator
+from tests.data_pipeline.infrastructure.conftest import make_kaggle_row
+
+
+def _use_case(**kwargs) -> PipelinedProcessDataUseCase:
+    return PipelinedProcessDataUseCase(
+        LocalFileTransactionRepository(),
+        KaggleFeatureEngineeringService(),
+        LocalFileValidationReportRepository(),
+        **kwargs,
+    )
+
+
+class TestPipelinedProcessDataUseCase:
+    def test_execute_matches_sequential_run(self, kaggle_csv, tmp_path):
+        rows = [
+            make_kaggle_row(Time=str(i * 4000.0), Amount=f"{i * 7}.50", Class=str(i % 2))
+            for i in range(20)
+        ]
+        rows[3]["V1"] = "nan"
+        rows[11]["Amount"] = "-1.00"
+        csv_path = kaggle_csv(rows)
+        destination = tmp_path / "out" / "features.csv"
+
+        result = _use_case(batch_size=3, queue_size=1).execute(
+            str(csv_path), str(destination)
+        )
+
+        repo = LocalFileTransactionRepository()
+        service = KaggleFeatureEngineeringService()
+        expected_path = tmp_path / "expected.csv"
+        transactions = list(repo.load_raw_transactions(str(csv_path)))
+        valid = [t for i, t in enumerate(transactions) if i not in (3, 11)]
+        repo.save_features(service.extract_features(valid), str(expected_path))
+
+        assert result.total_records == 20
+        assert result.valid_records == 18
+        assert result.features_path == str(destination)
+        assert destination.read_text() == expected_path.read_text()
+
+    def test_report_saved_next_to_features(self, kaggle_csv, tmp_path):
+        csv_path = kaggle_csv([make_kaggle_row(), make_kaggle_row(Amount="-2.00")])
+        destination = tmp_path / "features.csv"
+
+        result = _use_case().execute(str(csv_path), str(destination))
+
+        report_path = tmp_path / "features_validation_report.json"
+        assert result.validation_report_path == str(report_path)
+        data = json.loads(report_path.read_text())
+        assert data["total_records"] == 2
+        assert data["errors"] == [
+            {"field": "amount", "message": "invalid amount", "record_index": 1}
+        ]
+
+    def test_stage_metrics(self, kaggle_csv, tmp_path):
+        csv_path = kaggle_csv(
+            [make_kaggle_row(), make_kaggle_row(Amount="-2.00"), make_kaggle_row()]
+        )
+
+        result = _use_case(batch_size=2).execute(str(csv_path), str(tmp_path / "f.csv"))
+
+        metrics = {m.name: m for m in result.stage_metrics}
+        assert list(metrics) == ["parse", "validate", "extract", "write"]
+        assert (metrics["parse"].rows_in, metrics["parse"].rows_out) == (3, 3)
+        assert (metrics["validate"].rows_in, metrics["validate"].rows_out) == (3, 2)
+        assert (metrics["extract"].rows_in, metrics["extract"].rows_out) == (2, 2)
+        assert metrics["write"].rows_in == 2
+        for m in metrics.values():
+            assert 0.0 <= m.busy_seconds <= m.wall_seconds
+            assert not math.isnan(m.rows_per_second)
+
+    def test_stage_metrics_count_bytes(self, kaggle_csv, tmp_path):
+        csv_path = kaggle_csv([make_kaggle_row() for _ in range(5)])
+        destination = tmp_path / "f.csv"
+
+        result = _use_case(batch_size=2).execute(str(csv_path), str(destination))
+
+        metrics = {m.name: m for m in result.stage_metrics}
+        assert metrics["parse"].bytes_read == csv_path.stat().st_size
+        assert metrics["write"].bytes_written == destination.stat().st_size
+        assert metrics["validate"].bytes_read == metrics["validate"].bytes_written == 0
+        assert all(m.cpu_seconds >= 0.0 for m in metrics.values())
+        assert result.to_event().stage_metrics == result.stage_metrics
+
+    def test_aggregated_report(self, kaggle_csv, tmp_path):
+        rows = [make_kaggle_row(Amount="-1.00") for _ in range(6)] + [make_kaggle_row()]
+        csv_path = kaggle_csv(rows)
+
+        result = _use_case(
+            validator=TransactionValidator(max_error_samples=2), batch_size=3
+        ).execute(str(csv_path), str(tmp_path / "f.csv"))
+
+        data = json.loads((tmp_path / "f_validation_report.json").read_text())
+        assert result.valid_records == 1
+        assert len(data["errors"]) == 2
+        assert data["error_summary"][0]["count"] == 6
+
+    def test_empty_input(self, kaggle_csv, tmp_path):
+        destination = tmp_path / "features.csv"
+        result = _use_case().execute(str(kaggle_csv([])), str(destination))
+
+        assert result.total_records == 0
+        with open(destination, newline="") as f:
+            assert list(csv.DictReader(f)) == []
+
+    def test_parse_error_propagates(self, kaggle_csv, tmp_path):
+        rows = [make_kaggle_row() for _ in range(10)] + [make_kaggle_row(Class="x")]
+        csv_path = kaggle_csv(rows)
+
+        with pytest.raises(ValueError, match="Row 10: invalid Class 'x'"):
+            _use_case(batch_size=2, queue_size=1).execute(
+                str(csv_path), str(tmp_path / "f.csv")
+            )
+
+    def test_tolerant_load_continues_past_parse_errors(self, kaggle_csv, tmp_path):
+        rows = [make_kaggle_row() for _ in range(10)] + [make_kaggle_row(Class="x")]
+        rows += [make_kaggle_row(Amount="-1.00"), make_kaggle_row()]
+        use_case = PipelinedProcessDataUseCase(
+            LocalFileTransactionRepository(tolerant=True),
+            KaggleFeatureEngineeringService(),
+            LocalFileValidationReportRepository(),
+            batch_size=4,
+        )
+
+        result = use_case.execute(str(kaggle_csv(rows)), str(tmp_path / "f.csv"))
+
+        data = json.loads((tmp_path / "f_validation_report.json").read_text())
+        assert result.total_records == 13
+        assert result.valid_records == 11
+        assert [(e["message"], e["record_index"]) for e in data["errors"]] == [
+            ("invalid Class", 10),
+            ("invalid amount", 11),
+        ]
+        metrics = {m.name: m for m in result.stage_metrics}
+        assert (metrics["parse"].rows_in, metrics["parse"].rows_out) == (13, 12)
+
+    @pytest.mark.parametrize("pca_features", ["lazy", "skip"])
+    def test_feature_only_run_without_pca_decoding(self, kaggle_csv, tmp_path, pca_features):
+        rows = [
+            make_kaggle_row(Time=str(i * 900.0), Amount=f"{i * 3}.10", Class=str(i % 2))
+            for i in range(10)
+        ]
+        rows[4]["Amount"] = "-1.00"
+        csv_path = kaggle_csv(rows)
+
+        results = {}
+        for mode in ("strict", pca_features):
+            use_case = PipelinedProcessDataUseCase(
+                LocalFileTransactionRepository(pca_features=mode),
+                KaggleFeatureEngineeringService(velocity=True),
+                LocalFileValidationReportRepository(),
+                batch_size=3,
+            )
+            results[mode] = use_case.execute(str(csv_path), str(tmp_path / f"{mode}.csv"))
+
+        assert results[pca_features].valid_records == results["strict"].valid_records == 9
+        assert (tmp_path / f"{pca_features}.csv").read_bytes() == (
+            tmp_path / "strict.csv"
+        ).read_bytes()
+
+    def test_sorter_orders_rows_by_time_before_velocity(self, kaggle_csv, tmp_path):
+        times = [300.0, 0.0, 200.0, 30.0, 100.0, 60.0]
+        rows = [make_kaggle_row(Time=str(t), Amount="1.00") for t in times]
+        rows[2]["Amount"] = "-5.00"
+        use_case = PipelinedProcessDataUseCase(
+            LocalFileTransactionRepository(),
+            KaggleFeatureEngineeringService(velocity=True),
+            LocalFileValidationReportRepository(),
+            batch_size=2,
+            sorter=ExternalTimeSorter(memory_bytes=1024, temp_dir=tmp_path / "sort"),
+        )
+        (tmp_path / "sort").mkdir()
+
+        result = use_case.execute(str(kaggle_csv(rows)), str(tmp_path / "features.csv"))
+
+        with open(tmp_path / "features.csv", newline="") as f:
+            written = list(csv.DictReader(f))
+        assert [r["transaction_id"] for r in written] == [
+            "txn_000001", "txn_000003", "txn_000005", "txn_000004", "txn_000000",
+        ]
+        assert [r["txn_count_60s"] for r in written] == ["1", "2", "2", "2", "1"]
+        report = json.loads(open(result.validation_report_path).read())
+        assert [e["record_index"] for e in report["errors"]] == [2]
+        assert list((tmp_path / "sort").iterdir()) == []
+
+    def test_velocity_features_written_and_reset_between_runs(self, kaggle_csv, tmp_path):
+        rows = [make_kaggle_row(Time=str(float(i * 20)), Amount=f"{i}.00") for i in range(9)]
+        csv_path = kaggle_csv(rows)
+        use_case = PipelinedProcessDataUseCase(
+            LocalFileTransactionRepository(),
+            KaggleFeatureEngineeringService(velocity=True),
+            LocalFileValidationReportRepository(),
+            batch_size=4,
+        )
+
+        use_case.execute(str(csv_path), str(tmp_path / "a.csv"))
+        use_case.execute(str(csv_path), str(tmp_path / "b.csv"))
+
+        with open(tmp_path / "a.csv", newline="") as f:
+            written = list(csv.DictReader(f))
+        assert [r["txn_count_60s"] for r in written] == ["1", "2"] + ["3"] * 7
+        assert written[8]["amount_sum_60s"] == "21"
+        assert (tmp_path / "a.csv").read_bytes() == (tmp_path / "b.csv").read_bytes()
+
+    def test_missing_source_propagates(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            _use_case().execute(str(tmp_path / "missing.csv"), str(tmp_path / "f.csv"))
+
+    def test_non_positive_queue_size_rejected(self):
+        with pytest.raises(ValueError, match="queue_size must be positive"):
+            _use_case(queue_size=0)
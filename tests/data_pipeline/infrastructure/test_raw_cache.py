@@ -0,0 +1,178 @@
+"""파싱 결과 memory-map 캐시 테스트."""
+
+import os
+
+import boto3
+import numpy as np
+import pytest
+from moto import mock_aws
+
+from services.data_pipeline.infrastructure.local_repository import (
+    LocalFileTransactionRepository,
+)
+from services.data_pipeline.infrastructure.raw_cache import ParsedRawCache, cache_key
+from services.data_pipeline.infrastructure.s3_repository import S3TransactionRepository
+from tests.data_pipeline.infrastructure.conftest import make_kaggle_row
+from tests.data_pipeline.infrastructure.test_s3_repository import (
+    _LatencyS3Client,
+    _upload_csv,
+)
+
+
+def _rows(n: int) -> list[dict[str, str]]:
+    return [
+        make_kaggle_row(
+            Time=str(float(i)),
+            Amount=f"{i}.{i % 100:02d}",
+            Class=str(int(i % 3 == 0)),
+            V5=str(i / 7),
+        )
+        for i in range(n)
+    ]
+
+
+def _columns(batches) -> dict[str, np.ndarray]:
+    return {
+        name: np.concatenate([getattr(b, name) for b in batches])
+        for name in ("row_index", "time_seconds", "amount_cents", "is_fraud", "pca_features")
+    }
+
+
+def _assert_same(left, right) -> None:
+    expected = _columns(right)
+    for name, values in _columns(left).items():
+        np.testing.assert_array_equal(values, expected[name])
+
+
+class TestParsedRawCache:
+    def test_hit_returns_memory_mapped_views(self, kaggle_csv, tmp_path):
+        csv_path = kaggle_csv(_rows(30))
+        cache = ParsedRawCache(tmp_path / "cache")
+        repo = LocalFileTransactionRepository(cache=cache)
+
+        first = list(repo.load_raw_batches(str(csv_path), batch_size=7))
+        second = list(repo.load_raw_batches(str(csv_path), batch_size=7))
+
+        _assert_same(second, first)
+        # 압축된 라벨을 바이트 경계에서 나누기 위해 배치 크기는 8의 배수로 맞춰진다.
+        assert [len(b) for b in second] == [8, 8, 8, 6]
+        assert all(isinstance(b.pca_features.base, np.memmap) for b in second)
+        assert [t.transaction_id for b in second for t in b] == [
+            f"txn_{i:06d}" for i in range(30)
+        ]
+
+    def test_modified_source_is_reparsed(self, kaggle_csv, tmp_path):
+        cache = ParsedRawCache(tmp_path / "cache")
+        repo = LocalFileTransactionRepository(cache=cache)
+        csv_path = kaggle_csv([make_kaggle_row(Amount="1.00")])
+        list(repo.load_raw_batches(str(csv_path)))
+
+        csv_path = kaggle_csv([make_kaggle_row(Amount="2.00"), make_kaggle_row()])
+        os.utime(csv_path, ns=(0, 10**18))
+        batches = list(repo.load_raw_batches(str(csv_path)))
+
+        assert batches[0].amount_cents.tolist() == [200, 14962]
+
+    def test_partial_consumption_does_not_commit(self, kaggle_csv, tmp_path):
+        cache = ParsedRawCache(tmp_path / "cache")
+        csv_path = kaggle_csv([make_kaggle_row() for _ in range(10)])
+        repo = LocalFileTransactionRepository(cache=cache)
+
+        batches = repo.load_raw_batches(str(csv_path), batch_size=2)
+        next(batches)
+        batches.close()
+
+        assert list((tmp_path / "cache").iterdir()) == []
+
+    def test_parse_error_does_not_commit(self, kaggle_csv, tmp_path):
+        cache = ParsedRawCache(tmp_path / "cache")
+        csv_path = kaggle_csv([make_kaggle_row(), make_kaggle_row(Class="9")])
+        repo = LocalFileTransactionRepository(cache=cache)
+
+        with pytest.raises(ValueError, match="Row 1: invalid Class"):
+            list(repo.load_raw_batches(str(csv_path)))
+        assert list((tmp_path / "cache").iterdir()) == []
+
+    def test_evicts_least_recently_used(self, kaggle_csv, tmp_path):
+        rows = [make_kaggle_row() for _ in range(10)]
+        repo = LocalFileTransactionRepository()
+        batches = list(repo.load_raw_batches(str(kaggle_csv(rows))))
+        entry_bytes = sum(b.row_index.nbytes * 3 + b.pca_features.nbytes for b in batches)
+        cache = ParsedRawCache(tmp_path / "cache", max_bytes=int(entry_bytes * 2.5))
+
+        for name, mtime in (("a", 1), ("b", 2)):
+            list(cache.write_through(name, batches))
+            os.utime(tmp_path / "cache" / name / "manifest.json", ns=(mtime, mtime))
+        assert list(cache.iter_batches("a", 100))  # a를 최근 사용으로 갱신
+        list(cache.write_through("c", batches))
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+
+    def test_parse_errors_survive_cache_hit(self, kaggle_csv, tmp_path):
+        rows = _rows(30)
+        for i in (0, 9, 10, 29):
+            rows[i]["Class"] = "x"
+        csv_path = kaggle_csv(rows)
+        repo = LocalFileTransactionRepository(
+            cache=ParsedRawCache(tmp_path / "cache"), tolerant=True
+        )
+
+        first = list(repo.load_raw_batches(str(csv_path), batch_size=8))
+        second = list(repo.load_raw_batches(str(csv_path), batch_size=8))
+
+        _assert_same(second, first)
+        assert [[e.record_index for e in b.parse_errors] for b in second] == [
+            [0, 9, 10], [], [], [29]
+        ]
+        assert sum(b.record_count for b in second) == 30
+
+    def test_tolerant_and_strict_entries_are_separate(self, kaggle_csv, tmp_path):
+        csv_path = kaggle_csv([make_kaggle_row(), make_kaggle_row(Class="x")])
+        cache = ParsedRawCache(tmp_path / "cache")
+        list(LocalFileTransactionRepository(cache=cache, tolerant=True).load_raw_batches(
+            str(csv_path)
+        ))
+
+        with pytest.raises(ValueError, match="Row 1: invalid Class"):
+            list(LocalFileTransactionRepository(cache=cache).load_raw_batches(str(csv_path)))
+
+    def test_lazy_pca_on_cache_hit(self, kaggle_csv, tmp_path):
+        csv_path = kaggle_csv(_rows(12))
+        cache = ParsedRawCache(tmp_path / "cache")
+        repo = LocalFileTransactionRepository(cache=cache, pca_features="lazy")
+
+        list(repo.load_raw_batches(str(csv_path), batch_size=5))
+        hit = list(repo.load_raw_batches(str(csv_path), batch_size=5))
+
+        assert not any(b.pca_features.loaded for b in hit)
+        _assert_same(hit, list(LocalFileTransactionRepository().load_raw_batches(str(csv_path))))
+        with pytest.raises(ValueError, match="cannot be combined with a parsed raw cache"):
+            LocalFileTransactionRepository(cache=cache, pca_features="skip")
+
+    def test_cache_key_depends_on_every_part(self):
+        assert cache_key("local", "a.csv", 1, 10) != cache_key("local", "a.csv", 2, 10)
+        assert cache_key("local", "a.csv", 1, 10) == cache_key("local", "a.csv", 1, 10)
+
+    def test_invalid_max_bytes_rejected(self, tmp_path):
+        with pytest.raises(ValueError, match="max_bytes must be positive"):
+            ParsedRawCache(tmp_path, max_bytes=0)
+
+
+class TestS3Cache:
+    @mock_aws
+    def test_second_load_skips_download(self, tmp_path):
+        rows = [make_kaggle_row(Time=str(float(i)), Class=str(i % 2)) for i in range(12)]
+        _upload_csv("test-bucket", "raw/creditcard.csv", rows)
+        client = _LatencyS3Client(boto3.client("s3", region_name="us-east-1"), 0.0)
+        repo = S3TransactionRepository(
+            bucket="test-bucket", s3_client=client, cache=ParsedRawCache(tmp_path)
+        )
+
+        first = list(repo.load_raw_batches("raw/creditcard.csv", batch_size=4))
+        client.max_in_flight = 0
+        second = list(repo.load_raw_batches("raw/creditcard.csv", batch_size=4))
+
+        assert client.max_in_flight == 0
+        _assert_same(second, first)
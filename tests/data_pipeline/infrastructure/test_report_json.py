@@ -0,0 +1,162 @@
+"""검증 리포트 JSON 스트리밍 인코딩 테스트."""
+
+import json
+
+import numpy as np
+import pytest
+
+from services.data_pipeline.domain.models import (
+    ErrorKindSummary,
+    ValidationError,
+    ValidationReport,
+)
+from services.data_pipeline.infrastructure.local_repository import (
+    LocalFileValidationReportRepository,
+    errors_sidecar_path,
+)
+from services.data_pipeline.infrastructure.report_json import (
+    decode_report_json,
+    encode_errors_ndjson,
+    encode_report_json,
+)
+from services.data_pipeline.infrastructure.validators import (
+    BitmaskErrors,
+    ValidationReportBuilder,
+)
+
+
+def _json_dump(report: ValidationReport) -> str:
+    """기존 save_report가 쓰던 json.dump 출력."""
+    data = {
+        "total_records": report.total_records,
+        "valid_records": report.valid_records,
+        "error_rate": report.error_rate,
+        "is_valid": report.is_valid,
+        "errors": [
+            {"field": e.field, "message": e.message, "record_index": e.record_index}
+            for e in report.errors
+        ],
+    }
+    if report.error_summary is not None:
+        data["error_summary"] = [
+            {
+                "field": k.field,
+                "message": k.message,
+                "count": k.count,
+                "sample_record_indices": list(k.sample_record_indices),
+            }
+            for k in report.error_summary
+        ]
+    return json.dumps(data, ensure_ascii=False, indent=2)
+
+
+_REPORTS = {
+    "empty": ValidationReport(total_records=0, errors=()),
+    "valid": ValidationReport(total_records=100, errors=()),
+    "errors": ValidationReport(
+        total_records=3,
+        errors=(
+            ValidationError("amount", "음수 금액", 0),
+            ValidationError("time", 'quote " and \\ backslash', 2),
+        ),
+    ),
+    "bitmask": ValidationReport(
+        total_records=4,
+        errors=BitmaskErrors(np.array([0, 6, 0, 32], dtype=np.uint8), np.arange(4)),
+    ),
+    "aggregated": ValidationReport(
+        total_records=100,
+        errors=(ValidationError("amount", "invalid amount", 5),),
+        error_summary=(
+            ErrorKindSummary("amount", "invalid amount", 30, (5,)),
+            ErrorKindSummary("time_seconds", "invalid time_seconds", 2, ()),
+        ),
+    ),
+}
+
+
+class TestEncodeReportJson:
+    @pytest.mark.parametrize("name", list(_REPORTS))
+    def test_byte_compatible_with_json_dump(self, name):
+        report = _REPORTS[name]
+        assert "".join(encode_report_json(report)) == _json_dump(report)
+
+    def test_chunks_concatenate_to_full_document(self):
+        errors = tuple(ValidationError("amount", "invalid amount", i) for i in range(50))
+        report = ValidationReport(total_records=100, errors=errors)
+
+        chunks = list(encode_report_json(report, chunk_chars=200))
+
+        assert len(chunks) > 1
+        assert all(len(chunk) >= 200 for chunk in chunks[:-1])
+        assert "".join(chunks) == _json_dump(report)
+
+    def test_non_positive_chunk_chars_rejected(self):
+        with pytest.raises(ValueError, match="chunk_chars must be positive"):
+            list(encode_report_json(_REPORTS["valid"], chunk_chars=0))
+
+
+class TestDecodeReportJson:
+    @pytest.mark.parametrize("name", list(_REPORTS))
+    def test_round_trip(self, name):
+        report = _REPORTS[name]
+
+        decoded = decode_report_json("".join(encode_report_json(report)))
+
+        assert decoded.total_records == report.total_records
+        assert list(decoded.errors) == list(report.errors)
+        assert decoded.error_summary == report.error_summary
+        assert decoded.valid_records == report.valid_records
+
+
+    def test_round_trip_keeps_samples_mergeable(self):
+        def shard(stream, size):
+            builder = ValidationReportBuilder(max_error_samples=4, seed=11, stream=stream)
+            builder.add_records(size)
+            builder.add_errors(
+                ValidationError("amount", "invalid amount", i) for i in range(0, size, 3)
+            )
+            return builder.build()
+
+        shards = [shard(stream, size) for stream, size in enumerate((30, 7, 50), start=1)]
+        decoded = [decode_report_json("".join(encode_report_json(r))) for r in shards]
+
+        expected = shards[0].merge(shards[1]).merge(shards[2])
+        merged = decoded[0].merge(decoded[1]).merge(decoded[2])
+
+        assert merged == expected
+        assert list(merged.errors) == list(expected.errors)
+        assert [k.sample_keys for k in merged.error_summary] == [
+            k.sample_keys for k in expected.error_summary
+        ]
+        assert [k.max_samples for k in merged.error_summary] == [4]
+
+
+class TestEncodeErrorsNdjson:
+    def test_one_object_per_line(self):
+        lines = "".join(encode_errors_ndjson(_REPORTS["errors"].errors)).splitlines()
+
+        assert [json.loads(line) for line in lines] == [
+            {"field": "amount", "message": "음수 금액", "record_index": 0},
+            {"field": "time", "message": 'quote " and \\ backslash', "record_index": 2},
+        ]
+
+
+class TestErrorsSidecar:
+    def test_sidecar_written_next_to_report(self, tmp_path):
+        dest = tmp_path / "report.json"
+        repo = LocalFileValidationReportRepository(errors_sidecar=True)
+
+        repo.save_report(_REPORTS["bitmask"], str(dest))
+
+        sidecar = errors_sidecar_path(dest)
+        assert sidecar == tmp_path / "report.errors.ndjson"
+        records = [json.loads(line) for line in sidecar.read_text().splitlines()]
+        assert records == json.loads(dest.read_text())["errors"]
+
+    def test_no_sidecar_by_default(self, tmp_path):
+        LocalFileValidationReportRepository().save_report(
+            _REPORTS["errors"], str(tmp_path / "report.json")
+        )
+
+        assert [p.name for p in tmp_path.iterdir()] == ["report.json"]
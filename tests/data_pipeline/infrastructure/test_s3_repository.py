@@ -1,11 +1,23 @@
 import csv
 import io
+import threading
+import time
+from decimal import Decimal
+from pathlib import Path
 
 import boto3
+import moto.s3.models
 import pytest
 from botocore.exceptions import ClientError
 from moto import mock_aws
 
+from services.data_pipeline.domain.models import Feature
+from services.data_pipeline.infrastructure.feature_engineering import (
+    KaggleFeatureEngineeringService,
+)
+from services.data_pipeline.infrastructure.local_repository import (
+    LocalFileTransactionRepository,
+)
 from services.data_pipeline.infrastructure.s3_repository import S3TransactionRepository
 from tests.data_pipeline.infrastructure.conftest import KAGGLE_FIELDNAMES, make_kaggle_row
 
@@ -33,6 +45,20 @@ class TestS3TransactionRepository:
         assert transactions[0].transaction_id == "txn_000000"
         assert transactions[1].is_fraud is True
 
+    @mock_aws
+    def test_load_raw_batches(self):
+        _upload_csv("test-bucket", "raw/creditcard.csv", [
+            make_kaggle_row(Time="0.0", Amount="149.62", Class="0"),
+            make_kaggle_row(Time="1.0", Amount="2.69", Class="1"),
+            make_kaggle_row(Time="2.0", Amount="378.66", Class="0"),
+        ])
+        repo = S3TransactionRepository(bucket="test-bucket")
+        batches = list(repo.load_raw_batches("raw/creditcard.csv", batch_size=2))
+        assert [len(b) for b in batches] == [2, 1]
+        assert batches[0].amount_cents.tolist() == [14962, 269]
+        assert batches[0].is_fraud.tolist() == [False, True]
+        assert batches[1].row_index.tolist() == [2]
+
     @mock_aws
     def test_load_empty_csv(self):
         _upload_csv("test-bucket", "raw/empty.csv", [])
@@ -47,3 +73,243 @@ class TestS3TransactionRepository:
         repo = S3TransactionRepository(bucket="test-bucket")
         with pytest.raises(ClientError):
             list(repo.load_raw_transactions("nonexistent.csv"))
+
+
+class _LatencyS3Client:
+    """get_object 호출마다 지연을 주고 동시 요청 수를 기록하는 S3 클라이언트 래퍼."""
+
+    def __init__(self, client, latency: float) -> None:
+        self._client = client
+        self._latency = latency
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self.max_in_flight = 0
+        self.ranges: list[str] = []
+
+    def get_object(self, **kwargs):
+        with self._lock:
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+            if "Range" in kwargs:
+                self.ranges.append(kwargs["Range"])
+        try:
+            time.sleep(self._latency)
+            return self._client.get_object(**kwargs)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+
+class _OverwritingS3Client:
+    """첫 Range GET 뒤에 같은 키를 다른 내용으로 덮어쓰는 S3 클라이언트 래퍼."""
+
+    def __init__(self, client) -> None:
+        self._client = client
+        self.overwritten = False
+
+    def get_object(self, **kwargs):
+        response = self._client.get_object(**kwargs)
+        if "Range" in kwargs and not self.overwritten:
+            self.overwritten = True
+            self._client.put_object(
+                Bucket=kwargs["Bucket"], Key=kwargs["Key"], Body=b"Time,Amount,Class\n"
+            )
+        return response
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+
+class TestRangedDownload:
+    @staticmethod
+    def _rows(n: int) -> list[dict]:
+        return [
+            make_kaggle_row(Time=str(float(i)), Amount=f"{i}.{i % 100:02d}", Class=str(i % 2))
+            for i in range(n)
+        ]
+
+    @mock_aws
+    def test_matches_single_stream(self):
+        _upload_csv("test-bucket", "raw/big.csv", self._rows(40))
+        client = _LatencyS3Client(boto3.client("s3", region_name="us-east-1"), 0.0)
+        ranged = S3TransactionRepository(
+            bucket="test-bucket",
+            s3_client=client,
+            range_bytes=257,
+            max_concurrency=3,
+            ranged_min_bytes=0,
+        )
+        single = S3TransactionRepository(bucket="test-bucket")
+
+        ranged_txns = [t for b in ranged.load_raw_batches("raw/big.csv", 8) for t in b]
+        single_txns = [t for b in single.load_raw_batches("raw/big.csv", 8) for t in b]
+
+        assert len(client.ranges) > 10
+        assert client.ranges[0] == "bytes=0-256"
+        assert ranged_txns == single_txns
+        assert [t.transaction_id for t in ranged_txns] == [f"txn_{i:06d}" for i in range(40)]
+
+    @mock_aws
+    def test_ranges_are_fetched_concurrently_with_bounded_read_ahead(self):
+        _upload_csv("test-bucket", "raw/big.csv", self._rows(20))
+        client = _LatencyS3Client(boto3.client("s3", region_name="us-east-1"), 0.05)
+        repo = S3TransactionRepository(
+            bucket="test-bucket",
+            s3_client=client,
+            range_bytes=500,
+            max_concurrency=4,
+            ranged_min_bytes=0,
+        )
+
+        batches = list(repo.load_raw_batches("raw/big.csv"))
+
+        assert sum(len(b) for b in batches) == 20
+        assert 1 < client.max_in_flight <= 4
+
+    @mock_aws
+    def test_overwrite_during_ranged_read_fails(self):
+        _upload_csv("test-bucket", "raw/big.csv", self._rows(40))
+        client = _OverwritingS3Client(boto3.client("s3", region_name="us-east-1"))
+        repo = S3TransactionRepository(
+            bucket="test-bucket",
+            s3_client=client,
+            range_bytes=257,
+            max_concurrency=1,
+            ranged_min_bytes=0,
+        )
+
+        with pytest.raises(ClientError, match="PreconditionFailed"):
+            list(repo.load_raw_batches("raw/big.csv"))
+        assert client.overwritten
+
+    @mock_aws
+    def test_overwrite_during_source_bytes_read_fails(self):
+        _upload_csv("test-bucket", "raw/big.csv", self._rows(40))
+        client = _OverwritingS3Client(boto3.client("s3", region_name="us-east-1"))
+        repo = S3TransactionRepository(
+            bucket="test-bucket", s3_client=client, range_bytes=257, max_concurrency=1
+        )
+
+        with pytest.raises(ClientError, match="PreconditionFailed"):
+            list(repo.iter_source_bytes("raw/big.csv"))
+
+    @mock_aws
+    def test_small_object_uses_single_get(self):
+        _upload_csv("test-bucket", "raw/small.csv", self._rows(2))
+        client = _LatencyS3Client(boto3.client("s3", region_name="us-east-1"), 0.0)
+        repo = S3TransactionRepository(bucket="test-bucket", s3_client=client)
+
+        batches = list(repo.load_raw_batches("raw/small.csv"))
+
+        assert sum(len(b) for b in batches) == 2
+        assert client.ranges == []
+
+
+def _features(n: int) -> list[Feature]:
+    return [
+        Feature(
+            transaction_id=f"txn_{i:06d}",
+            amount=Decimal(f"{i}.50"),
+            hour_of_day=i % 24,
+            day_of_week=i % 7,
+            amount_bin="medium",
+            is_fraud=i % 3 == 0,
+        )
+        for i in range(n)
+    ]
+
+
+class _RecordingS3Client:
+    def __init__(self, client) -> None:
+        self._client = client
+        self.part_sizes: list[int] = []
+
+    def upload_part(self, **kwargs):
+        self.part_sizes.append(len(kwargs["Body"]))
+        return self._client.upload_part(**kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+
+class TestSaveFeatures:
+    @pytest.fixture(autouse=True)
+    def _small_parts(self, monkeypatch):
+        monkeypatch.setattr(moto.s3.models, "S3_UPLOAD_PART_MIN_SIZE", 256)
+
+    @staticmethod
+    def _s3():
+        s3 = boto3.client("s3", region_name="us-east-1")
+        s3.create_bucket(Bucket="test-bucket")
+        return s3
+
+    @mock_aws
+    def test_same_format_as_local(self, tmp_path):
+        s3 = self._s3()
+        features = _features(50)
+        client = _RecordingS3Client(s3)
+        repo = S3TransactionRepository(
+            bucket="test-bucket", s3_client=client, part_bytes=512, max_concurrency=2
+        )
+
+        result = repo.save_features(iter(features), "features/out.csv")
+
+        local_path = LocalFileTransactionRepository().save_features(
+            features, str(tmp_path / "out.csv")
+        )
+        body = s3.get_object(Bucket="test-bucket", Key="features/out.csv")["Body"].read()
+        assert result == Path("features/out.csv")
+        assert body == local_path.read_bytes()
+        assert len(client.part_sizes) > 2
+        assert all(size >= 512 for size in client.part_sizes[:-1])
+
+    @mock_aws
+    def test_feature_batches_same_bytes_as_features(self):
+        rows = [make_kaggle_row(Time=str(i * 997.0), Amount=f"{i}.0{i % 10}") for i in range(40)]
+        _upload_csv("test-bucket", "raw.csv", rows)
+        s3 = boto3.client("s3", region_name="us-east-1")
+        repo = S3TransactionRepository(bucket="test-bucket", s3_client=s3, part_bytes=512)
+        service = KaggleFeatureEngineeringService(velocity=True)
+        batches = [
+            service.extract_features_batch(batch)
+            for batch in repo.load_raw_batches("raw.csv", batch_size=16)
+        ]
+
+        repo.save_feature_batches(iter(batches), "features/batches.csv")
+        repo.save_features([f for b in batches for f in b], "features/rows.csv")
+
+        def body(key):
+            return s3.get_object(Bucket="test-bucket", Key=key)["Body"].read()
+
+        assert body("features/batches.csv") == body("features/rows.csv")
+
+    @mock_aws
+    def test_empty_features_writes_header(self):
+        s3 = self._s3()
+        repo = S3TransactionRepository(bucket="test-bucket")
+
+        repo.save_features([], "features/empty.csv")
+
+        body = s3.get_object(Bucket="test-bucket", Key="features/empty.csv")["Body"].read()
+        assert body.decode().splitlines() == [
+            "transaction_id,amount,hour_of_day,day_of_week,amount_bin,is_fraud,is_weekend"
+        ]
+
+    @mock_aws
+    def test_failure_aborts_upload(self):
+        s3 = self._s3()
+
+        def broken():
+            yield from _features(30)
+            raise RuntimeError("boom")
+
+        repo = S3TransactionRepository(bucket="test-bucket", part_bytes=256)
+        with pytest.raises(RuntimeError, match="boom"):
+            repo.save_features(broken(), "features/broken.csv")
+
+        assert s3.list_multipart_uploads(Bucket="test-bucket").get("Uploads", []) == []
+        with pytest.raises(ClientError):
+            s3.head_object(Bucket="test-bucket", Key="features/broken.csv")
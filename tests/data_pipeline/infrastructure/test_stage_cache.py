@@ -0,0 +1,248 @@
+"""단계 결과 캐시 테스트."""
+
+import json
+import os
+
+import numpy as np
+import pytest
+
+from services.data_pipeline.domain.models import BatchSource, FeatureBatch
+from services.data_pipeline.infrastructure.feature_engineering import (
+    KaggleFeatureEngineeringService,
+)
+from services.data_pipeline.infrastructure.local_repository import (
+    LocalFileTransactionRepository,
+    LocalFileValidationReportRepository,
+)
+from services.data_pipeline.infrastructure.pipeline import PipelinedProcessDataUseCase
+from services.data_pipeline.infrastructure.stage_cache import StageCache, main, parse_size
+from services.data_pipeline.infrastructure.validators import TransactionValidator
+from tests.data_pipeline.infrastructure.conftest import make_kaggle_row
+
+
+class _CountingValidator(TransactionValidator):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    def validate_batch(self, batch):
+        self.calls += 1
+        return super().validate_batch(batch)
+
+
+class _FailingFeatureService(KaggleFeatureEngineeringService):
+    def extract_features_batch(self, batch):
+        raise RuntimeError("boom")
+
+
+class _BatchOnlyRepository(LocalFileTransactionRepository):
+    def save_features(self, features, destination):
+        raise AssertionError("features must be written as batches")
+
+
+def _rows(n: int) -> list[dict[str, str]]:
+    rows = [
+        make_kaggle_row(Time=str(i * 600.0), Amount=f"{i * 3}.25", Class=str(i % 2))
+        for i in range(n)
+    ]
+    rows[2]["Amount"] = "-1.00"
+    return rows
+
+
+def _use_case(cache, *, validator=None, feature_service=None, repository=None, **kwargs):
+    return PipelinedProcessDataUseCase(
+        repository or LocalFileTransactionRepository(),
+        feature_service or KaggleFeatureEngineeringService(),
+        LocalFileValidationReportRepository(),
+        validator=validator,
+        batch_size=3,
+        stage_cache=cache,
+        **kwargs,
+    )
+
+
+def _rows_in(result) -> dict[str, int]:
+    return {metrics.name: metrics.rows_in for metrics in result.stage_metrics}
+
+
+class TestPipelineStageCache:
+    def test_unchanged_run_only_writes_cached_features(self, kaggle_csv, tmp_path):
+        csv_path = kaggle_csv(_rows(8))
+        cache = StageCache(tmp_path / "cache")
+        first_path = tmp_path / "first.csv"
+        first = _use_case(cache).execute(str(csv_path), str(first_path))
+        validator = _CountingValidator()
+
+        second = _use_case(cache, validator=validator).execute(
+            str(csv_path), str(tmp_path / "second.csv")
+        )
+
+        assert validator.calls == 0
+        assert _rows_in(second) == {"parse": 0, "validate": 0, "extract": 0, "write": 7}
+        assert (second.total_records, second.valid_records) == (8, 7)
+        assert (tmp_path / "second.csv").read_bytes() == first_path.read_bytes()
+        assert json.loads(open(second.validation_report_path).read()) == json.loads(
+            open(first.validation_report_path).read()
+        )
+        assert sorted(entry.stage for entry in cache.entries()) == ["features", "validate"]
+
+    def test_replay_writes_feature_batches(self, kaggle_csv, tmp_path):
+        csv_path = kaggle_csv(_rows(8))
+        cache = StageCache(tmp_path / "cache")
+        feature_service = KaggleFeatureEngineeringService(velocity=True)
+        _use_case(cache, feature_service=feature_service).execute(
+            str(csv_path), str(tmp_path / "first.csv")
+        )
+
+        replayed = _use_case(
+            cache, feature_service=feature_service, repository=_BatchOnlyRepository()
+        ).execute(str(csv_path), str(tmp_path / "second.csv"))
+
+        assert _rows_in(replayed)["write"] == 7
+        assert (tmp_path / "second.csv").read_bytes() == (tmp_path / "first.csv").read_bytes()
+
+    def test_cached_features_keep_row_index_and_source(self, tmp_path):
+        def batch(rows, source):
+            return FeatureBatch.from_columns(
+                row_index=np.array(rows),
+                amount_cents=np.array(rows) * 100,
+                hour_of_day=np.zeros(len(rows)),
+                day_of_week=np.full(len(rows), 5),
+                amount_bin_codes=np.zeros(len(rows)),
+                amount_bin_labels=("low",),
+                is_fraud=np.array(rows) % 3 == 0,
+                source=source,
+            )
+
+        written = [
+            batch([0, 2, 3], BatchSource("a.csv")),
+            batch([4, 5, 6, 7, 9], BatchSource("a.csv")),
+            batch([10, 11, 13], BatchSource("b.csv", first_row=10)),
+            batch([14, 15], None),
+        ]
+        cache = StageCache(tmp_path / "cache")
+        with cache.record_features("key") as recorder:
+            for feature_batch in written:
+                recorder.append(feature_batch)
+            recorder.finish()
+
+        cached = cache.load_features("key")
+        batches = list(cached.batches(4))
+
+        assert [len(feature_batch) for feature_batch in batches] == [4, 4, 4, 1]
+        assert [f for b in batches for f in b] == [f for b in written for f in b]
+        assert [t for b in batches for t in b.transaction_ids()] == [
+            t for b in written for t in b.transaction_ids()
+        ]
+        assert [batches[0].source, batches[1].source, batches[3].source] == [
+            BatchSource("a.csv"),
+            BatchSource("a.csv"),
+            None,
+        ]
+
+    def test_changed_feature_version_reuses_validation(self, kaggle_csv, tmp_path):
+        csv_path = kaggle_csv(_rows(8))
+        cache = StageCache(tmp_path / "cache")
+        _use_case(cache).execute(str(csv_path), str(tmp_path / "plain.csv"))
+        validator = _CountingValidator()
+
+        result = _use_case(
+            cache,
+            validator=validator,
+            feature_service=KaggleFeatureEngineeringService(velocity=True),
+        ).execute(str(csv_path), str(tmp_path / "velocity.csv"))
+
+        uncached = _use_case(
+            None, feature_service=KaggleFeatureEngineeringService(velocity=True)
+        ).execute(str(csv_path), str(tmp_path / "expected.csv"))
+        assert validator.calls == 0
+        assert _rows_in(result)["extract"] == 7
+        assert result.valid_records == uncached.valid_records
+        assert (tmp_path / "velocity.csv").read_bytes() == (
+            tmp_path / "expected.csv"
+        ).read_bytes()
+        assert len(cache.entries()) == 3
+
+    def test_changed_source_or_rules_miss(self, kaggle_csv, tmp_path):
+        csv_path = kaggle_csv(_rows(8))
+        cache = StageCache(tmp_path / "cache")
+        _use_case(cache).execute(str(csv_path), str(tmp_path / "a.csv"))
+
+        strict = TransactionValidator(max_error_samples=1)
+        _use_case(cache, validator=strict).execute(str(csv_path), str(tmp_path / "b.csv"))
+        csv_path = kaggle_csv(_rows(9))
+        validator = _CountingValidator()
+        result = _use_case(cache, validator=validator).execute(
+            str(csv_path), str(tmp_path / "c.csv")
+        )
+
+        assert validator.calls == 3
+        assert result.total_records == 9
+        assert len(cache.entries()) == 6
+
+    def test_failed_run_leaves_no_entries(self, kaggle_csv, tmp_path):
+        csv_path = kaggle_csv(_rows(4))
+        cache = StageCache(tmp_path / "cache")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            _use_case(cache, feature_service=_FailingFeatureService()).execute(
+                str(csv_path), str(tmp_path / "f.csv")
+            )
+
+        assert list((tmp_path / "cache").iterdir()) == []
+
+    def test_lru_eviction(self, kaggle_csv, tmp_path):
+        csv_path = kaggle_csv(_rows(8))
+        cache = StageCache(tmp_path / "cache")
+        _use_case(cache).execute(str(csv_path), str(tmp_path / "a.csv"))
+        entries = {entry.stage: entry for entry in cache.entries()}
+        # 검증 항목을 가장 오래 전에 사용한 항목으로 만든다.
+        os.utime(tmp_path / "cache" / entries["validate"].key / "manifest.json", (1, 1))
+
+        removed = cache.evict(max_bytes=entries["features"].size_bytes)
+
+        assert [entry.stage for entry in removed] == ["validate"]
+        assert [entry.stage for entry in cache.entries()] == ["features"]
+
+    def test_hit_marks_entry_recently_used(self, kaggle_csv, tmp_path):
+        csv_path = kaggle_csv(_rows(8))
+        cache = StageCache(tmp_path / "cache")
+        _use_case(cache).execute(str(csv_path), str(tmp_path / "a.csv"))
+        for entry in cache.entries():
+            os.utime(tmp_path / "cache" / entry.key / "manifest.json", (1, 1))
+
+        _use_case(cache).execute(str(csv_path), str(tmp_path / "b.csv"))
+
+        assert all(entry.last_used_ns > 1_000_000_000 for entry in cache.entries())
+
+    def test_invalid_max_bytes(self, tmp_path):
+        with pytest.raises(ValueError, match="max_bytes must be positive"):
+            StageCache(tmp_path, max_bytes=0)
+
+
+class TestStageCacheCli:
+    def test_inspect_and_prune(self, kaggle_csv, tmp_path, capsys):
+        csv_path = kaggle_csv(_rows(8))
+        directory = tmp_path / "cache"
+        _use_case(StageCache(directory)).execute(str(csv_path), str(tmp_path / "a.csv"))
+
+        assert main(["inspect", str(directory)]) == 0
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[-1].startswith("2 entries")
+        assert {line.split()[1] for line in lines[:-1]} == {"validate", "features"}
+
+        assert main(["prune", str(directory), "--stage", "features"]) == 0
+        assert capsys.readouterr().out.startswith("removed 1 entries")
+        assert main(["prune", str(directory)]) == 0
+        assert StageCache(directory).entries() == []
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [("512", 512), ("4K", 4096), ("1.5M", 1572864), ("2GiB", 2 * 1024**3)],
+    )
+    def test_parse_size(self, text, expected):
+        assert parse_size(text) == expected
+
+    def test_parse_size_rejects_garbage(self):
+        with pytest.raises(ValueError, match="invalid size"):
+            parse_size("lots")
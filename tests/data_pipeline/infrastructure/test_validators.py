@@ -5,10 +5,25 @@ from __future__ import annotations
 import math
 from decimal import Decimal
 
+import numpy as np
 import pytest
 
-from services.data_pipeline.domain.models import RawTransaction
-from services.data_pipeline.infrastructure.validators import TransactionValidator
+from services.data_pipeline.domain.models import (
+    UNREPRESENTABLE_CENTS,
+    DeferredColumns,
+    RawTransaction,
+    TransactionBatch,
+    ValidationError,
+    ValidationReport,
+)
+from services.data_pipeline.infrastructure.validators import (
+    ERROR_AMOUNT,
+    ERROR_PCA_NON_FINITE,
+    ERROR_TIME_SECONDS,
+    TransactionValidator,
+    ValidationReportBuilder,
+    _ErrorReservoir,
+)
 
 
 def _make_txn(**overrides: object) -> RawTransaction:
@@ -73,6 +88,26 @@ class TestInvalidTransactions:
         assert report.errors[0].field == "amount"
         assert report.errors[0].message == "invalid amount"
 
+    def test_nan_amount_collected(self, validator: TransactionValidator) -> None:
+        valid, report = validator.validate([_make_txn(amount=Decimal("NaN"))])
+
+        assert valid == []
+        assert [(e.field, e.message) for e in report.errors] == [("amount", "invalid amount")]
+
+    @pytest.mark.parametrize("amount", ["0.001", "1e20", "NaN", "-1.00", "0", "12.50"])
+    def test_row_and_batch_paths_agree_on_amount(
+        self, validator: TransactionValidator, amount: str
+    ) -> None:
+        txns = [_make_txn(amount=Decimal(amount))]
+
+        valid, report = validator.validate(txns)
+        result = validator.validate_batch(TransactionBatch.from_transactions(txns))
+
+        assert result.valid_mask.tolist() == [len(valid) == 1]
+        assert [(e.field, e.message) for e in report.errors] == [
+            (e.field, e.message) for e in result.report.errors
+        ]
+
     def test_nan_in_pca_features_collected(
         self, validator: TransactionValidator
     ) -> None:
@@ -161,3 +196,269 @@ class TestMixedTransactions:
         assert not report.is_valid
         assert valid[0].transaction_id == "good-1"
         assert valid[1].transaction_id == "good-2"
+
+
+def _make_batch(
+    times: list[float],
+    cents: list[int],
+    pca: np.ndarray | DeferredColumns | None = None,
+) -> TransactionBatch:
+    n = len(times)
+    return TransactionBatch.from_columns(
+        row_index=np.arange(n),
+        time_seconds=np.array(times, dtype=np.float64),
+        amount_cents=np.array(cents, dtype=np.int64),
+        is_fraud=np.zeros(n, dtype=np.bool_),
+        pca_features=np.zeros((n, 28)) if pca is None else pca,
+    )
+
+
+class TestValidateBatch:
+    def test_all_valid(self, validator: TransactionValidator) -> None:
+        result = validator.validate_batch(_make_batch([0.0, 1.0], [100, 0]))
+
+        assert result.error_bits.dtype == np.uint8
+        assert result.valid_mask.tolist() == [True, True]
+        assert result.report.is_valid
+        assert result.report.total_records == 2
+
+    def test_matches_row_validator(self, validator: TransactionValidator) -> None:
+        pca = np.zeros((5, 28))
+        pca[2, 5] = math.nan
+        pca[3, 0] = math.inf
+        pca[4, 27] = -math.inf
+        batch = _make_batch(
+            [0.0, math.nan, 1.0, math.inf, 2.0], [100, -1, -5, 100, 100], pca
+        )
+
+        result = validator.validate_batch(batch)
+        valid, report = validator.validate(batch)
+
+        assert result.valid_mask.tolist() == [True, False, False, False, False]
+        assert [t.transaction_id for t in result.valid_batch] == [
+            t.transaction_id for t in valid
+        ]
+        assert result.report.total_records == report.total_records
+        assert result.report.valid_records == report.valid_records
+        assert tuple(result.report.errors) == report.errors
+        assert result.report == report
+        assert hash(result.report.errors) == hash(report.errors)
+        assert hash(result.report) == hash(report)
+
+    def test_error_bits_per_rule(self, validator: TransactionValidator) -> None:
+        pca = np.zeros((3, 28))
+        pca[2, 0] = math.nan
+        result = validator.validate_batch(_make_batch([-1.0, 0.0, 0.0], [0, -1, 0], pca))
+
+        assert result.error_bits.tolist() == [
+            ERROR_TIME_SECONDS,
+            ERROR_AMOUNT,
+            ERROR_PCA_NON_FINITE,
+        ]
+
+    def test_unrepresentable_amount_is_invalid(self, validator: TransactionValidator) -> None:
+        batch = _make_batch([0.0, 0.0], [100, UNREPRESENTABLE_CENTS])
+
+        result = validator.validate_batch(batch)
+
+        assert result.error_bits.tolist() == [0, ERROR_AMOUNT]
+        assert result.report == validator.validate(batch)[1]
+
+    def test_unloaded_deferred_pca_skips_pca_rule(
+        self, validator: TransactionValidator
+    ) -> None:
+        pca = np.zeros((2, 28))
+        pca[1, 3] = math.nan
+        deferred = DeferredColumns.wrap(pca)
+        batch = _make_batch([0.0, 0.0], [100, 100], deferred)
+
+        assert validator.validate_batch(batch).valid_mask.tolist() == [True, True]
+        assert not deferred.loaded
+        deferred.decode()
+        assert validator.validate_batch(batch).valid_mask.tolist() == [True, False]
+
+    def test_report_uses_row_index(self, validator: TransactionValidator) -> None:
+        batch = _make_batch([0.0, 0.0, 0.0], [0, 0, -1])[1:]
+        report = validator.validate_batch(batch).report
+
+        assert len(report.errors) == 1
+        assert report.errors[0] == ValidationError("amount", "invalid amount", 2)
+
+
+class TestValidateStream:
+    def test_yields_lazily(self, validator: TransactionValidator) -> None:
+        pulled: list[int] = []
+
+        def source():
+            for i in range(3):
+                pulled.append(i)
+                yield _make_txn(transaction_id=f"t-{i}")
+
+        stream = validator.validate_stream(source())
+
+        assert pulled == []
+        assert next(stream).transaction_id == "t-0"
+        assert pulled == [0]
+
+    def test_report_available_after_exhaustion(
+        self, validator: TransactionValidator
+    ) -> None:
+        txns = [_make_txn(), _make_txn(transaction_id=""), _make_txn()]
+        stream = validator.validate_stream(txns)
+
+        with pytest.raises(RuntimeError, match="not been exhausted"):
+            stream.report
+
+        valid = list(stream)
+        assert len(valid) == 2
+        assert stream.report.total_records == 3
+        assert stream.report.errors == (
+            ValidationError("transaction_id", "empty transaction_id", 1),
+        )
+
+    def test_on_complete_called_once(self, validator: TransactionValidator) -> None:
+        reports = []
+        stream = validator.validate_stream([_make_txn()], on_complete=reports.append)
+
+        list(stream)
+        list(stream)
+
+        assert len(reports) == 1
+        assert reports[0] is stream.report
+
+    def test_batches_stream(self, validator: TransactionValidator) -> None:
+        batches = [
+            _make_batch([0.0, 1.0], [100, -1]),
+            _make_batch([2.0, math.nan], [100, 100])[1:],
+        ]
+        stream = validator.validate_batches(batches)
+
+        valid = list(stream)
+
+        assert [len(b) for b in valid] == [1, 0]
+        assert stream.report.total_records == 3
+        assert [(e.field, e.record_index) for e in stream.report.errors] == [
+            ("amount", 1),
+            ("time_seconds", 1),
+        ]
+
+
+class TestAggregatedReport:
+    @staticmethod
+    def _batches() -> list[TransactionBatch]:
+        rng = np.random.default_rng(1)
+        batches = []
+        for start in range(0, 1000, 128):
+            n = min(128, 1000 - start)
+            times = np.where(rng.random(n) < 0.1, -1.0, 0.0)
+            cents = np.where(rng.random(n) < 0.3, -1, 100)
+            batch = _make_batch(times.tolist(), cents.tolist())
+            batches.append(batch.with_row_offset(start))
+        return batches
+
+    def test_counts_match_full_report(self) -> None:
+        full = TransactionValidator().validate_batches(self._batches())
+        aggregated = TransactionValidator(max_error_samples=5).validate_batches(
+            self._batches()
+        )
+        list(full)
+        list(aggregated)
+
+        full_report, report = full.report, aggregated.report
+        assert report.total_records == full_report.total_records == 1000
+        assert report.error_count == len(full_report.errors)
+        assert report.valid_records == full_report.valid_records
+        assert report.error_rate == full_report.error_rate
+        assert not report.is_valid
+        counts = {(k.field, k.message): k.count for k in report.error_summary}
+        assert counts == {
+            ("time_seconds", "invalid time_seconds"): sum(
+                e.field == "time_seconds" for e in full_report.errors
+            ),
+            ("amount", "invalid amount"): sum(
+                e.field == "amount" for e in full_report.errors
+            ),
+        }
+
+    def test_samples_are_bounded_real_failures(self) -> None:
+        stream = TransactionValidator(max_error_samples=5).validate_batches(
+            self._batches()
+        )
+        list(stream)
+        full = TransactionValidator().validate_batches(self._batches())
+        list(full)
+        failures = {(e.field, e.message, e.record_index) for e in full.report.errors}
+
+        report = stream.report
+        assert [len(k.sample_record_indices) for k in report.error_summary] == [5, 5]
+        assert len(report.errors) == 10
+        assert {(e.field, e.message, e.record_index) for e in report.errors} <= failures
+        assert [e.record_index for e in report.errors] == sorted(
+            e.record_index for e in report.errors
+        )
+
+    def test_same_seed_same_samples(self) -> None:
+        def samples(seed: int) -> tuple:
+            stream = TransactionValidator(max_error_samples=3, seed=seed).validate_batches(
+                self._batches()
+            )
+            list(stream)
+            return stream.report.error_summary
+
+        assert samples(7) == samples(7)
+        assert samples(7) != samples(8)
+
+    def test_merged_shards_match_sequential_sample(self) -> None:
+        rng = np.random.default_rng(3)
+        sequential = _ErrorReservoir(5)
+        shards = []
+        offset = 0
+        for size in (40, 3, 60, 35):
+            keys = rng.random(size)
+            shard = _ErrorReservoir(5)
+            shard.add(np.arange(size), keys)
+            shards.append(ValidationReport.aggregated(size, (shard.summary("f", "m"),)))
+            sequential.add(np.arange(size) + offset, keys)
+            offset += size
+        expected = ValidationReport.aggregated(offset, (sequential.summary("f", "m"),))
+        a, b, c, d = shards
+
+        for merged in (a.merge(b).merge(c).merge(d), a.merge(b.merge(c.merge(d)))):
+            assert merged == expected
+            assert merged.error_summary[0].sample_keys == expected.error_summary[0].sample_keys
+            assert merged.error_count == 138
+            assert len(merged.errors) == 5
+
+    def test_shard_streams_draw_different_samples(self) -> None:
+        validator = TransactionValidator(max_error_samples=3)
+
+        def samples(stream: int) -> tuple[int, ...]:
+            builder = validator.report_builder(stream=stream)
+            for batch in self._batches():
+                builder.add_batch_result(validator.validate_batch(batch))
+            return builder.build().error_summary[0].sample_record_indices
+
+        assert samples(0) == samples(0)
+        assert samples(0) != samples(1)
+
+    def test_row_path_aggregates(self) -> None:
+        txns = [_make_txn(transaction_id="") for _ in range(10)] + [_make_txn()]
+        valid, report = TransactionValidator(max_error_samples=0).validate(txns)
+
+        assert len(valid) == 1
+        assert report.errors == ()
+        assert report.valid_records == 1
+        assert [(k.field, k.count) for k in report.error_summary] == [("transaction_id", 10)]
+
+    def test_no_errors(self) -> None:
+        stream = TransactionValidator(max_error_samples=3).validate_batches(
+            [_make_batch([0.0], [1])]
+        )
+        list(stream)
+
+        assert stream.report.is_valid
+        assert stream.report.error_summary == ()
+
+    def test_negative_sample_size_rejected(self) -> None:
+        with pytest.raises(ValueError, match="max_error_samples must be non-negative"):
+            ValidationReportBuilder(max_error_samples=-1)
@@ -0,0 +1,141 @@
+"""구간별 거래 속도 피처 테스트."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from services.data_pipeline.domain.models import VELOCITY_WINDOWS_SECONDS
+from services.data_pipeline.infrastructure.velocity import (
+    SlidingWindow,
+    VelocityFeatureExtractor,
+)
+
+
+def _brute_force(
+    rows: list[tuple[float, int, bool]],
+) -> list[tuple[list[tuple[int, int, int]], float]]:
+    """행마다 앞선 거래 전체를 훑어 계산한 기준값."""
+    expected = []
+    for position, (time, _, _) in enumerate(rows):
+        seen = rows[:position + 1]
+        stats = []
+        for seconds in VELOCITY_WINDOWS_SECONDS:
+            amounts = [a for t, a, _ in seen if t > time - seconds]
+            stats.append((len(amounts), sum(amounts), max(amounts)))
+        prior = rows[:position]
+        rate = sum(f for _, _, f in prior) / len(prior) if prior else 0.0
+        expected.append((stats, rate))
+    return expected
+
+
+_sorted_rows = st.lists(
+    st.tuples(
+        st.integers(min_value=0, max_value=8000),
+        st.integers(min_value=0, max_value=10**9),
+        st.booleans(),
+    ),
+    max_size=60,
+).map(lambda rows: [(float(t), a, f) for t, a, f in sorted(rows, key=lambda r: r[0])])
+
+
+class TestSlidingWindow:
+    def test_window_is_half_open(self):
+        window = SlidingWindow(60)
+        window.push(0.0, 100)
+        assert window.push(59.5, 50) == (2, 150, 100)
+        assert window.push(60.0, 10) == (2, 60, 50)
+        assert len(window) == 2
+
+    def test_max_falls_back_after_expiry(self):
+        window = SlidingWindow(10)
+        window.push(0.0, 900)
+        window.push(1.0, 300)
+        window.push(2.0, 500)
+        assert window.push(10.5, 100) == (3, 900, 500)
+        assert window.push(11.5, 100) == (3, 700, 500)
+        assert window.push(12.5, 100) == (3, 300, 100)
+
+    def test_memory_bounded_by_window(self):
+        window = SlidingWindow(5)
+        for t in range(1000):
+            window.push(float(t), t)
+        assert len(window) == 5
+        assert len(window._maxima) == 1
+
+    def test_non_positive_seconds_rejected(self):
+        with pytest.raises(ValueError, match="window seconds must be positive"):
+            SlidingWindow(0)
+
+
+class TestVelocityFeatureExtractor:
+    @given(_sorted_rows)
+    def test_update_matches_brute_force(self, rows):
+        extractor = VelocityFeatureExtractor()
+        actual = [extractor.update(*row) for row in rows]
+        assert actual == _brute_force(rows)
+
+    @given(_sorted_rows, st.lists(st.integers(min_value=1, max_value=20), min_size=1))
+    def test_batches_match_brute_force_for_any_split(self, rows, sizes):
+        extractor = VelocityFeatureExtractor()
+        results = []
+        start = 0
+        for size in sizes * (len(rows) + 1):
+            if start >= len(rows):
+                break
+            chunk = rows[start:start + size]
+            start += size
+            results.append(extractor.update_batch(
+                np.array([t for t, _, _ in chunk], dtype=np.float64),
+                np.array([a for _, a, _ in chunk], dtype=np.int64),
+                np.array([f for _, _, f in chunk], dtype=np.bool_),
+            ))
+
+        expected = _brute_force(rows)
+        actual = [
+            (
+                [
+                    (
+                        int(columns.window_counts[i, w]),
+                        int(columns.window_amount_sums_cents[i, w]),
+                        int(columns.window_amount_maxes_cents[i, w]),
+                    )
+                    for w in range(len(VELOCITY_WINDOWS_SECONDS))
+                ],
+                float(columns.fraud_rate_to_date[i]),
+            )
+            for columns in results
+            for i in range(len(columns))
+        ]
+        assert actual == expected
+
+    def test_fraud_rate_uses_prior_rows_only(self):
+        extractor = VelocityFeatureExtractor()
+        columns = extractor.update_batch(
+            np.array([0.0, 1.0, 2.0]),
+            np.array([1, 1, 1]),
+            np.array([True, False, True]),
+        )
+        assert columns.fraud_rate_to_date.tolist() == [0.0, 1.0, 0.5]
+        assert extractor.update(3.0, 1, False)[1] == pytest.approx(2 / 3)
+
+    def test_decreasing_time_rejected_within_and_across_batches(self):
+        extractor = VelocityFeatureExtractor()
+        with pytest.raises(ValueError, match="non-decreasing"):
+            extractor.update_batch(np.array([5.0, 4.0]), np.array([1, 1]), np.zeros(2, bool))
+
+        extractor.update_batch(np.array([5.0]), np.array([1]), np.zeros(1, bool))
+        with pytest.raises(ValueError, match="got 4.0 after 5.0"):
+            extractor.update(4.0, 1, False)
+
+    def test_reset_starts_new_stream(self):
+        extractor = VelocityFeatureExtractor()
+        extractor.update(100.0, 5, True)
+        extractor.reset()
+        assert extractor.update(0.0, 7, False) == ([(1, 7, 7)] * 3, 0.0)
+
+    def test_non_finite_time_rejected(self):
+        with pytest.raises(ValueError, match="time_seconds must be finite"):
+            VelocityFeatureExtractor().update(float("inf"), 1, False)
@@ -3,6 +3,7 @@ from datetime import timezone
 import pytest
 
 from shared.domain.events import DataProcessingCompleted, DomainEvent
+from shared.domain.metrics import StageMetrics
 
 
 class TestDomainEvent:
@@ -21,6 +22,19 @@ class TestDataProcessingCompleted:
         assert event.total_records == 100
         assert event.valid_records == 95
         assert event.features_path == "/data/features.parquet"
+        assert event.stage_metrics == ()
+
+    def test_carries_stage_metrics(self):
+        metrics = (
+            StageMetrics(name="parse", rows_in=3, rows_out=3, wall_seconds=1.0, busy_seconds=0.5),
+        )
+        event = DataProcessingCompleted(
+            total_records=3,
+            valid_records=3,
+            features_path="/data/features.parquet",
+            stage_metrics=metrics,
+        )
+        assert event.stage_metrics == metrics
 
     def test_empty_features_path_rejected(self):
         with pytest.raises(ValueError, match="features_path must not be empty"):
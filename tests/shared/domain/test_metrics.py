@@ -0,0 +1,38 @@
+import pytest
+
+from shared.domain.metrics import StageMetrics
+
+
+class TestStageMetrics:
+    def test_rows_per_second_uses_busy_time(self):
+        metrics = StageMetrics(
+            name="parse", rows_in=1000, rows_out=1000, wall_seconds=4.0, busy_seconds=2.0
+        )
+        assert metrics.rows_per_second == 500.0
+
+    def test_zero_busy_time(self):
+        metrics = StageMetrics(
+            name="parse", rows_in=0, rows_out=0, wall_seconds=0.0, busy_seconds=0.0
+        )
+        assert metrics.rows_per_second == 0.0
+
+    def test_empty_name_rejected(self):
+        with pytest.raises(ValueError, match="name must not be empty"):
+            StageMetrics(name="", rows_in=0, rows_out=0, wall_seconds=0.0, busy_seconds=0.0)
+
+    def test_negative_rows_rejected(self):
+        with pytest.raises(ValueError, match="row counts must be non-negative"):
+            StageMetrics(
+                name="parse", rows_in=-1, rows_out=0, wall_seconds=0.0, busy_seconds=0.0
+            )
+
+    def test_negative_bytes_rejected(self):
+        with pytest.raises(ValueError, match="byte counts must be non-negative"):
+            StageMetrics(
+                name="write",
+                rows_in=0,
+                rows_out=0,
+                wall_seconds=0.0,
+                busy_seconds=0.0,
+                bytes_written=-1,
+            )
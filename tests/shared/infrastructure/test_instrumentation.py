@@ -0,0 +1,45 @@
+import threading
+
+from shared.infrastructure.instrumentation import (
+    StageRecorder,
+    record_bytes_read,
+    record_bytes_written,
+)
+
+
+class TestStageRecorder:
+    def test_records_rows_bytes_and_times(self):
+        recorder = StageRecorder("parse")
+        recorder.start()
+        recorder.add_rows(10, 8)
+        record_bytes_read(100)
+        record_bytes_written(40)
+        sum(range(10_000))
+        recorder.stop()
+
+        metrics = recorder.metrics()
+        assert (metrics.rows_in, metrics.rows_out) == (10, 8)
+        assert (metrics.bytes_read, metrics.bytes_written) == (100, 40)
+        assert metrics.wall_seconds > 0.0
+        assert 0.0 <= metrics.busy_seconds <= metrics.wall_seconds
+        assert metrics.cpu_seconds >= 0.0
+
+    def test_bytes_outside_active_recorder_are_ignored(self):
+        recorder = StageRecorder("write")
+        record_bytes_written(5)
+        recorder.start()
+        recorder.stop()
+        record_bytes_written(5)
+
+        assert recorder.metrics().bytes_written == 0
+
+    def test_recorder_is_per_thread(self):
+        recorder = StageRecorder("parse")
+        recorder.start()
+        thread = threading.Thread(target=record_bytes_read, args=(7,))
+        thread.start()
+        thread.join()
+        record_bytes_read(3)
+        recorder.stop()
+
+        assert recorder.metrics().bytes_read == 3